@@ -0,0 +1,1640 @@
+'''Benchmarks de rendimiento del taller
+
+   Cada benchmark trabaja sobre una base de datos sqlite temporal, nunca sobre database/mobile.db
+   uso: python benchmark.py [nombre ...]   (sin argumentos ejecuta todos)'''
+import os
+import sys
+import time
+import shutil
+import tempfile
+import subprocess
+import statistics
+import platform
+import threading
+import io
+import asyncio
+import csv
+import sqlite3
+import json
+import tracemalloc
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, redirect_stdout
+from datetime import datetime, timedelta
+from sqlalchemy import insert, select, func, text, event, column, cast, type_coerce, Integer
+from sqlalchemy.orm import sessionmaker, scoped_session, joinedload
+import flet as ft
+from flet_core.protocol import CommandEncoder
+from models import Cliente, Vehiculo, Recambio, Ingreso, Registro
+import busqueda
+import consultas
+import navegacion
+import catalogo
+import carga_recambios
+import carga_clientes
+import exportacion
+import resumenes
+import importes
+import esquema
+import datos_prueba
+import tareas
+import cache_consultas
+import models
+import db
+
+
+# metodo para crear una base de datos temporal con datos de prueba
+def base_temporal(clientes=1000, **kwargs):
+    '''Crea una base de datos sqlite temporal con las tablas y "clientes" clientes de prueba
+
+    Devuelve el engine y el directorio temporal (se borra con borrar_base_temporal)'''
+    directorio = tempfile.mkdtemp(prefix='taller_bench_')
+    engine = db.crear_engine(f"sqlite:///{os.path.join(directorio, 'bench.db')}", **kwargs)
+    db.Base_mobile.metadata.create_all(engine)
+    busqueda.crear_indices_busqueda(engine)
+    resumenes.crear_resumenes(engine)
+
+    ahora = datetime.now()
+    if clientes:
+        with engine.begin() as conexion:
+            conexion.execute(insert(Cliente.__table__), [
+                {'fecha_alta': ahora, 'nombre': f'cliente {i}', 'telefono': f'6{i:08d}',
+                 'direccion': f'calle {i}', 'correo': f'cliente{i}@taller.es'}
+                for i in range(clientes)])
+    return engine, directorio
+
+
+def borrar_base_temporal(engine, directorio):
+    engine.dispose()
+    shutil.rmtree(directorio, ignore_errors=True)
+
+
+# metodo para contar las sentencias SQL que se lanzan contra un engine
+@contextmanager
+def contar_consultas(engine):
+    '''Context manager que cuenta las sentencias ejecutadas en el engine: with contar_consultas(e) as n: ... n[0]'''
+    contador = [0]
+
+    def _contar(*args):
+        contador[0] += 1
+
+    event.listen(engine, 'before_cursor_execute', _contar)
+    try:
+        yield contador
+    finally:
+        event.remove(engine, 'before_cursor_execute', _contar)
+
+
+# metodo para medir el rendimiento de las sesiones con varias paginas concurrentes
+def benchmark_sesiones(paginas=(1, 2, 4, 8), consultas=200):
+    '''Mide consultas por segundo con N paginas concurrentes usando el registro de sesiones
+       (una sesion por pagina) frente a una unica sesion compartida como la antigua db.session'''
+    engine, directorio = base_temporal()
+    registro = scoped_session(sessionmaker(bind=engine), scopefunc=db.ambito_sesion)
+    compartida = sessionmaker(bind=engine)()
+    cerrojo = threading.Lock()
+
+    def pagina_registro():
+        for i in range(consultas):
+            registro.query(Cliente).filter(Cliente.nombre.ilike(f'%{i}%')).count()
+        registro.remove()
+
+    def pagina_compartida():
+        # una sesion compartida entre hilos solo es segura si se serializa su uso
+        for i in range(consultas):
+            with cerrojo:
+                compartida.query(Cliente).filter(Cliente.nombre.ilike(f'%{i}%')).count()
+
+    print('\n > Sesiones concurrentes (consultas/s)')
+    print(f"{'paginas':>8} {'registro':>10} {'compartida':>11}")
+    try:
+        for n in paginas:
+            resultados = []
+            for objetivo in (pagina_registro, pagina_compartida):
+                hilos = [threading.Thread(target=objetivo) for _ in range(n)]
+                inicio = time.perf_counter()
+                for hilo in hilos:
+                    hilo.start()
+                for hilo in hilos:
+                    hilo.join()
+                resultados.append(n * consultas / (time.perf_counter() - inicio))
+            print(f"{n:>8} {resultados[0]:>10.0f} {resultados[1]:>11.0f}")
+    finally:
+        compartida.close()
+        borrar_base_temporal(engine, directorio)
+
+
+# metodo para comparar los perfiles de PRAGMAs de sqlite
+def benchmark_perfiles(commits=200, lectores=4, duracion=2.0):
+    '''Mide la latencia media de commit y las lecturas por segundo de varios lectores concurrentes
+       mientras un hilo escribe, para cada perfil de db.PERFILES_SQLITE'''
+    print('\n > Perfiles sqlite')
+    print(f"{'perfil':>12} {'commit (ms)':>12} {'lecturas/s':>11}")
+    for perfil in db.PERFILES_SQLITE:
+        engine, directorio = base_temporal(perfil=perfil)
+        Sesion = sessionmaker(bind=engine)
+        try:
+            # latencia de commit: un insert y un commit por operacion como en cliente_nuevo
+            sesion = Sesion()
+            inicio = time.perf_counter()
+            for i in range(commits):
+                sesion.add(Recambio(fecha_alta=datetime.now(), nombre_recambio=f'recambio {i}',
+                                    descripcion='bench', categoria='Filtros', subcategoria='Filtro de aceite'))
+                sesion.commit()
+            latencia = (time.perf_counter() - inicio) / commits * 1000
+            sesion.close()
+
+            # lecturas concurrentes con un escritor activo
+            parar = threading.Event()
+            lecturas = []
+
+            def escritor():
+                sesion = Sesion()
+                while not parar.is_set():
+                    sesion.add(Cliente(fecha_alta=datetime.now(), nombre='escritor', telefono='0',
+                                       direccion='bench', correo='bench'))
+                    sesion.commit()
+                sesion.close()
+
+            def lector():
+                sesion = Sesion()
+                total = 0
+                while not parar.is_set():
+                    sesion.query(Cliente).filter(Cliente.nombre.ilike('%9%')).count()
+                    sesion.rollback()
+                    total += 1
+                sesion.close()
+                lecturas.append(total)
+
+            hilos = [threading.Thread(target=escritor)] + [threading.Thread(target=lector) for _ in range(lectores)]
+            for hilo in hilos:
+                hilo.start()
+            time.sleep(duracion)
+            parar.set()
+            for hilo in hilos:
+                hilo.join()
+            print(f"{perfil:>12} {latencia:>12.2f} {sum(lecturas) / duracion:>11.0f}")
+        finally:
+            borrar_base_temporal(engine, directorio)
+
+
+# metodo para comprobar que las consultas de las vistas usan indices
+def benchmark_indices():
+    '''Ejecuta EXPLAIN QUERY PLAN sobre las consultas por clave de las vistas (vistas_*.py) y
+       falla (AssertionError) si alguna recorre la tabla completa en lugar de usar un indice'''
+    engine, directorio = base_temporal(clientes=10)
+    Sesion = sessionmaker(bind=engine)
+    sesion = Sesion()
+    consultas = {
+        'cliente por nombre': sesion.query(Cliente).filter_by(nombre='cliente 1'),
+        'vehiculos del cliente': sesion.query(Vehiculo).filter_by(id_cliente=1),
+        'vehiculo por modelo': sesion.query(Vehiculo).filter_by(modelo='307 2.0'),
+        'vehiculo por matricula': sesion.query(Vehiculo).filter_by(matricula='9859 BWK'),
+        'ingresos del cliente': sesion.query(Ingreso).filter_by(id_cliente=1),
+        'ingresos del vehiculo': sesion.query(Ingreso).filter_by(id_vehiculo=1).order_by(Ingreso.fecha_ingreso),
+        'registros del ingreso': sesion.query(Registro).filter_by(id_ingreso=1),
+        'registros del recambio': sesion.query(Registro).filter_by(id_recambio=1),
+        'recambios por categoria': sesion.query(Recambio).filter_by(categoria='Filtros', subcategoria='Filtro de aceite'),
+    }
+    print('\n > Plan de consultas')
+    sin_indice = []
+    try:
+        with engine.connect() as conexion:
+            for nombre, consulta in consultas.items():
+                sql = consulta.statement.compile(engine, compile_kwargs={'literal_binds': True})
+                plan = ' | '.join(fila[-1] for fila in conexion.execute(text(f'EXPLAIN QUERY PLAN {sql}')))
+                print(f"{nombre:>24}: {plan}")
+                if 'INDEX' not in plan:
+                    sin_indice.append(nombre)
+    finally:
+        sesion.close()
+        borrar_base_temporal(engine, directorio)
+    assert not sin_indice, f"Consultas sin indice: {sin_indice}"
+
+
+# metodo para comparar la busqueda de matriculas con ilike y con el indice de trigramas
+def benchmark_matriculas(vehiculos=500000, repeticiones=20):
+    '''Mide el tiempo medio de busqueda de matriculas parciales con ilike('%x%') frente al
+       indice de trigramas de busqueda.filtro_matricula sobre "vehiculos" vehiculos'''
+    engine, directorio = base_temporal(clientes=1)
+    letras = 'BCDFGHJKLMNPRSTVWXYZ'
+    ahora = datetime.now()
+    with engine.begin() as conexion:
+        conexion.execute(insert(Vehiculo.__table__), [
+            {'fecha_alta': ahora, 'marca': 'Seat', 'modelo': 'Ibiza', 'kilometros': 100000, 'id_cliente': 1,
+             'matricula': f'{i % 10000:04d} {letras[i // 10000 % 20]}{letras[i // 200000 % 20]}{letras[i % 20]}'}
+            for i in range(vehiculos)])
+
+    Sesion = sessionmaker(bind=engine)
+    sesion = Sesion()
+    print(f'\n > Busqueda de matriculas en {vehiculos} vehiculos (ms por busqueda)')
+    print(f"{'texto':>10} {'ilike':>10} {'trigramas':>10} {'resultados':>11}")
+    try:
+        for texto in ('4521', 'BCD', '0007 B', '9999CHZ'):
+            tiempos = []
+            for filtro in (Vehiculo.matricula.ilike(f'%{texto}%'), busqueda.filtro_matricula(texto)):
+                inicio = time.perf_counter()
+                for _ in range(repeticiones):
+                    resultados = sesion.query(Vehiculo.id_vehiculo).filter(filtro).all()
+                tiempos.append((time.perf_counter() - inicio) / repeticiones * 1000)
+            print(f"{texto:>10} {tiempos[0]:>10.2f} {tiempos[1]:>10.2f} {len(resultados):>11}")
+    finally:
+        sesion.close()
+        borrar_base_temporal(engine, directorio)
+
+
+# metodo para comprobar el numero de consultas de las busquedas de las vistas
+def benchmark_consultas(vehiculos=300, lineas=60):
+    '''Comprueba (AssertionError) que las busquedas de las vistas lanzan un numero fijo de consultas
+       independiente del numero de resultados, para detectar regresiones N+1'''
+    engine, directorio = base_temporal(clientes=vehiculos)
+    ahora = datetime.now()
+    with engine.begin() as conexion:
+        conexion.execute(insert(Vehiculo.__table__), [
+            {'fecha_alta': ahora, 'marca': 'Seat', 'modelo': 'Ibiza', 'kilometros': 100000,
+             'matricula': f'{i:04d} BCD', 'id_cliente': i + 1} for i in range(vehiculos)])
+        conexion.execute(insert(Recambio.__table__), [
+            {'fecha_alta': ahora, 'nombre_recambio': f'recambio {i}', 'descripcion': 'bench',
+             'categoria': 'Filtros', 'subcategoria': 'Filtro de aceite'} for i in range(lineas)])
+        conexion.execute(insert(Ingreso.__table__), [
+            {'fecha_ingreso': ahora, 'kilometros_ingreso': 100000, 'averia': 'revision',
+             'diagnostico': 'revision', 'id_cliente': 1, 'id_vehiculo': 1}])
+        conexion.execute(insert(Registro.__table__), [
+            {'puc': 10.0, 'puv': 12.0, 'cantidad': 1.0, 'total_costo': 10.0, 'total_venta': 12.0,
+             'id_recambio': i + 1, 'id_ingreso': 1} for i in range(lineas)])
+
+    Sesion = sessionmaker(bind=engine)
+    sesion = Sesion()
+    print('\n > Consultas por busqueda')
+    try:
+        with contar_consultas(engine) as sentencias:
+            # mismo recorrido que VentanaVehiculo.buscar_vehiculo
+            resultados, _ = busqueda.buscar_vehiculos(sesion, 'BCD', tamanio=None)
+            nombres = [vehiculo.clientes.nombre for vehiculo in resultados]
+        print(f"{'buscar_vehiculo':>24}: {len(nombres)} resultados, {sentencias[0]} consultas")
+        assert len(nombres) == vehiculos
+        assert sentencias[0] == 1, f"buscar_vehiculo lanza {sentencias[0]} consultas, se esperaba 1"
+
+        with contar_consultas(engine) as sentencias:
+            # mismo recorrido que VentanaVerRegistrosIngreso.listaRegistrosListView
+            ingreso = consultas.ingreso_con_registros(sesion, 1)
+            nombres = [registro.recambios.nombre_recambio for registro in ingreso.registros]
+        print(f"{'listaRegistrosListView':>24}: {len(nombres)} registros, {sentencias[0]} consultas")
+        assert len(nombres) == lineas
+        assert sentencias[0] == 1, f"listaRegistrosListView lanza {sentencias[0]} consultas, se esperaba 1"
+    finally:
+        sesion.close()
+        borrar_base_temporal(engine, directorio)
+
+
+# metodo para medir el tiempo hasta la primera pagina de resultados segun el tamaño de la tabla
+def benchmark_paginacion(tamanios=(1000, 10000, 100000), paginas=5):
+    '''Compara el tiempo de la busqueda vacia de clientes cargando toda la tabla (.all() como antes)
+       con la primera pagina y las siguientes por keyset de busqueda.buscar_clientes'''
+    print(f'\n > Paginacion keyset de clientes (ms, paginas de {consultas.TAMANIO_PAGINA})')
+    print(f"{'clientes':>9} {'todo':>9} {'1a pagina':>10} {f'pagina {paginas}':>10}")
+    for tamanio in tamanios:
+        engine, directorio = base_temporal(clientes=tamanio)
+        sesion = sessionmaker(bind=engine)()
+        try:
+            inicio = time.perf_counter()
+            sesion.query(Cliente).filter(Cliente.nombre.ilike('%%')).all()
+            todo = (time.perf_counter() - inicio) * 1000
+            sesion.expunge_all()
+
+            cursor = None
+            tiempos = []
+            for _ in range(paginas):
+                inicio = time.perf_counter()
+                resultados, cursor = busqueda.buscar_clientes(sesion, '', cursor)
+                tiempos.append((time.perf_counter() - inicio) * 1000)
+            print(f"{tamanio:>9} {todo:>9.1f} {tiempos[0]:>10.2f} {tiempos[-1]:>10.2f}")
+        finally:
+            sesion.close()
+            borrar_base_temporal(engine, directorio)
+
+
+# metodo para medir lo que se envia al cliente de Flet al mostrar una lista de controles
+def medir_envio(control):
+    '''Devuelve los controles, los bytes del mensaje "add" que Flet enviaria por el websocket
+       para mostrar el control y los milisegundos que tarda en construirlo'''
+    inicio = time.perf_counter()
+    comandos = control._build_add_commands()
+    mensaje = json.dumps(comandos, cls=CommandEncoder, separators=(',', ':'))
+    return len(comandos), len(mensaje.encode('utf-8')), (time.perf_counter() - inicio) * 1000
+
+
+# metodo para comparar el GridView de resultados con la lista virtualizada
+def benchmark_virtual(clientes=10000):
+    '''Compara mostrar "clientes" resultados en VentanaCliente con una tarjeta por resultado en
+       un GridView (como antes) y con ListaVirtual: controles, bytes enviados y tiempo de
+       construccion, y el coste de recorrer la lista entera haciendo scroll'''
+    from vistas_clientes import VentanaCliente
+
+    engine, directorio = base_temporal(clientes=clientes)
+    sesion = sessionmaker(bind=engine)()
+    print(f'\n > Vista de resultados con {clientes} clientes')
+    print(f"{'vista':>12} {'controles':>10} {'bytes':>12} {'ms':>9}")
+    try:
+        resultados = busqueda.buscar_clientes(sesion, '', tamanio=None)[0]
+        ventana = VentanaCliente(None)
+
+        inicio = time.perf_counter()
+        rejilla = ft.GridView(runs_count=1, child_aspect_ratio=1.9, spacing=10)
+        for cliente in resultados:
+            tarjeta = ventana.crear_tarjeta()
+            ventana.rellenar_tarjeta(tarjeta, cliente)
+            rejilla.controls.append(tarjeta)
+        crear = (time.perf_counter() - inicio) * 1000
+        controles, enviados, construir = medir_envio(rejilla)
+        print(f"{'GridView':>12} {controles:>10} {enviados:>12} {crear + construir:>9.1f}")
+
+        lista = ventana.vistaResultadosBusqueda
+        inicio = time.perf_counter()
+        for pagina in range(0, len(resultados), consultas.TAMANIO_PAGINA):
+            lista.agregar(resultados[pagina:pagina + consultas.TAMANIO_PAGINA])
+        crear = (time.perf_counter() - inicio) * 1000
+        controles, enviados, construir = medir_envio(lista)
+        print(f"{'ListaVirtual':>12} {controles:>10} {enviados:>12} {crear + construir:>9.1f}")
+
+        # recorre la lista de arriba a abajo con un evento de scroll por cada tarjeta
+        rellenadas = []
+        lista.rellenar_elemento = lambda tarjeta, fila: (
+            rellenadas.append(fila), ventana.rellenar_tarjeta(tarjeta, fila))
+        lista.pila.update = lambda: None  # sin pagina no hay a quien enviar el update
+        inicio = time.perf_counter()
+        for indice in range(len(resultados)):
+            lista.al_hacer_scroll(SimpleNamespace(
+                pixels=indice * lista.paso, viewport_dimension=480, max_scroll_extent=lista.pila.height))
+        scroll = (time.perf_counter() - inicio) * 1000
+        print(f"scroll completo: {len(rellenadas)} tarjetas rellenadas en {len(lista.pila.controls)} "
+              f"huecos, {scroll / len(resultados) * 1000:.1f} us por evento")
+    finally:
+        sesion.close()
+        borrar_base_temporal(engine, directorio)
+
+
+# metodo para medir el tiempo de navegacion entre ventanas con y sin cache de vistas
+def benchmark_navegacion(clientes=1000, vueltas=5):
+    '''Recorre varias veces las ventanas cacheables haciendo lo mismo que el router: obtener la vista
+       sin cache (capacidad 0, como antes) y con la cache de vistas, y construir el mensaje "add" que
+       se envia en los dos casos; despues comprueba la invalidacion al hacer commit'''
+    import app  # importa la tabla de rutas sin arrancar la aplicacion
+
+    engine, directorio = base_temporal(clientes=clientes)
+    db.session.remove()
+    db.session.configure(bind=engine)  # las ventanas consultan con db.session
+    rutas = [ruta for ruta, definicion in app.RUTAS.items() if definicion['tablas'] is not None]
+    print(f'\n > Navegacion por ruta (ms de media en {vueltas} vueltas, {clientes} clientes)')
+    print(f"{'ruta':>16} {'construir':>10} {'con cache':>10} {'mensaje':>9}")
+    try:
+        tiempos = {}
+        for capacidad in (0, navegacion.CAPACIDAD_VISTAS):
+            cache = navegacion.CacheVistas(None, app.RUTAS, capacidad)
+            for vuelta in range(vueltas):
+                for ruta in rutas:
+                    inicio = time.perf_counter()
+                    vista = cache.obtener(ruta)
+                    obtener = time.perf_counter()
+                    vista._build_add_commands()
+                    tiempos.setdefault((ruta, capacidad), []).append((obtener - inicio) * 1000)
+                    tiempos.setdefault((ruta, 'mensaje'), []).append((time.perf_counter() - obtener) * 1000)
+        for ruta in rutas:
+            # con cache solo cuentan las visitas despues de la primera, que construye la vista
+            sin_cache, con_cache, mensaje = (
+                sum(valores) / len(valores) for valores in (
+                    tiempos[(ruta, 0)], tiempos[(ruta, navegacion.CAPACIDAD_VISTAS)][1:], tiempos[(ruta, 'mensaje')]))
+            print(f"{ruta:>16} {sin_cache:>10.2f} {con_cache:>10.3f} {mensaje:>9.2f}")
+
+        # un commit en clientes descarta las vistas que dependen de clientes y conserva el resto
+        navegacion.caches['benchmark'] = cache
+        db.session.add(Cliente(fecha_alta=datetime.now(), nombre='benchmark', telefono='0',
+                               direccion='-', correo='-'))
+        db.session.commit()
+        assert '/clientes' not in cache.vistas and '/vehiculoNuevo' not in cache.vistas
+        assert '/recambios' in cache.vistas
+        print(f"tras el commit en clientes quedan en la cache: {', '.join(cache.vistas)}")
+    finally:
+        navegacion.cerrar_cache('benchmark')
+        db.session.remove()
+        db.session.configure(bind=db.engine_sqlite)
+        borrar_base_temporal(engine, directorio)
+
+
+# metodo para medir la latencia del cambio de categoria en el desplegable de recambios
+def benchmark_catalogo(cambios=500):
+    '''Compara el cambio de categoria de VentanaRecambios leyendo y parseando menu_recambios.json en
+       cada cambio (como antes) con el catalogo compartido en memoria, mide la traduccion de
+       categorias con el indice plegado y comprueba la recarga del catalogo al modificar el fichero
+       con y sin el vigilante de watchdog'''
+    from vistas_recambios import VentanaRecambios
+
+    ventana = VentanaRecambios(None)
+    ventana.submenu_opciones.update = lambda: None  # sin pagina no hay a quien enviar el update
+    categorias = catalogo.catalogo.categorias()
+
+    def leyendo_fichero(categoria):
+        with open(catalogo.RUTA_CATALOGO, 'r', encoding='utf-8') as archivo:
+            menu = json.load(archivo)
+        ventana.submenu_opciones.options = [ft.dropdown.Option(sub) for sub in menu.get(categoria, [])]
+
+    def con_catalogo(categoria):
+        ventana.actualizar_submenu(SimpleNamespace(control=SimpleNamespace(value=categoria)))
+
+    print(f'\n > Cambio de categoria en el desplegable ({cambios} cambios, {len(categorias)} categorias)')
+    for nombre, cambiar in (('fichero', leyendo_fichero), ('catalogo', con_catalogo)):
+        with redirect_stdout(io.StringIO()):  # actualizar_submenu imprime las opciones
+            inicio = time.perf_counter()
+            for i in range(cambios):
+                cambiar(categorias[i % len(categorias)])
+            total = time.perf_counter() - inicio
+        print(f"{nombre:>10}: {total / cambios * 1000000:>8.1f} us por cambio")
+
+    # las formas sin acentos de las antiguas listas fijas de app.py llegan a la clave del catalogo
+    for texto, clave in (('Aceites y liquidos', 'Aceites y líquidos'), ('NEUMATICOS', 'Neumáticos'),
+                         ('Correas,cadenas,rodillos', 'Correas, cadenas, rodillos'),
+                         ('Arboles de transmision y diferenciales', 'Árboles de transmisión y diferenciales')):
+        assert catalogo.catalogo.categoria(texto) == clave, texto
+    inicio = time.perf_counter()
+    for i in range(cambios):
+        catalogo.catalogo.categoria(categorias[i % len(categorias)].upper())
+    print(f"{'categoria':>10}: {(time.perf_counter() - inicio) / cambios * 1000000:>8.1f} us por busqueda en el indice")
+
+    # recarga al modificar el fichero, sobre una copia temporal
+    directorio = tempfile.mkdtemp(prefix='taller_bench_')
+    ruta = os.path.join(directorio, 'menu_recambios.json')
+    try:
+        with redirect_stdout(io.StringIO()):
+            for vigilado in (False, True):
+                with open(ruta, 'w', encoding='utf-8') as archivo:
+                    json.dump({'Filtros': ['Filtro de aceite']}, archivo)
+                prueba = catalogo.Catalogo(ruta)
+                if vigilado:
+                    prueba.vigilar()
+                assert prueba.subcategorias('Frenos') is None
+                time.sleep(0.05)  # la fecha de modificacion cambia aunque el sistema de ficheros sea lento
+                with open(ruta, 'w', encoding='utf-8') as archivo:
+                    json.dump({'Filtros': ['Filtro de aceite'], 'Frenos': ['Pastillas']}, archivo)
+                limite = time.perf_counter() + 5
+                while prueba.subcategorias('Frenos') is None and time.perf_counter() < limite:
+                    time.sleep(0.01)
+                # con el vigilante activo subcategorias no mira la fecha del fichero, asi que se
+                # comprueba antes de detenerlo
+                recargado = prueba.subcategorias('Frenos')
+                prueba.dejar_de_vigilar()
+                assert recargado == ['Pastillas'], f"no se recargo (vigilado={vigilado})"
+        print('recarga al modificar el fichero: ok con mtime y con watchdog')
+    finally:
+        shutil.rmtree(directorio, ignore_errors=True)
+
+
+# metodo para medir la carga masiva de recambios
+def benchmark_carga(recambios=100000, uno_a_uno=500):
+    '''Compara crear recambios uno a uno con el ORM (add + commit por recambio, como crear_recambio)
+       con carga_recambios.cargar_recambios, y repite la carga para comprobar que actualiza en
+       lugar de duplicar'''
+    engine, directorio = base_temporal(clientes=0)
+    categorias = catalogo.catalogo.categorias()
+
+    def generar(descripcion='bench', prefijo='recambio'):
+        for i in range(recambios):
+            yield {'nombre_recambio': f'{prefijo} {i}', 'descripcion': f'{descripcion} {i % 7}',
+                   'categoria': categorias[i % len(categorias)], 'subcategoria': f'subcategoria {i % 50}'}
+
+    print(f'\n > Carga de recambios')
+    try:
+        sesion = sessionmaker(bind=engine)()
+        with redirect_stdout(io.StringIO()):  # el constructor de Recambio imprime cada recambio
+            inicio = time.perf_counter()
+            for i in range(uno_a_uno):
+                sesion.add(Recambio(fecha_alta=datetime.now(), nombre_recambio=f'orm {i}', descripcion='bench',
+                                    categoria='Filtros', subcategoria='Filtro de aceite'))
+                sesion.commit()
+            segundos = time.perf_counter() - inicio
+        sesion.close()
+        print(f"{'uno a uno':>14}: {uno_a_uno:>7} recambios {segundos:>7.2f} s {uno_a_uno / segundos:>9.0f} recambios/s")
+
+        for nombre, filas in (('carga', generar()), ('recarga igual', generar()),
+                              ('recarga nueva', generar('nueva'))):
+            total, segundos = carga_recambios.cargar_recambios(engine, filas)
+            print(f"{nombre:>14}: {total:>7} recambios {segundos:>7.2f} s {total / segundos:>9.0f} recambios/s")
+
+        with engine.connect() as conexion:
+            filas = conexion.execute(text('SELECT count(*) FROM recambios')).scalar()
+            actualizadas = conexion.execute(text("SELECT count(*) FROM recambios WHERE descripcion LIKE 'nueva%'")).scalar()
+            encontrados = conexion.execute(text(
+                "SELECT count(*) FROM recambios_fts WHERE recambios_fts MATCH 'nueva'")).scalar()
+        assert filas == recambios + uno_a_uno, f"{filas} recambios, se esperaban {recambios + uno_a_uno}"
+        assert actualizadas == encontrados == recambios
+        print(f"tras las recargas: {filas} recambios, {actualizadas} con la descripcion nueva tambien en el indice FTS")
+
+        # misma cantidad de recambios nuevos sin triggers y reconstruyendo el indice al final
+        total, segundos = carga_recambios.cargar_recambios(
+            engine, generar('masiva', prefijo='masivo'), reconstruir_fts=True)
+        print(f"{'reconstruir fts':>14}: {total:>7} recambios {segundos:>7.2f} s {total / segundos:>9.0f} recambios/s")
+        with engine.connect() as conexion:
+            encontrados = conexion.execute(text(
+                "SELECT count(*) FROM recambios_fts WHERE recambios_fts MATCH 'masiva'")).scalar()
+            triggers = conexion.execute(text(
+                "SELECT count(*) FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'recambios_fts_%'")).scalar()
+        assert encontrados == recambios and triggers == 3
+
+        total, segundos = carga_recambios.cargar_recambios(
+            engine, carga_recambios.recambios_de_fichero(catalogo.RUTA_CATALOGO))
+        print(f"menu_recambios.json: {total} recambios en {segundos * 1000:.1f} ms")
+    finally:
+        borrar_base_temporal(engine, directorio)
+
+
+# metodo para medir la importacion de clientes y vehiculos desde ficheros
+def benchmark_importacion(clientes=50000, uno_a_uno=500):
+    '''Compara dar de alta clientes uno a uno con el ORM (como VentanaClienteNuevo) con importar un
+       csv de clientes con dos vehiculos cada uno y algunas filas erroneas, y repite la importacion
+       para comprobar que no duplica nada'''
+    engine, directorio = base_temporal(clientes=0)
+    ruta_csv = os.path.join(directorio, 'clientes.csv')
+    ruta_jsonl = os.path.join(directorio, 'clientes.jsonl')
+    malas = 0
+    with open(ruta_csv, 'w', encoding='utf-8', newline='') as archivo:
+        escritor = csv.writer(archivo, delimiter=';')
+        escritor.writerow(carga_clientes.CAMPOS_CLIENTE + carga_clientes.CAMPOS_VEHICULO)
+        for i in range(clientes):
+            cliente = (f'cliente {i}', f'6{i:08d}', f'calle {i}', f'Cliente{i}@Taller.es')
+            escritor.writerow(cliente + ('Seat', 'Ibiza', f'{i:05d} BCD', f'{i * 3 % 300}.000'))
+            # segundo vehiculo enlazado solo por el telefono del cliente
+            escritor.writerow(('', f'6{i:08d}', '', '', 'Renault', 'Clio', f'{i:05d}-XYZ', ''))
+            if i % 100 == 0:
+                escritor.writerow((f'sin contacto {i}', '', '', '', '', '', '', ''))
+                escritor.writerow(('', '', '', f'cliente{i}@taller.es', 'Ford', '', f'{i:05d} FFF', '10'))
+                malas += 2
+    with open(ruta_jsonl, 'w', encoding='utf-8') as archivo:
+        for i in range(clientes // 10):
+            archivo.write(json.dumps({'nombre': f'json {i}', 'telefono': f'7{i:08d}', 'direccion': '', 'correo': '',
+                                      'vehiculos': [{'marca': 'Opel', 'modelo': 'Corsa', 'matricula': f'J{i:07d}'}]}) + '\n')
+        archivo.write('{esto no es json\n')
+
+    print(f'\n > Importacion de clientes y vehiculos')
+    try:
+        sesion = sessionmaker(bind=engine)()
+        with redirect_stdout(io.StringIO()):  # el constructor de Cliente imprime cada cliente
+            inicio = time.perf_counter()
+            for i in range(uno_a_uno):
+                sesion.add(Cliente(fecha_alta=datetime.now(), nombre=f'orm {i}', telefono=f'5{i:08d}',
+                                   direccion='calle', correo=f'orm{i}@taller.es'))
+                sesion.commit()
+            segundos = time.perf_counter() - inicio
+        sesion.close()
+        print(f"{'uno a uno':>14}: {uno_a_uno:>7} filas {segundos:>7.2f} s {uno_a_uno / segundos:>9.0f} filas/s")
+
+        for nombre, ruta in (('csv', ruta_csv), ('csv de nuevo', ruta_csv), ('jsonl', ruta_jsonl)):
+            resumen = carga_clientes.importar_fichero(engine, ruta)
+            print(f"{nombre:>14}: {resumen['filas']:>7} filas {resumen['segundos']:>7.2f} s "
+                  f"{resumen['filas'] / resumen['segundos']:>9.0f} filas/s  {resumen['clientes']} clientes, "
+                  f"{resumen['vehiculos']} vehiculos, {resumen['existentes']} existentes, {resumen['rechazadas']} rechazadas")
+            if nombre == 'csv':
+                assert resumen['clientes'] == clientes and resumen['vehiculos'] == 2 * clientes
+                assert resumen['rechazadas'] == malas
+            elif nombre == 'csv de nuevo':
+                assert resumen['clientes'] == resumen['vehiculos'] == 0
+            else:
+                assert resumen['clientes'] == resumen['vehiculos'] == clientes // 10 and resumen['rechazadas'] == 1
+
+        with open(ruta_csv + '.rechazos.csv', encoding='utf-8') as archivo:
+            rechazos = list(csv.DictReader(archivo))
+        print(f"rechazos: {len(rechazos)} filas, p. ej. fila {rechazos[0]['fila']}: {rechazos[0]['motivo']}")
+        with engine.connect() as conexion:
+            huerfanos = conexion.execute(text('SELECT count(*) FROM vehiculos WHERE id_cliente IS NULL')).scalar()
+            compartidos = conexion.execute(text(
+                'SELECT count(*) FROM (SELECT id_cliente FROM vehiculos GROUP BY id_cliente HAVING count(*) = 2)')).scalar()
+            indexadas = conexion.execute(text(
+                "SELECT count(*) FROM vehiculos_matricula_fts WHERE matricula LIKE '%XYZ%'")).scalar()
+            trigger = conexion.execute(text(
+                "SELECT count(*) FROM sqlite_master WHERE name = 'vehiculos_matricula_fts_ai'")).scalar()
+        assert huerfanos == 0 and compartidos == clientes
+        assert indexadas == clientes and trigger == 1, 'las matriculas importadas no estan en el indice de trigramas'
+    finally:
+        borrar_base_temporal(engine, directorio)
+
+
+# metodo para medir la exportacion del historial de ingresos
+def benchmark_exportacion(ingresos=20000, lineas=5):
+    '''Compara la memoria y el tiempo de recorrer el historial cargando los ingresos con el ORM y sus
+       registros (query(...).all() como en las ventanas) con exportacion.exportar_historial a csv y jsonl,
+       y comprueba el filtro por fechas'''
+    engine, directorio = base_temporal(clientes=100)
+    inicio_historial = datetime(2020, 1, 1)
+    with engine.begin() as conexion:
+        conexion.execute(insert(Vehiculo.__table__), [
+            {'fecha_alta': inicio_historial, 'marca': 'Seat', 'modelo': 'Ibiza', 'kilometros': 100000,
+             'matricula': f'{i:04d} BCD', 'id_cliente': i + 1} for i in range(100)])
+        conexion.execute(insert(Recambio.__table__), [
+            {'fecha_alta': inicio_historial, 'nombre_recambio': f'recambio {i}', 'descripcion': 'bench',
+             'categoria': 'Filtros', 'subcategoria': 'Filtro de aceite'} for i in range(50)])
+        # un ingreso cada 2 horas desde 2020
+        conexion.execute(insert(Ingreso.__table__), [
+            {'fecha_ingreso': inicio_historial + timedelta(hours=2 * i), 'kilometros_ingreso': 1000 * i,
+             'averia': f'averia {i}', 'diagnostico': 'revision', 'id_cliente': i % 100 + 1, 'id_vehiculo': i % 100 + 1}
+            for i in range(ingresos)])
+        conexion.execute(insert(Registro.__table__), [
+            {'puc': 10.0, 'puv': 12.5, 'cantidad': 2.0, 'total_costo': 20.0, 'total_venta': 25.0,
+             'id_recambio': (i + j) % 50 + 1, 'id_ingreso': i + 1} for i in range(ingresos) for j in range(lineas)])
+
+    print(f'\n > Exportacion del historial ({ingresos} ingresos, {ingresos * lineas} registros)')
+    print(f"{'forma':>14} {'filas':>8} {'segundos':>9} {'filas/s':>9} {'pico MB':>8}")
+    Sesion = sessionmaker(bind=engine)
+    try:
+        def medir(nombre, funcion):
+            # primero el tiempo y despues la memoria, porque tracemalloc hace todo varias veces mas lento
+            sesion = Sesion()
+            try:
+                inicio = time.perf_counter()
+                total = funcion(sesion)
+                segundos = time.perf_counter() - inicio
+            finally:
+                sesion.close()
+            sesion = Sesion()
+            tracemalloc.start()
+            try:
+                funcion(sesion)
+                pico = tracemalloc.get_traced_memory()[1] / 1e6
+            finally:
+                tracemalloc.stop()
+                sesion.close()
+            print(f"{nombre:>14} {total:>8} {segundos:>9.2f} {total / segundos:>9.0f} {pico:>8.1f}")
+            return total, pico
+
+        def con_orm(sesion):
+            # todos los ingresos con sus registros y recambios en la sesion antes de escribir nada
+            total = 0
+            for ingreso in sesion.query(Ingreso).options(
+                    joinedload(Ingreso.registros).joinedload(Registro.recambios),
+                    joinedload(Ingreso.clientes), joinedload(Ingreso.vehiculos)).all():
+                total += len(ingreso.registros) or 1
+            return total
+
+        total_orm, pico_orm = medir('ORM .all()', con_orm)
+        for extension in ('csv', 'jsonl'):
+            ruta = os.path.join(directorio, f'historial.{extension}')
+            total, pico = medir(extension, lambda sesion: exportacion.exportar_historial(sesion, ruta)[0])
+            assert total == total_orm == ingresos * lineas
+            assert pico < pico_orm / 5, f'la exportacion a {extension} usa {pico:.1f} MB'
+        with open(os.path.join(directorio, 'historial.csv'), encoding='utf-8') as archivo:
+            assert sum(1 for _ in archivo) == ingresos * lineas + 1
+
+        # solo 2021 (365 dias con 12 ingresos al dia)
+        sesion = Sesion()
+        try:
+            total, segundos = exportacion.exportar_historial(
+                sesion, os.path.join(directorio, '2021.csv'),
+                exportacion.leer_fecha('01/01/2021'), exportacion.leer_fecha('2021-12-31'))
+        finally:
+            sesion.close()
+        print(f"{'solo 2021':>14} {total:>8} {segundos:>9.2f}")
+        assert total == min(max(ingresos - 365 * 12, 0), 365 * 12) * lineas
+    finally:
+        borrar_base_temporal(engine, directorio)
+
+
+# metodo para medir las tablas resumen mantenidas por triggers
+def benchmark_resumenes(clientes=100, ingresos=20000, lineas=10, lecturas=200):
+    '''Compara los totales de un cliente y de un mes sumando los registros con la lectura de las
+       tablas resumen, mide lo que cuestan los triggers al insertar registros y comprueba que tras
+       modificar, mover y borrar registros, ingresos y recambios las tablas siguen cuadrando'''
+    print(f'\n > Tablas resumen ({ingresos} ingresos, {ingresos * lineas} registros)')
+    inicio_historial = datetime(2020, 1, 1)
+    tiempos_insercion = {}
+    for con_triggers in (False, True):
+        engine, directorio = base_temporal(clientes=clientes)
+        if not con_triggers:
+            with engine.begin() as conexion:
+                for ddl in resumenes.DDL_TRIGGERS_RESUMEN:
+                    conexion.execute(text(f"DROP TRIGGER {ddl.split()[5]}"))
+        with engine.begin() as conexion:
+            conexion.execute(insert(Recambio.__table__), [
+                {'fecha_alta': inicio_historial, 'nombre_recambio': f'recambio {i}', 'descripcion': 'bench',
+                 'categoria': f'categoria {i % 12}', 'subcategoria': 'bench'} for i in range(100)])
+            conexion.execute(insert(Ingreso.__table__), [
+                {'fecha_ingreso': inicio_historial + timedelta(hours=2 * i), 'kilometros_ingreso': 1000,
+                 'averia': 'averia', 'diagnostico': 'revision', 'id_cliente': i % clientes + 1, 'id_vehiculo': None}
+                for i in range(ingresos)])
+        inicio = time.perf_counter()
+        with engine.begin() as conexion:
+            conexion.execute(insert(Registro.__table__), [
+                {'puc': 10.0, 'puv': 12.5, 'cantidad': 2.0, 'total_costo': 20.0 + j, 'total_venta': 25.0 + j,
+                 'id_recambio': (i + j) % 100 + 1, 'id_ingreso': i + 1} for i in range(ingresos) for j in range(lineas)])
+        tiempos_insercion[con_triggers] = time.perf_counter() - inicio
+        if not con_triggers:
+            borrar_base_temporal(engine, directorio)
+    print(f"insertar registros: {tiempos_insercion[False]:.2f} s sin triggers, "
+          f"{tiempos_insercion[True]:.2f} s con triggers "
+          f"({(tiempos_insercion[True] - tiempos_insercion[False]) / (ingresos * lineas) * 1e6:.1f} us por registro)")
+
+    sesion = sessionmaker(bind=engine)()
+    try:
+        def medir(funcion):
+            inicio = time.perf_counter()
+            for i in range(lecturas):
+                resultado = funcion(i)
+            return (time.perf_counter() - inicio) / lecturas * 1000, resultado
+
+        # sumas en centimos leidas como Decimal en euros, igual que las tablas resumen
+        importes = (column('total_costo', models.Centimos), column('total_venta', models.Centimos))
+        suma_cliente = text('''SELECT count(*) AS lineas, sum(r.total_costo) AS total_costo, sum(r.total_venta) AS total_venta
+                               FROM registros r JOIN ingresos i ON i.id_ingreso = r.id_ingreso WHERE i.id_cliente = :id''').columns(
+            column('lineas'), *importes)
+        suma_mes = text('''SELECT coalesce(c.categoria, '') AS categoria, count(*) AS lineas, sum(r.total_costo) AS total_costo,
+                                  sum(r.total_venta) AS total_venta
+                           FROM registros r JOIN ingresos i ON i.id_ingreso = r.id_ingreso
+                           LEFT JOIN recambios c ON c.id_recambio = r.id_recambio
+                           WHERE strftime('%Y-%m', i.fecha_ingreso) = :mes GROUP BY 1 ORDER BY 1''').columns(
+            column('categoria'), column('lineas'), *importes)
+        suma_total = text('''SELECT count(*) AS lineas, sum(total_costo) AS total_costo, sum(total_venta) AS total_venta
+                             FROM registros''').columns(column('lineas'), *importes)
+        suma_resumen = text('''SELECT sum(lineas) AS lineas, sum(total_costo) AS total_costo, sum(total_venta) AS total_venta
+                               FROM resumen_clientes''').columns(column('lineas'), *importes)
+        meses = [f'{2020 + i // 12 % 4}-{i % 12 + 1:02d}' for i in range(lecturas)]
+
+        print(f"{'totales':>10} {'sumando ms':>11} {'resumen ms':>11}")
+        for nombre, sumar, leer in (
+                ('cliente', lambda i: tuple(sesion.execute(suma_cliente, {'id': i % clientes + 1}).one()),
+                 lambda i: resumenes.totales_cliente(sesion, i % clientes + 1)),
+                ('mes', lambda i: [tuple(fila) for fila in sesion.execute(suma_mes, {'mes': meses[i]})],
+                 lambda i: resumenes.totales_mes(sesion, meses[i])),
+                ('todo', lambda i: tuple(sesion.execute(suma_total).one()),
+                 lambda i: tuple(sesion.execute(suma_resumen).one()))):
+            ms_sumando, esperado = medir(sumar)
+            ms_resumen, obtenido = medir(leer)
+            assert esperado == obtenido, (esperado, obtenido)
+            print(f"{nombre:>10} {ms_sumando:>11.3f} {ms_resumen:>11.3f}")
+
+        # cambios como los de las ventanas: precio de un registro, ingreso que cambia de cliente y de
+        # fecha, recambio que cambia de categoria, y borrados
+        for i in range(200):
+            sesion.execute(text('UPDATE registros SET total_venta = CAST(round(total_venta * 1.21) AS INTEGER) '
+                                'WHERE id_registro = :id'),
+                           {'id': i * 37 + 1})
+            sesion.execute(text("UPDATE ingresos SET id_cliente = :cliente, fecha_ingreso = '2030-01-01 00:00:00.000000' "
+                                'WHERE id_ingreso = :id'), {'cliente': i + 1, 'id': i * 53 + 1})
+        sesion.execute(text("UPDATE recambios SET categoria = 'categoria nueva' WHERE id_recambio <= 5"))
+        sesion.execute(text('DELETE FROM recambios WHERE id_recambio = 6'))
+        sesion.execute(text('DELETE FROM registros WHERE id_registro % 97 = 0'))
+        sesion.execute(text('DELETE FROM ingresos WHERE id_ingreso % 101 = 0'))
+        sesion.commit()
+        diferencias = resumenes.comprobar_resumenes(engine)
+        assert not diferencias, diferencias[:5]
+
+        inicio = time.perf_counter()
+        resumenes.reconstruir_resumenes(engine)
+        print(f"reconstruir: {time.perf_counter() - inicio:.2f} s, tras los cambios las tablas cuadran con los registros")
+        assert not resumenes.comprobar_resumenes(engine)
+    finally:
+        sesion.close()
+        borrar_base_temporal(engine, directorio)
+
+
+# metodo para comparar el total de una linea calculado en SQL con models.importe
+def _comprobar_total_linea(precios=tuple(range(0, 1000)) + (1999, 4995, 12345, 99999),
+                           cantidades=tuple(n / 100 for n in range(-100, 1001, 5)) + (0.7, 1.15, 2.675, 0.333, 1.005, 0.125)):
+    '''Calcula el total de cada precio (en centimos) por cada cantidad con importes.total_linea en
+       sqlite y con models.importe, y devuelve (combinaciones, distintos con round() en float,
+       distintos con total_linea)'''
+    registros = Registro.__table__
+    engine, directorio = base_temporal(clientes=0)
+    try:
+        with engine.begin() as conexion:
+            conexion.exec_driver_sql(
+                'INSERT INTO registros (puc, puv, cantidad, total_costo, total_venta) VALUES (?, ?, ?, 0, 0)',
+                [(precio, precio, cantidad) for precio in precios for cantidad in cantidades])
+            puc = type_coerce(registros.c.puc, Integer)  # en centimos, sin pasar a euros
+            filas = conexion.execute(select(
+                puc, registros.c.cantidad,
+                cast(func.round(puc * registros.c.cantidad), Integer),  # como se calculaba antes
+                importes.total_linea(registros.c.puc))).all()
+    finally:
+        borrar_base_temporal(engine, directorio)
+    esperados = [models.centimos(models.importe(models.euros(precio), cantidad)) for precio, cantidad, _, _ in filas]
+    return (len(filas), sum(1 for fila, esperado in zip(filas, esperados) if fila[2] != esperado),
+            sum(1 for fila, esperado in zip(filas, esperados) if fila[3] != esperado))
+
+
+# metodo para medir los importes en centimos frente a los floats
+def benchmark_importes(ingresos=20000, lineas=10, recambios=100, cambios=10):
+    '''Compara la suma de los totales en floats con la suma exacta en centimos, migra una tabla
+       registros con importes FLOAT a centimos y comprueba que no se pierde ni un centimo, y compara
+       cambiar el precio de venta de varios recambios registro a registro con el ORM con
+       importes.actualizar_precios (un UPDATE)'''
+    print(f'\n > Importes en centimos ({ingresos * lineas} registros)')
+    # precios con dos decimales y cantidades como las de la ventana de registros
+    precios = [(f'{(i * 7919) % 10000 / 100 + 0.99:.2f}', (1, 2, 1.5, 0.25, 3)[i % 5]) for i in range(ingresos * lineas)]
+    inicio = time.perf_counter()
+    # como lo calculaba registro_nuevo, redondeando cada linea al centimo con round()
+    lineas_float = [round(float(precio) * cantidad, 2) for precio, cantidad in precios]
+    suma_float = sum(lineas_float)
+    segundos_float = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    lineas_exactas = [models.importe(precio, cantidad) for precio, cantidad in precios]
+    suma_exacta = sum(lineas_exactas)
+    segundos_exacta = time.perf_counter() - inicio
+    mal_redondeadas = sum(1 for a, b in zip(lineas_float, lineas_exactas) if models.centimos(a) != models.centimos(b))
+    print(f"suma de las lineas: float {suma_float!r} ({segundos_float:.2f} s), "
+          f"centimos {suma_exacta} ({segundos_exacta:.2f} s); {mal_redondeadas} lineas con un centimo de diferencia")
+    assert models.importe('10.10', 3) == models.euros(3030) and 10.10 * 3 != 30.30
+    combinaciones, distintos_round, distintos = _comprobar_total_linea()
+    print(f"total de una linea en SQL frente a models.importe ({combinaciones} precios x cantidades): "
+          f"{distintos_round} distintos con round() en float, {distintos} con importes.total_linea")
+    assert distintos == 0, 'importes.total_linea tiene que redondear como models.importe'
+
+    engine, directorio = base_temporal(clientes=100)
+    inicio_historial = datetime(2020, 1, 1)
+    try:
+        # base de datos con la tabla registros anterior, con los importes en FLOAT
+        with engine.begin() as conexion:
+            conexion.execute(text('DROP TABLE registros'))
+            conexion.execute(text('''CREATE TABLE registros (
+                id_registro INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT,
+                puc FLOAT NOT NULL, puv FLOAT NOT NULL, cantidad FLOAT NOT NULL,
+                total_costo FLOAT NOT NULL, total_venta FLOAT NOT NULL,
+                id_recambio INTEGER REFERENCES recambios (id_recambio),
+                id_ingreso INTEGER REFERENCES ingresos (id_ingreso))'''))
+            conexion.execute(text('CREATE INDEX ix_registros_id_ingreso ON registros (id_ingreso)'))
+            conexion.execute(text('CREATE INDEX ix_registros_id_recambio ON registros (id_recambio)'))
+            conexion.execute(insert(Recambio.__table__), [
+                {'fecha_alta': inicio_historial, 'nombre_recambio': f'recambio {i}', 'descripcion': 'bench',
+                 'categoria': f'categoria {i % 12}', 'subcategoria': 'bench'} for i in range(recambios)])
+            conexion.execute(insert(Ingreso.__table__), [
+                {'fecha_ingreso': inicio_historial + timedelta(hours=2 * i), 'kilometros_ingreso': 1000,
+                 'averia': 'averia', 'diagnostico': 'revision', 'id_cliente': i % 100 + 1, 'id_vehiculo': None}
+                for i in range(ingresos)])
+            conexion.execute(text('''INSERT INTO registros (puc, puv, cantidad, total_costo, total_venta, id_recambio, id_ingreso)
+                                     VALUES (:puc, :puv, :cantidad, :total_costo, :total_venta, :id_recambio, :id_ingreso)'''), [
+                {'puc': float(precio) * 0.8, 'puv': float(precio), 'cantidad': cantidad,
+                 'total_costo': float(precio) * 0.8 * cantidad, 'total_venta': float(precio) * cantidad,
+                 'id_recambio': n % recambios + 1, 'id_ingreso': n // lineas + 1}
+                for n, (precio, cantidad) in enumerate(precios)])
+            conexion.execute(text('DELETE FROM registros WHERE id_registro > :n'), {'n': len(precios) - 5})
+            esperado = conexion.execute(text('''SELECT count(*), sum(CAST(round(total_costo * 100) AS INTEGER)),
+                                                   sum(CAST(round(total_venta * 100) AS INTEGER)), total(total_venta)
+                                            FROM registros''')).one()
+
+        inicio = time.perf_counter()
+        assert models.migrar(engine) == ['centimos']
+        segundos_migrar = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        resumenes.crear_resumenes(engine)
+        segundos_resumenes = time.perf_counter() - inicio
+        assert models.migrar(engine) == [], 'la migracion se tiene que poder llamar en cada arranque'
+        with engine.begin() as conexion:
+            tipos = {fila[1]: fila[2] for fila in conexion.execute(text('PRAGMA table_info(registros)'))}
+            indices = {fila[1] for fila in conexion.execute(text('PRAGMA index_list(registros)'))}
+            secuencia = conexion.execute(text("SELECT seq FROM sqlite_sequence WHERE name = 'registros'")).scalar()
+            lineas_migradas, total_costo, total_venta = importes.totales(conexion)
+        print(f"migrar a centimos: {segundos_migrar:.2f} s (+{segundos_resumenes:.2f} s recalculando las tablas resumen); "
+              f"venta {esperado[3]!r} en FLOAT -> {total_venta} en centimos")
+        assert tipos['puc'] == tipos['total_venta'] == 'INTEGER' and tipos['cantidad'] == 'FLOAT'
+        assert indices == {'ix_registros_id_ingreso', 'ix_registros_id_recambio'} and secuencia == len(precios)
+        assert (lineas_migradas, total_costo, total_venta) == (esperado[0], models.euros(esperado[1]), models.euros(esperado[2]))
+        assert not resumenes.comprobar_resumenes(engine)
+
+        # cambio del precio de venta de varios recambios en todos sus registros
+        Sesion = sessionmaker(bind=engine)
+        sesion = Sesion()
+        try:
+            inicio = time.perf_counter()
+            for id_recambio in range(1, cambios + 1):
+                for registro in sesion.query(Registro).filter_by(id_recambio=id_recambio):
+                    registro.puv = '19.95'
+                    registro.total_venta = models.importe(registro.puv, registro.cantidad)
+            sesion.commit()
+            segundos_orm = time.perf_counter() - inicio
+            inicio = time.perf_counter()
+            filas = sum(importes.actualizar_precios(sesion, Registro.id_recambio == id_recambio, puv='24.95')
+                        for id_recambio in range(cambios + 1, 2 * cambios + 1))
+            sesion.commit()
+            segundos_update = time.perf_counter() - inicio
+            print(f"cambiar el precio de {cambios} recambios ({filas} registros): ORM {segundos_orm:.2f} s, "
+                  f"UPDATE {segundos_update:.2f} s")
+            distintos = sesion.execute(select(func.count()).where(
+                Registro.id_recambio <= 2 * cambios,
+                Registro.total_venta != importes.total_linea(Registro.__table__.c.puv))).scalar()
+            assert distintos == 0, 'el ORM y el UPDATE tienen que calcular los mismos totales'
+
+            # todos los totales desde precio por cantidad (los migrados se redondearon linea a linea)
+            inicio = time.perf_counter()
+            filas = importes.recalcular_totales(sesion)
+            sesion.commit()
+            print(f"recalcular todos los totales: {filas} registros cambiados en {time.perf_counter() - inicio:.2f} s")
+            assert importes.recalcular_totales(sesion) == 0
+        finally:
+            sesion.close()
+        assert not resumenes.comprobar_resumenes(engine)
+        print('las tablas resumen cuadran con los registros')
+    finally:
+        borrar_base_temporal(engine, directorio)
+
+
+# metodo para medir las consultas por kilometraje
+def benchmark_kilometros(vehiculos=100000, minimo=150000, repeticiones=20):
+    '''Migra una tabla vehiculos con los kilometros en texto a la columna INTEGER con indice, compara
+       buscar los vehiculos de mas de "minimo" km convirtiendo el texto en python con la consulta por
+       el indice, y comprueba que un ingreso nuevo actualiza los kilometros del vehiculo'''
+    print(f'\n > Kilometros de {vehiculos} vehiculos')
+    engine, directorio = base_temporal(clientes=100)
+    ahora = datetime.now()
+    formatos = ('{}', '{:,}', '{:,} km', 'desconocido')
+    try:
+        # base de datos anterior, con los kilometros en texto en varios formatos
+        with engine.begin() as conexion:
+            conexion.execute(text('DROP TABLE vehiculos'))
+            conexion.execute(text('''CREATE TABLE vehiculos (
+                id_vehiculo INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT, fecha_alta DATETIME,
+                marca VARCHAR(255) NOT NULL, modelo VARCHAR(255) NOT NULL, matricula VARCHAR(255) NOT NULL,
+                kilometros VARCHAR(255) NOT NULL, id_cliente INTEGER REFERENCES clientes (id_cliente))'''))
+        busqueda.crear_indices_busqueda(engine)
+        with engine.begin() as conexion:
+            conexion.execute(insert(Vehiculo.__table__), [
+                {'fecha_alta': ahora, 'marca': 'Seat', 'modelo': 'Ibiza', 'matricula': f'{i:06d} BCD',
+                 'kilometros': formatos[i % 4].format((i * 7919) % 300000).replace(',', '.'), 'id_cliente': i % 100 + 1}
+                for i in range(vehiculos)])
+
+        def en_python():
+            # lo que habia que hacer con la columna de texto: leer todos y convertir en python
+            encontrados = []
+            for vehiculo in sesion.query(Vehiculo.id_vehiculo, text('vehiculos.kilometros')).all():
+                try:
+                    if models.leer_kilometros(vehiculo[1]) >= minimo:
+                        encontrados.append(vehiculo[0])
+                except ValueError:
+                    pass
+            return encontrados
+
+        sesion = sessionmaker(bind=engine)()
+        try:
+            inicio = time.perf_counter()
+            esperados = en_python()
+            segundos_python = time.perf_counter() - inicio
+        finally:
+            sesion.close()
+
+        inicio = time.perf_counter()
+        assert models.migrar(engine) == ['kilometros']
+        segundos_migrar = time.perf_counter() - inicio
+        models.crear_indices(engine)
+        busqueda.crear_indices_busqueda(engine)
+        with engine.connect() as conexion:
+            no_validos = models.kilometros_no_validos(conexion)
+        print(f"migrar a INTEGER: {segundos_migrar:.2f} s; {len(no_validos)} textos que no son kilometros "
+              f"guardados en kilometros_no_validos (p. ej. {no_validos[0][2]!r})")
+        assert len(no_validos) == sum(1 for i in range(vehiculos) if formatos[i % 4] == 'desconocido')
+
+        sesion = sessionmaker(bind=engine)()
+        try:
+            inicio = time.perf_counter()
+            for _ in range(repeticiones):
+                total = sesion.query(func.count()).filter(Vehiculo.kilometros >= minimo).scalar()
+            ms_contar = (time.perf_counter() - inicio) / repeticiones * 1000
+            inicio = time.perf_counter()
+            for _ in range(repeticiones):
+                pagina, cursor = consultas.vehiculos_por_kilometros(sesion, minimo=minimo)
+            ms_pagina = (time.perf_counter() - inicio) / repeticiones * 1000
+            todos, cursor = [], None
+            while True:
+                vehiculos_pagina, cursor = consultas.vehiculos_por_kilometros(sesion, minimo=minimo, cursor=cursor, tamanio=5000)
+                todos += [vehiculo.id_vehiculo for vehiculo in vehiculos_pagina]
+                if cursor is None:
+                    break
+            plan = ' '.join(str(fila[-1]) for fila in sesion.execute(text(
+                'EXPLAIN QUERY PLAN SELECT id_vehiculo FROM vehiculos WHERE kilometros >= :minimo '
+                'ORDER BY kilometros DESC, id_vehiculo DESC'), {'minimo': minimo}))
+            print(f"mas de {minimo} km: texto en python {segundos_python * 1000:.1f} ms, "
+                  f"contar con el indice {ms_contar:.2f} ms, primera pagina {ms_pagina:.2f} ms ({total} vehiculos)")
+            print(f"plan: {plan}")
+            assert sorted(todos) == sorted(esperados) and total == len(esperados)
+            assert 'ix_vehiculos_kilometros' in plan
+            assert all(a.kilometros >= b.kilometros for a, b in zip(pagina, pagina[1:]))
+            assert sesion.query(func.count()).filter(Vehiculo.kilometros == 0).scalar() == sum(
+                1 for i in range(vehiculos) if i % 4 == 3 or (i * 7919) % 300000 == 0), \
+                'los kilometros que no eran un numero se quedan en 0'
+
+            # un ingreso con mas kilometros actualiza el vehiculo y uno con menos no
+            vehiculo = sesion.get(Vehiculo, 2)
+            for kilometros, esperado in ((vehiculo.kilometros + 1000, vehiculo.kilometros + 1000),
+                                         ('1.000', vehiculo.kilometros + 1000)):
+                with redirect_stdout(io.StringIO()):
+                    ingreso = Ingreso(kilometros_ingreso=kilometros, fecha_ingreso=ahora, averia='revision', diagnostico='')
+                vehiculo.ingresos.append(ingreso)
+                vehiculo.actualizar_kilometros(ingreso.kilometros_ingreso)
+                sesion.commit()
+                assert sesion.get(Vehiculo, 2).kilometros == esperado
+            try:
+                vehiculo.kilometros = '12O.000'
+                raise AssertionError('unos kilometros que no son un numero tienen que dar ValueError')
+            except ValueError:
+                sesion.rollback()
+        finally:
+            sesion.close()
+        with engine.connect() as conexion:
+            indexadas = conexion.execute(text('SELECT count(*) FROM vehiculos_matricula_fts')).scalar()
+            triggers = conexion.execute(text(
+                "SELECT count(*) FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'vehiculos_matricula_fts%'")).scalar()
+        assert indexadas == vehiculos and triggers == 3, 'el indice de matriculas se tiene que conservar'
+    finally:
+        borrar_base_temporal(engine, directorio)
+
+
+# metodo para simular una consulta lenta (fallo inyectado) que sqlite puede interrumpir
+def consulta_lenta(sesion, filas):
+    '''Cuenta "filas" filas generadas con un CTE recursivo: ocupa el hilo tanto como una consulta
+       pesada o una espera de busy_timeout, pero ejecutando instrucciones de la maquina virtual de
+       sqlite, asi que el manejador de progreso de tareas.consultar la puede cancelar'''
+    return sesion.execute(text(
+        'WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c LIMIT :n) SELECT count(*) FROM c'),
+        {'n': filas}).scalar()
+
+
+def benchmark_tareas(filas=1500000, hilos_flet=2, clicks=20, busquedas=5, intervalo=0.1):
+    '''Con "hilos_flet" consultas lentas ocupando el pool de manejadores de Flet, mide la latencia
+       de los clicks (una busqueda de clientes) cuando las consultas se ejecutan en el manejador
+       (antes) y cuando van al pool de tareas.consultar; despues compara escribir "busquedas"
+       busquedas lentas seguidas dejando que todas terminen con cancelar la anterior (Tareas)'''
+    print(f'\n > Consultas fuera de los manejadores ({hilos_flet} consultas lentas de {filas} filas)')
+    engine, directorio = base_temporal(clientes=10000)
+    Sesion = sessionmaker(bind=engine)
+
+    # metodo que ejecuta una funcion de base de datos como lo hacia un manejador normal de Flet
+    def en_manejador(funcion, *args):
+        with Sesion() as sesion:
+            return funcion(sesion, *args)
+
+    async def escenario_clicks(antes, pool_flet):
+        loop = asyncio.get_running_loop()
+        if antes:
+            # antes: cada manejador consulta en el pool de Flet con su sesion
+            def lanzar(funcion, *args):
+                return loop.run_in_executor(pool_flet, en_manejador, funcion, *args)
+        else:
+            # ahora: el manejador solo lanza la corrutina, que espera a la consulta en un hilo de base de datos
+            def lanzar(funcion, *args):
+                return asyncio.ensure_future(tareas.consultar(funcion, *args, engine=engine))
+
+        lentas = [lanzar(consulta_lenta, filas) for _ in range(hilos_flet)]
+        await asyncio.sleep(0.05)  # las consultas lentas ya ocupan sus hilos
+        latencias = []
+        for i in range(clicks):
+            inicio = time.perf_counter()
+            await lanzar(busqueda.buscar_clientes, f'cliente {i}')
+            latencias.append((time.perf_counter() - inicio) * 1000)
+        await asyncio.gather(*lentas)
+        return latencias
+
+    try:
+        print(f"{'click (ms)':<12} {'media':>8} {'max':>8}")
+        for nombre, antes in (('antes', True), ('ahora', False)):
+            with ThreadPoolExecutor(max_workers=hilos_flet) as pool_flet:
+                latencias = asyncio.run(escenario_clicks(antes, pool_flet))
+            print(f"{nombre:<12} {sum(latencias) / len(latencias):>8.1f} {max(latencias):>8.1f}")
+
+        # busquedas seguidas: cada tecla lanza una busqueda lenta y solo importa la ultima
+        async def escenario_busquedas(cancelar):
+            loop = asyncio.get_running_loop()
+            pagina = SimpleNamespace(run_task=lambda corrutina, *args: asyncio.run_coroutine_threadsafe(
+                corrutina(*args), loop))
+            ventana = tareas.Tareas(pagina)
+            mostradas = []
+
+            async def buscar(i):
+                mostradas.append((i, await tareas.consultar(consulta_lenta, filas, engine=engine)))
+
+            inicio = time.perf_counter()
+            lanzadas = []
+            for i in range(busquedas):
+                if cancelar:
+                    ventana.lanzar('busqueda', buscar, i)
+                else:
+                    lanzadas.append(asyncio.ensure_future(buscar(i)))
+                await asyncio.sleep(intervalo)
+            await asyncio.gather(*lanzadas)
+            while ventana.en_curso('busqueda'):
+                await asyncio.sleep(0.005)
+            return time.perf_counter() - inicio, mostradas
+
+        print(f"{f'{busquedas} busquedas':<12} {'ultima (s)':>10} {'consultas terminadas':>21}")
+        for nombre, cancelar in (('sin cancelar', False), ('cancelando', True)):
+            segundos, mostradas = asyncio.run(escenario_busquedas(cancelar))
+            assert mostradas[-1] == (busquedas - 1, filas), 'la ultima busqueda se tiene que mostrar'
+            print(f"{nombre:<12} {segundos:>10.2f} {len(mostradas):>21}")
+        assert len(mostradas) == 1, 'las busquedas anteriores se tienen que cancelar'
+
+        en_cola = sorted(cola * 1000 for cola, _ in tareas.latencias)
+        ejecutando = sorted(ejecucion * 1000 for _, ejecucion in tareas.latencias)
+        print(f"tareas.latencias: {len(en_cola)} consultas, cola mediana {en_cola[len(en_cola) // 2]:.1f} ms "
+              f"(max {en_cola[-1]:.1f}), ejecucion mediana {ejecutando[len(ejecutando) // 2]:.1f} ms "
+              f"(max {ejecutando[-1]:.1f})")
+    finally:
+        borrar_base_temporal(engine, directorio)
+
+
+def benchmark_incremental(filas=100000, intervalo=0.08):
+    '''Escribe letra a letra un texto en los buscadores de clientes, vehiculos y recambios con
+       "filas" filas de cada uno: compara consultar la base de datos en cada tecla con refinar en
+       memoria (busqueda.BusquedaIncremental), comprobando que los resultados son los mismos, y
+       simula el tecleo con una tecla cada "intervalo" segundos para contar las consultas lanzadas'''
+    engine, directorio = base_temporal(clientes=filas)
+    letras = 'BCDFGHJKLMNPRSTVWXYZ'
+    nombres = ('Líquido de frenos', 'Filtro de aceite', 'Pastillas de freno', 'Bujía', 'Correa de distribución')
+    ahora = datetime.now()
+    with engine.begin() as conexion:
+        conexion.execute(insert(Vehiculo.__table__), [
+            {'fecha_alta': ahora, 'marca': 'Seat', 'modelo': 'Ibiza', 'kilometros': 100000, 'id_cliente': i + 1,
+             'matricula': f'{i % 10000:04d} {letras[i // 10000 % 20]}{letras[i // 200000 % 20]}{letras[i % 20]}'}
+            for i in range(filas)])
+        conexion.execute(insert(Recambio.__table__), [
+            {'fecha_alta': ahora, 'nombre_recambio': f'{nombres[i % 5]} {i}', 'descripcion': f'referencia R-{i % 997}',
+             'categoria': 'Frenos', 'subcategoria': f'subcategoria {i % 50}'}
+            for i in range(filas)])
+
+    buscadores = (
+        ('clientes', busqueda.buscar_clientes, busqueda.coincide_cliente, 'cliente 99999'),
+        ('vehiculos', busqueda.buscar_vehiculos, busqueda.coincide_vehiculo, '9999 LBZ'),
+        ('recambios', busqueda.buscar_recambios, busqueda.coincide_recambio, 'liquido de frenos 9999'),
+    )
+    print(f'\n > Busqueda mientras se escribe ({filas} filas, ms por tecla)')
+    print(f"{'buscador':<10} {'teclas':>6} {'bd max':>8} {'bd total':>9} {'ahora max':>10} {'ahora total':>12} {'en memoria':>11}")
+    sesion = sessionmaker(bind=engine)()
+    try:
+        for nombre, buscar, coincide, texto in buscadores:
+            antes, ahora_ms = [], []
+            incremental = busqueda.BusquedaIncremental(coincide)
+            for letra in range(1, len(texto) + 1):
+                parcial = texto[:letra]
+                # antes: cada tecla (o cada click en buscar) va a la base de datos
+                inicio = time.perf_counter()
+                resultados, cursor = buscar(sesion, parcial)
+                antes.append((time.perf_counter() - inicio) * 1000)
+
+                inicio = time.perf_counter()
+                refinados = incremental.refinar(parcial)
+                if refinados is None:
+                    refinados, siguiente = buscar(sesion, parcial, tamanio=busqueda.FILAS_REFINABLES)
+                    incremental.guardar(parcial, refinados, siguiente)
+                ahora_ms.append((time.perf_counter() - inicio) * 1000)
+                # el orden de los recambios refinados es el de la relevancia anterior: se comparan los conjuntos
+                if incremental.completa:
+                    completos, _ = buscar(sesion, parcial, tamanio=None)
+                    assert sorted(id(fila) for fila in refinados) == sorted(id(fila) for fila in completos), \
+                        f'{nombre} "{parcial}": los resultados refinados no coinciden'
+            print(f"{nombre:<10} {len(texto):>6} {max(antes):>8.1f} {sum(antes):>9.1f} "
+                  f"{max(ahora_ms):>10.1f} {sum(ahora_ms):>12.1f} {incremental.refinadas:>11}")
+
+        # el mismo texto (pulsar Buscar) o un alta en la tabla buscada vuelven a la base de datos
+        incremental = busqueda.BusquedaIncremental(busqueda.coincide_cliente, ('clientes',))
+        for parcial in ('cliente 9999', 'cliente 9999'):
+            assert incremental.refinar(parcial) is None, 'el mismo texto se tiene que volver a consultar'
+            incremental.guardar(parcial, *busqueda.buscar_clientes(sesion, parcial, tamanio=busqueda.FILAS_REFINABLES))
+        sesion.add(Cliente(fecha_alta=ahora, nombre='cliente 99999 nuevo', telefono='600000000',
+                           direccion='calle', correo='nuevo@taller.es'))
+        sesion.commit()
+        assert incremental.refinar('cliente 99999') is None, 'despues de un alta en clientes se tiene que volver a consultar'
+        resultados, cursor = busqueda.buscar_clientes(sesion, 'cliente 99999', tamanio=busqueda.FILAS_REFINABLES)
+        incremental.guardar('cliente 99999', resultados, cursor)
+        assert incremental.refinar('cliente 99999 n') == [cliente for cliente in resultados if cliente.nombre.endswith('nuevo')]
+
+        # tecleo real: una tecla cada "intervalo" segundos, cada una cancela la busqueda que esperaba su pausa
+        async def teclear(texto):
+            loop = asyncio.get_running_loop()
+            pagina = SimpleNamespace(run_task=lambda corrutina, *args: asyncio.run_coroutine_threadsafe(
+                corrutina(*args), loop))
+            ventana = tareas.Tareas(pagina)
+            incremental = busqueda.BusquedaIncremental(busqueda.coincide_cliente)
+            respuestas = []
+
+            async def buscar(parcial):
+                await asyncio.sleep(busqueda.PAUSA_TECLEO)
+                inicio = time.perf_counter()
+                resultados = incremental.refinar(parcial)
+                if resultados is None:
+                    resultados, cursor = await tareas.consultar(
+                        busqueda.buscar_clientes, parcial, None, busqueda.FILAS_REFINABLES, engine=engine)
+                    incremental.guardar(parcial, resultados, cursor)
+                respuestas.append((parcial, (time.perf_counter() - inicio) * 1000))
+
+            for letra in range(1, len(texto) + 1):
+                ventana.lanzar('busqueda', buscar, texto[:letra])
+                await asyncio.sleep(intervalo)
+            # el usuario se para a mirar y despues corrige el final
+            await asyncio.sleep(busqueda.PAUSA_TECLEO + 0.2)
+            for parcial in (texto + '9', texto):
+                ventana.lanzar('busqueda', buscar, parcial)
+                await asyncio.sleep(busqueda.PAUSA_TECLEO + 0.2)
+            return incremental, respuestas
+
+        incremental, respuestas = asyncio.run(teclear('cliente 9999'))
+        print(f"tecleo de 'cliente 9999' + '9' + borrar (una tecla cada {intervalo * 1000:.0f} ms, pausa "
+              f"{busqueda.PAUSA_TECLEO * 1000:.0f} ms): {incremental.consultadas} consultas, "
+              f"{incremental.refinadas} en memoria; respuestas tras la pausa: "
+              + ', '.join(f"'{parcial}' {ms:.1f} ms" for parcial, ms in respuestas))
+    finally:
+        sesion.close()
+        borrar_base_temporal(engine, directorio)
+
+
+def benchmark_cache(clientes=10000, recambios=20000, aperturas=100, altas_cada=20):
+    '''Simula "aperturas" aperturas de las ventanas de vehiculo nuevo / ingreso nuevo / registro
+       (lista de clientes y de recambios) dando de alta un cliente cada "altas_cada": compara cargar
+       los objetos con query().all() como antes con cache_consultas, y comprueba que cada alta se ve
+       en la siguiente apertura (invalidacion por tabla) sin perder los recambios guardados'''
+    print(f'\n > Cache de consultas ({clientes} clientes, {recambios} recambios, {aperturas} aperturas)')
+    engine, directorio = base_temporal(clientes=clientes)
+    ahora = datetime.now()
+    with engine.begin() as conexion:
+        conexion.execute(insert(Recambio.__table__), [
+            {'fecha_alta': ahora, 'nombre_recambio': f'recambio {i}', 'descripcion': 'bench',
+             'categoria': 'Frenos', 'subcategoria': 'Pastillas'} for i in range(recambios)])
+    cache = cache_consultas.CacheConsultas()
+    Sesion = sessionmaker(bind=engine)
+    try:
+        for nombre in ('antes', 'cache'):
+            # el contador de altas sigue entre las dos pasadas para que los nombres no se repitan
+            inicio = time.perf_counter()
+            for apertura in range(aperturas):
+                with Sesion() as sesion:
+                    if apertura % altas_cada == 0:
+                        with redirect_stdout(io.StringIO()):  # el constructor de Cliente imprime
+                            sesion.add(Cliente(fecha_alta=ahora, nombre=f'alta {nombre} {apertura}', telefono='600000000',
+                                               direccion='calle', correo='alta@taller.es'))
+                            sesion.commit()
+                    if nombre == 'antes':
+                        nombres = [cliente.nombre for cliente in sesion.query(Cliente).all()]
+                        sesion.query(Recambio).all()
+                    else:
+                        nombres = [cliente.nombre for cliente in cache.consultar(sesion, select(Cliente.nombre))]
+                        cache.consultar(sesion, select(Recambio.id_recambio, Recambio.nombre_recambio))
+                    assert f'alta {nombre} {apertura - apertura % altas_cada}' in nombres, 'el alta se tiene que ver'
+            segundos = time.perf_counter() - inicio
+            print(f"{nombre:>6}: {segundos / aperturas * 1000:>7.2f} ms por apertura")
+        estadisticas = cache.estadisticas()
+        print(f"cache: {estadisticas['aciertos']} aciertos, {estadisticas['fallos']} fallos "
+              f"({estadisticas['tasa']:.0%}), {estadisticas['invalidaciones']} invalidaciones")
+        # las altas de clientes solo invalidan la lista de clientes, no la de recambios
+        assert estadisticas['invalidaciones'] == aperturas // altas_cada - 1
+    finally:
+        borrar_base_temporal(engine, directorio)
+
+
+# Fichero en el que benchmark_arranque acumula sus medidas, una linea JSON por ejecucion
+HISTORIAL_ARRANQUE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'historial_arranque.jsonl')
+
+# Proceso hijo de benchmark_arranque: compila y ejecuta app.py como lo hace "python app.py" (sin .pyc)
+# sin arrancar Flet, construye la vista de la ruta y su mensaje "add" e imprime los tiempos en JSON
+_ARRANQUE = """
+import sys, time, json
+inicio = time.perf_counter()
+espacio = {'__name__': 'arranque', '__file__': 'app.py'}
+with open('app.py', encoding='utf-8') as fuente:
+    exec(compile(fuente.read(), 'app.py', 'exec'), espacio)
+if sys.argv[2] == 'todas':
+    import importlib
+    for definicion in espacio['RUTAS'].values():
+        importlib.import_module(definicion['vista'].rpartition('.')[0])
+importada = time.perf_counter()
+import navegacion
+navegacion.CacheVistas(None, espacio['RUTAS']).obtener(sys.argv[1])._build_add_commands()
+print(json.dumps({'fin': time.time(), 'app': importada - inicio, 'vista': time.perf_counter() - importada,
+                  'modulos': len(sys.modules)}))
+"""
+
+
+# metodo para ejecutar una vez el arranque en un proceso nuevo
+def _arrancar(ruta, ventanas, url):
+    lanzado = time.time()
+    salida = subprocess.run([sys.executable, '-c', _ARRANQUE, ruta, ventanas], capture_output=True,
+                            text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__)),
+                            env=dict(os.environ, TALLER_DB_URL=url))
+    medida = json.loads(salida.stdout.splitlines()[-1])
+    medida['primer_frame'] = medida.pop('fin') - lanzado
+    return medida
+
+
+# metodo para obtener lo que tarda en importar app.py y cada modulo que importa segun python -X importtime
+def _importtime():
+    '''Devuelve (microsegundos acumulados de app, lista de (microsegundos acumulados, modulo) de los
+       modulos que importa app.py directamente)'''
+    salida = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import app'], capture_output=True,
+                            text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+    directos = []
+    for linea in salida.stderr.splitlines():
+        campos = linea[len('import time:'):].split('|')
+        if not linea.startswith('import time:') or not campos[0].strip().isdigit():
+            continue
+        # importtime escribe cada modulo despues de los que importa, sangrados dos espacios por nivel
+        sangria = len(campos[2]) - len(campos[2].lstrip()) - 1
+        if sangria == 0 and campos[2].strip() != 'app':
+            directos = []
+        elif sangria == 0:
+            return int(campos[1]), sorted(directos, reverse=True)
+        elif sangria == 2:
+            directos.append((int(campos[1]), campos[2].strip()))
+    raise RuntimeError('python -X importtime no ha medido app')
+
+
+# metodo para obtener la version del codigo con la que se mide
+def _version_git():
+    return subprocess.run(['git', 'describe', '--always', '--dirty'], capture_output=True, text=True,
+                          cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or 'desconocida'
+
+
+# metodo para medir el arranque de la aplicacion y guardar la medida en el historial
+def benchmark_arranque(repeticiones=10, ruta='/inicio', historial=HISTORIAL_ARRANQUE):
+    '''Mide en procesos nuevos (mediana de "repeticiones") el tiempo de importar app.py, de construir
+       la vista de "ruta" y el total desde lanzar el interprete hasta tener el mensaje del primer frame,
+       importando solo el modulo de la ventana de la ruta (ahora) y todos los de RUTAS (como cuando
+       estaban en app.py). Muestra los modulos que mas tarda la importacion segun -X importtime y
+       añade la medida a "historial" para compararla con las de versiones anteriores'''
+    print(f'\n > Arranque hasta el primer frame de {ruta} (ms, mediana de {repeticiones} procesos)')
+    print(f"{'ventanas':>10} {'app.py':>8} {'vista':>8} {'primer frame':>13} {'modulos':>8}")
+    veces = {'ruta': [], 'todas': []}
+    # la vista consulta la base de datos: se abre una copia de database/mobile.db, no el fichero del repositorio
+    directorio = tempfile.mkdtemp(prefix='taller_bench_')
+    try:
+        copia = shutil.copy(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'database', 'mobile.db'), directorio)
+        for _ in range(repeticiones):
+            for ventanas in veces:  # alternados, para que los cambios de carga de la maquina afecten a los dos
+                veces[ventanas].append(_arrancar(ruta, ventanas, f'sqlite:///{copia}'))
+    finally:
+        shutil.rmtree(directorio, ignore_errors=True)
+    medidas = {}
+    for ventanas, medida in veces.items():
+        medida = medidas[ventanas] = {campo: statistics.median(vez[campo] for vez in medida) for campo in medida[0]}
+        print(f"{ventanas:>10} {medida['app'] * 1000:>8.1f} {medida['vista'] * 1000:>8.1f} "
+              f"{medida['primer_frame'] * 1000:>13.1f} {medida['modulos']:>8.0f}")
+
+    total, directos = _importtime()
+    print('\nimport app segun -X importtime (ms acumulados de lo que importa app.py directamente)')
+    for acumulado, nombre in directos:
+        print(f"{nombre:>20} {acumulado / 1000:>8.1f}")
+    print(f"{'app (total)':>20} {total / 1000:>8.1f}")
+
+    entrada = {'fecha': datetime.now().isoformat(timespec='seconds'), 'version': _version_git(),
+               'python': sys.version.split()[0], 'ruta': ruta,
+               'app_ms': round(medidas['ruta']['app'] * 1000, 1),
+               'vista_ms': round(medidas['ruta']['vista'] * 1000, 1),
+               'primer_frame_ms': round(medidas['ruta']['primer_frame'] * 1000, 1),
+               'importtime_app_ms': round(total / 1000, 1)}
+    anteriores = []
+    if os.path.exists(historial):
+        with open(historial, encoding='utf-8') as archivo:
+            anteriores = [json.loads(linea) for linea in archivo if linea.strip()]
+    anteriores = [anterior for anterior in anteriores if anterior['ruta'] == ruta]
+    if anteriores:
+        anterior = anteriores[-1]
+        print(f"\nfrente a {anterior['version']} ({anterior['fecha']}): primer frame "
+              f"{anterior['primer_frame_ms']:.1f} -> {entrada['primer_frame_ms']:.1f} ms, app.py "
+              f"{anterior['app_ms']:.1f} -> {entrada['app_ms']:.1f} ms")
+    with open(historial, 'a', encoding='utf-8') as archivo:
+        archivo.write(json.dumps(entrada, ensure_ascii=False) + '\n')
+    print(f'medida añadida a {os.path.basename(historial)}')
+
+
+# metodo para leer las tablas, indices y triggers de una base de datos
+def _esquema_sqlite(engine):
+    with engine.connect() as conexion:
+        return {fila[0]: fila[1] for fila in conexion.exec_driver_sql(
+            "SELECT name, sql FROM sqlite_master WHERE name NOT IN ('versiones_esquema', 'sqlite_sequence')")}
+
+
+# metodo para medir lo que cuesta preparar la base de datos en cada arranque
+def benchmark_esquema(clientes=10000, arranques=20):
+    '''Compara lo que cuesta en cada arranque preparar una base de datos que ya esta al dia llamando a
+       create_all, migrar, crear_indices, crear_indices_busqueda y crear_resumenes (como antes) con
+       esquema.actualizar, que solo lee la version del esquema. Mide tambien la primera actualizacion
+       de una base de datos anterior a versiones_esquema y la de una nueva, y comprueba que las dos
+       quedan con el mismo esquema'''
+    engine, directorio = base_temporal(clientes=clientes)
+
+    def como_antes(arranque):
+        db.Base_mobile.metadata.create_all(arranque)
+        models.migrar(arranque)
+        models.crear_indices(arranque)
+        busqueda.crear_indices_busqueda(arranque)
+        resumenes.crear_resumenes(arranque)
+
+    def medir(preparar, url, veces):
+        tiempos = []
+        for _ in range(veces):
+            arranque = db.crear_engine(url)  # cada arranque abre sus conexiones
+            with contar_consultas(arranque) as sentencias:
+                inicio = time.perf_counter()
+                resultado = preparar(arranque)
+                tiempos.append((time.perf_counter() - inicio) * 1000)
+            arranque.dispose()
+        return statistics.median(tiempos), sentencias[0], resultado
+
+    print(f'\n > Preparar la base de datos al arrancar ({clientes} clientes, mediana de {arranques} arranques)')
+    print(f"{'':>28} {'ms':>8} {'sentencias':>11}")
+    try:
+        antes = _esquema_sqlite(engine)
+        ms, sentencias, _ = medir(como_antes, engine.url, arranques)
+        print(f"{'como antes (al dia)':>28} {ms:>8.2f} {sentencias:>11}")
+        ms, sentencias, aplicadas = medir(esquema.actualizar, engine.url, 1)
+        assert aplicadas == [nombre for _, nombre, _ in esquema.MIGRACIONES]
+        print(f"{'primera vez (sin version)':>28} {ms:>8.2f} {sentencias:>11}")
+        assert _esquema_sqlite(engine) == antes, 'las migraciones tienen que poder aplicarse sobre una base de datos al dia'
+        ms, sentencias, aplicadas = medir(esquema.actualizar, engine.url, arranques)
+        assert aplicadas == []
+        print(f"{'esquema.actualizar (al dia)':>28} {ms:>8.2f} {sentencias:>11}")
+
+        nueva = f"sqlite:///{os.path.join(directorio, 'nueva.db')}"
+        ms, sentencias, _ = medir(esquema.actualizar, nueva, 1)
+        print(f"{'base de datos nueva':>28} {ms:>8.2f} {sentencias:>11}")
+        engine_nueva = db.crear_engine(nueva)
+        with engine_nueva.connect() as conexion:
+            assert esquema.version(conexion) == esquema.VERSION
+        assert _esquema_sqlite(engine_nueva) == antes, 'una base de datos nueva tiene que quedar igual que una actualizada'
+        engine_nueva.dispose()
+    finally:
+        borrar_base_temporal(engine, directorio)
+
+
+# Medidas de referencia de benchmark_escala (minimo, mediana y calibracion en ms por escala y caso) y
+# cuanto puede pasar el minimo de lo esperado (en proporcion y en ms, para no avisar por el ruido de
+# las muy rapidas)
+REFERENCIAS_ESCALA = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'referencias_escala.json')
+TOLERANCIA_REGRESION = float(os.environ.get('TALLER_TOLERANCIA_REGRESION', 0.5))
+TOLERANCIA_REGRESION_MS = 1.0
+
+# Escalas de datos_prueba que mide benchmark_escala (la de 1m se genera en unos minutos la primera vez)
+ESCALAS_BENCHMARK = os.environ.get('TALLER_ESCALAS', '1k,100k').split(',')
+
+
+# metodo para cronometrar una funcion repitiendola como pytest-benchmark
+def cronometrar(funcion, rondas_minimas=5, segundos_minimos=0.5, rondas_maximas=2000):
+    '''Llama una vez a funcion para calentar las caches de sqlite y del sistema y la repite hasta
+       hacer rondas_minimas y segundos_minimos (o rondas_maximas); devuelve un diccionario con el
+       minimo, la mediana, la media y la desviacion en ms y las rondas'''
+    funcion()
+    tiempos = []
+    empezado = time.perf_counter()
+    while len(tiempos) < rondas_maximas and (len(tiempos) < rondas_minimas
+                                             or time.perf_counter() - empezado < segundos_minimos):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    return {'min': min(tiempos), 'mediana': statistics.median(tiempos), 'media': statistics.mean(tiempos),
+            'desviacion': statistics.stdev(tiempos) if len(tiempos) > 1 else 0.0, 'rondas': len(tiempos)}
+
+
+# metodo con una carga fija de sqlite y python con la que se mide la velocidad de la maquina
+def _calibracion():
+    conexion = sqlite3.connect(':memory:')
+    conexion.execute('CREATE TABLE t (id INTEGER PRIMARY KEY, nombre TEXT)')
+    conexion.executemany('INSERT INTO t (nombre) VALUES (?)', ((f'cliente {i}',) for i in range(2000)))
+    conexion.execute("SELECT count(*) FROM t WHERE nombre LIKE '%99%'").fetchone()
+    conexion.close()
+    return sum(len(str(i)) for i in range(20000))
+
+
+# metodo para preparar los recorridos de las ventanas que mide benchmark_escala
+def casos_escala(Sesion):
+    '''Devuelve un diccionario caso -> funcion sin argumentos que hace con una sesion nueva lo mismo
+       que la ventana: la primera pagina de cada busqueda (busqueda.FILAS_REFINABLES filas, como al
+       escribir) leyendo lo que muestran sus tarjetas, los ingresos del vehiculo con mas ingresos y
+       los registros del ingreso con mas lineas. Los textos y los ids se eligen de los datos, asi que
+       con los mismos datos de datos_prueba los casos son siempre los mismos'''
+    with Sesion() as sesion:
+        id_vehiculo = sesion.execute(text(
+            'SELECT id_vehiculo FROM ingresos GROUP BY id_vehiculo ORDER BY count(*) DESC, id_vehiculo LIMIT 1')).scalar()
+        id_ingreso = sesion.execute(text(
+            'SELECT id_ingreso FROM registros GROUP BY id_ingreso ORDER BY count(*) DESC, id_ingreso LIMIT 1')).scalar()
+        nombre = sesion.execute(text('SELECT nombre FROM clientes ORDER BY id_cliente DESC LIMIT 1')).scalar()
+        matricula = sesion.execute(text(
+            'SELECT matricula FROM vehiculos ORDER BY id_vehiculo LIMIT 1 OFFSET (SELECT count(*) / 2 FROM vehiculos)')).scalar()
+
+    def buscar_cliente(texto):
+        # mismo recorrido que VentanaCliente.cargar_pagina y rellenar_tarjeta
+        with Sesion() as sesion:
+            clientes, _ = busqueda.buscar_clientes(sesion, texto, tamanio=busqueda.FILAS_REFINABLES)
+            return [(cliente.nombre, cliente.telefono, cliente.correo) for cliente in clientes]
+
+    def buscar_vehiculo(texto):
+        # mismo recorrido que VentanaVehiculo.cargar_pagina y rellenar_tarjeta
+        with Sesion() as sesion:
+            vehiculos, _ = busqueda.buscar_vehiculos(sesion, texto, tamanio=busqueda.FILAS_REFINABLES)
+            return [(vehiculo.matricula, vehiculo.clientes.nombre) for vehiculo in vehiculos]
+
+    def buscar_recambio(texto, categoria=None):
+        # mismo recorrido que VentanaRecambios.cargar_pagina y rellenar_tarjeta
+        with Sesion() as sesion:
+            recambios, _ = busqueda.buscar_recambios(sesion, texto, categoria, tamanio=busqueda.FILAS_REFINABLES)
+            return [(recambio.nombre_recambio, recambio.descripcion) for recambio in recambios]
+
+    def ingresos_vehiculo():
+        # mismas consultas que VentanaVerIngresosVehiculo.ingresos_vehiculo
+        with Sesion() as sesion:
+            ingresos = sesion.query(Ingreso).filter_by(id_vehiculo=id_vehiculo).all()
+            vehiculos = sesion.query(Vehiculo).filter_by(id_vehiculo=id_vehiculo).all()
+            return [(ingreso.id_ingreso, ingreso.fecha_ingreso, vehiculo.matricula)
+                    for ingreso in ingresos for vehiculo in vehiculos]
+
+    def lista_registros():
+        # mismo recorrido que VentanaVerRegistrosIngreso.listaRegistrosListView
+        with Sesion() as sesion:
+            ingreso = consultas.ingreso_con_registros(sesion, id_ingreso)
+            return [(registro.recambios.nombre_recambio, registro.total_venta) for registro in ingreso.registros]
+
+    return {
+        'buscar_cliente vacio': lambda: buscar_cliente(''),
+        'buscar_cliente frecuente': lambda: buscar_cliente('garcía'),
+        'buscar_cliente nombre': lambda: buscar_cliente(nombre),
+        'buscar_vehiculo parcial': lambda: buscar_vehiculo(matricula[:3]),
+        'buscar_vehiculo matricula': lambda: buscar_vehiculo(matricula),
+        'buscar_recambio texto': lambda: buscar_recambio('filtro aceite'),
+        'buscar_recambio categoria': lambda: buscar_recambio('', 'Frenos'),
+        'ingresos_vehiculo': ingresos_vehiculo,
+        'listaRegistrosListView': lista_registros,
+    }
+
+
+# metodo para medir las consultas de las ventanas con los datos sinteticos y comparar con las referencias
+def benchmark_escala(escalas=None, referencias=REFERENCIAS_ESCALA, guardar=None):
+    '''Mide cada caso de casos_escala sobre la base de datos de datos_prueba de cada escala
+       (TALLER_ESCALAS, por defecto 1k y 100k) y compara su minimo (la medida que menos cambia con la
+       carga del resto de la maquina) con el de referencias. Antes de cada caso se cronometra una carga
+       fija (_calibracion) y la referencia se escala por lo que ha cambiado su tiempo, asi que una
+       maquina mas lenta o mas cargada que la de la referencia no cuenta como regresion: si el minimo
+       pasa del esperado en mas de TOLERANCIA_REGRESION y TOLERANCIA_REGRESION_MS se marca como
+       regresion y al terminar falla (AssertionError). Los casos sin referencia la guardan; con TALLER_GUARDAR_REFERENCIAS=1
+       (o guardar=True) se sustituyen todas por las medidas nuevas, por ejemplo al cambiar de maquina'''
+    escalas = escalas or ESCALAS_BENCHMARK
+    guardar = os.environ.get('TALLER_GUARDAR_REFERENCIAS') == '1' if guardar is None else guardar
+    guardadas = {}
+    if os.path.exists(referencias):
+        with open(referencias, encoding='utf-8') as archivo:
+            guardadas = json.load(archivo)
+    regresiones, nuevas = [], 0
+    for escala in escalas:
+        engine = db.crear_engine(f'sqlite:///{datos_prueba.base_datos(escala)}')
+        Sesion = sessionmaker(bind=engine)
+        with engine.connect() as conexion:
+            ingresos = conexion.exec_driver_sql('SELECT count(*) FROM ingresos').scalar()
+        referencias_escala = guardadas.setdefault('escalas', {}).setdefault(escala, {})
+        print(f'\n > Consultas de las ventanas con {ingresos} ingresos ({escala}), ms')
+        print(f"{'caso':>26} {'min':>8} {'mediana':>8} {'media':>8} {'desv':>7} {'rondas':>6} {'esperado':>9}")
+        try:
+            for caso, funcion in casos_escala(Sesion).items():
+                calibracion = cronometrar(_calibracion, segundos_minimos=0.2)['min']
+                medida = cronometrar(funcion)
+                referencia = referencias_escala.get(caso)
+                esperado, aviso = '', ''
+                if referencia is not None:
+                    esperado = referencia['min'] * calibracion / referencia['calibracion']
+                    aviso = f"{medida['min'] / esperado - 1:+.0%}"
+                    if (medida['min'] > esperado * (1 + TOLERANCIA_REGRESION)
+                            and medida['min'] - esperado > TOLERANCIA_REGRESION_MS):
+                        aviso += ' REGRESION'
+                        regresiones.append(f"{escala} {caso}: minimo {medida['min']:.2f} ms, se esperaba {esperado:.2f}")
+                    esperado = f'{esperado:.2f}'
+                if referencia is None or guardar:
+                    referencias_escala[caso] = {'min': round(medida['min'], 3), 'mediana': round(medida['mediana'], 3),
+                                                'calibracion': round(calibracion, 3)}
+                    nuevas += 1
+                print(f"{caso:>26} {medida['min']:>8.2f} {medida['mediana']:>8.2f} {medida['media']:>8.2f} "
+                      f"{medida['desviacion']:>7.2f} {medida['rondas']:>6} {esperado:>9} {aviso}")
+        finally:
+            engine.dispose()
+
+    if nuevas:
+        guardadas.update({'fecha': datetime.now().isoformat(timespec='seconds'), 'version': _version_git(),
+                          'python': sys.version.split()[0], 'maquina': platform.machine()})
+        with open(referencias, 'w', encoding='utf-8') as archivo:
+            json.dump(guardadas, archivo, indent=2, ensure_ascii=False, sort_keys=True)
+        print(f'\n{nuevas} referencias guardadas en {os.path.basename(referencias)}')
+    assert not regresiones, 'regresiones frente a las referencias: ' + '; '.join(regresiones)
+
+
+BENCHMARKS = {
+    'sesiones': benchmark_sesiones,
+    'perfiles': benchmark_perfiles,
+    'indices': benchmark_indices,
+    'matriculas': benchmark_matriculas,
+    'consultas': benchmark_consultas,
+    'paginacion': benchmark_paginacion,
+    'virtual': benchmark_virtual,
+    'navegacion': benchmark_navegacion,
+    'catalogo': benchmark_catalogo,
+    'carga': benchmark_carga,
+    'importacion': benchmark_importacion,
+    'exportacion': benchmark_exportacion,
+    'resumenes': benchmark_resumenes,
+    'importes': benchmark_importes,
+    'kilometros': benchmark_kilometros,
+    'tareas': benchmark_tareas,
+    'incremental': benchmark_incremental,
+    'cache': benchmark_cache,
+    'arranque': benchmark_arranque,
+    'esquema': benchmark_esquema,
+    'escala': benchmark_escala,
+}
+
+
+if __name__ == '__main__':
+    for nombre in (sys.argv[1:] or BENCHMARKS):
+        BENCHMARKS[nombre]()
@@ -0,0 +1,310 @@
+# Motores de busqueda de texto sobre la base de datos del taller
+
+import os
+import re
+import unicodedata
+from functools import lru_cache
+from sqlalchemy import text, table, column, select, true
+from sqlalchemy.orm import joinedload
+from models import Cliente, Vehiculo, Recambio, Ingreso
+from consultas import pagina_keyset, fecha_orden, TAMANIO_PAGINA
+from catalogo import catalogo
+import cache_consultas
+import db
+
+'''Los recambios se buscan con una tabla virtual FTS5 (indice de texto completo de sqlite)
+   y las matriculas con una tabla FTS5 de trigramas, ambas sincronizadas mediante triggers,
+   en lugar de ilike('%...%') que obliga a recorrer la tabla entera en cada busqueda'''
+
+# Segundos sin escribir en el buscador antes de lanzar la busqueda (cada tecla reinicia la espera)
+PAUSA_TECLEO = float(os.environ.get('TALLER_PAUSA_BUSQUEDA', 0.3))
+
+# Resultados que se piden en la primera pagina de una busqueda mientras se escribe: si caben todos,
+# las teclas siguientes se resuelven en memoria (la lista solo dibuja las tarjetas visibles)
+FILAS_REFINABLES = int(os.environ.get('TALLER_FILAS_REFINABLES', 200))
+
+# Tabla virtual FTS5 de recambios (external content: el texto se lee de la tabla recambios)
+# unicode61 remove_diacritics 2 pliega acentos y mayusculas: "liquido" encuentra "Líquido"
+# prefix='2 3' mantiene indices de prefijos para que "fil*" no recorra todo el vocabulario
+DDL_RECAMBIOS_FTS = [
+    '''CREATE VIRTUAL TABLE IF NOT EXISTS recambios_fts USING fts5(
+           nombre_recambio, descripcion, categoria, subcategoria,
+           content='recambios', content_rowid='id_recambio',
+           tokenize='unicode61 remove_diacritics 2', prefix='2 3')''',
+    '''CREATE TRIGGER IF NOT EXISTS recambios_fts_ai AFTER INSERT ON recambios BEGIN
+           INSERT INTO recambios_fts(rowid, nombre_recambio, descripcion, categoria, subcategoria)
+           VALUES (new.id_recambio, new.nombre_recambio, new.descripcion, new.categoria, new.subcategoria);
+       END''',
+    '''CREATE TRIGGER IF NOT EXISTS recambios_fts_ad AFTER DELETE ON recambios BEGIN
+           INSERT INTO recambios_fts(recambios_fts, rowid, nombre_recambio, descripcion, categoria, subcategoria)
+           VALUES ('delete', old.id_recambio, old.nombre_recambio, old.descripcion, old.categoria, old.subcategoria);
+       END''',
+    '''CREATE TRIGGER IF NOT EXISTS recambios_fts_au AFTER UPDATE ON recambios BEGIN
+           INSERT INTO recambios_fts(recambios_fts, rowid, nombre_recambio, descripcion, categoria, subcategoria)
+           VALUES ('delete', old.id_recambio, old.nombre_recambio, old.descripcion, old.categoria, old.subcategoria);
+           INSERT INTO recambios_fts(rowid, nombre_recambio, descripcion, categoria, subcategoria)
+           VALUES (new.id_recambio, new.nombre_recambio, new.descripcion, new.categoria, new.subcategoria);
+       END''',
+]
+
+# Tabla virtual FTS5 de trigramas con la matricula normalizada (mayusculas, sin espacios ni guiones)
+# El tokenizador trigram resuelve LIKE '%...%' con el indice cuando el patron tiene 3 o mas caracteres
+SQL_MATRICULA_NORMALIZADA = "upper(replace(replace({}.matricula, ' ', ''), '-', ''))"
+DDL_MATRICULAS_TRIGRAMAS = [
+    '''CREATE VIRTUAL TABLE IF NOT EXISTS vehiculos_matricula_fts USING fts5(
+           matricula, tokenize='trigram')''',
+    f'''CREATE TRIGGER IF NOT EXISTS vehiculos_matricula_fts_ai AFTER INSERT ON vehiculos BEGIN
+           INSERT INTO vehiculos_matricula_fts(rowid, matricula)
+           VALUES (new.id_vehiculo, {SQL_MATRICULA_NORMALIZADA.format('new')});
+       END''',
+    '''CREATE TRIGGER IF NOT EXISTS vehiculos_matricula_fts_ad AFTER DELETE ON vehiculos BEGIN
+           DELETE FROM vehiculos_matricula_fts WHERE rowid = old.id_vehiculo;
+       END''',
+    f'''CREATE TRIGGER IF NOT EXISTS vehiculos_matricula_fts_au AFTER UPDATE OF matricula ON vehiculos BEGIN
+           UPDATE vehiculos_matricula_fts SET matricula = {SQL_MATRICULA_NORMALIZADA.format('new')}
+           WHERE rowid = new.id_vehiculo;
+       END''',
+]
+
+# Columnas de las tablas virtuales que se usan en las consultas (rank es la puntuacion bm25)
+recambios_fts = table('recambios_fts', column('rowid'), column('recambios_fts'), column('rank'))
+matriculas_fts = table('vehiculos_matricula_fts', column('rowid'), column('matricula'))
+
+
+# metodo para crear los indices de busqueda en la base de datos
+def crear_indices_busqueda(engine):
+    '''Crea las tablas FTS5 y sus triggers si no existen; la primera vez indexa los recambios
+       y vehiculos que ya hubiera en las tablas (se puede llamar en cada arranque)
+
+    args
+    -engine: es el engine o una conexion con la transaccion abierta (ver db.transaccion)
+    '''
+    with db.transaccion(engine) as conexion:
+        existentes = {fila[0] for fila in conexion.execute(text(
+            "SELECT name FROM sqlite_master WHERE name IN ('recambios_fts', 'vehiculos_matricula_fts')"))}
+        for ddl in DDL_RECAMBIOS_FTS + DDL_MATRICULAS_TRIGRAMAS:
+            conexion.execute(text(ddl))
+        if 'recambios_fts' not in existentes:
+            conexion.execute(text("INSERT INTO recambios_fts(recambios_fts) VALUES ('rebuild')"))
+        if 'vehiculos_matricula_fts' not in existentes:
+            conexion.execute(text(
+                'INSERT INTO vehiculos_matricula_fts(rowid, matricula) '
+                f"SELECT id_vehiculo, {SQL_MATRICULA_NORMALIZADA.format('vehiculos')} FROM vehiculos"))
+
+
+# metodo para convertir el texto del usuario en una consulta FTS5
+def consulta_fts(texto):
+    '''Convierte el texto del buscador en una expresion MATCH de FTS5: cada palabra se busca
+       como prefijo y todas deben aparecer ("filtro ace" -> "filtro"* "ace"*).
+       Devuelve None si el texto no contiene ninguna palabra'''
+    palabras = re.findall(r'\w+', texto or '')
+    if not palabras:
+        return None
+    return ' '.join(f'"{palabra}"*' for palabra in palabras)
+
+
+# metodo para buscar recambios por texto, categoria y subcategoria
+def buscar_recambios(sesion, texto, categoria=None, subcategoria=None, cursor=None, tamanio=TAMANIO_PAGINA):
+    '''Devuelve una pagina de los recambios que coinciden con el texto y el cursor de la siguiente.
+       Con texto se ordenan por relevancia (bm25), sin texto los mas recientes primero
+
+    args
+    -sesion: es la sesion de base de datos con la que se consulta
+    -texto: es un string con las palabras a buscar en nombre, descripcion, categoria y subcategoria
+    -categoria: es un string con la categoria elegida en el desplegable, con o sin acentos (opcional)
+    -subcategoria: es un string con la subcategoria elegida en el desplegable (opcional)
+    -cursor, tamanio: paginacion, ver consultas.pagina_keyset
+    '''
+    consulta = sesion.query(Recambio)
+
+    expresion = consulta_fts(texto)
+    if expresion:
+        consulta = consulta.join(recambios_fts, recambios_fts.c.rowid == Recambio.id_recambio).filter(
+            recambios_fts.c.recambios_fts.op('MATCH')(expresion))
+        # rank de bm25 es negativo: cuanto menor, mas relevante
+        orden, descendente = (recambios_fts.c.rank, Recambio.id_recambio), False
+    else:
+        orden, descendente = (fecha_orden(Recambio.fecha_alta), Recambio.id_recambio), True
+
+    # Los filtros de los desplegables usan el indice (categoria, subcategoria, nombre_recambio);
+    # la categoria se traduce a la clave del catalogo, que es como se guarda en la tabla
+    if categoria:
+        consulta = consulta.filter(Recambio.categoria == (catalogo.categoria(categoria) or categoria))
+    if subcategoria:
+        consulta = consulta.filter(Recambio.subcategoria == subcategoria)
+    return pagina_keyset(consulta, orden, cursor, tamanio, descendente)
+
+
+# metodo para normalizar una matricula igual que el indice de trigramas
+def normalizar_matricula(matricula):
+    '''Quita espacios y guiones y pasa a mayusculas ("9859 bwk" -> "9859BWK"); tambien quita
+       los comodines de LIKE para que el texto del usuario se busque literalmente'''
+    return re.sub(r'[\s\-%_]', '', matricula or '').upper()
+
+
+# metodo para filtrar vehiculos por una parte de la matricula
+def filtro_matricula(matricula, columna=Vehiculo.id_vehiculo):
+    '''Devuelve la condicion que filtra las filas cuya columna de id de vehiculo apunta a una matricula
+       que contiene el texto dado, resuelta con el indice de trigramas (sin texto es siempre verdadera)'''
+    matricula = normalizar_matricula(matricula)
+    if not matricula:
+        return true()
+    return columna.in_(
+        select(matriculas_fts.c.rowid).where(matriculas_fts.c.matricula.like(f'%{matricula}%')))
+
+
+# metodo para buscar clientes por nombre
+def buscar_clientes(sesion, nombre, cursor=None, tamanio=TAMANIO_PAGINA):
+    '''Devuelve una pagina de los clientes cuyo nombre contiene el texto dado (los mas recientes
+       primero) y el cursor de la siguiente, ver consultas.pagina_keyset'''
+    consulta = sesion.query(Cliente).filter(Cliente.nombre.ilike(f'%{nombre or ""}%'))
+    return pagina_keyset(consulta, (fecha_orden(Cliente.fecha_alta), Cliente.id_cliente), cursor, tamanio)
+
+
+# metodo para buscar vehiculos por matricula junto con su cliente
+def buscar_vehiculos(sesion, matricula, cursor=None, tamanio=TAMANIO_PAGINA):
+    '''Devuelve una pagina de los vehiculos cuya matricula contiene el texto dado (los mas recientes
+       primero) y el cursor de la siguiente, con el cliente (vehiculo.clientes) cargado en la misma
+       sentencia para no lanzar una consulta por vehiculo'''
+    consulta = sesion.query(Vehiculo).options(joinedload(Vehiculo.clientes)).filter(filtro_matricula(matricula))
+    return pagina_keyset(consulta, (fecha_orden(Vehiculo.fecha_alta), Vehiculo.id_vehiculo), cursor, tamanio)
+
+
+# metodo para buscar ingresos por matricula junto con su cliente y vehiculo
+def buscar_ingresos_matricula(sesion, matricula, cursor=None, tamanio=TAMANIO_PAGINA):
+    '''Devuelve una pagina de los ingresos de los vehiculos cuya matricula contiene el texto dado
+       (los mas recientes primero) y el cursor de la siguiente, con el cliente y el vehiculo cargados'''
+    consulta = sesion.query(Ingreso).options(joinedload(Ingreso.clientes), joinedload(Ingreso.vehiculos)).filter(
+        filtro_matricula(matricula, Ingreso.id_vehiculo))
+    return pagina_keyset(consulta, (fecha_orden(Ingreso.fecha_ingreso), Ingreso.id_ingreso), cursor, tamanio)
+
+
+# Busqueda mientras se escribe: los resultados completos de la ultima busqueda se guardan y, si el
+# texto nuevo solo añade caracteres al final del anterior, sus resultados son un subconjunto de
+# aquellos, asi que se filtran en memoria con las mismas reglas que la consulta en lugar de volver
+# a la base de datos. Las funciones coincide_* reproducen cada filtro de SQL sobre un objeto
+
+# Conversion a minusculas de sqlite (lower() y LIKE solo pliegan las letras ASCII)
+_MINUSCULAS_ASCII = str.maketrans('ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')
+
+
+# metodo para traducir un patron LIKE de sqlite a una expresion regular
+@lru_cache(maxsize=64)
+def _patron_like(patron):
+    '''Devuelve la expresion regular equivalente a patron LIKE (% cualquier texto, _ un caracter),
+       sin distinguir mayusculas ASCII como sqlite'''
+    partes = ('.*' if caracter == '%' else '.' if caracter == '_' else re.escape(caracter)
+              for caracter in patron.translate(_MINUSCULAS_ASCII))
+    return re.compile(''.join(partes), re.DOTALL)
+
+
+# metodo para saber si un cliente cumple el filtro de buscar_clientes
+def coincide_cliente(cliente, nombre):
+    patron = _patron_like(f'%{nombre or ""}%')
+    return patron.fullmatch((cliente.nombre or '').translate(_MINUSCULAS_ASCII)) is not None
+
+
+# metodo para saber si un vehiculo cumple el filtro de buscar_vehiculos
+def coincide_vehiculo(vehiculo, matricula):
+    return normalizar_matricula(matricula) in vehiculo.matricula.replace(' ', '').replace('-', '').upper()
+
+
+# metodo para partir un texto en tokens como el tokenizador unicode61 de recambios_fts
+def _tokens_fts(texto):
+    '''Quita los acentos (remove_diacritics), pasa a minusculas y separa por todo lo que no sea
+       letra o numero ("Líquido de frenos" -> ["liquido", "de", "frenos"])'''
+    sin_acentos = ''.join(caracter for caracter in unicodedata.normalize('NFD', texto or '')
+                          if not unicodedata.combining(caracter))
+    return re.findall(r'[^\W_]+', sin_acentos.lower())
+
+
+# metodo para saber si los tokens de una columna contienen una frase de consulta_fts
+def _contiene_frase(tokens, frase):
+    '''Como "frase"* en FTS5: los tokens de la frase seguidos y el ultimo como prefijo'''
+    ultimo = len(frase) - 1
+    for inicio in range(len(tokens) - ultimo):
+        if tokens[inicio:inicio + ultimo] == frase[:ultimo] and tokens[inicio + ultimo].startswith(frase[ultimo]):
+            return True
+    return False
+
+
+# metodo para saber si un recambio cumple la expresion MATCH de buscar_recambios
+def coincide_recambio(recambio, texto):
+    '''Cada palabra del texto (una frase si tiene guiones bajos) tiene que estar en alguna de las
+       columnas indexadas; la categoria y la subcategoria ya las filtro la busqueda anterior'''
+    columnas = [_tokens_fts(valor) for valor in (
+        recambio.nombre_recambio, recambio.descripcion, recambio.categoria, recambio.subcategoria)]
+    for palabra in re.findall(r'\w+', texto or ''):
+        frase = _tokens_fts(palabra)
+        if frase and not any(_contiene_frase(tokens, frase) for tokens in columnas):
+            return False
+    return True
+
+
+class BusquedaIncremental:
+    '''Resultados de la ultima busqueda de una ventana, para refinarlos en memoria mientras se escribe
+
+    args
+    -coincide: es una de las funciones coincide_* (objeto, texto) con el filtro de la busqueda
+    -tablas: es una tupla con las tablas que lee la busqueda; si el proceso escribe en alguna, la
+     siguiente busqueda vuelve a la base de datos
+    '''
+
+    def __init__(self, coincide, tablas=()):
+        self.coincide = coincide
+        self.tablas = tablas
+        self.generacion = None  # invalidaciones de las tablas (cache_consultas) al leer filas
+        self.texto = None  # texto de la ultima busqueda
+        self.filtros = None  # resto de filtros de la ultima busqueda (categoria, subcategoria)
+        self.filas = []  # resultados leidos hasta ahora, en el orden de la consulta
+        self.completa = False  # True si filas tiene todos los resultados (no quedan paginas)
+        self.refinadas = 0  # busquedas resueltas en memoria
+        self.consultadas = 0  # busquedas que han ido a la base de datos
+
+    # metodo para guardar una pagina de resultados leida de la base de datos
+    def guardar(self, texto, filas, cursor, nueva=True, filtros=()):
+        '''Guarda la primera pagina de una busqueda (nueva) o añade las siguientes; cuando el cursor
+           es None ya se han leido todos los resultados y la busqueda se puede refinar
+
+        args
+        -texto: es el string buscado
+        -filas: es la lista de objetos de la pagina
+        -cursor: es el cursor de la pagina siguiente (None si no hay mas)
+        -nueva: es un booleano, True si es la primera pagina de la busqueda
+        -filtros: es una tupla con el resto de filtros de la busqueda
+        '''
+        texto = texto or ''
+        if nueva:
+            self.consultadas += 1
+            self.texto, self.filtros, self.filas = texto, filtros, []
+        elif (texto, filtros) != (self.texto, self.filtros):
+            return  # pagina de una busqueda que ya no es la ultima
+        self.filas.extend(filas)
+        self.completa = cursor is None
+
+    # metodo para descartar los resultados guardados
+    def olvidar(self):
+        '''La siguiente busqueda va a la base de datos (al pulsar Buscar: lo que se ve tiene que
+           estar al dia aunque otro proceso haya cambiado los datos)'''
+        self.texto, self.filas, self.completa = None, [], False
+
+    # metodo para resolver en memoria una busqueda que amplia la anterior
+    def refinar(self, texto, filtros=()):
+        '''Devuelve la lista de resultados de texto filtrando los de la busqueda anterior, en su
+           mismo orden (los recambios siguen ordenados por la relevancia del texto anterior), o None
+           si hay que consultar la base de datos: la anterior no esta completa, tiene otros filtros,
+           el texto nuevo no amplia el anterior (el mismo texto tambien se consulta) o se ha escrito
+           en sus tablas desde que se leyo'''
+        texto = texto or ''
+        generacion = cache_consultas.generacion(self.tablas)
+        if (not self.completa or filtros != self.filtros or self.texto is None or generacion != self.generacion
+                or len(texto) <= len(self.texto) or not texto.startswith(self.texto)):
+            # las filas guardadas se dejan de usar hasta que guardar reciba las de la consulta, que ya
+            # vera los cambios anteriores a esta generacion
+            self.completa = False
+            self.generacion = generacion
+            return None
+        self.filas = [fila for fila in self.filas if self.coincide(fila, texto)]
+        self.texto = texto
+        self.refinadas += 1
+        return self.filas
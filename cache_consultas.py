@@ -0,0 +1,209 @@
+'''Cache de los resultados de las consultas que se repiten (listas de clientes de los desplegables,
+   recambios...), compartida por todas las paginas del proceso
+
+   Se guarda el resultado (filas de columnas, no objetos del ORM, que pertenecen a una sesion) por
+   la sentencia SQL y sus parametros, con un maximo de entradas (se descarta la usada hace mas
+   tiempo) y un tiempo de vida (para ver los cambios que hacen otros procesos, como carga_clientes.py).
+   Los cambios de este proceso invalidan solo las entradas que leen las tablas modificadas: los
+   eventos after_flush y after_commit de las sesiones apuntan las tablas de los objetos que se
+   escriben, y do_orm_execute las de los update/delete/insert sobre una sesion'''
+import os
+import time
+import threading
+import weakref
+from collections import OrderedDict
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_mapper
+from sqlalchemy.sql.util import find_tables
+
+# Resultados guardados como maximo y segundos que vale cada uno
+ENTRADAS = int(os.environ.get('TALLER_CACHE_ENTRADAS', 256))
+SEGUNDOS = float(os.environ.get('TALLER_CACHE_SEGUNDOS', 300))
+
+# Tablas que los triggers modifican al escribir en otra (resumenes.py y los indices de busqueda.py)
+TABLAS_DERIVADAS = {
+    'registros': {'resumen_ingresos', 'resumen_clientes', 'resumen_meses'},
+    'ingresos': {'resumen_clientes', 'resumen_meses'},
+    'recambios': {'resumen_meses', 'recambios_fts'},
+    'vehiculos': {'vehiculos_matricula_fts'},
+}
+
+# Clave de session.info con las tablas escritas en la transaccion en curso
+_TABLAS_SESION = 'tablas_cache_consultas'
+
+# Caches creadas en el proceso, todas se invalidan con los cambios de cualquier sesion
+_caches = weakref.WeakSet()
+
+
+class CacheConsultas:
+    '''Resultados de consultas por sentencia y parametros, LRU con tiempo de vida
+
+    args
+    -entradas: es un numero integer con los resultados que se guardan como maximo
+    -segundos: es un numero float con los segundos que vale un resultado
+    '''
+
+    def __init__(self, entradas=ENTRADAS, segundos=SEGUNDOS):
+        self.entradas = entradas
+        self.segundos = segundos
+        self.resultados = OrderedDict()  # clave -> (caduca, tablas, filas), la usada hace mas tiempo primero
+        self.por_tabla = {}  # tabla -> claves de los resultados que la leen
+        self.generaciones = {}  # tabla -> numero de invalidaciones, para no guardar lo leido antes de una
+        self.limpiezas = 0  # veces que se ha vaciado, cuenta como una invalidacion de todas las tablas
+        self.cerrojo = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+        self.invalidaciones = 0
+        _caches.add(self)
+
+    # metodo para ejecutar una consulta o devolver su resultado guardado
+    def consultar(self, sesion, sentencia):
+        '''Devuelve la tupla de filas de sentencia (un select de columnas). Si la sesion ha escrito
+           en alguna de sus tablas sin hacer commit, la consulta va a la base de datos y no se guarda
+
+        args
+        -sesion: es la sesion de base de datos con la que se consulta si no esta guardado
+        -sentencia: es un select de columnas, por ejemplo select(Cliente.id_cliente, Cliente.nombre)
+        '''
+        if any(isinstance(columna['expr'], type) for columna in sentencia.column_descriptions):
+            raise ValueError('la cache de consultas guarda columnas, no objetos del ORM')
+        compilada = sentencia.compile(dialect=sesion.get_bind().dialect)
+        clave = (str(compilada), repr(sorted(compilada.params.items())))
+        tablas = _tablas(sentencia)
+
+        if tablas & sesion.info.get(_TABLAS_SESION, set()):
+            return tuple(sesion.execute(sentencia))
+
+        with self.cerrojo:
+            guardado = self.resultados.get(clave)
+            if guardado is not None and guardado[0] > time.monotonic():
+                self.resultados.move_to_end(clave)
+                self.aciertos += 1
+                return guardado[2]
+            self.fallos += 1
+            generaciones = self._generaciones(tablas)
+
+        filas = tuple(sesion.execute(sentencia))
+
+        with self.cerrojo:
+            # si se ha escrito en sus tablas mientras se leia, el resultado puede estar ya anticuado
+            if generaciones == self._generaciones(tablas):
+                self._descartar(clave)
+                self.resultados[clave] = (time.monotonic() + self.segundos, tablas, filas)
+                for tabla in tablas:
+                    self.por_tabla.setdefault(tabla, set()).add(clave)
+                while len(self.resultados) > self.entradas:
+                    self._descartar(next(iter(self.resultados)))
+        return filas
+
+    # metodo para borrar los resultados que leen alguna de las tablas
+    def invalidar(self, tablas):
+        '''Descarta los resultados que leen las tablas (y las que modifican sus triggers)
+
+        args
+        -tablas: es un iterable de nombres de tabla
+        '''
+        tablas = set(tablas)
+        for tabla in list(tablas):
+            tablas |= TABLAS_DERIVADAS.get(tabla, set())
+        with self.cerrojo:
+            for tabla in tablas:
+                self.generaciones[tabla] = self.generaciones.get(tabla, 0) + 1
+                for clave in self.por_tabla.pop(tabla, set()):
+                    if self._descartar(clave):
+                        self.invalidaciones += 1
+
+    # metodo para vaciar la cache
+    def limpiar(self):
+        '''Descarta todos los resultados; las consultas que esten en curso tampoco se guardan'''
+        with self.cerrojo:
+            self.limpiezas += 1
+            self.resultados.clear()
+            self.por_tabla.clear()
+
+    # metodo para consultar los contadores de la cache
+    def estadisticas(self):
+        '''Devuelve un diccionario con aciertos, fallos, tasa de aciertos, invalidaciones y entradas'''
+        with self.cerrojo:
+            consultas = self.aciertos + self.fallos
+            return {'aciertos': self.aciertos, 'fallos': self.fallos,
+                    'tasa': self.aciertos / consultas if consultas else 0.0,
+                    'invalidaciones': self.invalidaciones, 'entradas': len(self.resultados)}
+
+    # metodo para leer las invalidaciones de unas tablas (con el cerrojo tomado)
+    def _generaciones(self, tablas):
+        return (self.limpiezas,) + tuple(self.generaciones.get(tabla, 0) for tabla in tablas)
+
+    # metodo para quitar un resultado y sus referencias por tabla (con el cerrojo tomado)
+    def _descartar(self, clave):
+        guardado = self.resultados.pop(clave, None)
+        if guardado is None:
+            return False
+        for tabla in guardado[1]:
+            claves = self.por_tabla.get(tabla)
+            if claves is not None:
+                claves.discard(clave)
+        return True
+
+
+# metodo para obtener las tablas que lee o escribe una sentencia
+def _tablas(sentencia):
+    return frozenset(tabla.name for tabla in find_tables(
+        sentencia, include_aliases=True, include_joins=True, include_selects=True, include_crud=True)
+        if hasattr(tabla, 'name'))
+
+
+# Cache del proceso, la que usan las ventanas
+cache = CacheConsultas()
+
+
+# metodo para consultar con la cache del proceso
+def consultar(sesion, sentencia):
+    '''Como CacheConsultas.consultar con la cache del proceso'''
+    return cache.consultar(sesion, sentencia)
+
+
+# metodo para leer las veces que se han invalidado unas tablas
+def generacion(tablas):
+    '''Devuelve una tupla con las invalidaciones de cada tabla en la cache del proceso; si cambia,
+       alguna sesion del proceso ha escrito en ellas (busqueda.BusquedaIncremental la compara)'''
+    with cache.cerrojo:
+        return cache._generaciones(tablas)
+
+
+# metodo para invalidar las tablas en todas las caches del proceso
+def invalidar(tablas):
+    for cache_proceso in list(_caches):
+        cache_proceso.invalidar(tablas)
+
+
+# metodo para apuntar tablas escritas por una sesion e invalidarlas ya
+def _escritas(sesion, tablas):
+    if tablas:
+        sesion.info.setdefault(_TABLAS_SESION, set()).update(tablas)
+        invalidar(tablas)
+
+
+@event.listens_for(Session, 'after_flush')
+def _despues_de_flush(sesion, contexto):
+    # se invalida en el flush para que la propia sesion no lea resultados anteriores a sus cambios
+    objetos = list(sesion.new) + list(sesion.dirty) + list(sesion.deleted)
+    _escritas(sesion, {tabla.name for objeto in objetos for tabla in object_mapper(objeto).tables})
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _al_ejecutar(estado):
+    # update(), delete() o insert() ejecutados con la sesion no pasan por el flush
+    if estado.is_update or estado.is_delete or estado.is_insert:
+        _escritas(estado.session, _tablas(estado.statement))
+
+
+@event.listens_for(Session, 'after_commit')
+def _despues_de_commit(sesion):
+    # otra sesion puede haber guardado lo que habia antes del commit entre el flush y el commit
+    invalidar(sesion.info.pop(_TABLAS_SESION, set()))
+
+
+@event.listens_for(Session, 'after_rollback')
+def _despues_de_rollback(sesion):
+    invalidar(sesion.info.pop(_TABLAS_SESION, set()))
@@ -0,0 +1,325 @@
+'''Importacion de clientes y vehiculos desde la base de datos de otro taller
+
+   uso: python carga_clientes.py [--rechazos rechazos.csv] fichero [fichero ...]
+
+   Los ficheros pueden ser .csv (separado por comas o ;), .jsonl (un objeto json por linea) o .json
+   (una lista de objetos); los .csv y .jsonl se leen fila a fila sin cargarlos enteros en memoria.
+   Cada fila puede traer un cliente, un vehiculo o un vehiculo con los datos de su cliente:
+
+       nombre, telefono, direccion, correo, marca, modelo, matricula, kilometros
+
+   En los .json un cliente puede traer ademas sus vehiculos en una lista "vehiculos".
+
+   Un cliente se reconoce por su correo (sin tener en cuenta mayusculas) o, si no tiene, por su
+   telefono; un vehiculo por su matricula sin espacios ni guiones. Un vehiculo sin nombre de cliente
+   se asigna al cliente con ese correo o telefono, ya este en la base de datos o antes en el fichero.
+   Los clientes y vehiculos que ya existen no se modifican, asi que el fichero se puede importar
+   de nuevo sin duplicar nada. Las filas que no se pueden importar se escriben con el motivo en el
+   fichero de rechazos (por defecto el nombre del fichero con .rechazos.csv, junto al original)'''
+import os
+import csv
+import sys
+import json
+import time
+from datetime import datetime
+from sqlalchemy import select, func, literal_column, or_, text
+from sqlalchemy.dialects.sqlite import insert
+from models import Cliente, Vehiculo
+import models
+import busqueda
+import esquema
+import db
+
+# Filas que se importan en cada transaccion
+TAMANIO_LOTE = int(os.environ.get('TALLER_TAMANIO_LOTE', 5000))
+
+CAMPOS_CLIENTE = ('nombre', 'telefono', 'direccion', 'correo')
+CAMPOS_VEHICULO = ('marca', 'modelo', 'matricula', 'kilometros')
+CAMPOS = CAMPOS_CLIENTE + CAMPOS_VEHICULO
+
+# Matricula normalizada de la tabla vehiculos, resuelta con el indice ix_vehiculos_matricula_normalizada
+MATRICULA_NORMALIZADA = literal_column(busqueda.SQL_MATRICULA_NORMALIZADA.format('vehiculos'))
+
+
+class FilaRechazada(Exception):
+    '''Error de una fila que no se puede importar; el mensaje es el motivo que se escribe en los rechazos'''
+
+
+# metodo para leer las filas de un fichero de clientes y vehiculos
+def filas_de_fichero(ruta):
+    '''Genera las filas (diccionarios) del fichero; una linea de .jsonl que no es json valido se
+       genera como {'_error': motivo} para que se rechace sin detener la importacion'''
+    if ruta.lower().endswith('.csv'):
+        with open(ruta, 'r', encoding='utf-8-sig', newline='') as archivo:
+            dialecto = csv.Sniffer().sniff(archivo.read(4096), delimiters=',;')
+            archivo.seek(0)
+            yield from csv.DictReader(archivo, dialect=dialecto)
+    elif ruta.lower().endswith('.jsonl'):
+        with open(ruta, 'r', encoding='utf-8') as archivo:
+            for linea in archivo:
+                if linea.strip():
+                    try:
+                        yield from _filas_de_objeto(json.loads(linea))
+                    except ValueError as error:
+                        yield {'_error': f'json no valido: {error}'}
+    else:
+        with open(ruta, 'r', encoding='utf-8') as archivo:
+            datos = json.load(archivo)
+        for objeto in (datos if isinstance(datos, list) else [datos]):
+            yield from _filas_de_objeto(objeto)
+
+
+# metodo para aplanar un cliente de json con su lista de vehiculos en filas
+def _filas_de_objeto(objeto):
+    if not isinstance(objeto, dict):
+        yield {'_error': 'la fila no es un objeto json'}
+        return
+    vehiculos = objeto.get('vehiculos')
+    cliente = {campo: valor for campo, valor in objeto.items() if campo != 'vehiculos'}
+    yield cliente
+    if isinstance(vehiculos, list):
+        for vehiculo in vehiculos:
+            if isinstance(vehiculo, dict):
+                # el vehiculo hereda el correo y telefono del cliente para enlazarlo por ellos
+                yield {'correo': cliente.get('correo'), 'telefono': cliente.get('telefono'), **vehiculo}
+            else:
+                yield {'_error': 'el vehiculo no es un objeto json'}
+
+
+# metodo para obtener la clave natural de un cliente
+def clave_cliente(correo, telefono):
+    '''Devuelve ('correo', correo en minusculas) o, si no hay correo, ('telefono', telefono)'''
+    if correo:
+        return ('correo', correo.lower())
+    if telefono:
+        return ('telefono', telefono)
+    return None
+
+
+# metodo para buscar los ids de los clientes por su clave natural
+def ids_de_clientes(conexion, claves):
+    '''Devuelve un diccionario clave -> id_cliente de los clientes que existen con alguna de las claves
+       (ver clave_cliente), con una consulta resuelta por los indices del correo y del telefono'''
+    tabla = Cliente.__table__
+    correos = [valor for tipo, valor in claves if tipo == 'correo']
+    telefonos = [valor for tipo, valor in claves if tipo == 'telefono']
+    ids = {}
+    for id_cliente, correo, telefono in conexion.execute(
+            select(tabla.c.id_cliente, func.lower(tabla.c.correo), tabla.c.telefono)
+            .where(or_(func.lower(tabla.c.correo).in_(correos), tabla.c.telefono.in_(telefonos)))
+            .order_by(tabla.c.id_cliente.desc())):
+        # si hay varios clientes con el mismo correo o telefono gana el mas antiguo
+        ids[('correo', correo)] = id_cliente
+        ids[('telefono', telefono)] = id_cliente
+    return ids
+
+
+# metodo para insertar vehiculos indexando sus matriculas en bloque
+def insertar_vehiculos(conexion, vehiculos):
+    '''Inserta los vehiculos y añade sus matriculas al indice de trigramas con un solo INSERT ... SELECT.
+       El trigger vehiculos_matricula_fts_ai escribe en la tabla FTS5 fila a fila y es unas diez
+       veces mas lento, asi que se quita y se vuelve a crear dentro de la misma transaccion: el resto
+       de conexiones nunca ven la tabla sin el trigger
+
+    args
+    -conexion: es una conexion con una transaccion abierta con BEGIN (pysqlite solo la abre antes de
+     un INSERT, un UPDATE o un DELETE, y el DROP TRIGGER iria fuera de ella)
+    -vehiculos: es una lista de diccionarios con las columnas de la tabla vehiculos
+    '''
+    ultimo = conexion.execute(text('SELECT coalesce(max(id_vehiculo), 0) FROM vehiculos')).scalar()
+    conexion.execute(text('DROP TRIGGER IF EXISTS vehiculos_matricula_fts_ai'))
+    conexion.execute(insert(Vehiculo.__table__), vehiculos)
+    conexion.execute(text(
+        'INSERT INTO vehiculos_matricula_fts(rowid, matricula) '
+        f"SELECT id_vehiculo, {busqueda.SQL_MATRICULA_NORMALIZADA.format('vehiculos')} FROM vehiculos "
+        'WHERE id_vehiculo > :ultimo'), {'ultimo': ultimo})
+    for ddl in busqueda.DDL_MATRICULAS_TRIGRAMAS:
+        if 'vehiculos_matricula_fts_ai' in ddl:
+            conexion.execute(text(ddl))
+
+
+# metodo para validar una fila y separar los datos del cliente y del vehiculo
+def validar_fila(fila):
+    '''Devuelve (clave del cliente, cliente o None, vehiculo o None) o lanza FilaRechazada
+
+    args
+    -fila: es un diccionario con alguno de los campos de CAMPOS_CLIENTE y CAMPOS_VEHICULO
+    '''
+    if '_error' in fila:
+        raise FilaRechazada(fila['_error'])
+    valores = {}
+    for campo in CAMPOS:
+        valor = fila.get(campo)
+        # en json los kilometros o el telefono pueden venir como numeros
+        valores[campo] = valor.strip() if isinstance(valor, str) else ('' if valor is None else str(valor))
+
+    clave = clave_cliente(valores['correo'], valores['telefono'])
+    if clave is None:
+        raise FilaRechazada('falta el correo o el telefono del cliente')
+    if valores['correo'] and '@' not in valores['correo']:
+        raise FilaRechazada(f"correo no valido: {valores['correo']}")
+
+    cliente = None
+    if valores['nombre']:
+        cliente = {campo: valores[campo] for campo in CAMPOS_CLIENTE}
+
+    vehiculo = None
+    if valores['matricula'] or valores['marca'] or valores['modelo'] or valores['kilometros']:
+        matricula = busqueda.normalizar_matricula(valores['matricula'])
+        if not matricula:
+            raise FilaRechazada('falta la matricula del vehiculo')
+        if not valores['marca'] or not valores['modelo']:
+            raise FilaRechazada(f"faltan la marca o el modelo del vehiculo {valores['matricula']}")
+        try:
+            kilometros = models.leer_kilometros(valores['kilometros'] or 0)  # "123.456 km" -> 123456
+        except ValueError as error:
+            raise FilaRechazada(str(error)) from None
+        vehiculo = {'marca': valores['marca'], 'modelo': valores['modelo'],
+                    'matricula': valores['matricula'], 'kilometros': kilometros, '_normalizada': matricula}
+
+    if cliente is None and vehiculo is None:
+        raise FilaRechazada('la fila no tiene nombre de cliente ni datos de vehiculo')
+    return clave, cliente, vehiculo
+
+
+class Importacion:
+    '''Importacion por lotes de clientes y vehiculos, con un resumen de lo importado
+
+    args
+    -engine: es el engine de la base de datos
+    -rechazos: es un string con la ruta del fichero csv donde se escriben las filas rechazadas
+    -tamanio_lote: es un numero integer con las filas por transaccion
+    '''
+
+    def __init__(self, engine, rechazos, tamanio_lote=TAMANIO_LOTE):
+        self.engine = engine
+        self.ruta_rechazos = rechazos
+        self.tamanio_lote = tamanio_lote
+        self.archivo_rechazos = None
+        self.escritor_rechazos = None
+        self.resumen = {'filas': 0, 'clientes': 0, 'vehiculos': 0, 'existentes': 0, 'rechazadas': 0}
+
+    # metodo para importar las filas de un iterable
+    def importar(self, filas):
+        '''Valida e inserta las filas por lotes, cada lote en una transaccion; devuelve el resumen
+           con las filas leidas, clientes y vehiculos nuevos, existentes y rechazadas, y los segundos'''
+        inicio = time.perf_counter()
+        lote = []
+        try:
+            for numero, fila in enumerate(filas, start=1):
+                self.resumen['filas'] += 1
+                try:
+                    lote.append((numero, fila) + validar_fila(fila))
+                except FilaRechazada as motivo:
+                    self.rechazar(numero, fila, str(motivo))
+                if len(lote) >= self.tamanio_lote:
+                    self.importar_lote(lote)
+                    lote = []
+            if lote:
+                self.importar_lote(lote)
+        finally:
+            self.cerrar()
+        self.resumen['segundos'] = time.perf_counter() - inicio
+        return self.resumen
+
+    # metodo para insertar un lote de filas validas en una transaccion
+    def importar_lote(self, lote):
+        ahora = datetime.now()
+        with self.engine.connect() as conexion:
+            # la transaccion se abre a mano, como en esquema.actualizar: si el lote solo trae vehiculos,
+            # antes del DROP TRIGGER de insertar_vehiculos solo hay SELECT y pysqlite aun no la habria abierto
+            conexion.exec_driver_sql('BEGIN IMMEDIATE')
+            # clientes ya existentes (de la base de datos o de lotes anteriores) por correo y telefono
+            claves = {clave for _, _, clave, _, _ in lote}
+            ids_clientes = ids_de_clientes(conexion, claves)
+
+            # clientes nuevos, una vez cada uno aunque aparezca en varias filas
+            nuevos = {}
+            for _, _, clave, cliente, _ in lote:
+                if cliente is not None:
+                    if clave in ids_clientes or clave in nuevos:
+                        self.resumen['existentes'] += 1
+                    else:
+                        nuevos[clave] = dict(cliente, fecha_alta=ahora)
+            if nuevos:
+                # sin RETURNING: con el orden de los parametros sqlite insertaria fila a fila,
+                # asi que los ids se leen despues con una sola consulta por el indice
+                conexion.execute(insert(Cliente.__table__), list(nuevos.values()))
+                ids_clientes = ids_de_clientes(conexion, claves)
+                self.resumen['clientes'] += len(nuevos)
+
+            # vehiculos nuevos enlazados con su cliente
+            matriculas = {vehiculo['_normalizada'] for _, _, _, _, vehiculo in lote if vehiculo is not None}
+            existentes = set(conexion.execute(
+                select(MATRICULA_NORMALIZADA).select_from(Vehiculo.__table__)
+                .where(MATRICULA_NORMALIZADA.in_(matriculas))).scalars())
+            vehiculos = []
+            for numero, fila, clave, _, vehiculo in lote:
+                if vehiculo is None:
+                    continue
+                if vehiculo['_normalizada'] in existentes:
+                    self.resumen['existentes'] += 1
+                elif clave not in ids_clientes:
+                    self.rechazar(numero, fila, f'no existe el cliente con {clave[0]} {clave[1]}')
+                else:
+                    existentes.add(vehiculo['_normalizada'])
+                    vehiculos.append({'marca': vehiculo['marca'], 'modelo': vehiculo['modelo'],
+                                      'matricula': vehiculo['matricula'], 'kilometros': vehiculo['kilometros'],
+                                      'fecha_alta': ahora, 'id_cliente': ids_clientes[clave]})
+            if vehiculos:
+                insertar_vehiculos(conexion, vehiculos)
+                self.resumen['vehiculos'] += len(vehiculos)
+            conexion.commit()
+
+    # metodo para escribir una fila rechazada con su motivo
+    def rechazar(self, numero, fila, motivo):
+        if self.escritor_rechazos is None:
+            # el fichero solo se crea si hay alguna fila rechazada
+            self.archivo_rechazos = open(self.ruta_rechazos, 'w', encoding='utf-8', newline='')
+            self.escritor_rechazos = csv.writer(self.archivo_rechazos)
+            self.escritor_rechazos.writerow(('fila', 'motivo') + CAMPOS)
+        self.escritor_rechazos.writerow(
+            (numero, motivo) + tuple(fila.get(campo, '') for campo in CAMPOS))
+        self.resumen['rechazadas'] += 1
+
+    # metodo para cerrar el fichero de rechazos
+    def cerrar(self):
+        if self.archivo_rechazos is not None:
+            self.archivo_rechazos.close()
+            self.archivo_rechazos = None
+            self.escritor_rechazos = None
+
+
+# metodo para importar un fichero de clientes y vehiculos
+def importar_fichero(engine, ruta, rechazos=None, tamanio_lote=TAMANIO_LOTE):
+    '''Importa el fichero y devuelve el resumen de Importacion.importar
+
+    args
+    -engine: es el engine de la base de datos
+    -ruta: es un string con la ruta del fichero .csv, .jsonl o .json
+    -rechazos: es un string con la ruta del csv de filas rechazadas (por defecto <ruta>.rechazos.csv)
+    -tamanio_lote: es un numero integer con las filas por transaccion
+    '''
+    importacion = Importacion(engine, rechazos or f'{ruta}.rechazos.csv', tamanio_lote)
+    return importacion.importar(filas_de_fichero(ruta))
+
+
+if __name__ == '__main__':
+    # crea o actualiza las tablas y los indices, como main.py
+    esquema.actualizar(db.engine_sqlite)
+
+    argumentos = sys.argv[1:]
+    rechazos = None
+    if '--rechazos' in argumentos:
+        posicion = argumentos.index('--rechazos')
+        rechazos = argumentos[posicion + 1]
+        del argumentos[posicion:posicion + 2]
+    if not argumentos:
+        sys.exit(__doc__)
+
+    for ruta in argumentos:
+        resumen = importar_fichero(db.engine_sqlite, ruta, rechazos)
+        print(f"{ruta}: {resumen['filas']} filas en {resumen['segundos']:.2f} s "
+              f"({resumen['filas'] / max(resumen['segundos'], 1e-9):.0f} filas/s): "
+              f"{resumen['clientes']} clientes y {resumen['vehiculos']} vehiculos nuevos, "
+              f"{resumen['existentes']} ya existian, {resumen['rechazadas']} rechazadas")
@@ -0,0 +1,142 @@
+'''Carga masiva de recambios desde el catalogo menu_recambios.json o desde catalogos de proveedores
+
+   uso: python carga_recambios.py [--reconstruir-fts] [fichero ...]   (sin ficheros carga database/menu_recambios.json)
+
+   Los ficheros pueden ser:
+   - .json con la forma de menu_recambios.json: {categoria: [subcategoria, ...]}; se crea un recambio
+     generico por subcategoria (o por categoria si no tiene subcategorias)
+   - .json con una lista de recambios: [{"nombre_recambio", "descripcion", "categoria", "subcategoria"}, ...]
+   - .csv con cabecera nombre_recambio,descripcion,categoria,subcategoria (separado por comas o ;)
+
+   Un recambio se identifica por (categoria, subcategoria, nombre_recambio): si ya existe se actualiza
+   su descripcion y si no se inserta, asi que la carga se puede repetir para refrescar la tabla.
+
+   Con --reconstruir-fts los triggers del indice de texto completo se quitan durante la carga y el
+   indice se reconstruye entero al final, que en cargas de decenas de miles de recambios es mas
+   rapido que actualizarlo fila a fila (mientras dura la carga las busquedas no ven los recambios nuevos)'''
+import os
+import csv
+import sys
+import json
+import time
+from datetime import datetime
+from sqlalchemy import text
+from sqlalchemy.dialects.sqlite import insert
+from models import Recambio
+from catalogo import catalogo, RUTA_CATALOGO
+import busqueda
+import esquema
+import db
+
+# Recambios que se insertan en cada transaccion
+TAMANIO_LOTE = int(os.environ.get('TALLER_TAMANIO_LOTE', 5000))
+
+
+# metodo para leer los recambios de un catalogo con la forma de menu_recambios.json
+def recambios_de_menu(menu):
+    '''Genera un recambio generico por cada subcategoria del diccionario categoria -> subcategorias'''
+    for categoria, subcategorias in menu.items():
+        for subcategoria in subcategorias or [categoria]:
+            yield {'nombre_recambio': subcategoria, 'descripcion': f'{categoria} / {subcategoria}',
+                   'categoria': categoria, 'subcategoria': subcategoria}
+
+
+# metodo para leer los recambios de un fichero de proveedor
+def recambios_de_fichero(ruta):
+    '''Genera los recambios de un fichero .json o .csv (ver el principio del modulo); el csv se lee
+       fila a fila, sin cargarlo entero en memoria'''
+    if ruta.lower().endswith('.csv'):
+        with open(ruta, 'r', encoding='utf-8-sig', newline='') as archivo:
+            dialecto = csv.Sniffer().sniff(archivo.read(4096), delimiters=',;')
+            archivo.seek(0)
+            yield from csv.DictReader(archivo, dialect=dialecto)
+    else:
+        with open(ruta, 'r', encoding='utf-8') as archivo:
+            datos = json.load(archivo)
+        if isinstance(datos, dict):
+            yield from recambios_de_menu(datos)
+        else:
+            yield from datos
+
+
+# metodo para cargar recambios en bloque con insercion o actualizacion
+def cargar_recambios(engine, recambios, tamanio_lote=TAMANIO_LOTE, reconstruir_fts=False):
+    '''Inserta o actualiza los recambios por lotes, cada lote en una transaccion con un solo
+       executemany (sin crear objetos Recambio ni una sesion por fila)
+
+    args
+    -engine: es el engine de la base de datos
+    -recambios: es un iterable de diccionarios con nombre_recambio, descripcion, categoria y subcategoria
+    -tamanio_lote: es un numero integer con los recambios por transaccion
+    -reconstruir_fts: es un booleano, si es True se quitan los triggers de recambios_fts durante la
+                      carga y el indice se reconstruye al final
+
+    Devuelve el numero de recambios procesados y los segundos que ha tardado
+    '''
+    sentencia = insert(Recambio.__table__)
+    # si (categoria, subcategoria, nombre_recambio) ya existe solo se actualiza la descripcion, y solo
+    # cuando cambia, para no reescribir la fila ni el indice de texto completo sin necesidad
+    sentencia = sentencia.on_conflict_do_update(
+        index_elements=['categoria', 'subcategoria', 'nombre_recambio'],
+        set_={'descripcion': sentencia.excluded.descripcion},
+        where=Recambio.__table__.c.descripcion != sentencia.excluded.descripcion)
+
+    inicio = time.perf_counter()
+    if reconstruir_fts:
+        with engine.begin() as conexion:
+            for trigger in ('recambios_fts_ai', 'recambios_fts_ad', 'recambios_fts_au'):
+                conexion.execute(text(f'DROP TRIGGER IF EXISTS {trigger}'))
+    try:
+        total = _cargar_lotes(engine, sentencia, recambios, tamanio_lote)
+    finally:
+        if reconstruir_fts:
+            # vuelve a crear los triggers y reindexa la tabla aunque la carga se haya interrumpido
+            with engine.begin() as conexion:
+                for ddl in busqueda.DDL_RECAMBIOS_FTS:
+                    conexion.execute(text(ddl))
+                conexion.execute(text("INSERT INTO recambios_fts(recambios_fts) VALUES ('rebuild')"))
+    return total, time.perf_counter() - inicio
+
+
+# metodo para insertar los recambios por lotes con la sentencia de insercion o actualizacion
+def _cargar_lotes(engine, sentencia, recambios, tamanio_lote):
+    total = 0
+    lote = []
+    ahora = datetime.now()
+    categorias = {}  # texto leido -> clave del catalogo, para no plegar la misma categoria en cada fila
+    for recambio in recambios:
+        nombre = (recambio.get('nombre_recambio') or '').strip()
+        if not nombre:
+            continue
+        categoria = (recambio.get('categoria') or '').strip()
+        if categoria not in categorias:
+            categorias[categoria] = catalogo.categoria(categoria) or categoria  # clave del catalogo si existe
+        lote.append({
+            'fecha_alta': ahora,
+            'nombre_recambio': nombre,
+            'descripcion': (recambio.get('descripcion') or '').strip(),
+            'categoria': categorias[categoria],
+            'subcategoria': (recambio.get('subcategoria') or '').strip(),
+        })
+        if len(lote) >= tamanio_lote:
+            with engine.begin() as conexion:
+                conexion.execute(sentencia, lote)
+            total += len(lote)
+            lote = []
+    if lote:
+        with engine.begin() as conexion:
+            conexion.execute(sentencia, lote)
+        total += len(lote)
+    return total
+
+
+if __name__ == '__main__':
+    # crea o actualiza las tablas y los indices, como main.py
+    esquema.actualizar(db.engine_sqlite)
+
+    argumentos = sys.argv[1:]
+    reconstruir_fts = '--reconstruir-fts' in argumentos
+    rutas = [argumento for argumento in argumentos if argumento != '--reconstruir-fts']
+    for ruta in (rutas or [RUTA_CATALOGO]):
+        total, segundos = cargar_recambios(db.engine_sqlite, recambios_de_fichero(ruta), reconstruir_fts=reconstruir_fts)
+        print(f"{ruta}: {total} recambios en {segundos:.2f} s ({total / max(segundos, 1e-9):.0f} recambios/s)")
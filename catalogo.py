@@ -0,0 +1,126 @@
+# Catalogo de categorias y subcategorias de recambios (database/menu_recambios.json)
+
+import os
+import json
+import logging
+import threading
+import unicodedata
+from watchdog.observers import Observer
+from watchdog.events import FileSystemEventHandler
+
+'''El catalogo se lee del fichero una sola vez y se comparte entre todas las ventanas y paginas;
+   los desplegables consultan las subcategorias de una categoria en el diccionario en memoria.
+   Si el fichero cambia se vuelve a leer: con el vigilante de watchdog activo (vigilar()) se recarga
+   en cuanto se guarda, y sin el se comprueba la fecha de modificacion del fichero en cada consulta.
+   Al cargarlo se construye un indice de las categorias plegadas (sin mayusculas, acentos, espacios
+   ni signos) para traducir cualquier forma de escribirlas a la clave exacta del catalogo'''
+
+# Ruta del fichero del catalogo, relativa a este modulo para que no dependa del directorio de trabajo
+RUTA_CATALOGO = os.environ.get(
+    'TALLER_CATALOGO', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'database', 'menu_recambios.json'))
+
+
+# Log del catalogo (las recargas se ven en nivel debug)
+log = logging.getLogger(__name__)
+
+
+# metodo para plegar un texto a la forma con la que se indexan las categorias
+def plegar(texto):
+    '''Quita acentos, mayusculas, espacios y signos: "Aceites y líquidos" y "aceites y liquidos"
+       dan "aceitesyliquidos", "Correas, cadenas, rodillos" y "Correas,cadenas,rodillos" lo mismo'''
+    descompuesto = unicodedata.normalize('NFKD', texto or '')
+    return ''.join(caracter for caracter in descompuesto if caracter.isalnum()).casefold()
+
+
+class Catalogo:
+    '''Catalogo de recambios en memoria: diccionario categoria -> lista de subcategorias
+
+    args
+    -ruta: es un string con la ruta del fichero json del catalogo
+    '''
+
+    def __init__(self, ruta=RUTA_CATALOGO):
+        self.ruta = ruta
+        self.datos = None
+        self.indice = {}  # categoria plegada -> clave del catalogo
+        self.mtime = None
+        self.observador = None
+        self.cerrojo = threading.Lock()
+
+    # metodo para leer el fichero del catalogo
+    def recargar(self):
+        with self.cerrojo:
+            mtime = os.stat(self.ruta).st_mtime_ns
+            with open(self.ruta, 'r', encoding='utf-8') as archivo:
+                datos = json.load(archivo)
+            self.indice = {plegar(categoria): categoria for categoria in datos}
+            self.datos = datos
+            self.mtime = mtime
+            log.debug('Catalogo de recambios cargado: %d categorias', len(datos))
+
+    # metodo para obtener el catalogo completo, leyendolo si ha cambiado
+    def menu(self):
+        '''Devuelve el diccionario categoria -> subcategorias; con el vigilante activo no toca el
+           disco, sin el compara la fecha de modificacion del fichero con la de la ultima lectura'''
+        if self.datos is None or (self.observador is None and os.stat(self.ruta).st_mtime_ns != self.mtime):
+            self.recargar()
+        return self.datos
+
+    # metodo para traducir una categoria escrita de cualquier forma a la clave del catalogo
+    def categoria(self, texto):
+        '''Devuelve la clave del catalogo que corresponde al texto sin tener en cuenta mayusculas,
+           acentos, espacios ni signos ("aceites y liquidos" -> "Aceites y líquidos"), o None si
+           no corresponde a ninguna categoria'''
+        self.menu()
+        return self.indice.get(plegar(texto))
+
+    # metodo para obtener las subcategorias de una categoria
+    def subcategorias(self, categoria):
+        '''Devuelve la lista de subcategorias de la categoria (escrita de cualquier forma, ver
+           categoria) o None si la categoria no existe'''
+        return self.menu().get(self.categoria(categoria))
+
+    # metodo para obtener las categorias en el orden del fichero
+    def categorias(self):
+        return list(self.menu())
+
+    # metodo para obtener las categorias en orden alfabetico para los desplegables
+    def categorias_ordenadas(self):
+        # se ordena por la forma plegada para que "Árboles..." no quede detras de "Tuning"
+        return sorted(self.menu(), key=plegar)
+
+    # metodo para recargar el catalogo automaticamente cuando se modifica el fichero
+    def vigilar(self):
+        '''Arranca un observador de watchdog sobre la carpeta del fichero (se llama una vez al
+           arrancar la aplicacion); cada vez que el fichero se guarda el catalogo se recarga'''
+        if self.observador is not None:
+            return
+        self.menu()
+        catalogo = self
+
+        class _Manejador(FileSystemEventHandler):
+            def on_any_event(self, evento):
+                rutas = {evento.src_path, getattr(evento, 'dest_path', '')}
+                if evento.event_type in ('created', 'modified', 'moved') and \
+                        os.path.abspath(catalogo.ruta) in {os.path.abspath(ruta) for ruta in rutas if ruta}:
+                    try:
+                        catalogo.recargar()
+                    except (OSError, ValueError) as error:
+                        # el editor puede estar a medio guardar: se reintenta en el siguiente evento
+                        log.warning('No se pudo recargar el catalogo de recambios: %s', error)
+
+        self.observador = Observer()
+        self.observador.schedule(_Manejador(), os.path.dirname(os.path.abspath(self.ruta)))
+        self.observador.daemon = True
+        self.observador.start()
+
+    # metodo para detener el observador del fichero
+    def dejar_de_vigilar(self):
+        if self.observador is not None:
+            self.observador.stop()
+            self.observador.join()
+            self.observador = None
+
+
+# Catalogo compartido por toda la aplicacion
+catalogo = Catalogo()
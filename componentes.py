@@ -0,0 +1,132 @@
+# Controles reutilizables de la interfaz del taller
+
+import math
+import flet as ft
+
+'''ListaVirtual sustituye al GridView de resultados de las ventanas de busqueda: en lugar de crear
+   una tarjeta por resultado (15-25 controles cada una) que viajan todas por el websocket en el
+   update(), solo mantiene las tarjetas de la parte visible mas un margen y las reutiliza al hacer
+   scroll cambiando sus textos, asi que con 10.000 resultados el cliente recibe unas pocas tarjetas'''
+
+# Distancia en pixeles al final de la lista a partir de la cual se carga la siguiente pagina
+UMBRAL_CARGAR_MAS = 200
+
+
+class ListaVirtual(ft.Container):
+    '''Lista de resultados virtualizada con tarjetas de alto fijo que se reciclan al hacer scroll
+
+    args
+    -alto_elemento: es un numero integer con el alto en pixeles de cada tarjeta
+    -crear_elemento: es una funcion sin argumentos que devuelve una tarjeta vacia
+    -rellenar_elemento: es una funcion (tarjeta, fila) que escribe los datos de la fila en la tarjeta
+    -cargar_mas: es una funcion (e) que recibe tambien los eventos de scroll, para pedir la siguiente
+                 pagina al acercarse al final (opcional, ver cargar_mas_al_final)
+    -alto_visible: es un numero integer con el alto aproximado de la zona visible en pixeles
+    -reserva: es un numero integer con las tarjetas extra que se mantienen por encima y por debajo
+    -espacio: es un numero integer con la separacion en pixeles entre tarjetas
+    '''
+
+    def __init__(self, alto_elemento, crear_elemento, rellenar_elemento, cargar_mas=None,
+                 alto_visible=480, reserva=2, espacio=10, **kwargs):
+        self.paso = alto_elemento + espacio  # distancia entre el principio de dos tarjetas seguidas
+        self.alto_elemento = alto_elemento
+        self.crear_elemento = crear_elemento
+        self.rellenar_elemento = rellenar_elemento
+        self.cargar_mas = cargar_mas
+        self.reserva = reserva
+        self.huecos = math.ceil(alto_visible / self.paso) + 2 * reserva  # tarjetas que se llegan a crear
+        self.filas = []
+        self.primero = 0  # indice de la primera fila dibujada
+
+        # El Stack tiene el alto de todas las filas para que la barra de scroll sea la real,
+        # pero solo contiene los huecos, colocados con top en la posicion de la fila que muestran
+        self.pila = ft.Stack(controls=[], height=0)
+        super().__init__(
+            content=ft.Column(
+                controls=[self.pila],
+                scroll=ft.ScrollMode.AUTO,
+                expand=True,
+                horizontal_alignment=ft.CrossAxisAlignment.STRETCH,
+                on_scroll_interval=10,
+                on_scroll=self.al_hacer_scroll,
+            ),
+            **kwargs
+        )
+
+    # metodo para vaciar la lista antes de una busqueda nueva
+    def limpiar(self):
+        self.filas = []
+        self.primero = 0
+        self.pila.controls = []
+        self.pila.height = 0
+
+    # metodo para añadir una pagina de resultados al final de la lista
+    def agregar(self, filas):
+        '''Añade las filas (objetos de datos, no controles) y dibuja las que caen en la zona visible;
+           hay que llamar a update() despues, como con el GridView'''
+        self.filas.extend(filas)
+        self.pila.height = len(self.filas) * self.paso
+        self.dibujar()
+
+    # metodo para colocar y rellenar los huecos de la zona visible
+    def dibujar(self):
+        '''Cada fila visible se dibuja en el hueco indice % huecos: al avanzar una fila solo se
+           rellena de nuevo el hueco que sale por arriba, el resto no cambia y no se envia'''
+        ultimo = min(self.primero + self.huecos, len(self.filas))
+        while len(self.pila.controls) < min(self.huecos, len(self.filas)):
+            self.pila.controls.append(ft.Container(
+                content=self.crear_elemento(), height=self.alto_elemento, left=0, right=0))
+
+        ocupados = set()
+        for indice in range(self.primero, ultimo):
+            hueco = self.pila.controls[indice % self.huecos]
+            ocupados.add(indice % self.huecos)
+            if hueco.data != indice:
+                hueco.data = indice
+                hueco.top = indice * self.paso
+                hueco.visible = True
+                self.rellenar_elemento(hueco.content, self.filas[indice])
+
+        # huecos sobrantes cuando hay menos filas que huecos
+        for posicion, hueco in enumerate(self.pila.controls):
+            if posicion not in ocupados and hueco.visible:
+                hueco.data = None
+                hueco.visible = False
+
+    # metodo que se ejecuta con cada evento de scroll de la lista
+    def al_hacer_scroll(self, e):
+        # si la zona visible real es mas alta de lo previsto se crean mas huecos y se redibuja todo
+        if e.viewport_dimension:
+            huecos = math.ceil(e.viewport_dimension / self.paso) + 2 * self.reserva
+            if huecos > self.huecos:
+                self.huecos = huecos
+                for hueco in self.pila.controls:
+                    hueco.data = None
+                self.primero = -1
+
+        primero = max(0, int(e.pixels // self.paso) - self.reserva)
+        if primero != self.primero:
+            self.primero = primero
+            self.dibujar()
+            self.pila.update()
+
+        if self.cargar_mas:
+            self.cargar_mas(e)
+
+
+# metodo para crear la barra que indica que la ventana espera a la base de datos
+def barra_carga():
+    '''Devuelve una ProgressBar indeterminada y oculta, que tareas.Tareas.lanzar muestra mientras
+       la tarea a la que se pasa como indicador esta en curso'''
+    return ft.ProgressBar(visible=False, height=3, color="#12597b", bgcolor="#D1E2E7")
+
+
+# metodo para cargar la siguiente pagina de resultados al acercarse al final de la lista
+def cargar_mas_al_final(ventana, e):
+    '''Manejador on_scroll de vistaResultadosBusqueda: pide a la ventana la siguiente pagina
+       (ventana.cargar_pagina, en un hilo de base de datos) cuando el scroll llega cerca del final y quedan resultados'''
+    if ventana.cursor_busqueda is None or e.pixels < e.max_scroll_extent - UMBRAL_CARGAR_MAS:
+        return
+    # si ya se esta cargando una pagina (o una busqueda nueva) se ignoran los eventos de scroll que lleguen mientras tanto
+    if not ventana.tareas.en_curso('busqueda'):
+        ventana.tareas.lanzar('busqueda', ventana.cargar_pagina, indicador=ventana.barraCarga)
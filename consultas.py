@@ -0,0 +1,89 @@
+# Consultas reutilizables de las vistas del taller
+
+import os
+from sqlalchemy import tuple_, func, literal_column, type_coerce, String
+from sqlalchemy.orm import joinedload
+from models import Vehiculo, Ingreso, Registro
+
+'''Cada metodo devuelve los datos que necesita una vista cargados con el menor numero de
+   sentencias posible, para no lanzar una consulta por cada fila que se dibuja'''
+
+# Numero de resultados por pagina de las busquedas (configurable por variable de entorno)
+TAMANIO_PAGINA = int(os.environ.get('TALLER_TAMANIO_PAGINA', 30))
+
+
+# metodo para ordenar por una fecha que puede ser NULL
+def fecha_orden(columna):
+    '''Devuelve coalesce(columna, '') para ordenar y paginar por una fecha que puede ser NULL: la
+       comparacion por tuplas de pagina_keyset nunca es cierta con un NULL y esas filas no salian en
+       ninguna pagina. '' queda donde SQLite ordena los NULL (antes que cualquier fecha) y se lee como
+       texto; los indices ix_*_orden de models.py tienen la misma expresion'''
+    return type_coerce(func.coalesce(columna, literal_column("''")), String)
+
+
+# metodo para paginar una consulta por clave (keyset) en lugar de OFFSET
+def pagina_keyset(consulta, orden, cursor=None, tamanio=TAMANIO_PAGINA, descendente=True):
+    '''Devuelve una pagina de la consulta y el cursor para pedir la siguiente.
+
+    La pagina continua justo despues de la ultima fila de la anterior comparando las columnas
+    de orden, asi que su coste no crece con el numero de paginas ya leidas (OFFSET si crece)
+
+    args
+    -consulta: es la consulta (Query) de la que se leen los resultados, sin limite
+    -orden: es una tupla de columnas que ordenan de forma estable (la ultima debe ser unica, el id) y no
+            pueden ser NULL (las fechas se pasan por fecha_orden)
+    -cursor: es la tupla de valores de orden de la ultima fila de la pagina anterior (None en la primera)
+    -tamanio: es un numero integer con los resultados por pagina (None devuelve todos)
+    -descendente: es un booleano, True ordena de mayor a menor (los mas recientes primero)
+
+    devuelve
+    -(resultados, cursor_siguiente): cursor_siguiente es None cuando no quedan mas resultados
+    '''
+    consulta = consulta.add_columns(*orden).order_by(None)
+    if cursor is not None:
+        clave = tuple_(*orden)
+        consulta = consulta.filter(clave < tuple_(*cursor) if descendente else clave > tuple_(*cursor))
+    consulta = consulta.order_by(*[columna.desc() if descendente else columna.asc() for columna in orden])
+
+    if tamanio is None:
+        return [fila[0] for fila in consulta.all()], None
+
+    # se pide una fila de mas para saber si hay pagina siguiente
+    filas = consulta.limit(tamanio + 1).all()
+    cursor_siguiente = tuple(filas[tamanio - 1][1:]) if len(filas) > tamanio else None
+    return [fila[0] for fila in filas[:tamanio]], cursor_siguiente
+
+
+# metodo para cargar un ingreso con todos sus registros y recambios
+def ingreso_con_registros(sesion, id_ingreso):
+    '''Devuelve el ingreso con sus registros (ingreso.registros) y el recambio de cada registro
+       (registro.recambios) cargados en una unica consulta con joins, o None si no existe
+
+    args
+    -sesion: es la sesion de base de datos con la que se consulta
+    -id_ingreso: es un numero integer con el codigo del ingreso
+    '''
+    return sesion.query(Ingreso).options(
+        joinedload(Ingreso.registros).joinedload(Registro.recambios)
+    ).filter(Ingreso.id_ingreso == id_ingreso).first()
+
+
+# metodo para buscar los vehiculos por kilometraje
+def vehiculos_por_kilometros(sesion, minimo=None, maximo=None, cursor=None, tamanio=TAMANIO_PAGINA):
+    '''Devuelve una pagina de los vehiculos con los kilometros entre minimo y maximo (incluidos), los
+       de mas kilometros primero, con su cliente cargado, y el cursor de la siguiente; el rango y el
+       orden se resuelven con el indice de Vehiculo.kilometros (por ejemplo los vehiculos de mas de
+       150000 km para cambiar la distribucion)
+
+    args
+    -sesion: es la sesion de base de datos con la que se consulta
+    -minimo: es un numero integer con los kilometros minimos (None sin limite)
+    -maximo: es un numero integer con los kilometros maximos (None sin limite)
+    -cursor, tamanio: paginacion, ver pagina_keyset
+    '''
+    consulta = sesion.query(Vehiculo).options(joinedload(Vehiculo.clientes))
+    if minimo is not None:
+        consulta = consulta.filter(Vehiculo.kilometros >= minimo)
+    if maximo is not None:
+        consulta = consulta.filter(Vehiculo.kilometros <= maximo)
+    return pagina_keyset(consulta, (Vehiculo.kilometros, Vehiculo.id_vehiculo), cursor, tamanio)
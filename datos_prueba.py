@@ -0,0 +1,230 @@
+'''Bases de datos de prueba con datos sinteticos del taller, para medir las ventanas a escala
+
+   uso: python datos_prueba.py [1k|100k|1m ...]   (sin argumentos genera la de 1k)
+
+   La base de datos del repositorio tiene unas pocas filas; con ella no se puede saber como se
+   comportan las busquedas con los datos de varios años de un taller. generar crea una base de datos
+   con clientes, vehiculos, recambios del catalogo, ingresos y sus registros en las proporciones de
+   un taller (unos 8 ingresos por cliente, 1,3 vehiculos por cliente, 3 lineas por ingreso, nombres y
+   recambios repartidos con frecuencias desiguales, como los reales). Con la misma escala y semilla
+   (y el mismo menu_recambios.json) los datos son siempre los mismos, asi que las medidas de
+   benchmark.py se pueden comparar entre versiones. Las filas se insertan sin indices ni triggers y
+   despues esquema.actualizar crea los indices, las tablas FTS y las tablas resumen de una vez.
+
+   Las bases de datos se guardan en CARPETA_DATOS y se reutilizan: la de 1m tarda unos minutos'''
+import os
+import sys
+import time
+import random
+import tempfile
+from datetime import datetime, timedelta
+from sqlalchemy.schema import CreateTable
+from catalogo import catalogo
+import esquema
+import db
+
+# Escalas de los datos, por numero de ingresos
+ESCALAS = {'1k': 1000, '100k': 100000, '1m': 1000000}
+
+# Semilla del generador y version de los datos (se sube al cambiar lo que genera generar)
+SEMILLA = int(os.environ.get('TALLER_SEMILLA_DATOS', 1))
+VERSION_DATOS = 1
+
+# Carpeta donde se guardan las bases de datos generadas
+CARPETA_DATOS = os.environ.get('TALLER_DATOS_PRUEBA', os.path.join(tempfile.gettempdir(), 'taller_datos_prueba'))
+
+# Filas por transaccion al insertar (ingresos por lote en los ingresos y sus registros)
+TAMANIO_LOTE = 20000
+
+# Ultimo dia de los datos (fijo para que no dependan del dia en que se generan) y años que abarcan
+FECHA_FINAL = datetime(2025, 1, 1)
+ANIOS = 5
+
+NOMBRES = ['Antonio', 'Manuel', 'José', 'Francisco', 'David', 'Juan', 'Javier', 'Daniel', 'Carlos',
+           'Jesús', 'Alejandro', 'Miguel', 'Rafael', 'Pablo', 'Pedro', 'Ángel', 'Sergio', 'Fernando',
+           'Jorge', 'Luis', 'María', 'Carmen', 'Ana', 'Isabel', 'Laura', 'Cristina', 'Marta', 'Lucía',
+           'Pilar', 'Elena', 'Paula', 'Sara', 'Raquel', 'Rosa', 'Teresa', 'Andrea', 'Sofía', 'Nuria',
+           'Silvia', 'Julia']
+APELLIDOS = ['García', 'Rodríguez', 'González', 'Fernández', 'López', 'Martínez', 'Sánchez', 'Pérez',
+             'Gómez', 'Martín', 'Jiménez', 'Ruiz', 'Hernández', 'Díaz', 'Moreno', 'Muñoz', 'Álvarez',
+             'Romero', 'Alonso', 'Gutiérrez', 'Navarro', 'Torres', 'Domínguez', 'Vázquez', 'Ramos',
+             'Gil', 'Ramírez', 'Serrano', 'Blanco', 'Molina', 'Morales', 'Suárez', 'Ortega', 'Delgado',
+             'Castro', 'Ortiz', 'Rubio', 'Marín', 'Sanz', 'Núñez']
+CALLES = ['Calle Mayor', 'Avenida de la Constitución', 'Calle Real', 'Plaza de España', 'Calle del Sol',
+          'Calle Nueva', 'Avenida de Andalucía', 'Calle San Juan', 'Calle de la Iglesia', 'Paseo del Prado']
+MARCAS = {'Seat': ['Ibiza', 'León', 'Arona', 'Ateca'], 'Renault': ['Clio', 'Mégane', 'Captur'],
+          'Volkswagen': ['Golf', 'Polo', 'Passat', 'T-Roc'], 'Peugeot': ['208', '308', '3008'],
+          'Ford': ['Fiesta', 'Focus', 'Kuga'], 'Toyota': ['Corolla', 'Yaris', 'RAV4'],
+          'Citroën': ['C3', 'C4', 'Berlingo'], 'Opel': ['Corsa', 'Astra'], 'Kia': ['Ceed', 'Sportage'],
+          'Hyundai': ['i30', 'Tucson']}
+MARCAS_RECAMBIO = ['Bosch', 'Mann', 'Brembo', 'Valeo', 'Febi', 'NGK', 'Castrol', 'Michelin', 'SKF', 'Gates']
+AVERIAS = ['Revisión de mantenimiento', 'Ruido al frenar', 'Pierde aceite', 'No arranca',
+           'Testigo de motor encendido', 'Vibraciones a alta velocidad', 'Cambio de neumáticos',
+           'Aire acondicionado no enfría', 'Embrague patina', 'Batería descargada', 'Pre-ITV']
+DIAGNOSTICOS = ['Cambio de aceite y filtros', 'Pastillas de freno desgastadas', 'Junta de cárter en mal estado',
+                'Batería agotada', 'Sonda lambda defectuosa', 'Neumáticos desequilibrados',
+                'Recarga de gas del aire acondicionado', 'Kit de embrague desgastado', 'Sin averías',
+                'Sustitución de correa de distribución']
+LETRAS_MATRICULA = 'BCDFGHJKLMNPRSTVWXYZ'
+
+
+# metodo para calcular cuantas filas de cada tabla corresponden a unos ingresos
+def proporciones(ingresos):
+    '''Devuelve un diccionario tabla -> filas (los registros son aproximados, unos 3 por ingreso)'''
+    clientes = max(50, ingresos // 8)
+    return {'clientes': clientes, 'vehiculos': clientes * 13 // 10,
+            'recambios': min(20000, max(300, ingresos // 50)), 'ingresos': ingresos}
+
+
+# metodo para convertir una fecha al texto con el que la guarda SQLAlchemy en sqlite
+def _fecha(fecha):
+    return fecha.strftime('%Y-%m-%d %H:%M:%S.%f')
+
+
+# metodo para elegir un indice de 0 a n-1 con los primeros mucho mas frecuentes
+def _sesgado(aleatorio, n, sesgo):
+    return int(n * aleatorio.random() ** sesgo)
+
+
+# metodo para generar las filas de todas las tablas
+def lotes(ingresos, semilla=SEMILLA):
+    '''Genera (tabla, lista de tuplas con las columnas de INSERTS) en el orden en que se insertan,
+       siempre los mismos para los mismos ingresos y semilla. Los ingresos y sus registros salen en
+       lotes de TAMANIO_LOTE ingresos, para no tener en memoria los millones de registros de 1m'''
+    aleatorio = random.Random(f'{semilla}-{ingresos}')
+    cantidades = proporciones(ingresos)
+    inicio = FECHA_FINAL - timedelta(days=365 * ANIOS)
+    segundos = 365 * ANIOS * 86400
+    pesos_apellidos = [1 / (posicion + 1) for posicion in range(len(APELLIDOS))]
+
+    clientes = []
+    for i in range(cantidades['clientes']):
+        nombre = (f"{aleatorio.choice(NOMBRES)} {aleatorio.choices(APELLIDOS, pesos_apellidos)[0]} "
+                  f"{aleatorio.choices(APELLIDOS, pesos_apellidos)[0]}")
+        clientes.append((i + 1, _fecha(inicio + timedelta(seconds=aleatorio.randrange(segundos))), nombre,
+                         f'6{aleatorio.randrange(10 ** 8):08d}',
+                         f'{aleatorio.choice(CALLES)}, {aleatorio.randrange(1, 120)}',
+                         f"{nombre.split()[0].lower()}.{i + 1}@correo.es"))
+
+    vehiculos, matriculas = [], set()
+    for i in range(cantidades['vehiculos']):
+        # los primeros vehiculos son uno de cada cliente, el resto segundos coches
+        propietario = i + 1 if i < len(clientes) else aleatorio.randrange(len(clientes)) + 1
+        marca = aleatorio.choice(list(MARCAS))
+        matricula = None
+        while matricula is None or matricula in matriculas:
+            matricula = f"{aleatorio.randrange(10000):04d} {''.join(aleatorio.choices(LETRAS_MATRICULA, k=3))}"
+        matriculas.add(matricula)
+        vehiculos.append([i + 1, _fecha(inicio + timedelta(seconds=aleatorio.randrange(segundos))), marca,
+                          aleatorio.choice(MARCAS[marca]), matricula, aleatorio.randrange(0, 250000), propietario])
+
+    recambios, precios = [], []
+    categorias = catalogo.categorias()
+    for i in range(cantidades['recambios']):
+        categoria = aleatorio.choice(categorias)
+        subcategoria = aleatorio.choice(catalogo.subcategorias(categoria) or [categoria])
+        marca = aleatorio.choice(MARCAS_RECAMBIO)
+        coche = aleatorio.choice(list(MARCAS))
+        recambios.append((i + 1, _fecha(inicio + timedelta(seconds=aleatorio.randrange(segundos))),
+                          f'{subcategoria} {marca} {1000 + i}',
+                          f'{subcategoria} {marca} para {coche} {aleatorio.choice(MARCAS[coche])}',
+                          categoria, subcategoria))
+        precios.append(aleatorio.randrange(200, 30000))
+
+    yield 'clientes', clientes
+    yield 'vehiculos', [tuple(vehiculo) for vehiculo in vehiculos]
+    yield 'recambios', recambios
+
+    ingresos_filas, registros = [], []
+    # las fechas de los ingresos crecen con su id, como al darlos de alta en el taller
+    fechas = sorted(aleatorio.randrange(segundos) for _ in range(ingresos))
+    # uno de cada cinco ingresos es de los vehiculos que vuelven mucho mas (flotas, taxis)
+    frecuentes = max(1, len(vehiculos) // 20)
+    for i, segundo in enumerate(fechas):
+        vehiculo = vehiculos[aleatorio.randrange(frecuentes if aleatorio.random() < 0.2 else len(vehiculos))]
+        vehiculo[5] += aleatorio.randrange(1000, 20000)  # el vehiculo se queda con los kilometros del ingreso
+        ingresos_filas.append((i + 1, _fecha(inicio + timedelta(seconds=segundo)), vehiculo[5],
+                               aleatorio.choice(AVERIAS), aleatorio.choice(DIAGNOSTICOS), vehiculo[6], vehiculo[0]))
+        for _ in range(aleatorio.choices((0, 1, 2, 3, 4, 6), (1, 3, 3, 3, 2, 1))[0]):
+            recambio = _sesgado(aleatorio, len(recambios), 3)
+            puc = precios[recambio]
+            puv = puc * aleatorio.randrange(130, 170) // 100
+            cantidad = aleatorio.choice((1, 1, 1, 2, 4))
+            registros.append((puc, puv, float(cantidad), puc * cantidad, puv * cantidad, recambio + 1, i + 1))
+        if len(ingresos_filas) == TAMANIO_LOTE or i == ingresos - 1:
+            yield 'ingresos', ingresos_filas
+            yield 'registros', registros
+            ingresos_filas, registros = [], []
+
+
+# Sentencias con las que se insertan las filas de lotes() (los importes ya van en centimos)
+INSERTS = {
+    'clientes': 'INSERT INTO clientes (id_cliente, fecha_alta, nombre, telefono, direccion, correo) VALUES (?, ?, ?, ?, ?, ?)',
+    'vehiculos': 'INSERT INTO vehiculos (id_vehiculo, fecha_alta, marca, modelo, matricula, kilometros, id_cliente) '
+                 'VALUES (?, ?, ?, ?, ?, ?, ?)',
+    'recambios': 'INSERT INTO recambios (id_recambio, fecha_alta, nombre_recambio, descripcion, categoria, subcategoria) '
+                 'VALUES (?, ?, ?, ?, ?, ?)',
+    'ingresos': 'INSERT INTO ingresos (id_ingreso, fecha_ingreso, kilometros_ingreso, averia, diagnostico, id_cliente, id_vehiculo) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+    'registros': 'INSERT INTO registros (puc, puv, cantidad, total_costo, total_venta, id_recambio, id_ingreso) '
+                 'VALUES (?, ?, ?, ?, ?, ?, ?)',
+}
+
+
+# metodo para crear una base de datos con datos sinteticos
+def generar(ruta, ingresos, semilla=SEMILLA):
+    '''Crea en ruta una base de datos sqlite con los datos de lotes(ingresos, semilla) y el esquema
+       completo (indices, FTS y resumenes). Devuelve un diccionario tabla -> filas insertadas
+
+    args
+    -ruta: es un string con la ruta del fichero, que no debe existir
+    -ingresos: es un numero integer con los ingresos a generar (ver ESCALAS)
+    -semilla: es un numero integer con la semilla del generador
+    '''
+    insertadas = dict.fromkeys(INSERTS, 0)
+    engine = db.crear_engine(f'sqlite:///{ruta}')
+    try:
+        with engine.begin() as conexion:
+            # solo las tablas: los indices se crean despues de insertar, de una vez
+            for tabla in db.Base_mobile.metadata.sorted_tables:
+                conexion.execute(CreateTable(tabla))
+        for tabla, filas in lotes(ingresos, semilla):
+            with engine.begin() as conexion:
+                conexion.exec_driver_sql(INSERTS[tabla], filas)
+            insertadas[tabla] += len(filas)
+        esquema.actualizar(engine)
+        with engine.connect() as conexion:
+            conexion.exec_driver_sql('ANALYZE')
+    finally:
+        engine.dispose()
+    return insertadas
+
+
+# metodo para obtener la base de datos de una escala, generandola si no existe
+def base_datos(escala, semilla=SEMILLA, carpeta=CARPETA_DATOS):
+    '''Devuelve la ruta de la base de datos de la escala ('1k', '100k' o '1m'); la primera vez la
+       genera (en un fichero temporal que se renombra al terminar, para no dejar una a medias)
+
+    args
+    -escala: es un string con una clave de ESCALAS
+    -semilla: es un numero integer con la semilla del generador
+    -carpeta: es un string con la carpeta donde se guardan las bases de datos
+    '''
+    ruta = os.path.join(carpeta, f'taller_{escala}_s{semilla}_v{VERSION_DATOS}.db')
+    if not os.path.exists(ruta):
+        os.makedirs(carpeta, exist_ok=True)
+        temporal = f'{ruta}.generando'
+        for sufijo in ('', '-wal', '-shm'):
+            if os.path.exists(temporal + sufijo):
+                os.remove(temporal + sufijo)
+        inicio = time.perf_counter()
+        generadas = generar(temporal, ESCALAS[escala], semilla)
+        os.replace(temporal, ruta)
+        print(f"Datos de prueba {escala}: {', '.join(f'{filas} {tabla}' for tabla, filas in generadas.items())} "
+              f"en {time.perf_counter() - inicio:.1f} s ({ruta})")
+    return ruta
+
+
+if __name__ == '__main__':
+    for escala in sys.argv[1:] or ['1k']:
+        print(base_datos(escala))
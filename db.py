@@ -1,21 +1,114 @@
 # Gracias a estas líneas de código, enfrento el mundo cada día 💪
 # Aqui va la configuracion de la base de datos
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+import os
+import threading
+from contextlib import contextmanager
+import flet as ft
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import sessionmaker, scoped_session, declarative_base
 
 '''El engine permite a SQLAlchemy comunicarse con la base de datos en un dialogo concreto
    https://docs.sqlalchemy.org/en/14/core/engines.html'''
 
-engine_sqlite = create_engine('sqlite:///database/mobile.db',
-                              connect_args={"check_same_thread": False})
+# Ruta de la base de datos y tamaño del pool de conexiones (configurables por variables de entorno)
+URL_DB = os.environ.get('TALLER_DB_URL', 'sqlite:///database/mobile.db')
+POOL_SIZE = int(os.environ.get('TALLER_POOL_SIZE', 5))  # conexiones que se mantienen abiertas
+MAX_OVERFLOW = int(os.environ.get('TALLER_MAX_OVERFLOW', 10))  # conexiones extra permitidas en picos de uso
+PERFIL_DB = os.environ.get('TALLER_DB_PERFIL', 'rendimiento')  # perfil de PRAGMAs de PERFILES_SQLITE
+
+# Perfiles de PRAGMAs que se aplican a cada conexion sqlite nueva
+PERFILES_SQLITE = {
+    # valores por defecto de sqlite: journal de rollback y sincronizacion completa
+    'defecto': {},
+    # WAL con sincronizacion completa: lectores sin bloqueo pero cada commit hace fsync
+    'seguro': {
+        'journal_mode': 'WAL',
+        'synchronous': 'FULL',
+        'busy_timeout': 5000,
+    },
+    # WAL con sincronizacion NORMAL: el fsync se hace en los checkpoints, no en cada commit
+    'rendimiento': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'mmap_size': 268435456,  # 256 MB mapeados en memoria
+        'cache_size': -65536,  # en negativo son KiB: 64 MB de cache de paginas
+        'temp_store': 'MEMORY',
+        'busy_timeout': 5000,  # milisegundos de espera si la base de datos esta bloqueada
+    },
+}
+
+
+def aplicar_perfil(engine, perfil):
+    '''Registra un evento connect que aplica los PRAGMAs del perfil a cada conexion nueva del engine'''
+    pragmas = PERFILES_SQLITE[perfil]
+
+    @event.listens_for(engine, 'connect')
+    def _aplicar_pragmas(conexion_dbapi, registro_conexion):
+        cursor = conexion_dbapi.cursor()
+        for nombre, valor in pragmas.items():
+            cursor.execute(f'PRAGMA {nombre}={valor}')
+        cursor.close()
+
+
+def crear_engine(url=URL_DB, pool_size=POOL_SIZE, max_overflow=MAX_OVERFLOW, perfil=PERFIL_DB):
+    '''Crea un engine con el pool de conexiones y el perfil de PRAGMAs configurados
+
+    args
+    -url: es un string con la url de la base de datos
+    -pool_size: es un numero integer con las conexiones que se mantienen abiertas en el pool
+    -max_overflow: es un numero integer con las conexiones extra que se pueden abrir en picos de uso
+    -perfil: es un string con el nombre del perfil de PERFILES_SQLITE (solo para sqlite)
+    '''
+    engine = create_engine(url,
+                           connect_args={"check_same_thread": False},
+                           pool_size=pool_size,
+                           max_overflow=max_overflow)
+    if engine.dialect.name == 'sqlite':
+        aplicar_perfil(engine, perfil)
+    return engine
+
+
+engine_sqlite = crear_engine()
+
+
+@contextmanager
+def transaccion(conectable):
+    '''Abre una transaccion con el engine, o usa la conexion si ya se le pasa una con su transaccion
+       abierta (por ejemplo la de esquema.actualizar, que aplica todos los pasos en una sola)'''
+    if isinstance(conectable, Connection):
+        yield conectable
+    else:
+        with conectable.begin() as conexion:
+            yield conexion
 
 '''Advertencia: crear el engine no conecta inmediatamente con la DB, eso lo hacemos despues
    Creamos la session, lo que permite realizar transacciones (operaciones) dentro de nuestra DB'''
 
-# Crear una nueva sesión para la base de datos de el mobil
+
+def ambito_sesion():
+    '''Devuelve la clave del registro de sesiones: la sesion de Flet de la pagina actual
+       (cada terminal conectado tiene la suya) o el hilo actual si no hay pagina (main.py, scripts)'''
+    page = ft.context.page
+    if page is not None:
+        return page.session_id
+    return threading.get_ident()
+
+
+# Registro de sesiones para la base de datos de el mobil, una sesion por pagina o por hilo
 Session = sessionmaker(bind=engine_sqlite)
-session = Session()
+session = scoped_session(Session, scopefunc=ambito_sesion)
+
+
+def cerrar_sesion(clave=None):
+    '''Cierra y descarta la sesion del registro asociada a la clave (por defecto la del ambito actual)'''
+    if clave is None:
+        session.remove()
+        return
+    sesion = session.registry.registry.pop(clave, None)
+    if sesion is not None:
+        sesion.close()
 
 '''Ahora vamos al fichero models.py en los modelos (clases) donde queremos
    que se transformen en tablas, le añadiremos esta variable y esto se encargara de mapear
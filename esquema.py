@@ -0,0 +1,103 @@
+# Version del esquema de la base de datos y migraciones que la actualizan al arrancar
+
+import sys
+from datetime import datetime
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+import models
+import busqueda
+import resumenes
+import db
+
+'''Antes cada arranque (app.py, main.py, los scripts de carga) llamaba a create_all, migrar,
+   crear_indices, crear_indices_busqueda y crear_resumenes: todos comprueban si tienen algo que hacer,
+   pero para saberlo leen sqlite_master y PRAGMA table_info de cada tabla y lanzan los CREATE ... IF
+   NOT EXISTS de los indices y triggers. Ahora la tabla versiones_esquema guarda las migraciones ya
+   aplicadas y actualizar solo lee su version: si la base de datos esta al dia no hace nada mas.
+
+   MIGRACIONES es una lista ordenada de (version, nombre, funcion(conexion)). Las pendientes se
+   aplican en orden en una sola transaccion (si alguna falla la base de datos se queda como estaba)
+   y cada una anota su version. Todas tienen que poder aplicarse dos veces sin cambiar nada, porque
+   las bases de datos anteriores a versiones_esquema las aplican todas la primera vez, tengan ya o
+   no sus tablas e indices. Para cambiar el esquema se añade una migracion al final con la version
+   siguiente; las que ya estan publicadas no se modifican'''
+
+# Tabla con una fila por migracion aplicada
+DDL_VERSIONES = '''CREATE TABLE IF NOT EXISTS versiones_esquema (
+    version INTEGER PRIMARY KEY,
+    nombre VARCHAR NOT NULL,
+    fecha DATETIME NOT NULL
+)'''
+
+
+# metodo para crear las tablas de los modelos que aun no existan
+def crear_tablas(conexion):
+    db.Base_mobile.metadata.create_all(conexion)
+
+
+# Migraciones del esquema, en orden de version
+MIGRACIONES = [
+    (1, 'tablas', crear_tablas),
+    (2, 'centimos', models.migrar_centimos),
+    (3, 'kilometros', models.migrar_kilometros),
+    (4, 'indices', models.crear_indices),
+    (5, 'busqueda', busqueda.crear_indices_busqueda),
+    (6, 'resumenes', resumenes.crear_resumenes),
+    (7, 'orden_fechas', models.crear_indices),
+]
+
+# Version del esquema que espera esta version de la aplicacion
+VERSION = MIGRACIONES[-1][0]
+
+
+# metodo para leer la version del esquema de la base de datos
+def version(conexion):
+    '''Devuelve la ultima version aplicada, 0 si la base de datos es nueva o anterior a versiones_esquema'''
+    try:
+        return conexion.exec_driver_sql('SELECT max(version) FROM versiones_esquema').scalar() or 0
+    except OperationalError:
+        return 0
+
+
+# metodo para llevar la base de datos a la version del esquema de la aplicacion
+def actualizar(engine=db.engine_sqlite):
+    '''Aplica las MIGRACIONES posteriores a la version de la base de datos y devuelve la lista de
+       sus nombres (vacia si ya estaba al dia). Se llama en cada arranque antes de usar la base de datos
+
+    args
+    -engine: es el engine de la base de datos a actualizar
+    '''
+    with engine.connect() as conexion:
+        if version(conexion) >= VERSION:
+            return []
+
+    with engine.connect() as conexion:
+        # pysqlite no abre la transaccion antes de un DROP o un ALTER, se abre a mano; IMMEDIATE
+        # hace esperar a otro proceso que arranque a la vez hasta que esta termine
+        conexion.exec_driver_sql('BEGIN IMMEDIATE')
+        conexion.exec_driver_sql(DDL_VERSIONES)
+        # se vuelve a leer ya con el bloqueo: el otro proceso puede haberla actualizado mientras tanto
+        actual = version(conexion)
+        pendientes = [(numero, nombre, migracion) for numero, nombre, migracion in MIGRACIONES if numero > actual]
+        for numero, nombre, migracion in pendientes:
+            migracion(conexion)
+            conexion.execute(text('INSERT INTO versiones_esquema (version, nombre, fecha) VALUES (:version, :nombre, :fecha)'),
+                             {'version': numero, 'nombre': nombre, 'fecha': datetime.now()})
+        conexion.commit()
+    return [nombre for _, nombre, _ in pendientes]
+
+
+if __name__ == '__main__':
+    # python esquema.py: actualiza database/mobile.db y muestra su version y los kilometros que no se pudieron migrar
+    try:
+        aplicadas = actualizar(db.engine_sqlite)
+    except models.RecambiosDuplicados as error:
+        sys.exit(str(error))
+    print(f"Migraciones aplicadas: {', '.join(aplicadas)}" if aplicadas else 'La base de datos ya estaba al dia')
+    with db.engine_sqlite.connect() as conexion:
+        print(f'Version del esquema: {version(conexion)} (la aplicacion espera la {VERSION})')
+        no_validos = models.kilometros_no_validos(conexion)
+    if no_validos:
+        print(f'{len(no_validos)} vehiculos con unos kilometros que no se pudieron leer al migrar (se dejaron en 0):')
+        for id_vehiculo, matricula, kilometros in no_validos:
+            print(f'  id {id_vehiculo} ({matricula}): {kilometros!r}')
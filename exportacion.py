@@ -0,0 +1,161 @@
+'''Exportacion del historial de ingresos y registros a csv o JSON Lines (para la gestoria)
+
+   uso: python exportacion.py fichero.csv|fichero.jsonl [--desde AAAA-MM-DD] [--hasta AAAA-MM-DD]
+
+   Cada fila del fichero es un registro (recambio usado) de un ingreso con los datos del cliente y
+   del vehiculo; los ingresos sin registros salen en una fila con las columnas del registro vacias.
+   Las filas se leen de la base de datos por bloques (yield_per) y se escriben segun llegan, asi
+   que exportar años de historial no carga todo en memoria ni en la sesion'''
+import os
+import csv
+import sys
+import json
+import time
+from datetime import datetime, date, timedelta
+from sqlalchemy import select
+from models import Cliente, Vehiculo, Recambio, Ingreso, Registro
+import esquema
+import db
+
+# Filas que se leen de la base de datos en cada bloque
+FILAS_POR_BLOQUE = int(os.environ.get('TALLER_FILAS_EXPORTACION', 2000))
+
+# Carpeta donde deja los ficheros la exportacion desde la ventana de ingresos
+RUTA_EXPORTACIONES = os.environ.get(
+    'TALLER_EXPORTACIONES', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'exportaciones'))
+
+# Columnas del fichero exportado, en orden
+COLUMNAS = [
+    Ingreso.id_ingreso, Ingreso.fecha_ingreso, Ingreso.kilometros_ingreso, Ingreso.averia, Ingreso.diagnostico,
+    Cliente.id_cliente, Cliente.nombre.label('cliente'), Cliente.telefono, Cliente.correo,
+    Vehiculo.id_vehiculo, Vehiculo.marca, Vehiculo.modelo, Vehiculo.matricula,
+    Registro.id_registro, Recambio.id_recambio, Recambio.nombre_recambio, Recambio.categoria, Recambio.subcategoria,
+    Registro.cantidad, Registro.puc, Registro.puv, Registro.total_costo, Registro.total_venta,
+]
+CABECERA = [columna.key for columna in COLUMNAS]
+
+
+# metodo para construir la consulta del historial entre dos fechas
+def consulta_historial(desde=None, hasta=None):
+    '''Devuelve la sentencia select de las filas del historial ordenadas por fecha de ingreso
+
+    args
+    -desde: es un date con el primer dia incluido (None sin limite)
+    -hasta: es un date con el ultimo dia incluido (None sin limite)
+    '''
+    sentencia = (
+        select(*COLUMNAS)
+        .select_from(Ingreso)
+        .outerjoin(Cliente, Ingreso.id_cliente == Cliente.id_cliente)
+        .outerjoin(Vehiculo, Ingreso.id_vehiculo == Vehiculo.id_vehiculo)
+        .outerjoin(Registro, Registro.id_ingreso == Ingreso.id_ingreso)
+        .outerjoin(Recambio, Registro.id_recambio == Recambio.id_recambio)
+        .order_by(Ingreso.fecha_ingreso, Ingreso.id_ingreso, Registro.id_registro)
+    )
+    # el filtro por fecha_ingreso usa su indice; hasta incluye el dia entero
+    if desde is not None:
+        sentencia = sentencia.where(Ingreso.fecha_ingreso >= datetime.combine(desde, datetime.min.time()))
+    if hasta is not None:
+        sentencia = sentencia.where(Ingreso.fecha_ingreso < datetime.combine(hasta + timedelta(days=1), datetime.min.time()))
+    return sentencia
+
+
+# metodo para recorrer el historial sin cargarlo entero
+def filas_historial(sesion, desde=None, hasta=None, filas_por_bloque=FILAS_POR_BLOQUE):
+    '''Genera las filas del historial como tuplas en el orden de CABECERA; se leen columnas sueltas,
+       no objetos del ORM, asi que la sesion no guarda nada en su identity map'''
+    resultado = sesion.execute(consulta_historial(desde, hasta).execution_options(yield_per=filas_por_bloque))
+    try:
+        yield from resultado
+    finally:
+        resultado.close()
+
+
+# metodo para convertir un valor de la base de datos en texto del fichero
+def _valor(valor):
+    if isinstance(valor, datetime):
+        return valor.isoformat(sep=' ', timespec='seconds')
+    return valor
+
+
+# metodo para exportar el historial a un fichero csv o jsonl
+def exportar_historial(sesion, ruta, desde=None, hasta=None, filas_por_bloque=FILAS_POR_BLOQUE):
+    '''Escribe el historial en ruta (.csv con ; como separador, o .jsonl con un objeto por linea) y
+       devuelve el numero de filas y los segundos que ha tardado. Se escribe primero en un fichero
+       temporal junto al destino, asi que si falla a medias no queda un fichero incompleto
+
+    args
+    -sesion: es la sesion de base de datos con la que se consulta
+    -ruta: es un string con la ruta del fichero de salida
+    -desde: es un date con el primer dia incluido (None sin limite)
+    -hasta: es un date con el ultimo dia incluido (None sin limite)
+    -filas_por_bloque: es un numero integer con las filas que se leen de la base de datos cada vez
+    '''
+    inicio = time.perf_counter()
+    jsonl = ruta.lower().endswith('.jsonl')
+    temporal = f'{ruta}.parcial'
+    total = 0
+    try:
+        with open(temporal, 'w', encoding='utf-8', newline='') as archivo:
+            if not jsonl:
+                escritor = csv.writer(archivo, delimiter=';')
+                escritor.writerow(CABECERA)
+            for fila in filas_historial(sesion, desde, hasta, filas_por_bloque):
+                valores = [_valor(valor) for valor in fila]
+                if jsonl:
+                    # los importes (Decimal) salen como numeros json
+                    archivo.write(json.dumps(dict(zip(CABECERA, valores)), ensure_ascii=False, default=float) + '\n')
+                else:
+                    escritor.writerow(valores)
+                total += 1
+        os.replace(temporal, ruta)
+    finally:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+    return total, time.perf_counter() - inicio
+
+
+# metodo para obtener la ruta del fichero de una exportacion desde la aplicacion
+def ruta_exportacion(desde=None, hasta=None, extension='csv'):
+    '''Devuelve la ruta en RUTA_EXPORTACIONES (creando la carpeta si no existe) con las fechas
+       en el nombre, por ejemplo historial_2024-01-01_2024-12-31.csv'''
+    os.makedirs(RUTA_EXPORTACIONES, exist_ok=True)
+    nombre = f"historial_{desde or 'inicio'}_{hasta or date.today()}.{extension}"
+    return os.path.join(RUTA_EXPORTACIONES, nombre)
+
+
+# metodo para leer una fecha de la linea de comandos o de la ventana de ingresos
+def leer_fecha(texto):
+    '''Convierte "AAAA-MM-DD" o "DD/MM/AAAA" en un date; sin texto devuelve None y con un texto
+       que no es una fecha lanza ValueError'''
+    texto = (texto or '').strip()
+    if not texto:
+        return None
+    for formato in ('%Y-%m-%d', '%d/%m/%Y'):
+        try:
+            return datetime.strptime(texto, formato).date()
+        except ValueError:
+            pass
+    raise ValueError(f'fecha no valida: {texto} (AAAA-MM-DD o DD/MM/AAAA)')
+
+
+if __name__ == '__main__':
+    # crea o actualiza las tablas y los indices, como main.py
+    esquema.actualizar(db.engine_sqlite)
+
+    argumentos = sys.argv[1:]
+    fechas = {'--desde': None, '--hasta': None}
+    for opcion in fechas:
+        if opcion in argumentos:
+            posicion = argumentos.index(opcion)
+            fechas[opcion] = leer_fecha(argumentos[posicion + 1])
+            del argumentos[posicion:posicion + 2]
+    if len(argumentos) != 1:
+        sys.exit(__doc__)
+
+    sesion = db.Session()
+    try:
+        total, segundos = exportar_historial(sesion, argumentos[0], fechas['--desde'], fechas['--hasta'])
+    finally:
+        sesion.close()
+    print(f"{argumentos[0]}: {total} filas en {segundos:.2f} s ({total / max(segundos, 1e-9):.0f} filas/s)")
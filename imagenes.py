@@ -0,0 +1,220 @@
+'''Variantes reducidas de las imagenes de las ventanas y manifiesto con el que las resuelven
+
+   uso: python imagenes.py [--informe]
+
+   Las ventanas muestran las imagenes de assets/ en contenedores de 320x120 o 250x250 pixeles en una
+   ventana de 350 de ancho, pero los ficheros originales miden hasta 2000 pixeles y varios megas, que
+   Flet tiene que enviar y decodificar antes de pintar la ventana. Este script genera en
+   assets/optimizadas/ una variante de cada imagen de IMAGENES recortada como la recorta ImageFit.COVER
+   y reducida al tamaño en que se ve (por DENSIDAD para las pantallas de alta densidad), en WebP o en
+   PNG optimizado, el que ocupe menos, y escribe manifiesto.json. Las ventanas piden la ruta con
+   imagenes.ruta("/ImagenClientes.png"), que devuelve la variante si esta en el manifiesto y la
+   imagen original si no. --informe solo muestra los bytes de imagenes de cada ruta de app.RUTAS
+
+   Generar las variantes necesita Pillow (pip install pillow); la aplicacion solo lee el manifiesto'''
+import os
+import io
+import re
+import sys
+import json
+import time
+import inspect
+from functools import lru_cache
+
+# Carpeta de los assets de Flet, de las variantes y manifiesto que las lista
+RUTA_ASSETS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets')
+CARPETA_VARIANTES = 'optimizadas'
+MANIFIESTO = os.path.join(RUTA_ASSETS, CARPETA_VARIANTES, 'manifiesto.json')
+
+# Pixeles de la imagen por pixel logico de la ventana (2 para las tabletas de alta densidad)
+DENSIDAD = float(os.environ.get('TALLER_DENSIDAD_IMAGENES', 2))
+
+# Calidad de las variantes WebP (0-100)
+CALIDAD_WEBP = int(os.environ.get('TALLER_CALIDAD_WEBP', 80))
+
+# Imagenes de las ventanas y tamaño (ancho, alto) del contenedor en que se muestran
+IMAGENES = {
+    '/logo-APP3.png': (250, 250),
+    '/ImagenVehiculo2.png': (200, 90),
+    '/ImagenClientes.png': (320, 120),
+    '/ImagenClienteNuevo.png': (320, 120),
+    '/ImagenVehiculos.png': (320, 120),
+    '/imagen_de_nuevo_vehiculo.png': (320, 120),
+    '/ImagenRecambios.png': (320, 120),
+    '/ImagenCrearRecambio.png': (320, 120),
+    '/Imagen_de_Ingresos.png': (320, 120),
+    '/Imagen_de_nuevo_ingreso.png': (320, 70),  # el fichero es imagen_de_nuevo_ingreso.png
+    'car-add.png': (30, 30),
+    'add-spare part.png': (30, 30),
+    'add-new entry.png': (30, 30),
+}
+
+
+# metodo para obtener la ruta en disco de una imagen de los assets
+def _fichero(src):
+    '''Devuelve la ruta del fichero de src en assets; si no existe tal cual lo busca sin distinguir
+       mayusculas, como lo encuentra Flet en Windows. None si no existe'''
+    fichero = os.path.join(RUTA_ASSETS, src.lstrip('/'))
+    if os.path.exists(fichero):
+        return fichero
+    carpeta, nombre = os.path.split(fichero)
+    for candidato in os.listdir(carpeta) if os.path.isdir(carpeta) else []:
+        if candidato.lower() == nombre.lower():
+            return os.path.join(carpeta, candidato)
+    return None
+
+
+# metodo para leer el manifiesto de las variantes
+@lru_cache(maxsize=1)
+def manifiesto():
+    '''Devuelve el diccionario src original -> datos de la variante (vacio si no se han generado)'''
+    try:
+        with open(MANIFIESTO, encoding='utf-8') as archivo:
+            return json.load(archivo)
+    except FileNotFoundError:
+        return {}
+
+
+# metodo para obtener la ruta de la imagen que tiene que cargar una ventana
+def ruta(src):
+    '''Devuelve la ruta de la variante reducida de src si esta en el manifiesto, o src si no
+
+    args
+    -src: es un string con la ruta de la imagen original dentro de assets (image_src o src)
+    '''
+    variante = manifiesto().get(src)
+    return variante['src'] if variante else src
+
+
+# metodo para recortar y reducir una imagen como la muestra ImageFit.COVER
+def _reducir(imagen, ancho, alto):
+    '''Recorta el centro de la imagen a la proporcion del contenedor y la reduce a ancho x alto por
+       DENSIDAD pixeles, sin ampliarla nunca'''
+    from PIL import Image
+    escala = max(ancho / imagen.width, alto / imagen.height)
+    recorte_ancho, recorte_alto = round(ancho / escala), round(alto / escala)
+    izquierda, arriba = (imagen.width - recorte_ancho) // 2, (imagen.height - recorte_alto) // 2
+    imagen = imagen.crop((izquierda, arriba, izquierda + recorte_ancho, arriba + recorte_alto))
+    destino = (round(ancho * DENSIDAD), round(alto * DENSIDAD))
+    if destino[0] < imagen.width:
+        imagen = imagen.resize(destino, Image.LANCZOS)
+    return imagen
+
+
+# metodo para codificar una variante en el formato que ocupe menos
+def _codificar(imagen):
+    '''Devuelve (extension, bytes) de la imagen en WebP o PNG optimizado, el mas pequeño'''
+    opciones = []
+    for extension, parametros in (('webp', {'format': 'WEBP', 'quality': CALIDAD_WEBP, 'method': 6}),
+                                  ('png', {'format': 'PNG', 'optimize': True})):
+        salida = io.BytesIO()
+        imagen.save(salida, **parametros)
+        opciones.append((len(salida.getvalue()), extension, salida.getvalue()))
+    _, extension, datos = min(opciones)
+    return extension, datos
+
+
+# metodo para generar las variantes de IMAGENES y el manifiesto
+def generar(imagenes=IMAGENES):
+    '''Escribe en assets/optimizadas/ la variante de cada imagen y el manifiesto, y lo devuelve.
+       Las imagenes que no existen se avisan y se dejan fuera (la ventana sigue pidiendo el original)
+
+    args
+    -imagenes: es un diccionario src -> (ancho, alto) del contenedor
+    '''
+    from PIL import Image
+    os.makedirs(os.path.dirname(MANIFIESTO), exist_ok=True)
+    variantes = {}
+    for src, (ancho, alto) in imagenes.items():
+        original = _fichero(src)
+        if original is None:
+            print(f'{src}: no existe, se deja fuera')
+            continue
+
+        with Image.open(original) as imagen:
+            imagen.load()
+            tamanio_original = imagen.size
+            variante = _reducir(imagen.convert('RGBA' if 'A' in imagen.getbands() else 'RGB'), ancho, alto)
+        extension, datos = _codificar(variante)
+        nombre = f"{os.path.splitext(os.path.basename(src))[0]}.{extension}"
+        with open(os.path.join(os.path.dirname(MANIFIESTO), nombre), 'wb') as archivo:
+            archivo.write(datos)
+        variantes[src] = {
+            'src': f'/{CARPETA_VARIANTES}/{nombre}',
+            'original': list(tamanio_original), 'variante': list(variante.size),
+            'bytes_original': os.path.getsize(original), 'bytes': len(datos),
+        }
+
+    with open(MANIFIESTO, 'w', encoding='utf-8') as archivo:
+        json.dump(variantes, archivo, indent=2, ensure_ascii=False, sort_keys=True)
+    manifiesto.cache_clear()
+    return variantes
+
+
+# metodo para obtener las imagenes que carga la ventana de cada ruta
+def imagenes_por_ruta(rutas):
+    '''Devuelve ruta -> lista de src de las imagenes que aparecen en el codigo de su vista
+
+    args
+    -rutas: es el diccionario RUTAS de app.py (ruta -> {'vista': clase o "modulo.Clase", ...})
+    '''
+    from navegacion import clase_vista
+    return {ruta_vista: re.findall(r'src=(?:imagenes\.ruta\()?"([^"]+)"', inspect.getsource(clase_vista(datos)))
+            for ruta_vista, datos in rutas.items()}
+
+
+# metodo para medir lo que cuesta decodificar una imagen
+def _decodificar(fichero):
+    from PIL import Image
+    inicio = time.perf_counter()
+    with Image.open(fichero) as imagen:
+        imagen.load()
+    return (time.perf_counter() - inicio) * 1000
+
+
+# metodo para mostrar los bytes de imagenes que se envian en cada ruta
+def informe(rutas):
+    '''Imprime por cada ruta las imagenes que carga, sus bytes y el tiempo de decodificarlas con
+       los originales y con las variantes del manifiesto, y devuelve los totales (antes, ahora)'''
+    decodificar = _pillow_instalado()  # sin Pillow solo se cuentan los bytes
+    print(f"{'ruta':<26} {'imagenes':>8} {'KB antes':>9} {'KB ahora':>9}" + (f" {'ms antes':>9} {'ms ahora':>9}" if decodificar else ''))
+    total_antes = total_ahora = 0
+    for ruta_vista, fuentes in imagenes_por_ruta(rutas).items():
+        antes = ahora = 0
+        ms_antes = ms_ahora = 0.0
+        for src in fuentes:
+            original = _fichero(src)
+            if original is None:
+                continue  # la ventana tampoco la encuentra
+            antes += os.path.getsize(original)
+            variante = _fichero(ruta(src))
+            ahora += os.path.getsize(variante)
+            if decodificar:
+                ms_antes += _decodificar(original)
+                ms_ahora += _decodificar(variante)
+        total_antes += antes
+        total_ahora += ahora
+        print(f"{ruta_vista:<26} {len(fuentes):>8} {antes / 1024:>9.0f} {ahora / 1024:>9.0f}"
+              + (f" {ms_antes:>9.1f} {ms_ahora:>9.1f}" if decodificar else ''))
+    print(f"{'total':<26} {'':>8} {total_antes / 1024:>9.0f} {total_ahora / 1024:>9.0f}")
+    return total_antes, total_ahora
+
+
+# metodo para saber si se puede usar Pillow
+def _pillow_instalado():
+    try:
+        import PIL  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+if __name__ == '__main__':
+    from app import RUTAS
+    if '--informe' not in sys.argv[1:]:
+        if not _pillow_instalado():
+            sys.exit('Generar las variantes necesita Pillow: pip install pillow')
+        for src, datos in generar().items():
+            print(f"{src}: {datos['original'][0]}x{datos['original'][1]} {datos['bytes_original'] / 1024:.0f} KB -> "
+                  f"{datos['src']} {datos['variante'][0]}x{datos['variante'][1]} {datos['bytes'] / 1024:.0f} KB")
+    informe(RUTAS)
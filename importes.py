@@ -0,0 +1,106 @@
+'''Importes de los registros calculados en la base de datos
+
+   uso: python importes.py [--recalcular]
+
+   Los importes de los registros se guardan en centimos (models.Centimos), asi que el total de una
+   linea y las sumas se calculan en SQL con enteros, sin los errores de redondeo de sumar floats.
+   Cuando cambian los precios, los totales de todas las lineas afectadas se recalculan con un solo
+   UPDATE en lugar de cargar cada Registro en la sesion. --recalcular vuelve a calcular los totales
+   de todas las lineas desde su precio unitario y su cantidad (por ejemplo despues de migrar una
+   base de datos con importes en FLOAT)'''
+import sys
+from sqlalchemy import select, update, func, cast, case, type_coerce, literal, or_, Integer
+from models import Registro
+import models
+import esquema
+import db
+
+registros = Registro.__table__
+
+
+# Cantidad de un registro en unidades enteras (millonesimas) para calcular su total con enteros
+ESCALA_CANTIDAD = 10 ** models.DECIMALES_CANTIDAD
+
+
+# metodo para construir el total en centimos de una linea: precio unitario por cantidad redondeado
+def total_linea(precio):
+    '''Devuelve la expresion SQL del total en centimos de precio * cantidad, redondeado la mitad
+       hacia arriba como models.importe. Se calcula con enteros: la cantidad (FLOAT) se pasa a
+       ESCALA_CANTIDAD unidades y al producto se le suma media unidad (o se le resta si es negativo)
+       antes de la division entera, que en sqlite trunca hacia cero. Con round() sobre el producto
+       en float no coincidia: 45 centimos * 0.7 es 31.499999999999996 y daba 31 y no 32
+
+    args
+    -precio: es la columna puc o puv de registros, o un numero integer de centimos
+    '''
+    producto = type_coerce(precio, Integer) * cast(func.round(registros.c.cantidad * ESCALA_CANTIDAD), Integer)
+    mitad = ESCALA_CANTIDAD // 2
+    return case((producto < 0, (producto - mitad) // ESCALA_CANTIDAD),
+                else_=(producto + mitad) // ESCALA_CANTIDAD)
+
+
+# metodo para recalcular los totales de las lineas desde su precio y su cantidad
+def recalcular_totales(conexion, *condiciones):
+    '''Recalcula total_costo y total_venta de los registros que cumplen las condiciones (todos si no
+       hay condiciones) con un UPDATE; solo escribe las filas cuyo total cambia, porque cada fila
+       escrita actualiza las tablas resumen con sus triggers. Devuelve las filas modificadas
+
+    args
+    -conexion: es la conexion o la sesion con la transaccion en la que se actualiza
+    -condiciones: son expresiones sobre las columnas de Registro, por ejemplo Registro.id_ingreso == 3
+    '''
+    total_costo, total_venta = total_linea(registros.c.puc), total_linea(registros.c.puv)
+    return conexion.execute(
+        update(registros)
+        .where(*condiciones, or_(registros.c.total_costo != total_costo, registros.c.total_venta != total_venta))
+        .values(total_costo=total_costo, total_venta=total_venta)
+    ).rowcount
+
+
+# metodo para cambiar el precio unitario de muchos registros y recalcular sus totales
+def actualizar_precios(conexion, *condiciones, puc=None, puv=None):
+    '''Pone el precio unitario de costo y/o de venta a los registros que cumplen las condiciones y
+       recalcula sus totales en el mismo UPDATE. Devuelve las filas modificadas
+
+    args
+    -conexion: es la conexion o la sesion con la transaccion en la que se actualiza
+    -condiciones: son expresiones sobre las columnas de Registro, por ejemplo Registro.id_recambio == 7
+    -puc: es el nuevo precio unitario de costo en euros (Decimal, float o string), None lo deja igual
+    -puv: es el nuevo precio unitario de venta en euros (Decimal, float o string), None lo deja igual
+    '''
+    valores = {}
+    if puc is not None:
+        valores['puc'] = puc
+        valores['total_costo'] = total_linea(literal(models.centimos(puc), Integer))
+    if puv is not None:
+        valores['puv'] = puv
+        valores['total_venta'] = total_linea(literal(models.centimos(puv), Integer))
+    if not valores:
+        return 0
+    return conexion.execute(update(registros).where(*condiciones).values(**valores)).rowcount
+
+
+# metodo para sumar los importes de los registros en la base de datos
+def totales(conexion, *condiciones):
+    '''Devuelve (lineas, total_costo, total_venta) de los registros que cumplen las condiciones,
+       sumados en SQL en centimos; los totales son Decimal en euros. Para los totales de un ingreso,
+       un cliente o un mes es mas rapido leer las tablas de resumenes.py
+
+    args
+    -conexion: es la conexion o la sesion con la que se consulta
+    -condiciones: son expresiones sobre las columnas de Registro
+    '''
+    lineas, total_costo, total_venta = conexion.execute(
+        select(func.count(), func.sum(registros.c.total_costo), func.sum(registros.c.total_venta))
+        .where(*condiciones)).one()
+    return lineas, total_costo or models.euros(0), total_venta or models.euros(0)
+
+
+if __name__ == '__main__':
+    esquema.actualizar(db.engine_sqlite)
+    if '--recalcular' in sys.argv[1:]:
+        with db.engine_sqlite.begin() as conexion:
+            print(f'{recalcular_totales(conexion)} registros con los totales recalculados')
+    with db.engine_sqlite.connect() as conexion:
+        lineas, total_costo, total_venta = totales(conexion)
+    print(f'{lineas} registros, costo {total_costo} EUR, venta {total_venta} EUR')
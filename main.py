@@ -5,6 +5,8 @@ from flet import *
 from sqlalchemy import and_, desc, asc
 from sqlalchemy.exc import SQLAlchemyError
 from models import Cliente, Vehiculo, Recambio, Ingreso, Registro
+import models
+import esquema
 import db
 
 # metodo para registrar cliente nuevo
@@ -51,7 +53,11 @@ def vehiculo_nuevo():
     marca = input("Introduce la marca del vehiculo: ")
     modelo = input("Introduce el modelo del vehiculo: ")
     matricula = input("Introduce la matricula del vehiculo: ")
-    kilometros = input("Introduce los kilometros del vehiculo: ")
+    try:
+        kilometros = models.leer_kilometros(input("Introduce los kilometros del vehiculo: "))
+    except ValueError as error:
+        print(error)
+        return
     fecha_alta = datetime.now()
 
 
@@ -140,7 +146,11 @@ def ingreso_nuevo(self):
         return
 
     # Datos del ingreso
-    kilometros_ingreso = input("Introduce los kilómetros del vehículo: ")
+    try:
+        kilometros_ingreso = models.leer_kilometros(input("Introduce los kilómetros del vehículo: "))
+    except ValueError as error:
+        print(error)
+        return
     averia = input("Introduce la avería reportada por el cliente: ")
     diagnostico = input("Introduce el diagnóstico del vehículo por el mecánico: ")
     fecha_ingreso = datetime.now()
@@ -153,6 +163,8 @@ def ingreso_nuevo(self):
     # Relación bidireccional automática
     cliente_seleccionado.ingresos.append(nuevo_ingreso)
     vehiculo_seleccionado.ingresos.append(nuevo_ingreso)
+    # el vehiculo se queda con los kilometros del ingreso
+    vehiculo_seleccionado.actualizar_kilometros(kilometros_ingreso)
 
     # Guardar cambios
     db.session.commit()
@@ -206,8 +218,11 @@ if __name__ == '__main__':
     # Resetea la base de datos si existe
     # db.Base_mobile.metadata.drop_all(bind=db.engine_sqlite, checkfirst=True)
 
-    # crea si no existen las tablas de todos los modelos que encuentre en models.py
-    db.Base_mobile.metadata.create_all(db.engine_sqlite) # Base de datos Mobil
+    # crea las tablas de todos los modelos de models.py, o las actualiza si la version del esquema no es la actual
+    try:
+        esquema.actualizar(db.engine_sqlite) # Base de datos Mobil
+    except models.RecambiosDuplicados as error:
+        sys.exit(str(error))
 
     print('Bienvenido, Elije una opcion del Menu')
     while True:
@@ -1,11 +1,100 @@
 # Gracias a estas líneas de código, enfrento el mundo cada día 💪
 #  Todas las clases van aqui:
 
+import re
 from sqlalchemy import *
 from sqlalchemy.orm import *
+from sqlalchemy.schema import CreateTable
+from sqlalchemy.exc import OperationalError
 from datetime import datetime
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
 import db # conecta el fichero db.py con models.py
 
+CENTIMO = Decimal('0.01')
+
+
+# metodo para convertir un importe en euros en un numero integer de centimos
+def centimos(importe):
+    '''Redondea el importe al centimo (la mitad hacia arriba, como en una factura) y lo devuelve en
+       centimos; acepta Decimal, int, float o string con punto o coma decimal (con un texto que
+       no es un numero lanza ValueError, como float())
+
+    args
+    -importe: es un numero o un string con el importe en euros
+    '''
+    if not isinstance(importe, Decimal):
+        try:
+            # str() de un float da su representacion mas corta (19.99 y no 19.98999...)
+            importe = Decimal(str(importe).strip().replace(',', '.'))
+        except InvalidOperation:
+            raise ValueError(f'importe no valido: {importe}') from None
+    return int(importe.quantize(CENTIMO, rounding=ROUND_HALF_UP).scaleb(2))
+
+
+# metodo para convertir un numero integer de centimos en un importe en euros
+def euros(centimos):
+    '''Devuelve los centimos como un Decimal en euros con dos decimales'''
+    return Decimal(int(centimos)).scaleb(-2)
+
+
+# Decimales de la cantidad de un registro que cuentan para su total (importes.total_linea usa los mismos)
+DECIMALES_CANTIDAD = 6
+
+
+# metodo para calcular el total de una linea
+def importe(precio, cantidad):
+    '''Devuelve precio * cantidad en euros redondeado al centimo, sin los errores de sumar o
+       multiplicar floats (10.10 * 3 es 30.30 y no 30.299999999999997); la cantidad se redondea
+       antes a DECIMALES_CANTIDAD decimales
+
+    args
+    -precio: es un numero o un string con el precio unitario en euros
+    -cantidad: es un numero o un string con las unidades
+    '''
+    precio = euros(centimos(precio))  # el precio unitario se guarda redondeado al centimo
+    try:
+        cantidad = Decimal(str(cantidad).strip().replace(',', '.'))
+    except InvalidOperation:
+        raise ValueError(f'cantidad no valida: {cantidad}') from None
+    cantidad = cantidad.quantize(Decimal(1).scaleb(-DECIMALES_CANTIDAD), rounding=ROUND_HALF_UP)
+    return euros(centimos(precio * cantidad))
+
+
+# Kilometros a partir de los cuales se considera que un valor es un error al teclear
+KILOMETROS_MAXIMOS = 3000000
+
+
+# metodo para leer los kilometros de un vehiculo o de un ingreso
+def leer_kilometros(valor):
+    '''Convierte 123456, "123456", "123.456" o "123 456 km" en un numero integer; con un valor que
+       no son kilometros (texto, decimales, negativos o mas de KILOMETROS_MAXIMOS) lanza ValueError
+
+    args
+    -valor: es un numero integer o un string con los kilometros
+    '''
+    if isinstance(valor, float) and valor.is_integer():
+        valor = int(valor)  # en json pueden venir como 123456.0
+    texto = re.sub(r'[\s.,]', '', str(valor).strip().lower().removesuffix('km'))
+    if not texto.isdigit() or int(texto) > KILOMETROS_MAXIMOS:
+        raise ValueError(f'kilometros no validos: {valor}')
+    return int(texto)
+
+
+class Centimos(TypeDecorator):
+    '''Tipo de columna para importes: en la base de datos es un INTEGER con los centimos, asi que
+       las sumas en SQL son exactas, y en python es un Decimal en euros (se le puede asignar un
+       Decimal, un float, un int o un string)'''
+
+    impl = Integer
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else centimos(value)
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else euros(value)
+
+
 
 
 class Cliente(db.Base_mobile):
@@ -23,13 +112,19 @@ class Cliente(db.Base_mobile):
     '''
 
     __tablename__ = 'clientes' # nombre de la tabla
-    __table_args__ = {'sqlite_autoincrement': True}  # (esto fuerza un valor autoincrementado como el id) diccionario de diferentes claves:valores (configuracion  de la tabla)
+    __table_args__ = (
+        # indice del correo sin mayusculas, con el que carga_clientes.py reconoce a un cliente ya existente
+        Index('ix_clientes_correo_minusculas', text('lower(correo)')),
+        # indice del orden de las busquedas paginadas, con la misma expresion que consultas.fecha_orden
+        Index('ix_clientes_fecha_alta_orden', text("coalesce(fecha_alta, '')")),
+        {'sqlite_autoincrement': True}  # (esto fuerza un valor autoincrementado como el id) diccionario de diferentes claves:valores (configuracion  de la tabla)
+    )
 
     # Estructura de la tabla clientes
     id_cliente = Column(Integer, primary_key=True, autoincrement=True)
-    fecha_alta = Column(DateTime, default=datetime.utcnow)
-    nombre = Column(String(255), nullable=False)
-    telefono = Column(String, nullable=False)
+    fecha_alta = Column(DateTime, default=datetime.utcnow, index=True)
+    nombre = Column(String(255), nullable=False, index=True)
+    telefono = Column(String, nullable=False, index=True)
     direccion = Column(String(255), nullable=False)
     correo = Column(String(255), nullable=False)
 
@@ -62,22 +157,29 @@ class Vehiculo(db.Base_mobile):
     -marca: es un string que compone la marce del vehiculo
     -modelo: es un string que compone el modelo del vehiculo
     -matricula: es un string que compone la matricula del vehiculo
-    -kilometros: es un string que compone los kilometros desde el primer ingreso o alta en la DB
+    -kilometros: es un numero integer que compone los kilometros del vehiculo (los del ultimo ingreso)
     '''
 
     __tablename__ = 'vehiculos'
-    __table_args__ = {'sqlite_autoincrement': True}
+    __table_args__ = (
+        # indice de la matricula normalizada (la misma expresion que busqueda.SQL_MATRICULA_NORMALIZADA)
+        # para reconocer un vehiculo ya existente aunque la matricula se escriba con espacios o guiones
+        Index('ix_vehiculos_matricula_normalizada', text("upper(replace(replace(matricula, ' ', ''), '-', ''))")),
+        # indice del orden de las busquedas paginadas, con la misma expresion que consultas.fecha_orden
+        Index('ix_vehiculos_fecha_alta_orden', text("coalesce(fecha_alta, '')")),
+        {'sqlite_autoincrement': True}
+    )
 
     # Estructura de la tabla vehiculos
     id_vehiculo = Column(Integer, primary_key=True, autoincrement=True)
-    fecha_alta = Column(DateTime, default=datetime.utcnow)
+    fecha_alta = Column(DateTime, default=datetime.utcnow, index=True)
     marca = Column(String(255), nullable=False)
-    modelo = Column(String(255), nullable=False)
-    matricula = Column(String(255), nullable=False)
-    kilometros = Column(String(255), nullable=False)
+    modelo = Column(String(255), nullable=False, index=True)
+    matricula = Column(String(255), nullable=False, index=True)
+    kilometros = Column(Integer, nullable=False, index=True)  # indice para las consultas por kilometraje
 
     # Clave foránea que hace referencia a la tabla Cliente
-    id_cliente = Column(Integer, ForeignKey('clientes.id_cliente'))
+    id_cliente = Column(Integer, ForeignKey('clientes.id_cliente'), index=True)
 
     # Relacion uno a muchos
     clientes = relationship('Cliente', back_populates='vehiculos')
@@ -93,6 +195,19 @@ class Vehiculo(db.Base_mobile):
         self.kilometros = kilometros  # kilometros del vehiculo
         print('Vehiculo creado con exito')
 
+    # metodo para validar los kilometros al asignarlos (acepta el texto de los formularios)
+    @validates('kilometros')
+    def validar_kilometros(self, clave, kilometros):
+        return leer_kilometros(kilometros)
+
+    # metodo para actualizar los kilometros con los de un ingreso nuevo
+    def actualizar_kilometros(self, kilometros):
+        '''Pone los kilometros del ingreso si son mas que los guardados (el cuentakilometros no baja;
+           un error al dar de alta el vehiculo se corrige desde la ventana de vehiculos)'''
+        kilometros = leer_kilometros(kilometros)
+        if self.kilometros is None or kilometros > self.kilometros:
+            self.kilometros = kilometros
+
     # metodo STR nos muestra la informacion
     def __str__(self):
         return "Vehiculo id: {}, Marca: {}, Modelo: {}, Matricula: {} ".format(self.id_vehiculo, self.marca, self.modelo, self.matricula)
@@ -109,10 +224,18 @@ class Recambio(db.Base_mobile):
     '''
 
     __tablename__ = 'recambios'
-    __table_args__ = {'sqlite_autoincrement': True}
+    __table_args__ = (
+        # indice compuesto para los filtros de los desplegables categoria y subcategoria; es unico
+        # porque identifica el recambio en las cargas masivas de catalogos (carga_recambios.py)
+        Index('ux_recambios_categoria_subcategoria_nombre', 'categoria', 'subcategoria', 'nombre_recambio',
+              unique=True),
+        # indice del orden de las busquedas paginadas, con la misma expresion que consultas.fecha_orden
+        Index('ix_recambios_fecha_alta_orden', text("coalesce(fecha_alta, '')")),
+        {'sqlite_autoincrement': True}
+    )
 
     id_recambio = Column(Integer, primary_key=True, autoincrement=True)
-    fecha_alta = Column(DateTime, default=datetime.utcnow)
+    fecha_alta = Column(DateTime, default=datetime.utcnow, index=True)
     nombre_recambio = Column(String(255), nullable=False)
     descripcion = Column(String(255), nullable=False)
     categoria = Column(String(255), nullable=False)
@@ -151,17 +274,23 @@ class Ingreso(db.Base_mobile):
     '''
 
     __tablename__ = 'ingresos'
-    __table_args__ = {'sqlite_autoincrement': True}
+    __table_args__ = (
+        # indice compuesto para el historial de ingresos de un vehiculo ordenado por fecha
+        Index('ix_ingresos_id_vehiculo_fecha_ingreso', 'id_vehiculo', 'fecha_ingreso'),
+        # indice del orden de las busquedas paginadas, con la misma expresion que consultas.fecha_orden
+        Index('ix_ingresos_fecha_ingreso_orden', text("coalesce(fecha_ingreso, '')")),
+        {'sqlite_autoincrement': True}
+    )
 
     # Estructura de la tabla ingresos
     id_ingreso = Column(Integer, primary_key=True, autoincrement=True)
-    fecha_ingreso = Column(DateTime, default=datetime.utcnow)
+    fecha_ingreso = Column(DateTime, default=datetime.utcnow, index=True)
     kilometros_ingreso = Column(Integer, nullable=False)
     averia = Column(String(255), nullable=False)
     diagnostico = Column(String(255), nullable=False)
 
     # Relacion clave foranea
-    id_cliente = Column(Integer, ForeignKey('clientes.id_cliente'))
+    id_cliente = Column(Integer, ForeignKey('clientes.id_cliente'), index=True)
     id_vehiculo = Column(Integer, ForeignKey('vehiculos.id_vehiculo'))
 
     # Relacion uno a muchos
@@ -179,6 +308,11 @@ class Ingreso(db.Base_mobile):
 
         print('Ingreso creado con exito')
 
+    # metodo para validar los kilometros del ingreso al asignarlos
+    @validates('kilometros_ingreso')
+    def validar_kilometros(self, clave, kilometros):
+        return leer_kilometros(kilometros)
+
     # metodo STR nos muestra la informacion
     def __str__(self):
         return "el Vehiculo id {}, del cliente id {}, con fecha de ingreso a taller {}".format(self.id_vehiculo, self.id_cliente, self.fecha_ingreso)
@@ -190,11 +324,11 @@ class Registro(db.Base_mobile):
 
     args
     -id_registro: es un numero integer que compone el código del registro
-    -puc: es un numero flotante que compone el precio unitario de costo de un determinado recambio
-    -puv: es un numero flotante que compone el precio unitario de venta de un determinado recambio
+    -puc: es un importe (Centimos) que compone el precio unitario de costo de un determinado recambio
+    -puv: es un importe (Centimos) que compone el precio unitario de venta de un determinado recambio
     -cantidad: es un numero flotante que compone la cantidad de unidades de un determinado item
-    -total_costo: es un numero flotante que compone el costo total de un grupo determinado de recambios
-    -total_venta: es un numero flotante que compone la venta total de un grupo determinado de recambios
+    -total_costo: es un importe (Centimos) que compone el costo total de un grupo determinado de recambios
+    -total_venta: es un importe (Centimos) que compone la venta total de un grupo determinado de recambios
     -id_cliente: es un numero integer que compone el codigo del cliente
     -id_vehiculo: es un numero integer que compone el codigo del vehiculo
     -id_ingreso: es un numero integer que compone el codigo del ingreso del vehiculo
@@ -205,15 +339,15 @@ class Registro(db.Base_mobile):
     __table_args__ = {'sqlite_autoincrement': True}
 
     id_registro = Column(Integer, primary_key=True, autoincrement=True)
-    puc = Column(Float, nullable=False)
-    puv = Column(Float, nullable=False)
+    puc = Column(Centimos, nullable=False)
+    puv = Column(Centimos, nullable=False)
     cantidad = Column(Float, nullable=False)
-    total_costo = Column(Float, nullable=False)
-    total_venta = Column(Float, nullable=False)
+    total_costo = Column(Centimos, nullable=False)
+    total_venta = Column(Centimos, nullable=False)
 
     # Relacion clave foranea
-    id_recambio = Column(Integer, ForeignKey('recambios.id_recambio'))
-    id_ingreso = Column(Integer, ForeignKey('ingresos.id_ingreso'))
+    id_recambio = Column(Integer, ForeignKey('recambios.id_recambio'), index=True)
+    id_ingreso = Column(Integer, ForeignKey('ingresos.id_ingreso'), index=True)
 
     # Relacion uno a muchos
     recambios = relationship('Recambio', back_populates='registros')
@@ -232,3 +366,221 @@ class Registro(db.Base_mobile):
     # metodo STR nos muestra la informacion
     def __str__(self):
         return "Registro {} para vehiculo matricula {} registrado con exito".format(self.id_registro, self.vehiculos.matricula)
+
+
+# Indices de versiones anteriores que ya estan cubiertos por otros y se borran en crear_indices
+INDICES_OBSOLETOS = [
+    'ix_recambios_categoria_subcategoria_nombre',  # sustituido por el unico ux_recambios_...
+]
+
+
+# Recambios repetidos (misma categoria, subcategoria y nombre), que el indice unico no admite;
+# la interfaz anterior permitia guardar el mismo recambio dos veces
+SQL_RECAMBIOS_DUPLICADOS = '''SELECT id_recambio, categoria, subcategoria, nombre_recambio, descripcion
+    FROM recambios
+    WHERE (categoria, subcategoria, nombre_recambio) IN (
+        SELECT categoria, subcategoria, nombre_recambio FROM recambios
+        GROUP BY categoria, subcategoria, nombre_recambio HAVING count(*) > 1)
+    ORDER BY categoria, subcategoria, nombre_recambio, id_recambio'''
+
+
+class RecambiosDuplicados(Exception):
+    '''Recambios repetidos que no se pueden fusionar solos porque tienen distinta descripcion
+
+    args
+    -grupos: es una lista con las filas (id_recambio, categoria, subcategoria, nombre_recambio,
+     descripcion) de cada grupo de recambios repetidos
+    '''
+
+    def __init__(self, grupos):
+        self.grupos = grupos
+        filas = '\n'.join(f'  id {fila[0]}: {fila[1]} / {fila[2]} / {fila[3]} - descripcion: {fila[4]!r}'
+                          for filas in grupos for fila in filas)
+        super().__init__('Hay recambios repetidos (misma categoria, subcategoria y nombre) con distinta descripcion '
+                         'y no se pueden fusionar solos. Cambia el nombre o borra los que sobran (sus registros '
+                         f'tienen que pasar al que se queda) y vuelve a arrancar:\n{filas}')
+
+
+# metodo para fusionar los recambios repetidos antes de crear el indice unico
+def fusionar_recambios_duplicados(conexion):
+    '''Deja el recambio de id mas bajo de cada grupo de repetidos, le pasa los registros de los demas
+       y borra los demas. Devuelve los recambios borrados; si en algun grupo las descripciones no son
+       iguales no cambia nada y lanza RecambiosDuplicados con las filas de esos grupos
+
+    args
+    -conexion: es la conexion con la transaccion abierta
+    '''
+    grupos = {}
+    for fila in conexion.exec_driver_sql(SQL_RECAMBIOS_DUPLICADOS).fetchall():
+        grupos.setdefault(tuple(fila[1:4]), []).append(tuple(fila))
+    conflictos = [filas for filas in grupos.values() if len({(fila[4] or '').strip() for fila in filas}) > 1]
+    if conflictos:
+        raise RecambiosDuplicados(conflictos)
+    for filas in grupos.values():
+        conservado, *repetidos = [fila[0] for fila in filas]
+        marcas = ', '.join('?' * len(repetidos))
+        # los triggers de resumenes.py restan y suman la linea en la misma categoria, los totales no cambian
+        conexion.exec_driver_sql(f'UPDATE registros SET id_recambio = ? WHERE id_recambio IN ({marcas})',
+                                 (conservado, *repetidos))
+        conexion.exec_driver_sql(f'DELETE FROM recambios WHERE id_recambio IN ({marcas})', tuple(repetidos))
+    return sum(len(filas) - 1 for filas in grupos.values())
+
+
+# metodo para crear los indices en bases de datos ya existentes
+def crear_indices(engine):
+    '''Crea los indices declarados en los modelos que aun no existan en la base de datos.
+       create_all solo crea los indices de las tablas nuevas, asi que las bases de datos
+       existentes los reciben aqui (comprueba antes si existe cada indice, se puede llamar en cada arranque).
+       Antes del indice unico de recambios fusiona los recambios repetidos (ver fusionar_recambios_duplicados)
+
+    args
+    -engine: es el engine o una conexion con la transaccion abierta (ver db.transaccion)
+    '''
+    with db.transaccion(engine) as conexion:
+        for nombre in INDICES_OBSOLETOS:
+            conexion.execute(text(f'DROP INDEX IF EXISTS {nombre}'))
+        # se comprueba por nombre en sqlite_master: checkfirst no reconoce los indices de expresiones
+        existentes = {fila[0] for fila in conexion.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'"))}
+        if 'ux_recambios_categoria_subcategoria_nombre' not in existentes:
+            fusionar_recambios_duplicados(conexion)
+        for tabla in db.Base_mobile.metadata.sorted_tables:
+            for indice in tabla.indexes:
+                if indice.name not in existentes:
+                    indice.create(conexion)
+
+
+# Columnas de registros que en bases de datos anteriores eran FLOAT en euros y ahora son centimos
+COLUMNAS_CENTIMOS = ['puc', 'puv', 'total_costo', 'total_venta']
+
+# Kilometros de un vehiculo guardados como texto en versiones anteriores ("123.456 km" -> 123456,
+# lo que no es un numero -> 0, y el texto se guarda en kilometros_no_validos)
+SQL_KILOMETROS_LIMPIOS = "replace(replace(replace(replace(lower(kilometros), 'km', ''), '.', ''), ',', ''), ' ', '')"
+SQL_KILOMETROS_VALIDOS = f"coalesce({SQL_KILOMETROS_LIMPIOS} GLOB '[0-9]*' AND {SQL_KILOMETROS_LIMPIOS} NOT GLOB '*[^0-9]*', 0)"
+SQL_KILOMETROS_TEXTO = f"CASE WHEN {SQL_KILOMETROS_VALIDOS} THEN CAST({SQL_KILOMETROS_LIMPIOS} AS INTEGER) ELSE 0 END"
+
+# Tabla con el texto original de los kilometros que la migracion no pudo leer
+DDL_KILOMETROS_NO_VALIDOS = '''CREATE TABLE IF NOT EXISTS kilometros_no_validos (
+    id_vehiculo INTEGER PRIMARY KEY,
+    kilometros VARCHAR,
+    fecha DATETIME NOT NULL
+)'''
+
+
+# metodo para cambiar el tipo de columnas de una tabla que ya tiene datos
+def _reconstruir_tabla(conexion, tabla, conversiones):
+    '''Crea la tabla con las columnas del modelo, copia las filas convirtiendo las columnas que
+       cambian y sustituye a la anterior (sqlite no cambia el tipo de una columna con ALTER TABLE).
+       Conserva los ids y el contador del autoincremento y vuelve a crear los indices del modelo y
+       los triggers de la tabla tal como estaban; los triggers de otras tablas que la leen (como
+       resumen_ingresos_au, de ingresos, que suma los registros) no se tocan
+
+    args
+    -conexion: es la conexion con la transaccion abierta
+    -tabla: es la Table del modelo (Modelo.__table__)
+    -conversiones: es un diccionario columna -> expresion SQL que la calcula desde la tabla anterior
+    '''
+    nueva = f'{tabla.name}_nueva'
+    # los triggers de la tabla se borran con ella (DROP TABLE), se guardan para crearlos despues
+    triggers = [sql for (sql,) in conexion.exec_driver_sql(
+        "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND tbl_name = ?", (tabla.name,)).fetchall()]
+    ddl = str(CreateTable(tabla).compile(dialect=conexion.dialect))
+    conexion.exec_driver_sql(ddl.replace(f'CREATE TABLE {tabla.name} (', f'CREATE TABLE {nueva} (', 1))
+    columnas = [columna.name for columna in tabla.columns]
+    conexion.exec_driver_sql(
+        f"INSERT INTO {nueva} ({', '.join(columnas)}) "
+        f"SELECT {', '.join(conversiones.get(columna, columna) for columna in columnas)} FROM {tabla.name}")
+    secuencia = conexion.exec_driver_sql('SELECT seq FROM sqlite_sequence WHERE name = ?', (tabla.name,)).scalar()
+    # los indices de la tabla anterior se van con ella; las claves foraneas de otras tablas apuntan
+    # por nombre y vuelven a ser validas al renombrar la nueva
+    conexion.exec_driver_sql(f'DROP TABLE {tabla.name}')
+    # sin legacy_alter_table el RENAME revisa los triggers de las demas tablas y falla con los que
+    # leen la tabla, que en ese momento no existe; con el nombre final vuelven a ser validos
+    conexion.exec_driver_sql('PRAGMA legacy_alter_table = ON')
+    try:
+        conexion.exec_driver_sql(f'ALTER TABLE {nueva} RENAME TO {tabla.name}')
+    finally:
+        conexion.exec_driver_sql('PRAGMA legacy_alter_table = OFF')
+    if secuencia:
+        # el contador no puede bajar, para no repetir ids de filas borradas
+        conexion.exec_driver_sql('DELETE FROM sqlite_sequence WHERE name = ?', (tabla.name,))
+        conexion.exec_driver_sql('INSERT INTO sqlite_sequence (name, seq) SELECT ?, max(?, coalesce(max(rowid), 0)) '
+                                 f'FROM {tabla.name}', (tabla.name, secuencia))
+    for indice in tabla.indexes:
+        indice.create(conexion)
+    for sql in triggers:
+        conexion.exec_driver_sql(sql)
+
+
+# metodo para leer el tipo de una columna en la base de datos
+def _tipo_columna(conexion, tabla, columna):
+    tipos = {fila[1]: fila[2].upper() for fila in conexion.exec_driver_sql(f'PRAGMA table_info({tabla})')}
+    return tipos.get(columna)
+
+
+# metodo para pasar los importes de los registros de euros en FLOAT a centimos en INTEGER
+def migrar_centimos(conexion):
+    '''Si la tabla registros aun guarda los importes como FLOAT la reconstruye con las columnas
+       INTEGER de Centimos, redondeando cada importe al centimo. Las tablas resumen, que estaban en
+       euros, se borran y resumenes.crear_resumenes las vuelve a calcular en centimos'''
+    if _tipo_columna(conexion, 'registros', 'puc') in (None, 'INTEGER'):
+        return False
+    for (nombre,) in conexion.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE 'resumen!_%' ESCAPE '!'").fetchall():
+        conexion.exec_driver_sql(f'DROP TABLE {nombre}')
+    _reconstruir_tabla(conexion, Registro.__table__,
+                       {columna: f'CAST(round({columna} * 100) AS INTEGER)' for columna in COLUMNAS_CENTIMOS})
+    return True
+
+
+# metodo para pasar los kilometros de los vehiculos de texto a INTEGER
+def migrar_kilometros(conexion):
+    '''Si la tabla vehiculos aun guarda los kilometros como texto la reconstruye con la columna
+       INTEGER (y su indice). Los textos que no son un numero se quedan en 0 y se copian antes a la
+       tabla kilometros_no_validos, que se lista con kilometros_no_validos() (python esquema.py)'''
+    if _tipo_columna(conexion, 'vehiculos', 'kilometros') in (None, 'INTEGER'):
+        return False
+    if conexion.exec_driver_sql(f'SELECT 1 FROM vehiculos WHERE NOT {SQL_KILOMETROS_VALIDOS} LIMIT 1').first():
+        conexion.exec_driver_sql(DDL_KILOMETROS_NO_VALIDOS)
+        conexion.exec_driver_sql('INSERT OR REPLACE INTO kilometros_no_validos (id_vehiculo, kilometros, fecha) '
+                                 f'SELECT id_vehiculo, kilometros, ? FROM vehiculos WHERE NOT {SQL_KILOMETROS_VALIDOS}',
+                                 (datetime.now(),))
+    _reconstruir_tabla(conexion, Vehiculo.__table__, {'kilometros': SQL_KILOMETROS_TEXTO})
+    return True
+
+
+# metodo para listar los vehiculos cuyos kilometros no se pudieron leer al migrar
+def kilometros_no_validos(conexion):
+    '''Devuelve una lista de (id_vehiculo, matricula, texto original de los kilometros) de los
+       vehiculos que migrar_kilometros dejo en 0 km; vacia si no hubo ninguno
+
+    args
+    -conexion: es la conexion con la que se consulta
+    '''
+    try:
+        return conexion.exec_driver_sql(
+            'SELECT k.id_vehiculo, v.matricula, k.kilometros FROM kilometros_no_validos AS k '
+            'LEFT JOIN vehiculos AS v ON v.id_vehiculo = k.id_vehiculo ORDER BY k.id_vehiculo').fetchall()
+    except OperationalError:
+        return []  # la tabla solo existe si la migracion encontro alguno
+
+
+# Migraciones de los datos de bases de datos creadas con versiones anteriores, en orden
+# (al arrancar las aplica esquema.actualizar, cada una con su version en esquema.MIGRACIONES)
+MIGRACIONES = [
+    ('centimos', migrar_centimos),
+    ('kilometros', migrar_kilometros),
+]
+
+
+# metodo para actualizar las tablas de una base de datos creada con una version anterior
+def migrar(engine):
+    '''Aplica las MIGRACIONES que necesite la base de datos, todas en una transaccion (si alguna
+       falla la base de datos se queda como estaba), y devuelve la lista de las aplicadas. Cada
+       migracion comprueba antes si hace falta, asi que se puede llamar varias veces. Al arrancar no
+       se usa: esquema.actualizar las aplica solo si la version de la base de datos es anterior'''
+    with engine.connect() as conexion:
+        # pysqlite no abre la transaccion antes de un DROP o un ALTER, se abre a mano
+        conexion.exec_driver_sql('BEGIN IMMEDIATE')
+        aplicadas = [nombre for nombre, migracion in MIGRACIONES if migracion(conexion)]
+        conexion.commit()
+    return aplicadas
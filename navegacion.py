@@ -0,0 +1,133 @@
+# Navegacion entre ventanas con cache de vistas ya construidas
+
+import os
+import importlib
+import threading
+from collections import OrderedDict
+from sqlalchemy import event
+import db
+
+'''Construir una ventana supone cientos de controles y, en algunas, consultas a la base de datos
+   (por ejemplo el desplegable de clientes de VentanaVehiculoNuevo). El router guarda las ventanas
+   ya construidas de cada pagina en una cache LRU y las reutiliza al volver a su ruta; cada ruta
+   declara las tablas de las que dependen sus datos y al hacer commit de cambios en esas tablas
+   las vistas afectadas se descartan para que se construyan de nuevo con los datos actuales'''
+
+# Numero de vistas construidas que se guardan por pagina (las menos usadas se descartan);
+# con 10 caben todas las rutas cacheables de app.RUTAS
+CAPACIDAD_VISTAS = int(os.environ.get('TALLER_CAPACIDAD_VISTAS', 10))
+
+# Caches de vistas de las paginas conectadas, por session_id de Flet
+caches = {}
+cerrojo_caches = threading.Lock()
+
+
+class CacheVistas:
+    '''Cache LRU de las vistas construidas de una pagina
+
+    args
+    -page: es la pagina de Flet a la que pertenecen las vistas
+    -rutas: es un diccionario ruta -> {'vista': clase de la ventana o string "modulo.Clase" que se importa
+            la primera vez que se construye, 'tablas': tablas de las que depende}
+            con 'tablas' a None la ventana depende de la seleccion guardada en page.session y se
+            construye de nuevo en cada visita
+    -capacidad: es un numero integer con las vistas que se guardan como maximo
+    '''
+
+    def __init__(self, page, rutas, capacidad=CAPACIDAD_VISTAS):
+        self.page = page
+        self.rutas = rutas
+        self.capacidad = capacidad
+        self.vistas = OrderedDict()
+        self.cerrojo = threading.Lock()
+
+    # metodo para obtener la vista de una ruta, construyendola solo si no esta en la cache
+    def obtener(self, ruta):
+        '''Devuelve la vista de la ruta o None si la ruta no existe'''
+        definicion = self.rutas.get(ruta)
+        if definicion is None:
+            return None
+        with self.cerrojo:
+            vista = self.vistas.get(ruta)
+            if vista is not None:
+                self.vistas.move_to_end(ruta)
+                return vista
+
+        vista = clase_vista(definicion)(self.page)
+        if definicion['tablas'] is not None:
+            with self.cerrojo:
+                self.vistas[ruta] = vista
+                while len(self.vistas) > self.capacidad:
+                    self.vistas.popitem(last=False)
+        return vista
+
+    # metodo para descartar las vistas que dependen de alguna de las tablas
+    def invalidar(self, tablas):
+        with self.cerrojo:
+            for ruta in list(self.vistas):
+                if set(self.rutas[ruta]['tablas']) & set(tablas):
+                    del self.vistas[ruta]
+
+    # metodo para descartar todas las vistas
+    def vaciar(self):
+        with self.cerrojo:
+            self.vistas.clear()
+
+
+# metodo para obtener la clase de la ventana de una ruta, importando su modulo si hace falta
+def clase_vista(definicion):
+    '''Devuelve la clase de definicion['vista']; si es un string "modulo.Clase" importa el modulo
+       (solo la primera vez, despues Python lo tiene en sys.modules)
+
+    args
+    -definicion: es el diccionario de una ruta de RUTAS
+    '''
+    vista = definicion['vista']
+    if isinstance(vista, str):
+        modulo, _, clase = vista.rpartition('.')
+        vista = getattr(importlib.import_module(modulo), clase)
+    return vista
+
+
+# metodo para crear la cache de vistas de una pagina que se conecta
+def cache_pagina(page, rutas, capacidad=CAPACIDAD_VISTAS):
+    cache = CacheVistas(page, rutas, capacidad)
+    with cerrojo_caches:
+        caches[page.session_id] = cache
+    return cache
+
+
+# metodo para olvidar la cache de vistas de una pagina que se desconecta
+def cerrar_cache(session_id):
+    with cerrojo_caches:
+        caches.pop(session_id, None)
+
+
+# metodo para descartar en todas las paginas las vistas que dependen de unas tablas
+def invalidar_vistas(*tablas):
+    '''Se llama automaticamente al hacer commit con db.session (ver _anotar_tablas); se puede
+       llamar a mano tras cambios que no pasan por el ORM, por ejemplo invalidar_vistas('clientes')'''
+    with cerrojo_caches:
+        copia = list(caches.values())
+    for cache in copia:
+        cache.invalidar(tablas)
+
+
+@event.listens_for(db.Session, 'after_flush')
+def _anotar_tablas(sesion, contexto_flush):
+    # guarda las tablas de los objetos añadidos, modificados o borrados hasta el commit
+    tablas = sesion.info.setdefault('tablas_modificadas', set())
+    for objeto in list(sesion.new) + list(sesion.dirty) + list(sesion.deleted):
+        tablas.add(type(objeto).__table__.name)
+
+
+@event.listens_for(db.Session, 'after_commit')
+def _invalidar_al_confirmar(sesion):
+    tablas = sesion.info.pop('tablas_modificadas', None)
+    if tablas:
+        invalidar_vistas(*tablas)
+
+
+@event.listens_for(db.Session, 'after_rollback')
+def _descartar_tablas(sesion):
+    sesion.info.pop('tablas_modificadas', None)
@@ -0,0 +1,237 @@
+'''Totales de costo y venta de los registros por ingreso, por cliente y por mes y categoria
+
+   uso: python resumenes.py [--reconstruir | --comprobar]
+
+   Las tablas resumen_* se mantienen con triggers de sqlite al insertar, modificar o borrar
+   registros (y al cambiar el cliente o la fecha de un ingreso o la categoria de un recambio),
+   en la misma transaccion que el cambio, asi que una pantalla de totales lee una fila en lugar
+   de sumar todos los registros. --reconstruir las vuelve a calcular desde los registros (para
+   bases de datos anteriores a los triggers) y --comprobar las compara con la suma completa.
+   Los totales se suman en centimos (INTEGER, como los importes de los registros) y se leen como
+   Decimal en euros'''
+import sys
+from sqlalchemy import text, table, column, select
+import models
+import db
+
+# Claves de cada tabla resumen y expresiones que las calculan a partir de un registro r,
+# su ingreso i y su recambio c (las mismas en los triggers y en la reconstruccion)
+CLAVES_RESUMEN = {
+    'resumen_ingresos': {'id_ingreso': 'r.id_ingreso'},
+    'resumen_clientes': {'id_cliente': 'i.id_cliente'},
+    'resumen_meses': {'mes': "strftime('%Y-%m', i.fecha_ingreso)", 'categoria': "coalesce(c.categoria, '')"},
+}
+
+DDL_TABLAS_RESUMEN = [
+    '''CREATE TABLE IF NOT EXISTS resumen_ingresos (
+           id_ingreso INTEGER PRIMARY KEY,
+           lineas INTEGER NOT NULL, total_costo INTEGER NOT NULL, total_venta INTEGER NOT NULL)''',
+    '''CREATE TABLE IF NOT EXISTS resumen_clientes (
+           id_cliente INTEGER PRIMARY KEY,
+           lineas INTEGER NOT NULL, total_costo INTEGER NOT NULL, total_venta INTEGER NOT NULL)''',
+    '''CREATE TABLE IF NOT EXISTS resumen_meses (
+           mes VARCHAR(7) NOT NULL, categoria VARCHAR(255) NOT NULL,
+           lineas INTEGER NOT NULL, total_costo INTEGER NOT NULL, total_venta INTEGER NOT NULL,
+           PRIMARY KEY (mes, categoria))''',
+] + [
+    # indices parciales de las filas que se quedan a cero al restar, para borrarlas sin recorrer la tabla
+    f'CREATE INDEX IF NOT EXISTS ix_{tabla}_a_cero ON {tabla} (lineas) WHERE lineas = 0'
+    for tabla in ('resumen_ingresos', 'resumen_clientes', 'resumen_meses')
+]
+
+# Tablas resumen para las consultas
+resumen_ingresos = table('resumen_ingresos', column('id_ingreso'), column('lineas'),
+                         column('total_costo', models.Centimos), column('total_venta', models.Centimos))
+resumen_clientes = table('resumen_clientes', column('id_cliente'), column('lineas'),
+                         column('total_costo', models.Centimos), column('total_venta', models.Centimos))
+resumen_meses = table('resumen_meses', column('mes'), column('categoria'), column('lineas'),
+                      column('total_costo', models.Centimos), column('total_venta', models.Centimos))
+SIN_TOTALES = (0, models.euros(0), models.euros(0))
+
+
+# metodo para generar las sentencias que suman (o restan) unos registros a una tabla resumen
+def _sumar(tabla, origen, signo='+'):
+    '''Devuelve un INSERT ... SELECT ... ON CONFLICT que suma a la tabla las lineas y totales de
+       las filas de origen agrupadas por las claves de la tabla; al restar añade el DELETE de las
+       filas que se quedan a cero, para que la tabla sea igual a la reconstruida
+
+    args
+    -tabla: es un string con el nombre de la tabla resumen de CLAVES_RESUMEN
+    -origen: es un string con el FROM ... WHERE de las filas r (registro), i (ingreso) y c (recambio)
+    -signo: es un string, '+' para sumar y '-' para restar
+    '''
+    claves = CLAVES_RESUMEN[tabla]
+    nombres = ', '.join(claves)
+    expresiones = ', '.join(claves.values())
+    no_nulas = ' AND '.join(f'{expresion} IS NOT NULL' for expresion in claves.values())
+    # el WHERE es obligatorio antes de ON CONFLICT en un INSERT ... SELECT (ambiguedad del parser)
+    sentencias = f'''
+           INSERT INTO {tabla} ({nombres}, lineas, total_costo, total_venta)
+           SELECT {expresiones}, {signo}count(*), {signo}sum(r.total_costo), {signo}sum(r.total_venta)
+           {origen} AND {no_nulas}
+           GROUP BY {expresiones}
+           ON CONFLICT ({nombres}) DO UPDATE SET
+               lineas = lineas + excluded.lineas,
+               total_costo = total_costo + excluded.total_costo,
+               total_venta = total_venta + excluded.total_venta;'''
+    if signo == '-':
+        # resuelto con el indice parcial de filas a cero, que casi siempre esta vacio
+        sentencias += f'''
+           DELETE FROM {tabla} WHERE lineas = 0;'''
+    return sentencias
+
+
+# FROM de un registro concreto (new u old dentro del trigger) con su ingreso y su recambio
+def _origen_registro(fila):
+    return f'''FROM (SELECT {fila}.id_ingreso AS id_ingreso, {fila}.id_recambio AS id_recambio,
+                            {fila}.total_costo AS total_costo, {fila}.total_venta AS total_venta) AS r
+           LEFT JOIN ingresos AS i ON i.id_ingreso = r.id_ingreso
+           LEFT JOIN recambios AS c ON c.id_recambio = r.id_recambio
+           WHERE true'''
+
+
+# FROM de todos los registros de un ingreso, con los datos del ingreso tal y como estaban (old) o estan (new)
+def _origen_ingreso(fila):
+    return f'''FROM registros AS r
+           JOIN (SELECT {fila}.id_ingreso AS id_ingreso, {fila}.id_cliente AS id_cliente,
+                        {fila}.fecha_ingreso AS fecha_ingreso) AS i ON i.id_ingreso = r.id_ingreso
+           LEFT JOIN recambios AS c ON c.id_recambio = r.id_recambio
+           WHERE true'''
+
+
+# FROM de todos los registros de un recambio, con su categoria de antes (old) o de ahora (new)
+def _origen_recambio(fila, categoria=None):
+    return f'''FROM registros AS r
+           JOIN ingresos AS i ON i.id_ingreso = r.id_ingreso
+           JOIN (SELECT {fila}.id_recambio AS id_recambio, {categoria or f'{fila}.categoria'} AS categoria) AS c
+               ON c.id_recambio = r.id_recambio
+           WHERE true'''
+
+
+# metodo para generar un trigger AFTER con varias sentencias
+def _trigger(nombre, evento, *sentencias):
+    return f'CREATE TRIGGER IF NOT EXISTS {nombre} AFTER {evento} BEGIN {"".join(sentencias)} END'
+
+
+DDL_TRIGGERS_RESUMEN = [
+    _trigger('resumen_registros_ai', 'INSERT ON registros',
+             *[_sumar(tabla, _origen_registro('new')) for tabla in CLAVES_RESUMEN]),
+    _trigger('resumen_registros_ad', 'DELETE ON registros',
+             *[_sumar(tabla, _origen_registro('old'), '-') for tabla in CLAVES_RESUMEN]),
+    _trigger('resumen_registros_au', 'UPDATE OF id_ingreso, id_recambio, total_costo, total_venta ON registros',
+             *[_sumar(tabla, _origen_registro('old'), '-') for tabla in CLAVES_RESUMEN],
+             *[_sumar(tabla, _origen_registro('new')) for tabla in CLAVES_RESUMEN]),
+    # el total de un ingreso no depende del ingreso, solo pasan de un cliente o de un mes a otro
+    _trigger('resumen_ingresos_au', 'UPDATE OF id_cliente, fecha_ingreso ON ingresos',
+             _sumar('resumen_clientes', _origen_ingreso('old'), '-'),
+             _sumar('resumen_meses', _origen_ingreso('old'), '-'),
+             _sumar('resumen_clientes', _origen_ingreso('new')),
+             _sumar('resumen_meses', _origen_ingreso('new'))),
+    _trigger('resumen_ingresos_ad', 'DELETE ON ingresos',
+             _sumar('resumen_clientes', _origen_ingreso('old'), '-'),
+             _sumar('resumen_meses', _origen_ingreso('old'), '-')),
+    # los registros de un recambio borrado o que cambia de categoria pasan a la categoria nueva ('' si se borra)
+    _trigger('resumen_recambios_au', 'UPDATE OF categoria ON recambios',
+             _sumar('resumen_meses', _origen_recambio('old'), '-'),
+             _sumar('resumen_meses', _origen_recambio('new'))),
+    _trigger('resumen_recambios_ad', 'DELETE ON recambios',
+             _sumar('resumen_meses', _origen_recambio('old'), '-'),
+             _sumar('resumen_meses', _origen_recambio('old', categoria='NULL'))),
+]
+
+# FROM de todos los registros para la reconstruccion y la comprobacion
+ORIGEN_COMPLETO = '''FROM registros AS r
+           LEFT JOIN ingresos AS i ON i.id_ingreso = r.id_ingreso
+           LEFT JOIN recambios AS c ON c.id_recambio = r.id_recambio
+           WHERE true'''
+
+
+# metodo para crear las tablas resumen y sus triggers
+def crear_resumenes(engine):
+    '''Crea las tablas resumen y sus triggers si no existen; si las tablas son nuevas las calcula
+       con los registros que ya hubiera (se puede llamar en cada arranque, como crear_indices_busqueda)
+
+    args
+    -engine: es el engine o una conexion con la transaccion abierta (ver db.transaccion)
+    '''
+    with db.transaccion(engine) as conexion:
+        existentes = {fila[0] for fila in conexion.execute(text(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE 'resumen_%'"))}
+        for ddl in DDL_TABLAS_RESUMEN + DDL_TRIGGERS_RESUMEN:
+            conexion.execute(text(ddl))
+        if not set(CLAVES_RESUMEN) <= existentes:
+            _calcular(conexion)
+
+
+# metodo para volver a calcular las tablas resumen desde los registros
+def reconstruir_resumenes(engine):
+    '''Vacia y recalcula las tablas resumen en una transaccion (los triggers siguen activos, asi
+       que los cambios de otras conexiones esperan a que termine y se suman despues)'''
+    with engine.begin() as conexion:
+        _calcular(conexion)
+
+
+def _calcular(conexion):
+    for tabla in CLAVES_RESUMEN:
+        conexion.execute(text(f'DELETE FROM {tabla}'))
+        conexion.execute(text(_sumar(tabla, ORIGEN_COMPLETO)))
+
+
+# metodo para comparar las tablas resumen con la suma completa de los registros
+def comprobar_resumenes(engine):
+    '''Devuelve una lista con las diferencias (tabla, clave, en la tabla, calculado); vacia si
+       los triggers han mantenido bien las tablas (en centimos tienen que coincidir exactamente)'''
+    diferencias = []
+    with engine.connect() as conexion:
+        for tabla, claves in CLAVES_RESUMEN.items():
+            nombres = ', '.join(claves)
+            guardado = {tuple(fila[:-3]): tuple(fila[-3:]) for fila in conexion.execute(text(
+                f'SELECT {nombres}, lineas, total_costo, total_venta FROM {tabla}'))}
+            calculado = {tuple(fila[:-3]): tuple(fila[-3:]) for fila in conexion.execute(text(
+                f'''SELECT {', '.join(claves.values())}, count(*), sum(r.total_costo), sum(r.total_venta)
+                    {ORIGEN_COMPLETO} AND {' AND '.join(f'{expresion} IS NOT NULL' for expresion in claves.values())}
+                    GROUP BY {', '.join(claves.values())}'''))}
+            for clave in guardado.keys() | calculado.keys():
+                if guardado.get(clave) != calculado.get(clave):
+                    diferencias.append((tabla, clave, guardado.get(clave), calculado.get(clave)))
+    return diferencias
+
+
+# metodo para leer los totales de un ingreso
+def totales_ingreso(sesion, id_ingreso):
+    '''Devuelve (lineas, total_costo, total_venta) del ingreso con una lectura por clave primaria'''
+    fila = sesion.execute(select(resumen_ingresos.c.lineas, resumen_ingresos.c.total_costo,
+                                 resumen_ingresos.c.total_venta)
+                          .where(resumen_ingresos.c.id_ingreso == id_ingreso)).first()
+    return tuple(fila) if fila else SIN_TOTALES
+
+
+# metodo para leer los totales de un cliente
+def totales_cliente(sesion, id_cliente):
+    '''Devuelve (lineas, total_costo, total_venta) de todos los ingresos del cliente'''
+    fila = sesion.execute(select(resumen_clientes.c.lineas, resumen_clientes.c.total_costo,
+                                 resumen_clientes.c.total_venta)
+                          .where(resumen_clientes.c.id_cliente == id_cliente)).first()
+    return tuple(fila) if fila else SIN_TOTALES
+
+
+# metodo para leer los totales por categoria de un mes
+def totales_mes(sesion, mes):
+    '''Devuelve una lista de (categoria, lineas, total_costo, total_venta) del mes ("AAAA-MM")'''
+    return [tuple(fila) for fila in sesion.execute(
+        select(resumen_meses.c.categoria, resumen_meses.c.lineas, resumen_meses.c.total_costo,
+               resumen_meses.c.total_venta)
+        .where(resumen_meses.c.mes == mes).order_by(resumen_meses.c.categoria))]
+
+
+if __name__ == '__main__':
+    import esquema  # importa este modulo, aqui para no importarlo en ciclo
+    esquema.actualizar(db.engine_sqlite)
+    if '--reconstruir' in sys.argv[1:]:
+        reconstruir_resumenes(db.engine_sqlite)
+        print('Tablas resumen reconstruidas')
+    if '--comprobar' in sys.argv[1:]:
+        diferencias = comprobar_resumenes(db.engine_sqlite)
+        for diferencia in diferencias:
+            print('Diferencia:', diferencia)
+        print(f'{len(diferencias)} diferencias entre las tablas resumen y los registros')
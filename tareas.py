@@ -0,0 +1,131 @@
+'''Ejecucion de las consultas de las ventanas en hilos de base de datos, fuera de los eventos de Flet
+
+   Flet ejecuta los manejadores que son funciones normales en un pool de hilos que comparten todas
+   las paginas: una consulta lenta, o la base de datos bloqueada por la escritura de otro terminal
+   (busy_timeout), deja ese hilo esperando y con varias esperas a la vez los eventos de todos los
+   terminales se quedan en cola. Aqui las consultas se ejecutan en un pool propio de hilos de base de
+   datos, cada una con su sesion, y la ventana espera el resultado con await desde una corrutina que
+   se lanza con page.run_task (Tareas.lanzar): el bucle de eventos sigue libre, la ventana muestra
+   una barra de carga mientras espera y una busqueda nueva cancela la anterior, interrumpiendo su
+   consulta en sqlite en lugar de esperar a que termine.
+
+   Los objetos que devuelve consultar estan desacoplados de la sesion (ya cerrada): las relaciones
+   que se vayan a usar en la ventana se tienen que cargar en la propia consulta (joinedload)'''
+import os
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import db
+
+# Hilos del pool de base de datos (sqlite admite un escritor a la vez, pero varios lectores con WAL)
+HILOS_DB = int(os.environ.get('TALLER_HILOS_DB', 4))
+
+# Instrucciones de la maquina virtual de sqlite entre dos comprobaciones de cancelacion
+INSTRUCCIONES_CANCELACION = 1000
+
+ejecutor = ThreadPoolExecutor(max_workers=HILOS_DB, thread_name_prefix='taller-db')
+
+# Latencias de las ultimas consultas (segundos en la cola del pool, segundos ejecutando)
+latencias = []
+MAX_LATENCIAS = 1000
+
+
+# metodo que ejecuta una funcion de base de datos en un hilo del pool
+def _en_hilo(engine, funcion, args, cancelada, encolada):
+    '''Abre una conexion con una sesion propia, instala el manejador de progreso de sqlite que
+       interrumpe la consulta cuando se cancela la tarea y llama a funcion(sesion, *args)'''
+    empezada = time.perf_counter()
+    if cancelada.is_set():
+        return None
+    try:
+        with engine.connect() as conexion:
+            conexion_dbapi = conexion.connection.dbapi_connection
+            # devolver un valor verdadero desde el manejador hace que sqlite aborte la sentencia en curso
+            conexion_dbapi.set_progress_handler(cancelada.is_set, INSTRUCCIONES_CANCELACION)
+            try:
+                with db.Session(bind=conexion) as sesion:
+                    return funcion(sesion, *args)
+            finally:
+                conexion_dbapi.set_progress_handler(None, 0)
+    finally:
+        latencias.append((empezada - encolada, time.perf_counter() - empezada))
+        del latencias[:-MAX_LATENCIAS]
+
+
+# metodo para ejecutar una funcion de base de datos sin bloquear el bucle de eventos
+async def consultar(funcion, *args, engine=None):
+    '''Ejecuta funcion(sesion, *args) en un hilo de base de datos y devuelve su resultado. La sesion
+       es nueva para cada llamada y se cierra al terminar (funcion hace commit si escribe). Si la
+       corrutina que espera se cancela, la consulta en curso se interrumpe y se hace rollback
+
+    args
+    -funcion: es una funcion (sesion, *args) que no toca controles de Flet
+    -args: son los argumentos de la funcion despues de la sesion
+    -engine: es el engine con el que se conecta (por defecto db.engine_sqlite)
+    '''
+    cancelada = threading.Event()
+    futuro = asyncio.get_running_loop().run_in_executor(
+        ejecutor, _en_hilo, engine or db.engine_sqlite, funcion, args, cancelada, time.perf_counter())
+    try:
+        return await futuro
+    except asyncio.CancelledError:
+        cancelada.set()
+        raise
+
+
+class Tareas:
+    '''Tareas de base de datos en curso de una ventana, por nombre ("busqueda", "guardar"...): lanzar
+       una tarea con el nombre de otra que no ha terminado cancela la anterior
+
+    args
+    -page: es la pagina de Flet en cuyo bucle de eventos se ejecutan las corrutinas
+    '''
+
+    def __init__(self, page):
+        self.page = page
+        self.tareas = {}  # nombre -> asyncio.Task, solo se modifica en el bucle de eventos
+        self.pendientes = {}  # nombre -> tareas lanzadas y no terminadas, se consulta desde cualquier hilo
+        self.cerrojo = threading.Lock()
+
+    # metodo para lanzar una corrutina de la ventana cancelando la anterior con el mismo nombre
+    def lanzar(self, nombre, corrutina, *args, indicador=None):
+        '''Se puede llamar desde un manejador normal (hilo de Flet) o desde una corrutina
+
+        args
+        -nombre: es un string que identifica la tarea en la ventana
+        -corrutina: es una funcion async de la ventana que espera a consultar
+        -args: son los argumentos de la corrutina
+        -indicador: es un control (ProgressBar) que se muestra mientras la tarea esta en curso
+        '''
+        with self.cerrojo:
+            self.pendientes[nombre] = self.pendientes.get(nombre, 0) + 1
+        return self.page.run_task(self._ejecutar, nombre, corrutina, args, indicador)
+
+    # metodo para saber si hay una tarea con ese nombre lanzada y sin terminar
+    def en_curso(self, nombre):
+        with self.cerrojo:
+            return self.pendientes.get(nombre, 0) > 0
+
+    async def _ejecutar(self, nombre, corrutina, args, indicador):
+        tarea = asyncio.current_task()
+        anterior = self.tareas.get(nombre)
+        if anterior is not None:
+            anterior.cancel()
+        self.tareas[nombre] = tarea
+        try:
+            if indicador is not None:
+                indicador.visible = True
+                indicador.update()
+            return await corrutina(*args)
+        except asyncio.CancelledError:
+            pass  # una tarea mas reciente con el mismo nombre ocupa su lugar
+        finally:
+            with self.cerrojo:
+                self.pendientes[nombre] -= 1
+            # solo la ultima tarea con el nombre quita el indicador y el registro
+            if self.tareas.get(nombre) is tarea:
+                del self.tareas[nombre]
+                if indicador is not None:
+                    indicador.visible = False
+                    indicador.update()
@@ -0,0 +1,41 @@
+# Configuracion comun de los tests: cada test trabaja sobre una base de datos sqlite temporal
+
+import os
+import sys
+import shutil
+import tempfile
+import pytest
+
+# los modulos de la aplicacion estan en la raiz del repositorio
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+# db.py crea su engine al importarse: se apunta a un fichero temporal para que ningun test
+# abra (ni pase a WAL) database/mobile.db
+DIRECTORIO_DB = tempfile.mkdtemp(prefix='taller_test_')
+os.environ['TALLER_DB_URL'] = f"sqlite:///{os.path.join(DIRECTORIO_DB, 'taller.db')}"
+
+import db
+import esquema
+
+
+def pytest_sessionfinish(session, exitstatus):
+    db.engine_sqlite.dispose()
+    shutil.rmtree(DIRECTORIO_DB, ignore_errors=True)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    '''Engine de una base de datos temporal vacia con el esquema al dia (esquema.actualizar)'''
+    engine = db.crear_engine(f"sqlite:///{tmp_path / 'taller.db'}")
+    esquema.actualizar(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def sesion(engine):
+    '''Sesion de la base de datos temporal, se cierra al terminar el test'''
+    sesion = db.Session(bind=engine)
+    yield sesion
+    sesion.close()
@@ -0,0 +1,53 @@
+# Tests del numero de sentencias SQL de las busquedas de las vistas (regresiones N+1)
+
+from datetime import datetime
+from sqlalchemy import insert
+from models import Cliente, Vehiculo, Recambio, Ingreso, Registro
+from benchmark import contar_consultas
+import busqueda
+import consultas
+
+VEHICULOS = 40
+LINEAS = 25
+
+
+# metodo para llenar la base de datos temporal con vehiculos, un ingreso y sus registros
+def datos(engine):
+    '''Inserta VEHICULOS clientes con un vehiculo cada uno y un ingreso del primero con LINEAS registros'''
+    ahora = datetime.now()
+    with engine.begin() as conexion:
+        conexion.execute(insert(Cliente.__table__), [
+            {'fecha_alta': ahora, 'nombre': f'cliente {i}', 'telefono': f'6{i:08d}',
+             'direccion': f'calle {i}', 'correo': f'cliente{i}@taller.es'} for i in range(VEHICULOS)])
+        conexion.execute(insert(Vehiculo.__table__), [
+            {'fecha_alta': ahora, 'marca': 'Seat', 'modelo': 'Ibiza', 'kilometros': 100000,
+             'matricula': f'{i:04d} BCD', 'id_cliente': i + 1} for i in range(VEHICULOS)])
+        conexion.execute(insert(Recambio.__table__), [
+            {'fecha_alta': ahora, 'nombre_recambio': f'recambio {i}', 'descripcion': 'test',
+             'categoria': 'Filtros', 'subcategoria': 'Filtro de aceite'} for i in range(LINEAS)])
+        conexion.execute(insert(Ingreso.__table__), [
+            {'fecha_ingreso': ahora, 'kilometros_ingreso': 100000, 'averia': 'revision',
+             'diagnostico': 'revision', 'id_cliente': 1, 'id_vehiculo': 1}])
+        conexion.execute(insert(Registro.__table__), [
+            {'puc': 1000, 'puv': 1200, 'cantidad': 1.0, 'total_costo': 1000, 'total_venta': 1200,
+             'id_recambio': i + 1, 'id_ingreso': 1} for i in range(LINEAS)])
+
+
+def test_buscar_vehiculo_una_consulta(engine, sesion):
+    datos(engine)
+    with contar_consultas(engine) as sentencias:
+        # mismo recorrido que VentanaVehiculo.cargar_pagina y rellenar_tarjeta
+        vehiculos, _ = busqueda.buscar_vehiculos(sesion, 'BCD', None, busqueda.FILAS_REFINABLES)
+        nombres = [vehiculo.clientes.nombre for vehiculo in vehiculos]
+    assert len(nombres) == VEHICULOS
+    assert sentencias[0] == 1
+
+
+def test_lista_registros_una_consulta(engine, sesion):
+    datos(engine)
+    with contar_consultas(engine) as sentencias:
+        # mismo recorrido que VentanaVerRegistrosIngreso.listaRegistrosListView
+        ingreso = consultas.ingreso_con_registros(sesion, 1)
+        nombres = [registro.recambios.nombre_recambio for registro in ingreso.registros]
+    assert len(nombres) == LINEAS
+    assert sentencias[0] == 1
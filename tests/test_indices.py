@@ -0,0 +1,50 @@
+# Tests de los indices de las consultas por clave de las vistas (vistas_*.py)
+
+import pytest
+from sqlalchemy import text
+from models import Cliente, Vehiculo, Recambio, Ingreso, Registro
+import models
+import db
+
+# Consultas por clave de las vistas, las mismas que comprueba benchmark.benchmark_indices
+CONSULTAS = {
+    'cliente por nombre': lambda sesion: sesion.query(Cliente).filter_by(nombre='cliente 1'),
+    'vehiculos del cliente': lambda sesion: sesion.query(Vehiculo).filter_by(id_cliente=1),
+    'vehiculo por modelo': lambda sesion: sesion.query(Vehiculo).filter_by(modelo='307 2.0'),
+    'vehiculo por matricula': lambda sesion: sesion.query(Vehiculo).filter_by(matricula='9859 BWK'),
+    'ingresos del cliente': lambda sesion: sesion.query(Ingreso).filter_by(id_cliente=1),
+    'ingresos del vehiculo': lambda sesion: sesion.query(Ingreso).filter_by(id_vehiculo=1).order_by(Ingreso.fecha_ingreso),
+    'registros del ingreso': lambda sesion: sesion.query(Registro).filter_by(id_ingreso=1),
+    'registros del recambio': lambda sesion: sesion.query(Registro).filter_by(id_recambio=1),
+    'recambios por categoria': lambda sesion: sesion.query(Recambio).filter_by(categoria='Filtros', subcategoria='Filtro de aceite'),
+}
+
+
+# metodo para leer el plan de una consulta
+def plan(engine, consulta):
+    '''Devuelve las lineas de EXPLAIN QUERY PLAN de la consulta (Query) unidas con " | "'''
+    sql = consulta.statement.compile(engine, compile_kwargs={'literal_binds': True})
+    with engine.connect() as conexion:
+        return ' | '.join(fila[-1] for fila in conexion.execute(text(f'EXPLAIN QUERY PLAN {sql}')))
+
+
+@pytest.mark.parametrize('nombre', CONSULTAS)
+def test_consulta_usa_indice(engine, sesion, nombre):
+    plan_consulta = plan(engine, CONSULTAS[nombre](sesion))
+    assert 'USING INDEX' in plan_consulta, f'{nombre}: {plan_consulta}'
+
+
+def test_crear_indices_en_base_existente(engine):
+    # una base de datos anterior a los indices: se borran y crear_indices los vuelve a crear,
+    # tambien si se llama dos veces
+    declarados = {indice.name for tabla in db.Base_mobile.metadata.sorted_tables for indice in tabla.indexes}
+    with engine.begin() as conexion:
+        for nombre in declarados:
+            conexion.execute(text(f'DROP INDEX {nombre}'))
+
+    models.crear_indices(engine)
+    models.crear_indices(engine)
+
+    with engine.connect() as conexion:
+        existentes = {fila[0] for fila in conexion.execute(text("SELECT name FROM sqlite_master WHERE type = 'index'"))}
+    assert declarados <= existentes
@@ -0,0 +1,50 @@
+# Tests de la paginacion keyset de las busquedas (consultas.pagina_keyset)
+
+from datetime import datetime, timedelta
+from sqlalchemy import insert
+from models import Cliente, Recambio
+import busqueda
+
+
+# metodo para leer todas las paginas de una busqueda
+def leer_paginas(buscar, tamanio):
+    '''Llama a buscar(cursor, tamanio) pagina a pagina hasta que no devuelve cursor y junta los resultados'''
+    resultados, cursor = buscar(None, tamanio)
+    while cursor is not None:
+        pagina, cursor = buscar(cursor, tamanio)
+        resultados += pagina
+    return resultados
+
+
+def test_clientes_sin_fecha_alta_salen_en_las_paginas(engine, sesion):
+    ahora = datetime(2024, 5, 1)
+    # uno de cada tres clientes sin fecha de alta, repartidos entre los que si la tienen
+    with engine.begin() as conexion:
+        conexion.execute(insert(Cliente.__table__), [
+            {'fecha_alta': None if i % 3 == 0 else ahora - timedelta(days=i), 'nombre': f'cliente {i}',
+             'telefono': f'6{i:08d}', 'direccion': f'calle {i}', 'correo': f'cliente{i}@taller.es'}
+            for i in range(50)])
+
+    clientes = leer_paginas(lambda cursor, tamanio: busqueda.buscar_clientes(sesion, '', cursor, tamanio), 7)
+
+    ids = [cliente.id_cliente for cliente in clientes]
+    assert sorted(ids) == list(range(1, 51))
+    # los mas recientes primero y los que no tienen fecha al final, cada grupo por id descendente
+    con_fecha = [cliente for cliente in clientes if cliente.fecha_alta is not None]
+    sin_fecha = [cliente for cliente in clientes if cliente.fecha_alta is None]
+    assert clientes == con_fecha + sin_fecha
+    assert [cliente.fecha_alta for cliente in con_fecha] == sorted((c.fecha_alta for c in con_fecha), reverse=True)
+    assert [cliente.id_cliente for cliente in sin_fecha] == sorted((c.id_cliente for c in sin_fecha), reverse=True)
+
+
+def test_pagina_que_empieza_en_una_fila_sin_fecha(engine, sesion):
+    # todas las filas de una pagina tienen NULL: el cursor de la siguiente tambien lo tiene
+    with engine.begin() as conexion:
+        conexion.execute(insert(Recambio.__table__), [
+            {'fecha_alta': None, 'nombre_recambio': f'recambio {i}', 'descripcion': 'test',
+             'categoria': 'Filtros', 'subcategoria': 'Filtro de aceite'} for i in range(10)])
+
+    recambios = leer_paginas(
+        lambda cursor, tamanio: busqueda.buscar_recambios(sesion, '', cursor=cursor, tamanio=tamanio), 3)
+
+    assert [recambio.id_recambio for recambio in recambios] == list(range(10, 0, -1))
@@ -0,0 +1,65 @@
+# Tests del registro de sesiones de db.py (una sesion por pagina de Flet o por hilo)
+
+import contextvars
+import threading
+from types import SimpleNamespace
+from flet_core.page import _session_page
+import db
+
+
+# metodo para ejecutar una funcion como si la llamara la pagina de Flet con session_id
+def en_pagina(session_id, funcion):
+    '''Ejecuta funcion() en un contexto con la pagina actual (ft.context.page) fijada, como hace
+       Flet en los eventos de cada pagina, y devuelve su resultado'''
+    def _ejecutar():
+        _session_page.set(SimpleNamespace(session_id=session_id))
+        return funcion()
+    return contextvars.copy_context().run(_ejecutar)
+
+
+def test_cada_pagina_tiene_su_sesion():
+    try:
+        sesion_a = en_pagina('pagina-a', db.session)
+        sesion_b = en_pagina('pagina-b', db.session)
+
+        assert sesion_a is not sesion_b
+        assert en_pagina('pagina-a', db.session) is sesion_a
+        assert en_pagina('pagina-a', db.ambito_sesion) == 'pagina-a'
+    finally:
+        db.cerrar_sesion('pagina-a')
+        db.cerrar_sesion('pagina-b')
+
+
+def test_cerrar_sesion_solo_quita_la_suya():
+    try:
+        sesion_a = en_pagina('pagina-a', db.session)
+        sesion_b = en_pagina('pagina-b', db.session)
+
+        db.cerrar_sesion('pagina-a')
+
+        assert 'pagina-a' not in db.session.registry.registry
+        assert en_pagina('pagina-b', db.session) is sesion_b
+        # la pagina cerrada recibe una sesion nueva si vuelve a consultar
+        assert en_pagina('pagina-a', db.session) is not sesion_a
+    finally:
+        db.cerrar_sesion('pagina-a')
+        db.cerrar_sesion('pagina-b')
+
+
+def test_cada_hilo_sin_pagina_tiene_su_sesion():
+    sesiones = {}
+
+    def _hilo():
+        sesiones['hilo'] = db.session()
+        db.cerrar_sesion()  # sin clave cierra la del ambito actual, la de este hilo
+
+    try:
+        sesiones['principal'] = db.session()
+        hilo = threading.Thread(target=_hilo)
+        hilo.start()
+        hilo.join()
+
+        assert sesiones['hilo'] is not sesiones['principal']
+        assert db.session() is sesiones['principal']
+    finally:
+        db.cerrar_sesion()
@@ -0,0 +1,1752 @@
+# Ventanas de gestion de clientes: busqueda, alta, edicion y sus vehiculos e ingresos
+
+from datetime import datetime
+import flet as ft
+from flet import CrossAxisAlignment, FontWeight, ImageRepeat, MainAxisAlignment, Row, TextAlign, TextStyle, icons
+from models import Cliente, Vehiculo, Ingreso
+import busqueda
+import consultas
+from componentes import ListaVirtual, barra_carga, cargar_mas_al_final
+import tareas
+import imagenes
+import db
+import asyncio
+
+
+# Gestion De Clientes
+class VentanaCliente(ft.View):
+    '''Clase VentanaClientes: Interfaz gráfica para la gestión de clientes.
+
+    Esta clase representa la ventana de la aplicación dedicada a la gestión de clientes, donde el
+    usuario puede realizar varias operaciones como búsqueda, adición, modificación y eliminación
+    de clientes registrados en el sistema del taller.
+
+    Args:
+        - page: Instancia de la página actual, que maneja el contenido y las interacciones de la ventana.
+
+    Contiene:
+        - Imagen de título: Muestra una imagen de "Clientes" para identificar visualmente la sección.
+        - Input: Campo de texto para ingresar el nombre del cliente a buscar.
+        - Botón ElevatedButton "Buscar Cliente": Activa la búsqueda de clientes según los datos ingresados
+          en el campo de búsqueda.
+        - Botón ElevatedButton "Añadir Cliente": Permite al usuario añadir un nuevo cliente al sistema
+          ingresando los datos requeridos (nombre, teléfono, dirección, etc.).
+        - Botón ElevatedButton "Editar": Accede a una interfaz para editar los datos de un
+          cliente existente en el sistema.
+        - Botón ElevatedButton "Eliminar Cliente": Elimina del sistema los registros del cliente y el cliente seleccionado.
+    '''
+
+    def __init__(self, page: ft.Page):
+        '''Constructor de la interfaz grafica para la ventana Clientes'''
+        super(VentanaCliente, self).__init__(
+            route="/clientes", horizontal_alignment=CrossAxisAlignment.CENTER,
+            vertical_alignment=MainAxisAlignment.CENTER
+        )
+        print("Gestion de Clientes (VentanaCliente)")
+
+        self.page = page
+
+        # Color de fondo contenedor principal
+        self.bgcolor = "#E0E7ED"
+
+        # Imagen clientes
+        self.imagenClientes = ft.Container(
+            ft.Container(
+                    content=ft.Text(
+                        value=" Gestión de Clientes",
+                        size=22,
+                        color=ft.colors.WHITE,
+                        weight=ft.FontWeight.BOLD
+                    ),
+                    shadow=ft.BoxShadow(
+                        blur_radius=8,  # Difuminado de la sombra
+                        spread_radius=2,  # Expansión de la sombra
+                        offset=ft.Offset(0, 4),  # Posición: hacia abajo
+                        color=ft.colors.GREY_500,  # Color de la sombra
+                    ),
+                    bgcolor="black",
+                    width=320,
+                    height=120,
+                    padding=0,
+                    image_repeat=ImageRepeat.NO_REPEAT,
+                    shape=ft.BoxShape("rectangle"),
+                    # Define imagen
+                    image_src=imagenes.ruta("/ImagenClientes.png"),
+                    image_fit=ft.ImageFit.COVER,
+                    image_opacity=0.7,
+                ),
+                alignment=ft.alignment.Alignment(x=0, y=0)
+            )
+
+        # Campo de entrada para la busqueda
+        self.input_buscar = ft.TextField(
+            label="Buscar Cliente",
+            label_style=TextStyle(color='#6a6965', size=12),
+            value="",
+            border_radius=ft.border_radius.vertical(top=6, bottom=6),
+            hint_text="Introduce el nombre del cliente",
+            hint_style=TextStyle(color='#6a6965', size=10),
+            color='black',
+            height=35,
+            cursor_color="#12597b",
+            text_size=13,
+            border_color="#12597b",
+            autofocus=True,
+            bgcolor="#D9E4EA",
+            on_change=lambda e: self.buscar_cliente(e),  # busca mientras se escribe
+        )
+
+        # Boton para activar la busqueda cliente y boton agregar nuevo cliente
+        self.BotonBuscarCliente = ft.Container(
+            alignment=ft.alignment.Alignment(x=0, y=0),
+            content=Row(
+                alignment=ft.MainAxisAlignment.CENTER,
+                controls=[
+                    # Boton buscar cliente
+                    ft.ElevatedButton(
+                        text="Buscar Cliente",
+                        color="#FAFAF3",
+                        bgcolor="#12597b",
+                        tooltip='Buscar Cliente',
+                        icon=icons.SEARCH,
+                        icon_color="#FAFAF3",
+                        width=180,
+                        height=30,
+                        on_click=lambda e: self.buscar_cliente(e),
+                    ),
+                    # Boton añadir nuevo
+                    ft.IconButton(
+                        icon=ft.icons.PERSON_ADD,
+                        icon_color="#709775",
+                        icon_size=30,
+                        tooltip="Añadir Nuevo",
+                        on_click=lambda e: page.go("/clienteNuevo"),
+                        )
+                ]
+            )
+        )
+
+        # Paginacion de los resultados: cursor de la pagina siguiente y consultas en curso de la ventana
+        self.cursor_busqueda = None
+        self.tareas = tareas.Tareas(page)
+        self.barraCarga = barra_carga()  # visible mientras se espera a la base de datos
+        self.incremental = busqueda.BusquedaIncremental(busqueda.coincide_cliente, ('clientes',))  # resultados para refinar en memoria
+
+        # Contenedor para mostrar los resultados de búsqueda
+        # solo se crean las tarjetas visibles y se reutilizan al hacer scroll
+        self.vistaResultadosBusqueda = ListaVirtual(
+            alto_elemento=175,  # el alto que daba child_aspect_ratio=1.9 con el ancho de la ventana
+            crear_elemento=self.crear_tarjeta,
+            rellenar_elemento=self.rellenar_tarjeta,
+            cargar_mas=lambda e: cargar_mas_al_final(self, e),  # carga la siguiente pagina al llegar al final
+            espacio=10,  # Espacio entre las tarjetas
+            bgcolor='#E0E7ED',
+            expand=True,
+        )
+
+        # Barra de navegacion
+        self.barraNavegacion = ft.NavigationBar(
+            selected_index=1,
+            height=50,
+            on_change=lambda e: self.barra_de_navegacion(e),
+            destinations=[
+                ft.NavigationBarDestination(
+                    icon_content=ft.Icon(
+                        name=ft.icons.HOME_OUTLINED,
+                        color="#31708E",
+                        size=20  # Ajusta el tamaño del ícono no seleccionado
+                    ),
+                    selected_icon_content=ft.Icon(
+                        name=ft.icons.HOME_ROUNDED,
+                        color="#31708E",
+                        size=28  # Ajusta el tamaño del ícono seleccionado
+                    ),
+                    label="Inicio",
+                ),
+                ft.NavigationBarDestination(
+                    icon_content=ft.Icon(
+                        name=ft.icons.PERSON_OUTLINED,
+                        color="#31708E",
+                        size=20
+                    ),
+                    selected_icon_content=ft.Icon(
+                        name=ft.icons.PERSON,
+                        color="#31708E",
+                        size=28
+                    ),
+                    label="Cliente",
+
+                ),
+                ft.NavigationBarDestination(
+                    icon_content=ft.Icon(
+                        name=ft.icons.DIRECTIONS_CAR_OUTLINED,
+                        color="#31708E",
+                        size=20
+                    ),
+                    selected_icon_content=ft.Icon(
+                        name=ft.icons.DIRECTIONS_CAR,
+                        color="#31708E",
+                        size=28
+                    ),
+                    label="Vehículo",
+                ),
+                ft.NavigationBarDestination(
+                    icon_content=ft.Icon(
+                        name=ft.icons.SETTINGS_OUTLINED,
+                        color="#31708E",
+                        size=20
+                    ),
+                    selected_icon_content=ft.Icon(
+                        name=ft.icons.SETTINGS,
+                        color="#31708E",
+                        size=28
+                    ),
+                    label="Recambio",
+                ),
+                ft.NavigationBarDestination(
+                    icon_content=ft.Icon(
+                        name=ft.icons.CAR_REPAIR_OUTLINED,
+                        color="#31708E",
+                        size=20
+                    ),
+                    selected_icon_content=ft.Icon(
+                        name=ft.icons.CAR_REPAIR,
+                        color="#31708E",
+                        size=28
+                    ),
+                    label="Ingreso",
+                )
+            ],
+            bgcolor="#D1E2E7",  # Color de fondo de la barra de navegación (azul oscuro)
+            indicator_color="#FFD700",  # Color del indicador del destino seleccionado (ámbar)
+            surface_tint_color="#E0E7ED",  # Color de superficie para el material (gris claro)
+            label_behavior=ft.NavigationBarLabelBehavior.ONLY_SHOW_SELECTED  # Mostrar la etiqueta  seleccionada
+        )
+
+        # Contenedor principal que contiene todos los elementos de la interfaz
+        self.controls = [
+            ft.Container(
+                ft.Column([
+                    # self.tituloClientes,
+                    self.imagenClientes,
+                    self.input_buscar,
+                    self.barraCarga,
+                    self.BotonBuscarCliente,
+                    ft.Divider(height=10, color="#B0BEC5"),
+                    self.vistaResultadosBusqueda,
+                    self.barraNavegacion,
+
+                ]
+                ),
+
+                # propiedades contenedor principal
+                border_radius=25,
+                width=350,  # ancho
+                height=655,  # Alto
+                gradient=ft.LinearGradient([  # color del contenedor configurable en 2 tonos de color
+                    "#E0E7ED",
+                    "#E0E7ED",
+                ])
+
+            )
+        ]
+
+    # metodo para cargar los clientes existentes en el GridView
+    def buscar_cliente(self,e):
+        # input donde el usuario ingresa el nombre del cliente que quiere buscar, se deja escrito para poder afinarlo
+        self.nombre_buscado = self.input_buscar.value or ""  # este es el Input
+        self.cursor_busqueda = None  # la busqueda empieza por la primera pagina
+
+        # la consulta va a un hilo de base de datos; si habia otra busqueda en curso se cancela
+        # mientras se escribe (on_change) se espera a que pase PAUSA_TECLEO sin otra tecla
+        pausa = busqueda.PAUSA_TECLEO if e.name == 'change' else 0
+        if e.name != 'change':
+            self.incremental.olvidar()  # al pulsar Buscar siempre se consulta la base de datos
+        self.tareas.lanzar('busqueda', self.cargar_pagina, True, pausa, indicador=self.barraCarga)
+
+    # metodo para cargar la siguiente pagina de clientes en la lista
+    async def cargar_pagina(self, nueva=False, pausa=0):
+        await asyncio.sleep(pausa)
+        nombre, cursor = self.nombre_buscado, self.cursor_busqueda
+
+        # si el texto amplia el de la busqueda anterior (completa) se filtran sus resultados en memoria
+        cliente_localizado = self.incremental.refinar(nombre) if nueva else None
+        if cliente_localizado is None:
+            # Buscamos el cliente por nombre (ignorando mayúsculas y minusculas), una pagina cada vez
+            cliente_localizado, cursor = await tareas.consultar(
+                busqueda.buscar_clientes, nombre, cursor, busqueda.FILAS_REFINABLES if nueva else consultas.TAMANIO_PAGINA)
+            self.incremental.guardar(nombre, cliente_localizado, cursor, nueva)
+
+        # Limpia los resultados anteriores cuando llegan los de la busqueda nueva
+        if nueva:
+            self.vistaResultadosBusqueda.limpiar()
+        self.cursor_busqueda = cursor
+
+        if cliente_localizado:
+            # agregar los clientes a la lista, que solo dibuja las tarjetas visibles
+            self.vistaResultadosBusqueda.agregar(cliente_localizado)
+        #actualizar la interfaz
+        self.vistaResultadosBusqueda.update()
+
+    # metodo para crear una tarjeta de cliente vacia que la lista reutiliza
+    def crear_tarjeta(self):
+        '''Crea la tarjeta de resultados de clientes sin datos; en card.data se guardan los textos
+           que cambian y el cliente que muestra, que se escriben con rellenar_tarjeta'''
+        nombre = ft.Text(size=14, weight=ft.FontWeight.W_700, color="#283747", text_align=ft.TextAlign.CENTER, no_wrap = False) # no_wrap Asegura que el texto se ajuste si es largo
+        desde = ft.Text(size=14, text_align=ft.TextAlign.LEFT, color="#283747")
+        telefono = ft.Text(size=12, text_align=ft.TextAlign.LEFT, color="#283747")
+        direccion = ft.Text(size=11, text_align=ft.TextAlign.LEFT, color="#283747", no_wrap = False) # no_wrap Asegura que el texto se ajuste si es largo
+        correo = ft.Text(size=12, text_align=ft.TextAlign.LEFT, color="#283747", no_wrap = False) # no_wrap Asegura que el texto se ajuste si es largo
+
+        card = ft.Card(
+            elevation=8,
+            content=ft.Container(
+                alignment=ft.alignment.Alignment(x=0, y=0),
+                bgcolor="#9ec4cc",
+                padding=5,
+                border=ft.border.all(1, ft.colors.BLUE_800),
+                border_radius=ft.border_radius.all(12),
+                content=ft.Column([
+                    ft.Container(
+                        ft.Row(
+                            [nombre, desde],
+                            wrap=True,  # asegura que el contenido se ajuste en varias filas si es necesario
+                            alignment=ft.MainAxisAlignment.CENTER,
+                        ),
+                        bgcolor="transparent",
+                        alignment=ft.alignment.center
+                    ),
+                    ft.Container(
+                        ft.Row(
+                            [
+                                ft.Text(f"Telefono:", size=12, weight=ft.FontWeight.W_700, color="#283747",text_align=ft.TextAlign.LEFT),
+                                telefono
+                            ],
+                            alignment=ft.MainAxisAlignment.START,
+                            vertical_alignment=ft.CrossAxisAlignment.CENTER
+                        ),
+                        bgcolor="transparent",
+                        padding=0,
+                        alignment=ft.alignment.center_left,
+
+                    ),
+                    ft.Container(
+                        ft.Row(
+                            [
+                                ft.Text(f"Dirección:", size=11, weight=ft.FontWeight.W_700, color="#283747", text_align=ft.TextAlign.LEFT),
+                                direccion
+                            ],
+                            wrap=True,  # asegura que el contenido se ajuste en varias filas si es necesario
+                            alignment=ft.MainAxisAlignment.START,
+                            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                        ),
+                        expand=True,
+                        bgcolor="transparent",
+                        padding=0,
+                        alignment=ft.alignment.center_left,
+                    ),
+                    ft.Container(
+                        ft.Row(
+                            [
+                                ft.Text(f"Correo:", size=12, weight=ft.FontWeight.W_700, color="#283747", text_align=ft.TextAlign.LEFT),
+                                correo
+                            ],
+                            wrap=True,  # asegura que el contenido se ajuste en varias filas si es necesario
+                            alignment=ft.MainAxisAlignment.START,
+                            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                        ),
+                        bgcolor="transparent",
+                        padding=0,
+                        alignment=ft.alignment.center_left,
+                    ),
+                    ft.Row(
+                        [
+                            # los botones leen el cliente que muestra la tarjeta en el momento del click
+                            ft.IconButton(
+                                icon=ft.icons.DIRECTIONS_CAR,
+                                icon_color="E0E7ED",
+                                icon_size=25,
+                                tooltip="Vehiculos",
+                                on_click=lambda e: (
+                                    self.objeto_Seleccionado(e, card.data['cliente']),
+                                    self.page.go("/vehiculosCliente"), print("VentanaVerVehiculosCliente")
+                                )
+                            ),
+                            ft.IconButton(
+                                icon=ft.icons.CAR_RENTAL,
+                                icon_color="E0E7ED",
+                                icon_size=25,
+                                tooltip="Ingresos",
+                                on_click=lambda e: (
+                                    self.objeto_Seleccionado(e, card.data['cliente']),
+                                    self.page.go("/ingresosCliente"), print("VentanaVerIngresosCliente")
+                                )
+                            ),
+                            ft.IconButton(
+                                icon=ft.icons.MODE_EDIT_OUTLINED,
+                                icon_color="E0E7ED",
+                                icon_size=25,
+                                tooltip="Editar",
+                                on_click=lambda e: (
+                                    self.objeto_Seleccionado(e, card.data['cliente']),
+                                    self.page.go("/editarCliente"), print("VentanaEditarCliente")
+                                ),
+                            ),
+                            ft.IconButton(
+                                icon=ft.icons.DELETE_FOREVER_ROUNDED,
+                                icon_color="E0E7ED",
+                                icon_size=25,
+                                tooltip="Eliminar",
+                            ),
+
+                        ],
+                    alignment=ft.MainAxisAlignment.SPACE_EVENLY,
+                    vertical_alignment=ft.CrossAxisAlignment.END,
+                    )
+                ])
+            )
+        )
+        card.data = {'cliente': None, 'nombre': nombre, 'desde': desde, 'telefono': telefono,
+                     'direccion': direccion, 'correo': correo}
+        return card
+
+    # metodo para mostrar un cliente en una tarjeta de la lista
+    def rellenar_tarjeta(self, card, cliente):
+        campos = card.data
+        campos['cliente'] = cliente
+        campos['nombre'].value = f"{cliente.nombre}, "
+        campos['desde'].value = f"Desde: {cliente.fecha_alta.strftime('%d/%m/%Y')}"
+        campos['telefono'].value = f"{cliente.telefono}"
+        campos['direccion'].value = f"{cliente.direccion}"
+        campos['correo'].value = f"{cliente.correo}"
+
+    #metodo para guardar en una variable el cliente seleccionado
+    def objeto_Seleccionado(self, e, cliente_seleccionado):
+        # Guardar el ID y el nombre del cliente seleccionado
+        self.page.session.set("idClienteSeleccionado", cliente_seleccionado.id_cliente)
+        self.page.session.set("nombreClienteSeleccionado", cliente_seleccionado.nombre)
+        self.page.session.set("telefonoClienteSeleccionado", cliente_seleccionado.telefono)
+        self.page.session.set("direccionClienteSeleccionado", cliente_seleccionado.direccion)
+        self.page.session.set("correoClienteSeleccionado", cliente_seleccionado.correo)
+
+    # metodo para navegar entre ventanas
+    def barra_de_navegacion(self, e):
+        selected_index = e.control.selected_index
+        if selected_index == 0:
+            self.page.go("/inicio")
+        elif selected_index == 1:
+            self.page.go("/clientes")
+        elif selected_index == 2:
+            self.page.go("/vehiculos")
+        elif selected_index == 3:
+            self.page.go("/recambios")
+        elif selected_index == 4:
+            self.page.go("/ingresos")
+
+
+# Gestion de Clientes - Añadir Cliente
+class VentanaClienteNuevo(ft.View):
+    '''Clase VentanaNuevoCliente: Interfaz gráfica para la gestión de clientes.
+
+    Esta clase representa la ventana de la aplicación dedicada a la adición de clientes nuevos en el sistema
+    del taller.
+
+    Args:
+        - page: Instancia de la página actual, que maneja el contenido y las interacciones de la ventana.
+
+    Contiene:
+        - Imagen de título: Muestra una imagen de "Gestión de clientes" para identificar visualmente la sección.
+        - Input: Campo de texto para ingresar el nombre del cliente.
+        - Input: Campo de texto para ingresar el telefono del cliente.
+        - Input: Campo de texto para ingresar el correo electronico del cliente.
+        - Input: Campo de texto para ingresar el domicilio del cliente.
+        - Botón ElevatedButton: "Aceptar" activa la accion de añadir el cliente al sistema los registros del taller
+        - Botón ElevatedButton: "Cancelar" cancela la operacion de añadir el cliente.
+    '''
+
+    def __init__(self, page: ft.Page):
+        '''Constructor de la interfaz grafica para la ventana Cliente Nuevo'''
+        super(VentanaClienteNuevo, self).__init__(
+            route="/clienteNuevo", horizontal_alignment=CrossAxisAlignment.CENTER,
+            vertical_alignment=MainAxisAlignment.CENTER
+        )
+        print("Gestion de Clientes - Añadir Cliente (VentanaClienteNuevo)")
+
+        self.page = page
+
+        # Color de fondo contenedor principal
+        self.bgcolor = "#E0E7ED"
+
+        # Imagen gestion de cliente
+        self.imagen_gestionCliente = ft.Container(
+            ft.Container(
+                    content=ft.Text(
+                        value=" Añadir Nuevo",
+                        size=22,
+                        color=ft.colors.WHITE,
+                        weight=ft.FontWeight.BOLD
+                    ),
+                    shadow=ft.BoxShadow(
+                        blur_radius=8,  # Difuminado de la sombra
+                        spread_radius=2,  # Expansión de la sombra
+                        offset=ft.Offset(0, 4),  # Posición: hacia abajo
+                        color=ft.colors.GREY_500,  # Color de la sombra
+                    ),
+                    bgcolor="black",
+                    width=320,
+                    height=120,
+                    padding=0,
+                    image_repeat=ImageRepeat.NO_REPEAT,
+                    shape=ft.BoxShape("rectangle"),
+                    # Define imagen
+                    image_src=imagenes.ruta("/ImagenClienteNuevo.png"),
+                    image_fit=ft.ImageFit.COVER,
+                    image_opacity=0.7,
+                ),
+                alignment=ft.alignment.Alignment(x=0, y=0)
+            )
+
+        # Campo de entrada para el nombre del cliente
+        self.input_nombreCliente = ft.TextField(
+            label="Nombre",
+            label_style=TextStyle(color='#6a6965', size=12),
+            value="",
+            border_radius=ft.border_radius.vertical(top=6, bottom=6),
+            hint_text="Introduce el nombre",
+            hint_style=TextStyle(color='#6a6965', size=10),
+            color='black',
+            height=35,
+            cursor_color="#12597b",
+            text_size=13,
+            border_color="#B0BEC5",
+            autofocus=True,
+            bgcolor="#D9E4EA"
+        )
+
+        # Campo de entrada para el telefono del cliente
+        self.input_telefonoCliente = ft.TextField(
+            label="Telefono",
+            label_style=TextStyle(color='#6a6965', size=12),
+            value="",
+            border_radius=ft.border_radius.vertical(top=6, bottom=6),
+            hint_text="Introduce el telefono",
+            hint_style=TextStyle(color='#6a6965', size=10),
+            color='black',
+            height=35,
+            cursor_color="#12597b",
+            text_size=13,
+            border_color="#B0BEC5",
+            autofocus=True,
+            bgcolor="#D9E4EA"
+        )
+
+        # Campo de entrada para el correo electronico del cliente
+        self.input_correoCliente = ft.TextField(
+            label="Correo Electronico",
+            label_style=TextStyle(color='#6a6965', size=12),
+            value="",
+            border_radius=ft.border_radius.vertical(top=6, bottom=6),
+            hint_text="Introduce el correo",
+            hint_style=TextStyle(color='#6a6965', size=10),
+            color='black',
+            height=35,
+            cursor_color="#12597b",
+            text_size=13,
+            border_color="#B0BEC5",
+            autofocus=True,
+            bgcolor="#D9E4EA"
+        )
+
+        # Campo de entrada para la direccion del cliente
+        self.input_direccionCliente = ft.Container(
+            bgcolor='#D9E4EA',
+            border=ft.border.all(color="#B0BEC5", width=1),
+            border_radius=ft.border_radius.vertical(top=6, bottom=6),
+            # expand=True,
+            height=180,
+            content=
+            ft.TextField(
+                filled=False,
+                label="Direccion",
+                label_style=TextStyle(color='#6a6965', size=12, ),
+                expand=True,
+                value="",
+                border_radius=ft.border_radius.vertical(top=6, bottom=6),
+                hint_text="Introduce la direccion",
+                hint_style=TextStyle(color='#6a6965', size=10),
+                max_length=200,  # maximo de caracteres que se pueden ingresar en TextField
+                # max_lines =  10, # maximo de líneas que se mostraran a la vez
+                multiline=True,  # puede contener varias lineas de texto
+                color='black',
+                height=180,
+                cursor_color="#12597b",
+                text_size=13,
+                border_color="transparent",
+                autofocus=False,
+                bgcolor="#D9E4EA",
+                text_vertical_align=ft.VerticalAlignment.START,
+            )
+        )
+
+        # Botones para agregar y cancelar operacion
+        self.BotonAgregarCliente = ft.Container(
+            expand=True,
+            alignment=ft.alignment.Alignment(x=0, y=0),
+            content=Row(
+                alignment=ft.MainAxisAlignment.CENTER,
+                controls=[
+                    # Boton agregar cliente nuevo
+                    ft.ElevatedButton(
+                        text="Aceptar",
+                        color="#FAFAF3",
+                        bgcolor="#12597b",
+                        tooltip='Aceptar Añadir',
+                        icon=icons.ADD,
+                        icon_color="#FAFAF3",
+                        width=140,
+                        height=30,
+                        on_click=lambda e: (self.cliente_nuevo(e), page.go("/clientes")),
+                    ),
+                    # cancelar operacion
+                    ft.ElevatedButton(
+                        text="Cancelar",
+                        color="#FAFAF3",
+                        bgcolor="#12597b",
+                        tooltip='Cancelar Añadir',
+                        icon=icons.CANCEL,
+                        icon_color="#FAFAF3",
+                        width=140,
+                        height=30,
+                        on_click=lambda _: page.go("/clientes"),
+                    ),
+                ]
+            )
+        )
+
+        # Contenedor principal que contiene todos los elementos de la interfaz
+        self.controls = [
+            ft.Container(
+                ft.Column([
+                    # self.tituloClientes,
+                    self.imagen_gestionCliente,
+                    ft.Divider(height=10, color="transparent"),
+                    self.input_nombreCliente,
+                    self.input_telefonoCliente,
+                    self.input_correoCliente,
+                    self.input_direccionCliente,
+                    self.BotonAgregarCliente,
+                ]
+                ),
+
+                # propiedades contenedor principal
+                border_radius=25,
+                width=350,  # ancho
+                height=655,  # Alto
+                gradient=ft.LinearGradient([  # color del contenedor configurable en 2 tonos de color
+                    "#E0E7ED",
+                    "#E0E7ED",
+                ])
+
+            )
+        ]
+
+    # metodo para añadir un nuevo cliente al sistema del taller
+    def cliente_nuevo(self, e):
+        print("\n > Crear cliente")
+        # Captura y limpieza de los datos ingresados por el usuario
+        nombre = self.input_nombreCliente.value.strip()  # Nombre del cliente
+        telefono = self.input_telefonoCliente.value.strip() # Teléfono de contacto del cliente
+        correo = self.input_correoCliente.value.strip() # Correo electrónico del cliente
+        direccion = self.input_direccionCliente.content.value.strip() # Dirección del cliente
+        fecha_alta = datetime.now() # Fecha de registro del cliente en el sistema
+
+        # Creación de una nueva instancia de Cliente con los datos proporcionados
+        nuevo_cliente = Cliente(nombre=nombre, telefono=telefono, direccion=direccion, correo=correo,
+                                fecha_alta=fecha_alta)
+
+        # Agregar el nuevo cliente a la sesión de la base de datos
+        db.session.add(nuevo_cliente)
+
+        # Guardar los cambios en la base de datos y cerrar la sesión
+        db.session.commit()
+        db.session.close()
+
+
+# Gestion de Clientes - Vehiculos del cliente seleccionado
+class VentanaVerVehiculosCliente(ft.View):
+    '''Clase VentanaVerVehiculosCliente:
+        Interfaz gráfica para la visualización de los vehículos del cliente seleccionado.
+
+        Esta clase representa la ventana de la aplicación dedicada a la visualización de los vehículos de un cliente,
+        permitiendo al usuario explorar el historial de vehículos y realizar acciones específicas, como editar datos
+        o visualizar ingresos relacionados.
+
+        Args:
+            page: Instancia de la página actual, utilizada para gestionar el contenido y las interacciones de la ventana.
+
+        Componentes principales:
+            - Título (Text): Identifica la sección de vehículos del cliente seleccionado.
+            - GridView: Presenta una lista de vehículos del cliente seleccionado, con opciones interactivas.
+            - IconButtons:
+                * IconButton 1: Permite visualizar los ingresos asociados al vehículo seleccionado.
+                * IconButton 2: Permite editar los datos del vehículo seleccionado.
+            - Botón Volver: Navega de regreso a la ventana de clientes.
+      '''
+
+    def __init__(self, page: ft.Page):
+        '''Constructor de la interfaz grafica para la ventana para visualizar los Vehiculos del Cliente'''
+        super(VentanaVerVehiculosCliente, self).__init__(
+            route="/vehiculosCliente", horizontal_alignment=CrossAxisAlignment.CENTER,
+            vertical_alignment=MainAxisAlignment.CENTER
+        )
+        print("Gestion de Clientes - Vehiculos del cliente seleccionado (VentanaVerVehiculosCliente)")
+
+        self.page = page
+
+        # Color de fondo contenedor principal
+        self.bgcolor = "#E0E7ED"
+
+        # Titulo que identifica la sección correspondiente
+        self.nombre_cliente = ft.Row([
+            ft.Text(
+                value=f'Vehiculos de',
+                width=None,
+                size=12,
+                text_align=TextAlign.START,
+                weight=FontWeight.W_600,
+                color="#333333"
+            ),
+            ft.Text(
+                value=self.page.session.get("nombreClienteSeleccionado"),
+                size=12,
+                color='green700',
+                weight=FontWeight.W_600
+            )
+        ],
+            alignment=ft.MainAxisAlignment.CENTER,
+        )
+
+        # Contenedor para mostrar los vehiculos del cliente
+        self.vistaResultadosBusqueda = ft.Container(
+            bgcolor='#E0E7ED', # Color de fondo
+            expand=True,
+            content=ft.GridView(
+                expand=1,
+                on_scroll_interval=10,  # Intervalo de scroll
+                child_aspect_ratio=2.8, # Ajusta la relación alto por ancho
+                runs_count=1,  # Número de columnas según el diseño
+                spacing=10,  # Espacio entre las imágenes
+                run_spacing=1,  # Espacio entre las filas
+            )
+        )
+
+        # Boton para realizar la accion de volver a la ventana clientes
+        self.botonVolver = ft.Container(
+            ft.ElevatedButton(
+                        text="Volver",
+                        color="#FAFAF3",
+                        bgcolor="#12597b",
+                        tooltip='Volver atras',
+                        icon=icons.ARROW_BACK,
+                        icon_color="#FAFAF3",
+                        width=180,
+                        height=30,
+                        on_click=lambda e: self.page.go("/clientes"),
+                    ),
+            alignment=ft.alignment.Alignment(x=0, y=0)
+        )
+
+
+        # Contenedor principal que contiene todos los elementos de la interfaz
+        self.controls = [
+            ft.Container(
+                ft.Column([
+                    self.nombre_cliente,
+                    self.vistaResultadosBusqueda,
+                    self.botonVolver,
+
+                ]
+                ),
+
+                # propiedades contenedor principal
+                border_radius=25,
+                width=350,  # ancho
+                height=655,  # Alto
+                gradient=ft.LinearGradient([  # color del contenedor configurable en 2 tonos de color
+                    "#E0E7ED",
+                    "#E0E7ED",
+                ])
+
+            )
+        ]
+
+        # Llama al metodo para mostrar los vehiculos del cliente
+        self.vehiculos_cliente(self)
+
+    # metodo para cargar los vehiculos existentes en el GridView
+    def vehiculos_cliente(self,e):
+        # Obtener el ID de usuario actual de la sesion
+        id_cliente_actual = self.page.session.get("idClienteSeleccionado")
+
+        # Realizar la busqueda de los vehiculos del cliente
+        vehiculos_cliente = db.session.query(Vehiculo).filter_by(
+            id_cliente = id_cliente_actual ).all()
+
+
+        if vehiculos_cliente:
+            cards = []
+            for vehiculo in vehiculos_cliente:
+                card = ft.Card(
+                            elevation=8,
+                        content=ft.Container(
+                            alignment=ft.alignment.Alignment(x=0, y=0),
+                            bgcolor="#9ec4cc",
+                            padding=5,
+                            border=ft.border.all(1, ft.colors.BLUE_800),
+                            border_radius=ft.border_radius.all(12),
+                            content=ft.Column([
+                                ft.Container(
+                                    ft.Row(
+                                        [
+                                            ft.Text(f"Marca:", size=12, weight=ft.FontWeight.W_700, color="#283747",text_align=ft.TextAlign.CENTER, no_wrap=True),
+                                            ft.Text(f"{vehiculo.marca}",size=12, text_align=ft.TextAlign.CENTER, color="#283747", no_wrap=True),
+                                            ft.Text(f"Modelo:", size=12, weight=ft.FontWeight.W_700, color="#283747", text_align=ft.TextAlign.CENTER, no_wrap=False),
+                                            ft.Text(f"{vehiculo.modelo}", size=12, text_align=ft.TextAlign.CENTER, color="#283747", no_wrap=False)
+                                        ],
+                                        alignment=ft.MainAxisAlignment.SPACE_EVENLY,
+                                        vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                                    ),
+                                    bgcolor="transparent",
+                                    padding=0,
+                                    alignment=ft.alignment.center,
+
+                                ),
+
+                                ft.Container(
+                                    ft.Row(
+                                        [
+                                            ft.Text(f"Matricula:", size=12, color="#283747", weight=ft.FontWeight.W_700, text_align=ft.TextAlign.RIGHT),
+                                            ft.Text(f"{vehiculo.matricula}", size=12, text_align=ft.TextAlign.LEFT, color="#283747", no_wrap = False),
+                                            #ft.Text(f"   ", size=12, weight=ft.FontWeight.W_700, color="Transparent", text_align=ft.TextAlign.CENTER),
+                                            ft.Text(f"Kilometros:", size=12, color="#283747", weight=ft.FontWeight.W_700, text_align=ft.TextAlign.RIGHT),
+                                            ft.Text(f"{vehiculo.kilometros}", size=12, text_align=ft.TextAlign.LEFT, color="#283747", no_wrap=False)
+                                        ],
+                                        alignment=ft.MainAxisAlignment.CENTER,
+                                        vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                                    ),
+                                    bgcolor="transparent",
+                                    padding=0,
+                                    alignment=ft.alignment.center_left,
+                                ),
+
+                                ft.Row(
+                                    [
+                                        ft.IconButton(
+                                            icon=ft.icons.CAR_RENTAL,
+                                            icon_color="E0E7ED",
+                                            icon_size=25,
+                                            tooltip="Ingresos",
+                                            on_click=lambda e, vehiculo_seleccionado=vehiculo: (
+                                                self.objeto_seleccionado(e, vehiculo_seleccionado),
+                                                self.page.go("/ingresosVehiculoCliente"),
+                                                print("VentanaVerIngresosVehiculoCliente")
+                                            )
+                                        ),
+                                        ft.IconButton(
+                                            icon=ft.icons.MODE_EDIT_OUTLINED,
+                                            icon_color="E0E7ED",
+                                            icon_size=25,
+                                            tooltip="Editar",
+                                            on_click=lambda e: self.page.go("/editarVehiculo"),
+                                        ),
+                                    ],
+                                alignment=ft.MainAxisAlignment.SPACE_AROUND,
+                                vertical_alignment=ft.CrossAxisAlignment.END,
+                                )
+                            ])
+                        )
+                    )
+
+                cards.append(card)
+
+            # Limpia los controles actuales del GridView
+            self.vistaResultadosBusqueda.content.controls = []
+
+            # agregar cards al GridView
+            for card in cards:
+                self.vistaResultadosBusqueda.content.controls.append(card)
+
+
+    def objeto_seleccionado(self, e, vehiculo_seleccionado):
+        # Guardar el ID y el nombre del cliente seleccionado
+        self.page.session.set("idVehiculoSeleccionadoCliente", vehiculo_seleccionado.id_vehiculo)
+        self.page.session.set("marcaVehiculoSeleccionadoCliente",vehiculo_seleccionado.marca)
+        self.page.session.set("modeloVehiculoSeleccionadoCliente", vehiculo_seleccionado.modelo)
+        self.page.session.set("matriculaVehiculoSeleccionadoCliente", vehiculo_seleccionado.matricula)
+        self.page.session.set("kilometrosVehiculoSeleccionadoCliente", vehiculo_seleccionado.kilometros)
+
+
+# Gestion de Clientes - Ingresos del cliente seleccionado
+class VentanaVerIngresosCliente(ft.View):
+    '''Clase VentanaVerIngresosCliente:
+    Interfaz gráfica para la visualización de los ingresos del vehículo seleccionado.
+
+    Esta clase representa una ventana de la aplicación dedicada a mostrar los ingresos al taller
+    del vehículo seleccionado. Permite al usuario explorar el historial de ingresos y realizar
+    acciones específicas, como añadir datos o editar información relacionada.
+
+    Args:
+        page (ft.Page): Instancia de la página actual, utilizada para gestionar el contenido
+                       y las interacciones de la ventana.
+
+    Componentes principales:
+        - Título (ft.Text): Identifica la sección correspondiente a los ingresos del vehículo seleccionado.
+        - GridView (ft.GridView): Muestra una lista interactiva de ingresos del vehículo.
+        - IconButtons (ft.IconButton):
+            * Icono 1: Visualiza la información detallada de la reparación o mantenimiento.
+            * Icono 2: Permite editar los datos del ingreso seleccionado.
+        - Botón Volver (ft.ElevatedButton): Navega de regreso a la ventana principal de clientes.
+'''
+
+    def __init__(self, page: ft.Page):
+        '''Constructor de la interfaz grafica para la ventana para visualizar los Ingresos del Cliente'''
+        super(VentanaVerIngresosCliente, self).__init__(
+            route="/ingresosCliente", horizontal_alignment=CrossAxisAlignment.CENTER,
+            vertical_alignment=MainAxisAlignment.CENTER
+        )
+        print("Gestion de Clientes - Ingresos del cliente seleccionado (VentanaVerIngresosCliente)")
+
+        self.page = page
+
+        # Color de fondo contenedor principal
+        self.bgcolor = "#E0E7ED"
+
+        # Titulo que identifica la sección correspondiente
+        self.nombre_cliente = ft.Row([
+            ft.Text(
+                value=f'Ingresos de',
+                width=None,
+                size=12,
+                text_align=TextAlign.START,
+                weight=FontWeight.W_600,
+                color="#333333"
+            ),
+            ft.Text(
+                value=self.page.session.get("nombreClienteSeleccionado"),
+                size=12,
+                color='green700',
+                weight=FontWeight.W_600
+            )
+        ],
+            alignment=ft.MainAxisAlignment.CENTER,
+        )
+
+        # Contenedor para mostrar los ingresos del cliente
+        self.vistaResultadosBusqueda = ft.Container(
+            bgcolor='#E0E7ED', # Color de fondo
+            expand=True,
+            content=ft.GridView(
+                expand=1,
+                on_scroll_interval=10,  # Intervalo de scroll
+                child_aspect_ratio=1.6, # Ajusta la relación alto por ancho
+                runs_count=1,  # Número de columnas según el diseño
+                spacing=10,  # Espacio entre las imágenes
+                run_spacing=1,  # Espacio entre las filas
+            )
+        )
+
+        # Boton para realizar la accion de volver a la ventana clientes
+        self.botonVolver = ft.Container(
+            ft.ElevatedButton(
+                        text="Volver",
+                        color="#FAFAF3",
+                        bgcolor="#12597b",
+                        tooltip='Volver atras',
+                        icon=icons.ARROW_BACK,
+                        icon_color="#FAFAF3",
+                        width=180,
+                        height=30,
+                        on_click=lambda e: self.page.go("/clientes"),
+                    ),
+            alignment=ft.alignment.Alignment(x=0, y=0)
+        )
+
+
+        # Contenedor principal que contiene todos los elementos de la interfaz
+        self.controls = [
+            ft.Container(
+                ft.Column([
+                    self.nombre_cliente,
+                    self.vistaResultadosBusqueda,
+                    self.botonVolver,
+
+                ]
+                ),
+
+                # propiedades contenedor principal
+                border_radius=25,
+                width=350,  # ancho
+                height=655,  # Alto
+                gradient=ft.LinearGradient([  # color del contenedor configurable en 2 tonos de color
+                    "#E0E7ED",
+                    "#E0E7ED",
+                ])
+
+            )
+        ]
+
+        # Llama al metodo para mostrar los vehiculos del cliente
+        self.ingresos_cliente(self)
+
+    # metodo para cargar los vehiculos existentes en el GridView
+    def ingresos_cliente(self, e):
+        # Obtener el ID de usuario actual de la sesion
+        id_cliente_actual = self.page.session.get("idClienteSeleccionado")
+
+        # Realizar la busqueda de los vehiculos del cliente
+        ingresos_cliente = db.session.query(Ingreso).filter_by(
+            id_cliente = id_cliente_actual ).all()
+
+        if ingresos_cliente:
+            cards = []
+            for ingreso in ingresos_cliente:
+                card = ft.Card(
+                            elevation=8,
+                        content=ft.Container(
+                            alignment=ft.alignment.Alignment(x=0, y=0),
+                            bgcolor="#9ec4cc",
+                            padding=5,
+                            border=ft.border.all(1, ft.colors.BLUE_800),
+                            border_radius=ft.border_radius.all(12),
+                            content=ft.Column([
+                                ft.Container(
+                                    ft.Row(
+                                        [
+                                            ft.Text(f"Id Ingreso:", size=12, weight=ft.FontWeight.W_700, color="#283747",text_align=ft.TextAlign.CENTER, no_wrap=True),
+                                            ft.Text(f"{ingreso.id_ingreso}",size=12, text_align=ft.TextAlign.CENTER, color="#283747", no_wrap=True),
+                                        ],
+                                        alignment=ft.MainAxisAlignment.START,
+                                        vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                                    ),
+                                    bgcolor="transparent",
+                                    padding=0,
+                                    alignment=ft.alignment.center,
+
+                                ),
+                                ft.Container(
+                                    ft.Row(
+                                        [
+                                            ft.Text(f"Fecha Ingreso:", size=12, weight=ft.FontWeight.W_700,
+                                                    color="#283747", text_align=ft.TextAlign.CENTER, no_wrap=False),
+                                            ft.Text(f"{ingreso.fecha_ingreso.strftime('%d/%m/%Y')}", size=12, text_align=ft.TextAlign.CENTER,
+                                                    color="#283747", no_wrap=False)
+                                        ],
+                                        alignment=ft.MainAxisAlignment.START
+                                        ,
+                                        vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                                    ),
+                                    bgcolor="transparent",
+                                    padding=0,
+                                    alignment=ft.alignment.center,
+
+                                ),
+                                ft.Container(
+                                    ft.Row(
+                                        [
+                                            ft.Text(f"Marca:", size=12, weight=ft.FontWeight.W_700,
+                                                    color="#283747", text_align=ft.TextAlign.CENTER, no_wrap=False),
+                                            ft.Text(f"{ingreso.vehiculos.marca}, {ingreso.vehiculos.modelo}", size=12,
+                                                    text_align=ft.TextAlign.CENTER,
+                                                    color="#283747", no_wrap=False)
+                                        ],
+                                        alignment=ft.MainAxisAlignment.START
+                                        ,
+                                        vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                                    ),
+                                    bgcolor="transparent",
+                                    padding=0,
+                                    alignment=ft.alignment.center,
+
+                                ),
+
+
+                                ft.Container(
+                                    ft.Row(
+                                        [
+                                            ft.Text(f"Kilometros Ingreso:", size=12, color="#283747", weight=ft.FontWeight.W_700, text_align=ft.TextAlign.RIGHT),
+                                            ft.Text(f"{ingreso.kilometros_ingreso}", size=12, text_align=ft.TextAlign.LEFT, color="#283747", no_wrap = False),
+
+                                        ],
+                                        alignment=ft.MainAxisAlignment.START,
+                                        vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                                    ),
+                                    bgcolor="transparent",
+                                    padding=0,
+                                    alignment=ft.alignment.center_left,
+                                ),
+                                ft.Container(
+                                    ft.Row(
+                                        [
+                                            # ft.Text(f"   ", size=12, weight=ft.FontWeight.W_700, color="Transparent", text_align=ft.TextAlign.CENTER),
+                                            ft.Text(f"Diagnostico:", size=12, color="#283747",
+                                                    weight=ft.FontWeight.W_700, text_align=ft.TextAlign.RIGHT),
+                                            ft.Text(f"{ingreso.diagnostico}", size=12, text_align=ft.TextAlign.LEFT,
+                                                    color="#283747", no_wrap=False)
+                                        ],
+                                        alignment=ft.MainAxisAlignment.START,
+                                        vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                                    ),
+                                    bgcolor="transparent",
+                                    padding=0,
+                                    alignment=ft.alignment.center_left,
+                                ),
+
+                                ft.Row(
+                                    [
+                                        ft.IconButton(
+                                            icon=ft.icons.REMOVE_RED_EYE,
+                                            icon_color="E0E7ED",
+                                            icon_size=25,
+                                            tooltip="Ver Registro",
+                                            on_click=lambda e: self.page.go("/registrosIngreso1"),
+                                        ),
+                                        ft.IconButton(
+                                            icon=ft.icons.MODE_EDIT_OUTLINED,
+                                            icon_color="E0E7ED",
+                                            icon_size=25,
+                                            tooltip="Editar",
+                                            on_click=lambda e: self.page.go("/editarVehiculo"),
+                                        ),
+                                    ],
+                                alignment=ft.MainAxisAlignment.SPACE_AROUND,
+                                vertical_alignment=ft.CrossAxisAlignment.END,
+                                )
+                            ])
+                        )
+                    )
+
+                cards.append(card)
+
+                # Limpia los controles actuales del GridView
+                self.vistaResultadosBusqueda.content.controls = []
+
+                # agregar cards al GridView
+                for card in cards:
+                    self.vistaResultadosBusqueda.content.controls.append(card)
+
+
+# Gestion de Clientes - Ingresos del Vehiculo Seleccionado
+class VentanaVerIngresosVehiculoCliente(ft.View):
+    '''Clase VentanaRegistro: Interfaz gráfica para la gestión de registro de repuestos e historial.
+
+      Esta clase representa la ventana de la aplicación dedicada a la gestión de registro de repuestos e historial,
+      permitiendo al usuario mantener un seguimiento del historial por cliente o vehiculo.
+
+      Args:
+          - page: Instancia de la página actual, que gestiona el contenido y las interacciones de la ventana.
+
+      Contiene:
+          - Imagen de diagnóstico de ingresos como título: Identifica la sección de ingreso nuevo con una imagen representativa.
+          - Dropdown Cliente: Desplegable para seleccionar el cliente que ingresa el vehículo al taller.
+          - Dropdown Vehículo: Desplegable para seleccionar el vehículo del cliente que será ingresado al taller.
+          - Input Kilometraje: Campo de texto para introducir el kilometraje actual del vehículo al momento del ingreso.
+          - Input Motivo de Ingreso: Campo de texto para introducir el motivo por el cual el vehículo acude al taller.
+          - Input Diagnóstico Previo: Campo de texto para introducir el diagnóstico inicial del taller antes del ingreso.
+          - Botón Aceptar: Botón para confirmar y registrar el ingreso.
+      '''
+
+    def __init__(self, page: ft.Page):
+        '''Constructor de la interfaz grafica para visualizar los ingresos del vehiculo seleccionado'''
+        super(VentanaVerIngresosVehiculoCliente, self).__init__(
+            route="/ingresosVehiculoCliente", horizontal_alignment=CrossAxisAlignment.CENTER,
+            vertical_alignment=MainAxisAlignment.CENTER
+        )
+        print("Gestion de Clientes - Ingresos del Vehiculo Seleccionado (VentanaVerIngresosVehiculoCliente)")
+
+        self.page = page
+
+        # Color de fondo contenedor principal
+        self.bgcolor = "#E0E7ED"
+
+        # Titulo que identifica la sección correspondiente
+        self.modelo_vehiculo = ft.Row([
+            ft.Text(
+                value=f'Ingresos de',
+                width=None,
+                size=12,
+                text_align=TextAlign.START,
+                weight=FontWeight.W_600,
+                color="#333333"
+            ),
+            ft.Text(
+                value = self.page.session.get("marcaVehiculoSeleccionadoCliente"),
+                size=12,
+                color='green700',
+                weight=FontWeight.W_600
+            ),
+            ft.Text(
+                value=self.page.session.get("modeloVehiculoSeleccionadoCliente"),
+                size=12,
+                color='green700',
+                weight=FontWeight.W_600
+            ),
+            ft.Text(
+                value=self.page.session.get("matriculaVehiculoSeleccionadoCliente"),
+                size=12,
+                color='green700',
+                weight=FontWeight.W_600
+            )
+        ],
+            alignment=ft.MainAxisAlignment.CENTER,
+        )
+
+        # Contenedor para mostrar los ingresos del cliente
+        self.vistaResultadosBusqueda = ft.Container(
+            bgcolor='#E0E7ED',  # Color de fondo
+            expand=True,
+            content=ft.GridView(
+                expand=1,
+                on_scroll_interval=10,  # Intervalo de scroll
+                child_aspect_ratio=1.6,  # Ajusta la relación alto por ancho
+                runs_count=1,  # Número de columnas según el diseño
+                spacing=10,  # Espacio entre las imágenes
+                run_spacing=1,  # Espacio entre las filas
+            )
+        )
+
+        # Boton para realizar la accion de volver a la ventana vehiculos
+        self.botonVolver = ft.Container(
+            ft.ElevatedButton(
+                text="Volver",
+                color="#FAFAF3",
+                bgcolor="#12597b",
+                tooltip='Volver atras',
+                icon=icons.ARROW_BACK,
+                icon_color="#FAFAF3",
+                width=180,
+                height=30,
+                on_click=lambda e: self.page.go("/clientes"),
+            ),
+            alignment=ft.alignment.Alignment(x=0, y=0)
+        )
+
+
+
+        # Contenedor principal que contiene todos los elementos de la interfaz
+        self.controls = [
+            ft.Container(
+                ft.Column([
+                    self.modelo_vehiculo,
+                    self.vistaResultadosBusqueda,
+                    self.botonVolver,
+
+                ]
+                ),
+
+                # propiedades contenedor principal
+                border_radius=25,
+                width=350,  # ancho
+                height=655,  # Alto
+                gradient=ft.LinearGradient([  # color del contenedor configurable en 2 tonos de color
+                    "#E0E7ED",
+                    "#E0E7ED",
+                ])
+
+            )
+        ]
+
+        self.ingresos_vehiculo(self)
+
+# metodo para cargar todos los ingresos existentes del vehiculo seleccionado
+    def ingresos_vehiculo(self, e):
+        # Obtener el ID del vehiculo actual de la sesion
+        id_vehiculo_actual = self.page.session.get("idVehiculoSeleccionadoCliente")
+
+        vehiculoSeleccionado = db.session.query(Ingreso).filter_by(
+            id_vehiculo = id_vehiculo_actual ).all(
+        )
+
+        vehiculoActual = db.session.query(Vehiculo).filter_by(
+            id_vehiculo=id_vehiculo_actual).all(
+        )
+
+        if vehiculoSeleccionado:
+            cards = []
+            for ingreso in vehiculoSeleccionado:
+                for vehiculo in vehiculoActual:
+                    card = ft.Card(
+                                elevation=8,
+                            content=ft.Container(
+                                alignment=ft.alignment.Alignment(x=0, y=0),
+                                bgcolor="#9ec4cc",
+                                padding=5,
+                                border=ft.border.all(1, ft.colors.BLUE_800),
+                                border_radius=ft.border_radius.all(12),
+                                content=ft.Column([
+                                    ft.Container(
+                                        ft.Row(
+                                            [
+                                                ft.Text(f"Ingreso:", size=12, weight=ft.FontWeight.W_700, color="#283747",text_align=ft.TextAlign.CENTER, no_wrap=True),
+                                                ft.Text(f"{ingreso.id_ingreso}",size=12, text_align=ft.TextAlign.CENTER, color="#283747", no_wrap=True),
+                                            ],
+                                            alignment=ft.MainAxisAlignment.START,
+                                            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                                        ),
+                                        bgcolor="transparent",
+                                        padding=0,
+                                        alignment=ft.alignment.center,
+
+                                    ),
+                                    ft.Container(
+                                        ft.Row(
+                                            [
+                                                ft.Text(f"Fecha Ingreso:", size=12, weight=ft.FontWeight.W_700,
+                                                        color="#283747", text_align=ft.TextAlign.CENTER, no_wrap=False),
+                                                ft.Text(f"{ingreso.fecha_ingreso.strftime('%d/%m/%Y')}", size=12, text_align=ft.TextAlign.CENTER,
+                                                        color="#283747", no_wrap=False)
+                                            ],
+                                            alignment=ft.MainAxisAlignment.START
+                                            ,
+                                            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                                        ),
+                                        bgcolor="transparent",
+                                        padding=0,
+                                        alignment=ft.alignment.center,
+
+                                    ),
+                                    ft.Container(
+                                        ft.Row(
+                                            [
+                                                ft.Text(f"Vehiculo:", size=12, weight=ft.FontWeight.W_700,
+                                                        color="#283747", text_align=ft.TextAlign.CENTER, no_wrap=False),
+                                                ft.Text(f"{vehiculo.marca}, {vehiculo.modelo}", size=12, text_align=ft.TextAlign.CENTER,
+                                                        color="#283747", no_wrap=False)
+                                            ],
+                                            alignment=ft.MainAxisAlignment.START
+                                            ,
+                                            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                                        ),
+                                        bgcolor="transparent",
+                                        padding=0,
+                                        alignment=ft.alignment.center,
+                                    ),
+
+                                    ft.Container(
+                                        ft.Row(
+                                            [
+                                                ft.Text(f"Kilometros Ingreso:", size=12, color="#283747", weight=ft.FontWeight.W_700, text_align=ft.TextAlign.RIGHT),
+                                                ft.Text(f"{ingreso.kilometros_ingreso}", size=12, text_align=ft.TextAlign.LEFT, color="#283747", no_wrap = False),
+
+                                            ],
+                                            alignment=ft.MainAxisAlignment.START,
+                                            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                                        ),
+                                        bgcolor="transparent",
+                                        padding=0,
+                                        alignment=ft.alignment.center_left,
+                                    ),
+                                    ft.Container(
+                                        ft.Row(
+                                            [
+                                                # ft.Text(f"   ", size=12, weight=ft.FontWeight.W_700, color="Transparent", text_align=ft.TextAlign.CENTER),
+                                                ft.Text(f"Diagnostico:", size=12, color="#283747",
+                                                        weight=ft.FontWeight.W_700, text_align=ft.TextAlign.RIGHT),
+                                                ft.Text(f"{ingreso.diagnostico}", size=12, text_align=ft.TextAlign.LEFT,
+                                                        color="#283747", no_wrap=False)
+                                            ],
+                                            alignment=ft.MainAxisAlignment.START,
+                                            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                                        ),
+                                        bgcolor="transparent",
+                                        padding=0,
+                                        alignment=ft.alignment.center_left,
+                                    ),
+
+                                    ft.Row(
+                                        [
+                                            ft.IconButton(
+                                                icon=ft.icons.REMOVE_RED_EYE,
+                                                icon_color="E0E7ED",
+                                                icon_size=25,
+                                                tooltip="Ver Ingreso",
+                                                on_click=lambda e, ingreso_seleccionado=ingreso: (
+                                                    self.objeto_seleccionado(e, ingreso_seleccionado),
+                                                    self.page.go("/registrosIngreso"),
+                                                )
+                                            ),
+                                            ft.IconButton(
+                                                icon=ft.icons.MODE_EDIT_OUTLINED,
+                                                icon_color="E0E7ED",
+                                                icon_size=25,
+                                                tooltip="Editar",
+                                                on_click=lambda e: self.page.go("/editarVehiculo"),
+                                            ),
+                                        ],
+                                    alignment=ft.MainAxisAlignment.SPACE_AROUND,
+                                    vertical_alignment=ft.CrossAxisAlignment.END,
+                                    )
+                                ])
+                            )
+                        )
+
+                    cards.append(card)
+
+            # Limpia los controles actuales del GridView
+            self.vistaResultadosBusqueda.content.controls = []
+
+            # agregar cards al GridView
+            for card in cards:
+                self.vistaResultadosBusqueda.content.controls.append(card)
+
+    # metodo para guardar el ingreso seleccionado en la session
+    def objeto_seleccionado(self, e, ingreso_seleccionado):
+        # Guardar el ID y el nombre del cliente seleccionado
+        self.page.session.set("idIngresoSeleccionadoCliente", ingreso_seleccionado.id_ingreso)
+        self.page.session.set("fechaIngresoSeleccionadoCliente",ingreso_seleccionado.fecha_ingreso)
+        self.page.session.set("kilometrosIngresoSeleccionadoCliente", ingreso_seleccionado.kilometros_ingreso)
+        self.page.session.set("motivoIngresoSeleccionadoCliente", ingreso_seleccionado.averia)
+        self.page.session.set("diagnosticoIngresoSeleccionadoCliente", ingreso_seleccionado.diagnostico)
+
+
+# Gestion de Clientes - Editar Cliente Seleccionado
+class VentanaEditarCliente(ft.View):
+    '''Clase VentanaEditarCliente: Interfaz gráfica para la edición de los datos de un cliente.
+
+    Esta clase representa la ventana de la aplicación dedicada a la modificación de los datos
+    de un cliente previamente registrado en el sistema del taller. El usuario puede visualizar
+    la información actual del cliente y actualizarla según sea necesario.
+
+    Args:
+        - page: Instancia de la página actual, que maneja el contenido y las interacciones de la ventana.
+
+    Contiene:
+        - Imagen de título: Muestra un encabezado visual con el texto "Editar Cliente".
+        - Datos actuales: Sección donde se presentan los datos actuales del cliente
+          (nombre, teléfono, dirección y correo).
+        - Campos de entrada (Input/TextField): Permiten modificar los datos del cliente
+          (nombre, teléfono, dirección y correo electrónico).
+        - Botón "Aceptar": Guarda los cambios realizados en la información del cliente.
+        - Botón "Cancelar": Cancela la edición y regresa a la vista anterior sin guardar cambios.'''
+
+    def __init__(self, page: ft.Page):
+        '''Constructor de la interfaz grafica para editar/modificar los datos del cliente seleccionado'''
+        super(VentanaEditarCliente, self).__init__(
+            route="/editarCliente", horizontal_alignment=CrossAxisAlignment.CENTER,
+            vertical_alignment=MainAxisAlignment.CENTER
+        )
+        print("Gestion de Clientes - Editar Cliente Seleccionado (VentanaEditarCliente)")
+
+        self.page = page
+
+        # Color de fondo contenedor principal
+        self.bgcolor = "#E0E7ED"
+
+        # Imagen editar de cliente
+        self.imagen_editarCliente = ft.Container(
+            ft.Container(
+                content=ft.Text(
+                    value=" Editar Cliente",
+                    size=22,
+                    color=ft.colors.WHITE,
+                    weight=ft.FontWeight.BOLD
+                ),
+                shadow=ft.BoxShadow(
+                    blur_radius=8,  # Difuminado de la sombra
+                    spread_radius=2,  # Expansión de la sombra
+                    offset=ft.Offset(0, 4),  # Posición: hacia abajo
+                    color=ft.colors.GREY_500,  # Color de la sombra
+                ),
+                bgcolor="black",
+                width=320,
+                height=120,
+                padding=0,
+                image_repeat=ImageRepeat.NO_REPEAT,
+                shape=ft.BoxShape("rectangle"),
+                # Define imagen
+                image_src=imagenes.ruta("/ImagenClienteNuevo.png"),
+                image_fit=ft.ImageFit.COVER,
+                image_opacity=0.7,
+            ),
+            alignment=ft.alignment.Alignment(x=0, y=0)
+        )
+
+        # Nombre del cliente
+        self.nombre_cliente = ft.Row([
+            ft.Text(
+                value=f'Nombre:',
+                width=None,
+                size=12,
+                text_align=TextAlign.CENTER,
+                weight=FontWeight.W_600,
+                color="#333333"
+            ),
+            ft.Text(
+                value=self.page.session.get("nombreClienteSeleccionado"),
+                size=12,
+                color='green700',
+                weight=FontWeight.W_600
+            ),
+        ],
+            alignment=ft.MainAxisAlignment.START,
+            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+        )
+
+        # Telefono del cliente
+        self.telefono_cliente = ft.Row([
+            ft.Text(
+                value=f'Telefono:',
+                width=None,
+                size=12,
+                text_align=TextAlign.CENTER,
+                weight=FontWeight.W_600,
+                color="#333333"
+            ),
+            ft.Text(
+                value=self.page.session.get("telefonoClienteSeleccionado"),
+                size=12,
+                color='green700',
+                weight=FontWeight.W_600
+            ),
+        ],
+            alignment=ft.MainAxisAlignment.START,
+            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+        )
+
+        # Direccion del cliente
+        self.direccion_cliente = ft.Row([
+            ft.Text(
+                value=f'Dirección:',
+                width=None,
+                size=12,
+                text_align=TextAlign.CENTER,
+                weight=FontWeight.W_600,
+                color="#333333"
+            ),
+            ft.Text(
+                value=self.page.session.get("direccionClienteSeleccionado"),
+                size=12,
+                color='green700',
+                weight=FontWeight.W_600
+            ),
+        ],
+            alignment=ft.MainAxisAlignment.START,
+            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+        )
+
+        # Correo del cliente
+        self.correo_cliente = ft.Row([
+            ft.Text(
+                value=f'Correo:',
+                width=None,
+                size=12,
+                text_align=TextAlign.CENTER,
+                weight=FontWeight.W_600,
+                color="#333333"
+            ),
+            ft.Text(
+                value=self.page.session.get("correoClienteSeleccionado"),
+                size=12,
+                color='green700',
+                weight=FontWeight.W_600
+            ),
+        ],
+            alignment=ft.MainAxisAlignment.START,
+            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+        )
+
+        self.agregar_cambios = ft.Container(
+            ft.Text(
+            value=f'Introduce los Cambios',
+            width=None,
+            size=12,
+            text_align=TextAlign.CENTER,
+            weight=FontWeight.W_600,
+            color="#12597b"
+        ),
+        )
+
+        # Campo de entrada para el nombre del cliente
+        self.input_nombreCliente = ft.TextField(
+            label="Nombre",
+            label_style=TextStyle(color='#6a6965', size=12),
+            value="",
+            border_radius=ft.border_radius.vertical(top=6, bottom=6),
+            hint_text="Introduce el nombre",
+            hint_style=TextStyle(color='#6a6965', size=10),
+            color='black',
+            height=35,
+            cursor_color="#12597b",
+            text_size=13,
+            border_color="#B0BEC5",
+            autofocus=True,
+            bgcolor="#D9E4EA"
+        )
+
+        # Campo de entrada para el telefono del cliente
+        self.input_telefonoCliente = ft.TextField(
+            label="Telefono",
+            label_style=TextStyle(color='#6a6965', size=12),
+            value="",
+            border_radius=ft.border_radius.vertical(top=6, bottom=6),
+            hint_text="Introduce el telefono",
+            hint_style=TextStyle(color='#6a6965', size=10),
+            color='black',
+            height=35,
+            cursor_color="#12597b",
+            text_size=13,
+            border_color="#B0BEC5",
+            autofocus=True,
+            bgcolor="#D9E4EA"
+        )
+
+        # Campo de entrada para el correo electronico del cliente
+        self.input_correoCliente = ft.TextField(
+            label="Correo Electronico",
+            label_style=TextStyle(color='#6a6965', size=12),
+            value="",
+            border_radius=ft.border_radius.vertical(top=6, bottom=6),
+            hint_text="Introduce el correo",
+            hint_style=TextStyle(color='#6a6965', size=10),
+            color='black',
+            height=35,
+            cursor_color="#12597b",
+            text_size=13,
+            border_color="#B0BEC5",
+            autofocus=True,
+            bgcolor="#D9E4EA"
+        )
+
+        # Campo de entrada para la direccion del cliente
+        self.input_direccionCliente = ft.Container(
+            bgcolor='#D9E4EA',
+            border=ft.border.all(color="#B0BEC5", width=1),
+            border_radius=ft.border_radius.vertical(top=6, bottom=6),
+            # expand=True,
+            height=180,
+            content=
+            ft.TextField(
+                filled=False,
+                label="Direccion",
+                label_style=TextStyle(color='#6a6965', size=12, ),
+                expand=True,
+                value="",
+                border_radius=ft.border_radius.vertical(top=6, bottom=6),
+                hint_text="Introduce la direccion",
+                hint_style=TextStyle(color='#6a6965', size=10),
+                max_length=200,  # maximo de caracteres que se pueden ingresar en TextField
+                # max_lines =  10, # maximo de líneas que se mostraran a la vez
+                multiline=True,  # puede contener varias lineas de texto
+                color='black',
+                height=180,
+                cursor_color="#12597b",
+                text_size=13,
+                border_color="transparent",
+                autofocus=False,
+                bgcolor="#D9E4EA",
+                text_vertical_align=ft.VerticalAlignment.START,
+            )
+        )
+
+        # Botones para agregar y cancelar operacion
+        self.botonEditarCliente = ft.Container(
+            expand=True,
+            alignment=ft.alignment.Alignment(x=0, y=0),
+            content=Row(
+                alignment=ft.MainAxisAlignment.CENTER,
+                controls=[
+                    # Boton agregar cliente nuevo
+                    ft.ElevatedButton(
+                        text="Aceptar",
+                        color="#FAFAF3",
+                        bgcolor="#12597b",
+                        tooltip='Aceptar Añadir',
+                        icon=icons.ADD,
+                        icon_color="#FAFAF3",
+                        width=140,
+                        height=30,
+                        on_click=lambda e: (self.cliente_modificar(e), page.go("/clientes")),
+                    ),
+                    # cancelar operacion
+                    ft.ElevatedButton(
+                        text="Cancelar",
+                        color="#FAFAF3",
+                        bgcolor="#12597b",
+                        tooltip='Cancelar Añadir',
+                        icon=icons.CANCEL,
+                        icon_color="#FAFAF3",
+                        width=140,
+                        height=30,
+                        on_click=lambda _: page.go("/clientes"),
+                    ),
+                ]
+            )
+        )
+
+        # Contenedor principal que contiene todos los elementos de la interfaz
+        self.controls = [
+            ft.Container(
+                ft.Column([
+                    self.imagen_editarCliente,
+                    ft.Divider(height=1, color="transparent"),
+                    self.nombre_cliente,
+                    self.telefono_cliente,
+                    self.direccion_cliente,
+                    self.correo_cliente,
+                    ft.Divider(height=1, color="gray"),
+                    self.agregar_cambios,
+                    self.input_nombreCliente,
+                    self.input_telefonoCliente,
+                    self.input_direccionCliente,
+                    self.input_correoCliente,
+                    ft.Divider(height=1, color="gray"),
+                    self.botonEditarCliente,
+
+
+
+                ]
+                ),
+
+                # propiedades contenedor principal
+                border_radius=25,
+                width=350,  # ancho
+                height=655,  # Alto
+                gradient=ft.LinearGradient([  # color del contenedor configurable en 2 tonos de color
+                    "#E0E7ED",
+                    "#E0E7ED",
+                ])
+
+            )
+        ]
+
+        # metodo para realizar cambios a la informacion del cliente en el sistema
+
+    def cliente_modificar(self, e):
+        print("\n > Modificar cliente")
+
+        # Recuperar el id desde la sesión
+        id_cliente = self.page.session.get("idClienteSeleccionado")
+
+        if not id_cliente:
+            print("⚠️ No hay cliente seleccionado en la sesión")
+            return
+
+        # Buscar el cliente en la base de datos
+        cliente = db.session.query(Cliente).get(int(id_cliente))
+
+        if cliente:
+            # Actualizar solo si el input no está vacío
+            if self.input_nombreCliente.value.strip():
+                cliente.nombre = self.input_nombreCliente.value.strip()
+            if self.input_telefonoCliente.value.strip():
+                cliente.telefono = self.input_telefonoCliente.value.strip()
+            if self.input_correoCliente.value.strip():
+                cliente.correo = self.input_correoCliente.value.strip()
+            if self.input_direccionCliente.content.value.strip():
+                cliente.direccion = self.input_direccionCliente.content.value.strip()
+
+            # Guardar cambios
+            db.session.commit()
+            db.session.close()
+            print("Cliente actualizado correctamente ✅")
+        else:
+            print("⚠️ Cliente no encontrado")
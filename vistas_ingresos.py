@@ -0,0 +1,1884 @@
+# Ventanas de gestion de ingresos y de sus registros de recambios
+
+from datetime import datetime
+import flet as ft
+from flet import Alignment, CrossAxisAlignment, FontWeight, ImageRepeat, MainAxisAlignment, Row, TextAlign, TextStyle, icons
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from models import Cliente, Vehiculo, Recambio, Ingreso, Registro
+import models
+import busqueda
+import consultas
+import exportacion
+import resumenes
+from catalogo import catalogo
+from componentes import ListaVirtual, barra_carga, cargar_mas_al_final
+import tareas
+import cache_consultas
+import imagenes
+import db
+
+
+# Gestion de Ingresos
+class VentanaIngreso(ft.View):
+    '''Clase VentanaIngreso: Interfaz gráfica para la gestión de ingresos de vehículos al taller.
+
+    Esta clase representa la ventana de la aplicación dedicada a la gestión de ingresos, permitiendo
+    al usuario registrar, buscar, modificar y eliminar los ingresos de vehículos en el taller.
+
+    Args:
+        - page: Instancia de la página actual, que gestiona el contenido y las interacciones de la ventana.
+
+    Contiene:
+        - Imagen de diagnóstico de ingresos como título: Identifica la sección de ingresos con una imagen adecuada.
+        - Input: Campo de texto para buscar ingresos por criterios como fecha, matrícula del vehículo o diagnóstico.
+        - Botón ElevatedButton "Buscar Ingreso": Activa la búsqueda de ingresos basados en los datos ingresados.
+        - Botón ElevatedButton "Añadir Ingreso": Permite añadir un nuevo registro de ingreso de un vehículo al taller,
+          incluyendo detalles como fecha, avería reportada y diagnóstico.
+        - Botón ElevatedButton "Modificar Ingreso": Accede a una interfaz para modificar los detalles de un ingreso
+          ya registrado.
+        - Botón ElevatedButton "Eliminar Ingreso": Elimina del sistema el ingreso seleccionado.
+    '''
+
+    def __init__(self, page: ft.Page):
+        '''Constructor de la interfaz grafica para la ventana Ingresos'''
+        super(VentanaIngreso, self).__init__(
+            route="/ingresos", horizontal_alignment=CrossAxisAlignment.CENTER,
+            vertical_alignment=MainAxisAlignment.CENTER
+        )
+        print("Gestion de Ingresos (VentanaIngreso)")
+
+        self.page = page
+
+        # Color de fondo contenedor principal
+        self.bgcolor = "#E0E7ED"
+
+        # Titulo imagen ingresos
+        self.imagenIngreso = ft.Container(
+            ft.Container(
+                    content=ft.Text(
+                        value=" Gestión de Ingresos",
+                        size=22,
+                        color=ft.colors.WHITE,
+                        weight=ft.FontWeight.BOLD
+                    ),
+                    shadow=ft.BoxShadow(
+                        blur_radius=8,  # Difuminado de la sombra
+                        spread_radius=2,  # Expansión de la sombra
+                        offset=ft.Offset(0, 4),  # Posición: hacia abajo
+                        color=ft.colors.GREY_500,  # Color de la sombra
+                    ),
+                    bgcolor="black",
+                    width=320,
+                    height=120,
+                    padding=0,
+                    image_repeat=ImageRepeat.NO_REPEAT,
+                    shape=ft.BoxShape("rectangle"),
+                    # Define imagen
+                    image_src=imagenes.ruta("/Imagen_de_Ingresos.png"),
+                    image_fit=ft.ImageFit.COVER,
+                    image_opacity=0.7,
+                ),
+                alignment=ft.alignment.Alignment(x=0, y=0)
+            )
+
+        # Campo de entrada para la busqueda
+        self.input_buscar = ft.TextField(
+            label="Buscar Ingresos...",
+            label_style=TextStyle(color='#6a6965', size=12),
+            value="",
+            border_radius=ft.border_radius.vertical(top=6, bottom=6),
+            hint_text="Introduce la matricula del vehiculo",
+            hint_style=TextStyle(color='#6a6965', size=10),
+            color='black',
+            height=35,
+            cursor_color="#12597b",
+            text_size=13,
+            border_color="#12597b",
+            autofocus=True,
+            bgcolor="#D9E4EA"
+        )
+
+        # Boton para activar la busqueda del ingreso y agregar nuevo ingreso
+        self.BotonBuscarVehiculo = ft.Container(
+            alignment=ft.alignment.Alignment(x=0, y=0),
+            content=Row(
+                alignment=ft.MainAxisAlignment.CENTER,
+                controls=[
+                    # Boton buscar cliente y añadir nuevo
+                    ft.ElevatedButton(
+                        text="Buscar Ingreso",
+                        color="#FAFAF3",
+                        bgcolor="#12597b",
+                        tooltip='Buscar Ingreso',
+                        icon=icons.SEARCH,
+                        icon_color="#FAFAF3",
+                        width=180,
+                        height=30,
+                        on_click=lambda e: self.buscar_ingreso_porMatricula(e),
+                    ),
+                    ft.IconButton(
+                        content=ft.Image(src=imagenes.ruta("add-new entry.png"),
+                                         color= "#709775",
+                                         height=30,
+                                         width=30),
+                        tooltip="Añadir Nuevo",
+                        on_click=lambda _: page.go("/nuevoIngreso"),
+                        ),
+                    ft.IconButton(
+                        icon=ft.icons.DOWNLOAD,
+                        icon_color="#12597b",
+                        icon_size=30,
+                        tooltip="Exportar historial",
+                        on_click=lambda e: self.page.open(self.dialogoExportar),
+                    )
+                ]
+            )
+        )
+
+        # Campos de fecha y dialogo para exportar el historial de ingresos y registros
+        self.input_desde = ft.TextField(
+            label="Desde (DD/MM/AAAA)",
+            label_style=TextStyle(color='#6a6965', size=10),
+            dense=True,
+            height=35,
+            text_size=12,
+            border_color="#12597b",
+        )
+        self.input_hasta = ft.TextField(
+            label="Hasta (DD/MM/AAAA)",
+            label_style=TextStyle(color='#6a6965', size=10),
+            dense=True,
+            height=35,
+            text_size=12,
+            border_color="#12597b",
+        )
+        self.resultadoExportar = ft.Text(size=11, color="#333333")
+        self.dialogoExportar = ft.AlertDialog(
+            title=ft.Text("Exportar historial", size=16, weight=ft.FontWeight.W_600),
+            content=ft.Column(
+                [self.input_desde, self.input_hasta, self.resultadoExportar],
+                tight=True,
+            ),
+            actions=[
+                ft.TextButton("CSV", on_click=lambda e: self.exportar_historial(e, 'csv')),
+                ft.TextButton("JSONL", on_click=lambda e: self.exportar_historial(e, 'jsonl')),
+                ft.TextButton("Cerrar", on_click=lambda e: self.page.close(self.dialogoExportar)),
+            ],
+        )
+
+        # Paginacion de los resultados: cursor de la pagina siguiente y consultas en curso de la ventana
+        self.cursor_busqueda = None
+        self.tareas = tareas.Tareas(page)
+        self.barraCarga = barra_carga()  # visible mientras se espera a la base de datos
+
+        # Contenedor para mostrar los resultados de busqueda
+        # solo se crean las tarjetas visibles y se reutilizan al hacer scroll
+        self.vistaResultadosBusqueda = ListaVirtual(
+            alto_elemento=205,  # el alto que daba child_aspect_ratio=1.6 con el ancho de la ventana
+            crear_elemento=self.crear_tarjeta,
+            rellenar_elemento=self.rellenar_tarjeta,
+            cargar_mas=lambda e: cargar_mas_al_final(self, e),  # carga la siguiente pagina al llegar al final
+            espacio=1,  # Espacio entre las tarjetas
+            bgcolor='#E0E7ED',
+            expand=True,
+        )
+
+        # Barra de navegacion
+        self.barraNavegacion = ft.NavigationBar(
+            selected_index=4,
+            height=50,
+            on_change=lambda e: self.barra_de_navegacion(e),
+            destinations=[
+                ft.NavigationBarDestination(
+                    icon_content=ft.Icon(
+                        name=ft.icons.HOME_OUTLINED,
+                        color="#12597b",
+                        size=20
+                    ),
+                    selected_icon_content=ft.Icon(
+                        name=ft.icons.HOME_ROUNDED,
+                        color="#12597b",
+                        size=24
+                    ),
+                    label="Inicio",
+                ),
+                ft.NavigationBarDestination(
+                    icon_content=ft.Icon(
+                        name=ft.icons.PERSON_OUTLINED,
+                        color="#12597b",
+                        size=20
+                    ),
+                    selected_icon_content=ft.Icon(
+                        name=ft.icons.PERSON,
+                        color="#12597b",
+                        size=24
+                    ),
+                    label="Cliente",
+
+                ),
+                ft.NavigationBarDestination(
+                    icon_content=ft.Icon(
+                        name=ft.icons.DIRECTIONS_CAR_OUTLINED,
+                        color="#12597b",
+                        size=20
+                    ),
+                    selected_icon_content=ft.Icon(
+                        name=ft.icons.DIRECTIONS_CAR,
+                        color="#12597b",
+                        size=24
+                    ),
+                    label="Vehículo",
+                ),
+                ft.NavigationBarDestination(
+                    icon_content=ft.Icon(
+                        name=ft.icons.SETTINGS_OUTLINED,
+                        color="#12597b",
+                        size=20
+                    ),
+                    selected_icon_content=ft.Icon(
+                        name=ft.icons.SETTINGS,
+                        color="#12597b",
+                        size=24
+                    ),
+                    label="Recambio",
+                ),
+                ft.NavigationBarDestination(
+                    icon_content=ft.Icon(
+                        name=ft.icons.CAR_REPAIR_OUTLINED,
+                        color="#12597b",
+                        size=20
+                    ),
+                    selected_icon_content=ft.Icon(
+                        name=ft.icons.CAR_REPAIR,
+                        color="#12597b",
+                        size=24
+                    ),
+                    label="Ingreso",
+                )
+            ],
+            bgcolor="#D1E2E7",  # Color de fondo de la barra de navegación (azul oscuro)
+            indicator_color="#FFD700",  # Color del indicador del destino seleccionado (ámbar)
+            surface_tint_color="#E0E7ED",  # Color de superficie para el material (gris claro)
+            label_behavior=ft.NavigationBarLabelBehavior.ONLY_SHOW_SELECTED  # Mostrar la etiqueta  seleccionada
+        )
+
+        # Contenedor principal que contiene todos los elementos de la interfaz
+        self.controls = [
+            ft.Container(
+                ft.Column([
+                    self.imagenIngreso,
+                    self.input_buscar,
+                    self.barraCarga,
+                    self.BotonBuscarVehiculo,
+                    self.vistaResultadosBusqueda,
+                    self.barraNavegacion,
+                ]
+                ),
+
+                # propiedades del contenedor principal
+                border_radius=25,
+                width=350,  # ancho
+                height=655,  # Alto
+                gradient=ft.LinearGradient([  # color del contenedor configurable en 2 tonos de color
+                    "#E0E7ED",
+                    "#E0E7ED",
+                ])
+
+            )
+        ]
+
+    # metodo para cargar los ingresos existentes por matricula en el GridView
+    def buscar_ingreso_porMatricula(self, e):
+        print("\n > Buscar ingreso por matricula")
+
+        # input del vehiculo que quiere buscar
+        matricula_vehiculo = self.input_buscar.value.strip()  # este es el Input
+
+        if not matricula_vehiculo:
+            print("Ingrese una matrícula válida")
+        else:
+            self.matricula_buscada = matricula_vehiculo
+            self.cursor_busqueda = None  # la busqueda empieza por la primera pagina
+
+            self.input_buscar.value = ""
+            self.input_buscar.update()
+
+            # la consulta va a un hilo de base de datos; si habia otra busqueda en curso se cancela
+            self.tareas.lanzar('busqueda', self.cargar_pagina, True, indicador=self.barraCarga)
+
+    # metodo para cargar la siguiente pagina de ingresos en la lista
+    async def cargar_pagina(self, nueva=False):
+        # Buscamos el vehiculo por parte de la matricula en el indice de trigramas (sin espacios ni guiones)
+        # junto con su cliente y vehiculo en la misma consulta, una pagina cada vez
+        vehiculo_ingresado, cursor = await tareas.consultar(
+            busqueda.buscar_ingresos_matricula, self.matricula_buscada, self.cursor_busqueda)
+
+        # Limpia los resultados anteriores cuando llegan los de la busqueda nueva
+        if nueva:
+            self.vistaResultadosBusqueda.limpiar()
+        self.cursor_busqueda = cursor
+
+        if vehiculo_ingresado:
+            # agregar los ingresos a la lista, que solo dibuja las tarjetas visibles
+            self.vistaResultadosBusqueda.agregar(vehiculo_ingresado)
+        # actualizar la interfaz
+        self.vistaResultadosBusqueda.update()
+
+    # metodo para exportar el historial de ingresos entre las fechas del dialogo
+    def exportar_historial(self, e, extension):
+        print("\n > Exportar historial de ingresos")
+        try:
+            desde = exportacion.leer_fecha(self.input_desde.value)
+            hasta = exportacion.leer_fecha(self.input_hasta.value)
+        except ValueError as error:
+            self.resultadoExportar.value = str(error)
+            self.resultadoExportar.update()
+            return
+
+        # una exportacion cada vez: los clicks mientras se escribe el fichero se ignoran
+        if self.tareas.en_curso('exportar'):
+            return
+        self.resultadoExportar.value = "Exportando..."
+        self.resultadoExportar.update()
+        ruta = exportacion.ruta_exportacion(desde, hasta, extension)
+        self.tareas.lanzar('exportar', self.escribir_exportacion, ruta, desde, hasta)
+
+    # metodo para escribir el fichero de la exportacion sin bloquear la ventana
+    async def escribir_exportacion(self, ruta, desde, hasta):
+        # sesion propia en un hilo de base de datos: las filas se leen por bloques sin pasar por la sesion de la pagina
+        try:
+            total, segundos = await tareas.consultar(exportacion.exportar_historial, ruta, desde, hasta)
+            self.resultadoExportar.value = f"{total} filas exportadas a {ruta}"
+        except (SQLAlchemyError, OSError) as error:
+            self.resultadoExportar.value = f"No se pudo exportar: {error}"
+        print(self.resultadoExportar.value)
+        self.resultadoExportar.update()
+
+    # metodo para crear una tarjeta de ingreso vacia que la lista reutiliza
+    def crear_tarjeta(self):
+        '''Crea la tarjeta de resultados de ingresos sin datos; en card.data se guardan los textos
+           que cambian y el ingreso que muestra, que se escriben con rellenar_tarjeta'''
+        cliente = ft.Text(size=12, weight=ft.FontWeight.W_700, text_align=ft.TextAlign.START)
+        fecha = ft.Text(size=11, weight=ft.FontWeight.W_400, text_align=ft.TextAlign.START)
+        vehiculo = ft.Text(size=11, text_align=ft.TextAlign.LEFT)
+        matricula = ft.Text(size=11, text_align=ft.TextAlign.LEFT)
+        diagnostico = ft.Text(size=11, text_align=ft.TextAlign.LEFT)
+        kilometros = ft.Text(size=11, text_align=ft.TextAlign.LEFT)
+
+        card = ft.Card(
+            elevation=15,
+            content=ft.Container(
+                alignment=ft.alignment.Alignment(x=0, y=0),
+                bgcolor="#9ec4cc",
+                padding=5,
+                border=ft.border.all(1, ft.colors.BLUE_800),
+                border_radius=ft.border_radius.all(12),
+                content=ft.Column([
+                    ft.Container(
+                        ft.Row(
+                            [cliente, fecha],
+                            alignment=ft.MainAxisAlignment.CENTER,
+                            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                        ),
+                        bgcolor="transparent",
+                        alignment=ft.alignment.center
+                    ),
+                    ft.Container(
+                        ft.Row(
+                            [
+                                ft.Text(f"Marca y modelo:", size=12, weight=ft.FontWeight.W_700,
+                                        text_align=ft.TextAlign.LEFT),
+                                vehiculo
+                            ],
+                            alignment=ft.MainAxisAlignment.START,
+                            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                        ),
+                        bgcolor="transparent",
+                        padding=0,
+                        alignment=ft.alignment.center_left,
+                    ),
+                    ft.Container(
+                        ft.Row(
+                            [
+                                ft.Text(f"Matricula:", size=12, weight=ft.FontWeight.W_700,
+                                        text_align=ft.TextAlign.LEFT),
+                                matricula
+                            ],
+                            alignment=ft.MainAxisAlignment.START,
+                            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                        ),
+                        bgcolor="transparent",
+                        padding=0,
+                        alignment=ft.alignment.center_left,
+                    ),
+                    ft.Container(
+                        ft.Row(
+                            [
+                                ft.Text(f"Diagnostico:", size=12, weight=ft.FontWeight.W_700,
+                                        text_align=ft.TextAlign.LEFT),
+                                diagnostico,
+                            ],
+                            alignment=ft.MainAxisAlignment.START,
+                            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                        ),
+                        bgcolor="transparent",
+                        padding=0,
+                        alignment=ft.alignment.center_left,
+
+                    ),
+                    ft.Container(
+                        ft.Row(
+                            [
+                                ft.Text(f"Kilometros:", size=12, weight=ft.FontWeight.W_700,
+                                        text_align=ft.TextAlign.LEFT),
+                                kilometros
+                            ],
+                            alignment=ft.MainAxisAlignment.START,
+                            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                        ),
+                        bgcolor="transparent",
+                        padding=0,
+                        alignment=ft.alignment.center_left,
+                    ),
+                    ft.Row(
+                        [
+                            ft.IconButton(
+                                icon=ft.icons.REMOVE_RED_EYE,
+                                icon_color="E0E7ED",
+                                icon_size=25,
+                                tooltip="Ver Registro",
+                                on_click=lambda e: self.page.go("/verRegistrosIngreso"),
+                            ),
+                            ft.IconButton(
+                                icon=ft.icons.MODE_EDIT_OUTLINED,
+                                icon_color="E0E7ED",
+                                icon_size=25,
+                                tooltip="Editar",
+                                on_click=lambda e: self.page.go("/editarVehiculo"),
+                            ),
+                        ],
+                        alignment=ft.MainAxisAlignment.SPACE_AROUND,
+                        vertical_alignment=ft.CrossAxisAlignment.END,
+                    ),
+                ])
+            )
+        )
+        card.data = {'ingreso': None, 'cliente': cliente, 'fecha': fecha, 'vehiculo': vehiculo,
+                     'matricula': matricula, 'diagnostico': diagnostico, 'kilometros': kilometros}
+        return card
+
+    # metodo para mostrar un ingreso en una tarjeta de la lista
+    def rellenar_tarjeta(self, card, ingreso):
+        campos = card.data
+        campos['ingreso'] = ingreso
+        campos['cliente'].value = f"{ingreso.clientes.nombre}"
+        campos['fecha'].value = f"Fecha Ingreso: {ingreso.fecha_ingreso.strftime('%d/%m/%Y')}"
+        campos['vehiculo'].value = f"{ingreso.vehiculos.marca}, {ingreso.vehiculos.modelo}"
+        campos['matricula'].value = f"{ingreso.vehiculos.matricula}"
+        campos['diagnostico'].value = f"{ingreso.diagnostico}"
+        campos['kilometros'].value = f"{ingreso.kilometros_ingreso}"
+
+    # metodo para navegar entre ventanas
+    def barra_de_navegacion(self, e):
+        selected_index = e.control.selected_index
+        if selected_index == 0:
+            self.page.go("/inicio")
+        elif selected_index == 1:
+            self.page.go("/clientes")
+        elif selected_index == 2:
+            self.page.go("/vehiculos")
+        elif selected_index == 3:
+            self.page.go("/recambios")
+        elif selected_index == 4:
+            self.page.go("/ingresos")
+
+
+# Gestion de Ingresos - Nuevo Ingreso
+class VentanaNuevoIngreso(ft.View):
+    '''Clase VentanaNuevoIngreso: Interfaz gráfica para la gestión de ingresos nuevos de vehículos al taller.
+
+    Esta clase representa la ventana de la aplicación dedicada a la gestión de nuevos ingresos, permitiendo
+    al usuario registrar los vehículos en el taller y asociarlos con clientes específicos.
+
+    Args:
+        - page: Instancia de la página actual, que gestiona el contenido y las interacciones de la ventana.
+
+    Contiene:
+        - Imagen de diagnóstico de ingresos como título: Identifica la sección de ingreso nuevo con una imagen representativa.
+        - Dropdown Cliente: Desplegable para seleccionar el cliente que ingresa el vehículo al taller.
+        - Dropdown Vehículo: Desplegable para seleccionar el vehículo del cliente que será ingresado al taller.
+        - Input Kilometraje: Campo de texto para introducir el kilometraje actual del vehículo al momento del ingreso.
+        - Input Motivo de Ingreso: Campo de texto para introducir el motivo por el cual el vehículo acude al taller.
+        - Input Diagnóstico Previo: Campo de texto para introducir el diagnóstico inicial del taller antes del ingreso.
+        - Botón Aceptar: Botón para confirmar y registrar el ingreso.
+    '''
+
+    def __init__(self, page: ft.Page):
+        '''Constructor de la interfaz grafica para añadir ingresos al vehiculo seleccionado'''
+        super(VentanaNuevoIngreso, self).__init__(
+            route="/nuevoIngreso", horizontal_alignment=CrossAxisAlignment.CENTER,
+            vertical_alignment=MainAxisAlignment.CENTER
+        )
+        print("Gestion de Ingresos - Nuevo Ingreso (VentanaNuevoIngreso)")
+
+        self.page = page
+        self.tareas = tareas.Tareas(page)  # consultas en curso de la ventana
+
+        # Color de fondo contenedor principal
+        self.bgcolor = "#E0E7ED"
+
+        # Titulo imagen ingresos
+        self.imagenNuevoIngreso = ft.Container(
+            ft.Container(
+                    content=ft.Text(
+                        value=" Añadir Nuevo",
+                        size=22,
+                        color=ft.colors.WHITE,
+                        weight=ft.FontWeight.BOLD
+                    ),
+                    shadow=ft.BoxShadow(
+                        blur_radius=8,  # Difuminado de la sombra
+                        spread_radius=2,  # Expansión de la sombra
+                        offset=ft.Offset(0, 4),  # Posición: hacia abajo
+                        color=ft.colors.GREY_500,  # Color de la sombra
+                    ),
+                    bgcolor="black",
+                    width=320,
+                    height=70,
+                    padding=0,
+                    image_repeat=ImageRepeat.NO_REPEAT,
+                    shape=ft.BoxShape("rectangle"),
+                    # Define imagen
+                    image_src=imagenes.ruta("/Imagen_de_nuevo_ingreso.png"),
+                    image_fit=ft.ImageFit.COVER,
+                    image_opacity=0.7,
+                ),
+                alignment=ft.alignment.Alignment(x=0, y=0)
+            )
+
+        # Objeto Text para mostrar la opción elegida
+        self.texto_opcion_elegida = ft.Text()
+
+        # menu desplegable principal para elegir un cliente
+        self.menu_clientes= ft.Container(
+            alignment=ft.alignment.Alignment(x=0, y=0),
+            content=Row(
+                alignment=ft.MainAxisAlignment.START,
+                controls=[
+                    ft.Dropdown(
+                        label='Selecciona un Cliente',
+                        alignment=Alignment(0.0, 0.0),
+                        label_style=TextStyle(color='#12597b', size=12, bgcolor='#E0E7ED', weight=ft.FontWeight.W_700),
+                        options_fill_horizontally=True,
+                        dense=True,
+                        max_menu_height=True,
+                        height=50,
+                        width=300,
+                        content_padding=6,
+                        color='#12597b',
+                        border_color='#12597b',
+                        text_size=10,
+                        on_change=lambda e: (self.pestaniaOpcion(e), self.cargar_menu_vehiculos(e)),
+                        # nombres de los clientes de la cache de consultas, compartida con las demas ventanas
+                        options=[ft.dropdown.Option(str(cliente.nombre))
+                            for cliente in cache_consultas.consultar(db.session, select(Cliente.nombre))],
+                        bgcolor="#E0E7ED",
+                        padding=0,
+                    )
+                ]
+            )
+        )
+
+
+        # menu desplegable para seleccionar el vehiculo
+        self.menu_vehiculosCliente= ft.Dropdown(
+                        label='Selecciona un Vehiculo',
+                        alignment = Alignment(0.0, 0.0),
+                        label_style=TextStyle(color='#12597b', size=12, bgcolor= '#E0E7ED', weight=ft.FontWeight.W_700),
+                        options_fill_horizontally =True,
+                        dense = True,
+                        max_menu_height=True,
+                        height=50,
+                        width=300,
+                        content_padding=6,
+                        color='#12597b',
+                        border_color='#12597b',
+                        text_size=10,
+                        #on_change=lambda e: (self.actualizar_submenu(e)),
+                        options=[],
+                        bgcolor="#E0E7ED",
+                        padding=0,
+                    )
+
+        # Campo de entrada para la busqueda
+        self.input_kilometros = ft.TextField(
+            #label="Kilometros...",
+            label_style=TextStyle(color='#6a6965', size=12),
+            value="",
+            border_radius=ft.border_radius.vertical(top=6, bottom=6),
+            hint_text="Introduce los kilometros del vehiculo",
+            hint_style=TextStyle(color='#6a6965', size=11),
+            color='black',
+            height=35,
+            cursor_color="#12597b",
+            text_size=13,
+            border_color="#B0BEC5",
+            autofocus=True,
+            bgcolor="#D9E4EA"
+        )
+
+        # Campo de entrada del motivo de la averia reportada por el cliente
+        self.input_motivo = ft.Container(
+            bgcolor='#D9E4EA',
+            border=ft.border.all(color="#B0BEC5"),
+            #expand=True,
+            height=180,
+            content=
+                ft.TextField(
+                    filled=False,
+                    #label="Motivo...",
+                    label_style=TextStyle(color='#12597b', size=12, ),
+                    expand=True,
+                    value="",
+                    border_radius=ft.border_radius.vertical(top=5, bottom=5),
+                    hint_text="Introduce el motivo de la averia reportada por el cliente",
+                    hint_style=TextStyle(color='#6a6965', size=11),
+                    max_length=180,  # maximo de caracteres que se pueden ingresar en TextField
+                    # max_lines =  10, # maximo de líneas que se mostraran a la vez
+                    multiline=True,  # puede contener varias lineas de texto
+                    color='black',
+                    height=180,
+                    cursor_color="#12597b",
+                    text_size=13,
+                    border_color="transparent",
+                    autofocus=False,
+                    bgcolor="#D9E4EA",
+                    text_vertical_align=ft.VerticalAlignment.START,
+                )
+            )
+
+        # Campo de entrada del diagnostico del vehiculo por taller
+        self.input_diagnotico = ft.Container(
+            bgcolor='#D9E4EA',
+            border=ft.border.all(color="#B0BEC5"),
+            # expand=True,
+            height=180,
+            content=
+            ft.TextField(
+                filled=False,
+                #label="Diagnostico...",
+                label_style=TextStyle(color='#12597b', size=12, ),
+                expand=True,
+                value="",
+                border_radius=ft.border_radius.vertical(top=5, bottom=5),
+                hint_text="Introduce el diagnostico del vehiculo por taller",
+                hint_style=TextStyle(color='#6a6965', size=11),
+                max_length=180,  # maximo de caracteres que se pueden ingresar en TextField
+                # max_lines =  10, # maximo de líneas que se mostraran a la vez
+                multiline=True,  # puede contener varias lineas de texto
+                color='black',
+                height=180,
+                cursor_color="#12597b",
+                text_size=13,
+                border_color="transparent",
+                autofocus=False,
+                bgcolor="#D9E4EA",
+                text_vertical_align=ft.VerticalAlignment.START,
+            )
+        )
+
+        # Boton para activar la busqueda del ingreso y agregar nuevo ingreso
+        self.BotonAgregarVehiculo = ft.Container(
+            alignment=ft.alignment.Alignment(x=0, y=0),
+            content=Row(
+                alignment=ft.MainAxisAlignment.CENTER,
+                controls=[
+                    # Boton buscar cliente y añadir nuevo
+                    ft.ElevatedButton(
+                        text="Aceptar",
+                        color="#FAFAF3",
+                        bgcolor="#12597b",
+                        tooltip='Aceptar Ingreso',
+                        icon=icons.ADD,
+                        icon_color="#FAFAF3",
+                        width=140,
+                        height=30,
+                        on_click=lambda e: (self.ingreso_nuevo(e), page.go("/registro")),
+                    ),
+                    ft.ElevatedButton(
+                        text="Cancelar",
+                        color="#FAFAF3",
+                        bgcolor="#12597b",
+                        tooltip='Cancelar Ingreso',
+                        icon=icons.CANCEL,
+                        icon_color="#FAFAF3",
+                        width=140,
+                        height=30,
+                        on_click=lambda _: page.go("/ingresos"),
+                    ),
+                ]
+            )
+        )
+
+        # Contenedor para mostrar los resultados de busqueda
+        self.vistaResultadosBusqueda = ft.Container(
+            bgcolor='#ede0cc',
+            expand=True,
+            content=ft.GridView(
+                expand=1,
+                child_aspect_ratio=1.7, # ajusta la relacion alto por ancho
+                runs_count=1,  # ajusta el número de columnas según el diseño
+                spacing=1,  # Espacio entre las imágenes
+                run_spacing=1,  # Espacio entre las filas
+            )
+        )
+
+
+
+        # Contenedor principal que contiene todos los elementos de la interfaz
+        self.controls = [
+            ft.Container(
+                ft.Column([
+                    self.imagenNuevoIngreso,
+                    self.menu_clientes,
+                    self.menu_vehiculosCliente,
+                    self.input_kilometros,
+                    self.input_motivo,
+                    self.input_diagnotico,
+                    self.BotonAgregarVehiculo,
+                    self.vistaResultadosBusqueda,
+                ]
+                ),
+
+                # propiedades contenedor principal
+                border_radius=25,
+                width=350,  # ancho
+                height=655,  # Alto
+                gradient=ft.LinearGradient([  # color del contenedor configurable en 2 tonos de color
+                    "#E0E7ED",
+                    "#E0E7ED",
+                ])
+
+            )
+        ]
+
+    # metodo para manejar la opcion seleccionada en el menu desplegable
+    def pestaniaOpcion(self, e):
+        # Obtener la opción seleccionada
+        elegirOpcion = self.menu_clientes.content.controls[0].value
+
+        # Actualizar texto con la opción elegida
+        self.texto_opcion_elegida.value = (
+            f"Opción elegida: {elegirOpcion}" if elegirOpcion else "No se ha seleccionado ninguna opción."
+        )
+
+        # Imprime la opción seleccionada
+        print(f"Cliente seleccionado: {elegirOpcion}")
+
+        # Actualiza la interfaz
+        self.page.update(self)
+
+    # metodo para cargar los vehículos asociados al cliente seleccionado en el dropdown de vehículos
+    def cargar_menu_vehiculos(self, e):
+        # Obtiene el nombre del cliente seleccionado; si se cambia de cliente antes de que lleguen
+        # los vehiculos del anterior, esa consulta se cancela
+        cliente_nombre = e.control.value
+        self.tareas.lanzar('vehiculos', self.rellenar_menu_vehiculos, cliente_nombre)
+
+    # metodo para leer en un hilo de base de datos los vehiculos del cliente con ese nombre
+    @staticmethod
+    def leer_vehiculos_cliente(sesion, cliente_nombre):
+        cliente_seleccionado = sesion.query(Cliente).filter_by(nombre=cliente_nombre).first()
+
+        # Verifica si se encontró un cliente y luego obtiene sus vehículos (de la cache de consultas)
+        if cliente_seleccionado is None:
+            return []
+        vehiculos = cache_consultas.consultar(sesion, select(Vehiculo.id_vehiculo, Vehiculo.marca, Vehiculo.modelo).where(
+            Vehiculo.id_cliente == cliente_seleccionado.id_cliente))
+        return [(vehiculo.id_vehiculo, f"{vehiculo.marca}, {vehiculo.modelo}") for vehiculo in vehiculos]
+
+    # metodo para poner los vehiculos del cliente en el dropdown cuando llegan de la base de datos
+    async def rellenar_menu_vehiculos(self, cliente_nombre):
+        vehiculos = await tareas.consultar(self.leer_vehiculos_cliente, cliente_nombre)
+
+        # Asigna las opciones de vehículos al dropdown correspondiente (vacio si no hay un cliente válido);
+        # la clave de cada opcion es el id del vehiculo, el valor que lee ingreso_nuevo
+        self.menu_vehiculosCliente.options = [ft.dropdown.Option(key=str(id_vehiculo), text=texto)
+                                              for id_vehiculo, texto in vehiculos]
+
+        # Actualiza el dropdown para reflejar los nuevos cambios
+        self.menu_vehiculosCliente.update()
+
+    # metodo para añadir nuevo ingreso
+    def ingreso_nuevo(self, e):
+        print("\n > Crear ingreso")
+        id_cliente = self.menu_clientes.content.controls[0].value.strip()
+        id_vehiculo = self.menu_vehiculosCliente.value.strip()
+        kilometros_ingreso = self.input_kilometros.value.strip()
+        averia = self.input_motivo.content.value.strip()
+        diagnostico = self.input_diagnotico.content.value.strip()
+        fecha_ingreso = datetime.now()
+
+        # Consulta para obtener el cliente y el vehículo seleccionados; el dropdown muestra la marca y
+        # el modelo pero su valor es el id del vehiculo (por modelo podria ser el coche de otro cliente)
+        cliente = db.session.query(Cliente).filter_by(nombre=id_cliente).first()
+        vehiculo = db.session.get(Vehiculo, int(id_vehiculo)) if id_vehiculo.isdigit() else None
+
+        # Validación
+        if not cliente or not vehiculo or vehiculo.id_cliente != cliente.id_cliente:
+            print("Error: Cliente o Vehículo no encontrado.")
+            return
+        if not kilometros_ingreso or not averia:
+            print("Error: Kilómetros o Motivo de avería no proporcionado.")
+            return
+        try:
+            kilometros_ingreso = models.leer_kilometros(kilometros_ingreso)
+        except ValueError as error:
+            print(f"Error: {error}")
+            return
+
+        # Creación y adición del nuevo recambio
+        nuevo_ingreso = Ingreso(kilometros_ingreso=kilometros_ingreso, averia=averia,
+                                diagnostico=diagnostico,fecha_ingreso=fecha_ingreso)
+        db.session.add(nuevo_ingreso)
+
+        # Relación bidireccional automática
+        cliente.ingresos.append(nuevo_ingreso)
+        vehiculo.ingresos.append(nuevo_ingreso)
+        # el vehiculo se queda con los kilometros del ingreso (se guarda en el mismo commit)
+        vehiculo.actualizar_kilometros(kilometros_ingreso)
+        # Guardar cambios
+        db.session.commit()
+
+        print("Ingreso creado exitosamente.")
+
+        # Guardar el ID del nuevo ingreso en la sesión
+        self.page.session.set("nuevo_ingreso", nuevo_ingreso.id_ingreso)
+        self.page.session.set("nombre_cliente", cliente.nombre)
+        self.page.session.set("vehiculo", vehiculo.modelo)
+        self.page.session.set("matricula", vehiculo.matricula)
+        db.session.close()
+
+
+# Gestion de Registros
+class VentanaRegistro(ft.View):
+    '''Clase VentanaRegistro: Interfaz gráfica para la gestión de registro de repuestos e historial.
+
+    Esta clase representa la ventana de la aplicación dedicada a la gestión de registro de repuestos e historial,
+    permitiendo al usuario mantener un seguimiento del historial por cliente o vehiculo.
+
+    Args:
+        - page: Instancia de la página actual, que gestiona el contenido y las interacciones de la ventana.
+
+    Contiene:
+        - Imagen de diagnóstico de ingresos como título: Identifica la sección de ingreso nuevo con una imagen representativa.
+        - Dropdown Cliente: Desplegable para seleccionar el cliente que ingresa el vehículo al taller.
+        - Dropdown Vehículo: Desplegable para seleccionar el vehículo del cliente que será ingresado al taller.
+        - Input Kilometraje: Campo de texto para introducir el kilometraje actual del vehículo al momento del ingreso.
+        - Input Motivo de Ingreso: Campo de texto para introducir el motivo por el cual el vehículo acude al taller.
+        - Input Diagnóstico Previo: Campo de texto para introducir el diagnóstico inicial del taller antes del ingreso.
+        - Botón Aceptar: Botón para confirmar y registrar el ingreso.
+    '''
+
+    def __init__(self, page: ft.Page):
+        '''Constructor de la interfaz grafica para la ventana registro'''
+        super(VentanaRegistro, self).__init__(
+            route="/registro", horizontal_alignment=CrossAxisAlignment.CENTER,
+            vertical_alignment=MainAxisAlignment.CENTER
+        )
+        print("Gestion de Registros (VentanaRegistro)")
+
+        self.page = page
+
+        # Color de fondo contenedor principal
+        self.bgcolor = "#E0E7ED"
+
+        # Titulo imagen registro
+        self.imagenRegistro = ft.Container(
+            ft.Container(
+                bgcolor="#E0E7ED",
+                width=320,
+                height=70,
+                padding=0,
+                image_repeat=ImageRepeat.NO_REPEAT,
+                shape=ft.BoxShape("rectangle"),
+                # Define imagen
+                image_src=imagenes.ruta("/ImagenVehiculo3.png"),
+                image_fit=ft.ImageFit.COVER,
+            ),
+            alignment=ft.alignment.Alignment(x=0, y=0)
+        )
+
+        # Nombre del cliente
+        self.nombre_cliente = ft.Row([
+            ft.Text(
+                value=f'',
+                width=None,
+                size=12,
+                text_align=TextAlign.START,
+                weight=FontWeight.W_600,
+                color="#333333"
+
+            ),
+            ft.Text(
+                value=self.page.session.get("nombre_cliente"),
+                size=12,
+                color='green700',
+                weight=FontWeight.W_600,
+            ),
+            ft.Text(
+                value=f' / ',
+                width=None,
+                size=12,
+                text_align=TextAlign.START,
+                weight=FontWeight.W_600,
+                color="#333333"
+            ),
+            ft.Text(
+                value=self.page.session.get("vehiculo"),
+                size=12,
+                color='green700',
+                weight=FontWeight.W_600,
+            ),
+            ft.Text(
+                value=f'-',
+                size=12,
+                color='green700',
+                weight=FontWeight.W_600,
+            ),
+            ft.Text(
+                value=self.page.session.get("matricula"),
+                size=12,
+                color='green700',
+                weight=FontWeight.W_600,
+            ),
+        ],
+            alignment=ft.MainAxisAlignment.CENTER,
+        )
+
+        # Campo de entrada para la busqueda
+        self.input_buscar = ft.TextField(
+            label="Buscar Recambio...",
+            label_style=TextStyle(color='#6a6965', size=10),
+            value="",
+            border_radius=ft.border_radius.vertical(top=5, bottom=5),
+            hint_text="Introduce el recambio",
+            dense=True,
+            hint_style=TextStyle(color='#6a6965', size=10),
+            color='black',
+            height=35,
+            cursor_color="#12597b",
+            text_size=10,
+            border_color="#12597b",
+            autofocus=True,
+            bgcolor="#E1F5FE"
+        )
+
+        # Menu desplegable principal para elegir una opcion
+        self.menu_principal = ft.Container(
+            alignment=ft.alignment.Alignment(x=0, y=0),
+            content=Row(
+                alignment=ft.MainAxisAlignment.SPACE_AROUND,
+                controls=[
+                    ft.Dropdown(
+                        label='Selecciona Categoría',
+                        alignment=Alignment(0.0, 0.0),
+                        label_style=TextStyle(color='#12597b', size=10, bgcolor='#D9E4EA', weight=ft.FontWeight.W_700),
+                        options_fill_horizontally=True,
+                        dense=True,
+                        height=35,
+                        width=240,
+                        content_padding=6,
+                        color='#12597b',
+                        border_color='#12597b',
+                        text_size=10,
+                        on_change=lambda e: (self.pestaniaOpcion(e),
+                                             self.actualizar_submenu(e)),
+                        # Lista de opciones para los recambios, del catalogo de menu_recambios.json
+                        options=[ft.dropdown.Option(categoria) for categoria in catalogo.categorias_ordenadas()],
+                        bgcolor="#D9E4EA",
+                        padding=0,
+                    ),
+                    ft.IconButton(
+                        icon=ft.icons.SEARCH,
+                        icon_color="#12597b",
+                        icon_size=30,
+                        tooltip="Buscar Recambio",
+                        on_click=lambda e: self.buscar_recambio(e),
+                    ),
+                ]
+            ),
+        )
+
+        # Menu desplegable secundario para elegir una opcion
+        self.submenu_opciones = ft.Dropdown(
+            label='Selecciona Subcategoría',
+            alignment=Alignment(0.0, 0.0),
+            label_style=TextStyle(color='#12597b', size=10, bgcolor='#D9E4EA', weight=ft.FontWeight.W_700),
+            options_fill_horizontally=True,
+            dense=True,
+            max_menu_height=True,
+            height=35,
+            width=300,
+            content_padding=6,
+            color='#12597b',
+            border_color='#12597b',
+            text_size=10,
+            options=[],
+            bgcolor="#D9E4EA",
+            padding=0,
+        )
+
+        # campo de entrada para la cantidad y el precio del proveedor sin descuento
+        self.precio_costoYventa = ft.Row([
+            ft.Text(
+                value=f'Precio Costo',
+                width=None,
+                size=10,
+                text_align=TextAlign.START,
+                weight=FontWeight.W_600,
+                color="#333333"
+
+            ),
+            ft.TextField(
+                label=None,
+                label_style=TextStyle(color='#6a6965', size=12),
+                value="",
+                border_radius=ft.border_radius.vertical(top=5, bottom=5),
+                dense=True,
+                text_align=TextAlign.CENTER,
+                hint_style=TextStyle(color='#6a6965', size=10),
+                color='black',
+                height=30,
+                width=70,
+                cursor_color="#12597b",
+                text_size=10,
+                border_color="#12597b",
+                autofocus=False,
+                bgcolor="#E1F5FE"
+            ),
+            ft.Text(
+                value=f' Precio Venta',
+                width=None,
+                size=10,
+                text_align=TextAlign.START,
+                weight=FontWeight.W_600,
+                color="#333333"
+            ),
+            ft.TextField(
+                label=None,
+                label_style=TextStyle(color='#6a6965', size=10),
+                value="",
+                border_radius=ft.border_radius.vertical(top=5, bottom=5),
+                # hint_text="cantidad",
+                dense=True,
+                text_align=TextAlign.CENTER,
+                hint_style=TextStyle(color='#6a6965', size=10),
+                color='black',
+                height=30,
+                width=70,
+                cursor_color="#12597b",
+                text_size=10,
+                border_color="#12597b",
+                autofocus=False,
+                bgcolor="#E1F5FE"
+            ),
+        ],
+            alignment=ft.MainAxisAlignment.CENTER,
+        )
+
+        # Campo de entrada para el descuento del proveedor y el costo con el descuento aplicado
+        self.cantidad_items = ft.Row([
+            ft.Text(
+                value=f' Cantidad',
+                width=None,
+                size=10,
+                text_align=TextAlign.START,
+                weight=FontWeight.W_600,
+                color="#333333"
+
+            ),
+            ft.TextField(
+                label=None,
+                label_style=TextStyle(color='#6a6965', size=10),
+                value="",
+                border_radius=ft.border_radius.vertical(top=5, bottom=5),
+                # hint_text="%",
+                dense=True,
+                text_align=TextAlign.CENTER,
+                hint_style=TextStyle(color='#6a6965', size=10),
+                color='black',
+                height=30,
+                width=60,
+                cursor_color="#12597b",
+                text_size=10,
+                border_color="#12597b",
+                autofocus=False,
+                bgcolor="#E1F5FE"
+            )
+        ],
+            alignment=ft.MainAxisAlignment.CENTER,
+        )
+
+        # Paginacion de los resultados: cursor de la pagina siguiente y consultas en curso de la ventana
+        self.cursor_busqueda = None
+        self.tareas = tareas.Tareas(page)
+        self.barraCarga = barra_carga()  # visible mientras se espera a la base de datos
+
+        # Contenedor para mostrar los resultados de búsqueda
+        # solo se crean las tarjetas visibles y se reutilizan al hacer scroll
+        self.vistaResultadosBusqueda = ListaVirtual(
+            alto_elemento=195,  # el alto que daba child_aspect_ratio=1.7 con el ancho de la ventana
+            crear_elemento=self.crear_tarjeta,
+            rellenar_elemento=self.rellenar_tarjeta,
+            cargar_mas=lambda e: cargar_mas_al_final(self, e),  # carga la siguiente pagina al llegar al final
+            espacio=1,  # Espacio entre las tarjetas
+            bgcolor='#E0E7ED',
+            expand=True,
+        )
+
+        # Boton para finalizar
+        self.BotonSalir = ft.Container(
+            alignment=ft.alignment.Alignment(x=0, y=0),
+            content=Row(
+                alignment=ft.MainAxisAlignment.CENTER,
+                controls=[
+                    # Boton buscar cliente y añadir nuevo
+                    ft.ElevatedButton(
+                        text="Salir",
+                        color="#FAFAF3",
+                        bgcolor="#12597b",
+                        tooltip='Salir',
+                        icon=icons.EXIT_TO_APP_SHARP,
+                        icon_color="#FAFAF3",
+                        width=185,
+                        height=30,
+                        on_click=lambda e: page.go("/ingresos"),
+                    )
+                ]
+            )
+        )
+
+        # Contenedor principal que contiene todos los elementos de la interfaz
+        self.controls = [
+            ft.Container(
+                ft.Column([
+                    # self.imagenRegistro,
+                    self.nombre_cliente,
+                    # self.vehiculo_cliente,
+                    self.input_buscar,
+                    self.barraCarga,
+                    self.menu_principal,
+                    self.submenu_opciones,
+                    self.precio_costoYventa,
+                    self.cantidad_items,
+                    self.vistaResultadosBusqueda,
+                    self.BotonSalir
+                ]
+                ),
+
+                # propiedades contenedor principal
+                border_radius=25,
+                width=350,  # ancho
+                height=655,  # Alto
+                gradient=ft.LinearGradient([  # color del contenedor configurable en 2 tonos de color
+                    "#E0E7ED",
+                    "#E0E7ED",
+                ])
+
+            )
+        ]
+
+    # metodo para manejar la opcion seleccionada en el menu desplegable principal
+    def pestaniaOpcion(self, e):
+        try:
+            # Crear un objeto Text para mostrar la opcion elegida
+            t = ft.Text()
+
+            # Obtener la opcion elegida del menu desplegable
+            elegirOpcion = self.menu_principal.content.controls[0].value
+
+            # Actualizar el valor del objeto Text con la opcion elegida
+            t.value = f"Opción elegida: {elegirOpcion}"
+
+            # Categoria del catalogo que corresponde a la opcion elegida (sin mayusculas ni acentos)
+            categoria = catalogo.categoria(elegirOpcion)
+
+            # Imprimir un mensaje segun la opcion elegida
+            if categoria is not None:
+                print(f'Buscar en {categoria}')
+            else:
+                print('Opcion no valida')
+
+            # Actualizar la pagina con el objeto Text
+            self.page.update(self)
+            # Agregar el objeto Text a la pagina
+            self.page.add(t)
+        except Exception as e:
+            print(f'Error: {e}')
+            # Registrar el error en el archivo de texto
+            with open("errores.txt", "a") as file:
+                momentoEspecificoError = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                nombre_metodo = "pestaniaOpcion, VentanaRecambios"
+                mensaje_error = f"{momentoEspecificoError} - Método: {nombre_metodo} - Error general: {e}\n"
+                file.write(mensaje_error)
+        finally:
+            db.session.close()
+
+    # Submenús asociados a cada opción del menú principal
+    def actualizar_submenu(self, e):
+        # Obtiene las opciones del submenú basadas en la selección del primer dropdown
+        seleccion = e.control.value
+
+        # Submenús asociados a la opción elegida, del catalogo compartido en memoria
+        subcategorias = catalogo.subcategorias(seleccion)
+
+        # Actualizar el valor del objeto Text con la opcion elegida
+        if subcategorias is not None:
+            print(subcategorias)
+            self.submenu_opciones.options = [ft.dropdown.Option(sub) for sub in subcategorias]
+            print(self.submenu_opciones.options)
+
+        else:
+            self.submenu_opciones.options = []  # Si no hay submenú, vacía las opciones
+        self.submenu_opciones.value = None  # Resetea la selección del submenú
+        self.submenu_opciones.update()
+
+    # metodo para el evento de clic del boton de busqueda
+    def botonBuscar(self, e):
+        categoria = self.menu_principal.content.controls[0].value
+
+        # Realizar la búsqueda segun la categoria seleccionada
+        if catalogo.categoria(categoria) is not None:
+            self.buscar_recambio(e)
+        else:
+            print('Opción no válida, elige categoria en el desplegable')
+
+    # metodo para cargar los recambios existentes en el GridView
+    def buscar_recambio(self, e):
+        # inputs donde el usuario ingresa el nombre, menu categoria y subcategoria del recambio que quiere buscar
+        self.recambio_buscado = (
+            self.input_buscar.value.strip(),  # este es el Input
+            self.menu_principal.content.controls[0].value.strip(),
+            self.submenu_opciones.value.strip() if self.submenu_opciones.value else ""
+        )
+        self.cursor_busqueda = None  # la busqueda empieza por la primera pagina
+
+        self.input_buscar.value = ""
+        self.input_buscar.update()
+
+        # la consulta va a un hilo de base de datos; si habia otra busqueda en curso se cancela
+        self.tareas.lanzar('busqueda', self.cargar_pagina, True, indicador=self.barraCarga)
+
+    # metodo para cargar la siguiente pagina de recambios en la lista
+    async def cargar_pagina(self, nueva=False):
+        # Buscamos el recambio en el indice de texto completo (ignorando mayúsculas y acentos), una pagina cada vez
+        recambio, categoria, subcategoria = self.recambio_buscado
+        recambio_localizado, cursor = await tareas.consultar(
+            busqueda.buscar_recambios, recambio, categoria, subcategoria, self.cursor_busqueda)
+
+        # Limpia los resultados anteriores cuando llegan los de la busqueda nueva
+        if nueva:
+            self.vistaResultadosBusqueda.limpiar()
+        self.cursor_busqueda = cursor
+
+        if recambio_localizado:
+            # agregar los recambios a la lista, que solo dibuja las tarjetas visibles
+            self.vistaResultadosBusqueda.agregar(recambio_localizado)
+        # actualizar la interfaz
+        self.vistaResultadosBusqueda.update()
+
+    # metodo para crear una tarjeta de recambio vacia que la lista reutiliza
+    def crear_tarjeta(self):
+        '''Crea la tarjeta de resultados de recambios sin datos; en card.data se guardan los textos
+           que cambian y el recambio que muestra, que se escriben con rellenar_tarjeta'''
+        id_recambio = ft.Text(size=11, text_align=ft.TextAlign.LEFT)
+        nombre = ft.Text(size=11, text_align=ft.TextAlign.CENTER, no_wrap=False)  # no_wrap Asegura que el texto se ajuste si es largo
+        descripcion = ft.Text(size=11, text_align=ft.TextAlign.LEFT, no_wrap=False)  # no_wrap asegura que el texto se ajuste si es largo
+
+        card = ft.Card(
+            elevation=15,
+            content=ft.Container(
+                alignment=ft.alignment.Alignment(x=0, y=0),
+                bgcolor="#9ec4cc",
+                padding=5,
+                border=ft.border.all(1, ft.colors.BLUE_800),
+                border_radius=ft.border_radius.all(12),
+                content=ft.Column([
+                    ft.Container(
+                        ft.Row(
+                            [
+                                ft.Text(f"ID:", size=12, weight=ft.FontWeight.W_700,
+                                        text_align=ft.TextAlign.LEFT),
+                                id_recambio,
+                            ],
+                            alignment=ft.MainAxisAlignment.START,
+                            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                        ),
+                        bgcolor="transparent",
+                        padding=0,
+                        alignment=ft.alignment.center_left,
+
+                    ),
+                    ft.Container(
+                        ft.Row(
+                            [
+                                ft.Text(f"Recambio:", size=12, weight=ft.FontWeight.W_700,
+                                        text_align=ft.TextAlign.LEFT),
+                                nombre
+                            ],
+                            wrap=True,  # asegura que el contenido se ajuste en varias filas si es necesario
+                            alignment=ft.MainAxisAlignment.START,
+                            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                        ),
+                        bgcolor="transparent",
+                        padding=0,
+                        alignment=ft.alignment.center_left,
+                    ),
+                    ft.Container(
+                        ft.Row(
+                            [
+                                ft.Text(f"Descripcion:", size=12, weight=ft.FontWeight.W_700,
+                                        text_align=ft.TextAlign.LEFT),
+                                descripcion
+                            ],
+                            wrap=True,  # asegura que el contenido se ajuste en varias filas si es necesario
+                            alignment=ft.MainAxisAlignment.START,
+                            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                        ),
+                        expand=True,
+                        bgcolor="transparent",
+                        padding=1,
+                        alignment=ft.alignment.center_left,
+                    ),
+
+                    ft.Row([
+                        # el boton lee el recambio que muestra la tarjeta en el momento del click
+                        ft.ElevatedButton(
+                            bgcolor="#12597b",
+                            width=95,
+                            height=20,
+                            content=ft.Text("Añadir", color="white", size=11, bgcolor="#12597b"),
+                            on_click=lambda e: self.registro_nuevo(e, card.data['recambio'].id_recambio),
+                        ),
+                    ],
+                        alignment=ft.MainAxisAlignment.CENTER,
+                        vertical_alignment=ft.CrossAxisAlignment.END,
+                    )
+                ])
+            )
+        )
+        card.data = {'recambio': None, 'id_recambio': id_recambio, 'nombre': nombre, 'descripcion': descripcion}
+        return card
+
+    # metodo para mostrar un recambio en una tarjeta de la lista
+    def rellenar_tarjeta(self, card, recambios):
+        campos = card.data
+        campos['recambio'] = recambios
+        campos['id_recambio'].value = f"{recambios.id_recambio}"
+        campos['nombre'].value = f"{recambios.nombre_recambio}"
+        campos['descripcion'].value = f"{recambios.descripcion}"
+
+    # metodo para asignar recambios al ingreso
+    def registro_nuevo(self, e, producto_seleccionado_id):
+        print("\n > Crear registro")
+
+        # Obtener el ID del ingreso almacenado en la sesión
+        ingreso_id = self.page.session.get('nuevo_ingreso')
+        if ingreso_id:
+            ingreso_actual = db.session.query(Ingreso).filter_by(id_ingreso=ingreso_id).first()
+            if ingreso_actual:
+                print(
+                    f" ID : {ingreso_actual.id_ingreso}, ID Cliente: {ingreso_actual.id_cliente}, ID Vehiculo: {ingreso_actual.id_vehiculo}")
+            else:
+                print("Error: No se ha encontrado el ingreso en la base de datos.")
+                return
+        else:
+            print("Error: No se ha establecido el ingreso en la sesión.")
+            return
+
+        # elimina impresion de la ultima busqueda en pantalla (y su paginacion)
+        self.vistaResultadosBusqueda.limpiar()
+        self.vistaResultadosBusqueda.update()
+        self.cursor_busqueda = None
+
+        # Seleccionar el recambio para agregar al registro del ingreso
+        id_recambio_seleccionado = producto_seleccionado_id
+
+        recambio_seleccionado = db.session.query(Recambio).filter(
+            Recambio.id_recambio == id_recambio_seleccionado).first()
+        # Obtener precio, cantidad, descuento y total
+        # los importes se calculan al centimo con Decimal (se guardan en centimos, ver models.Centimos)
+        precio_costo = models.euros(models.centimos(self.precio_costoYventa.controls[1].value))
+        precio_venta = models.euros(models.centimos(self.precio_costoYventa.controls[3].value))
+        cantidad = float(self.cantidad_items.controls[1].value.strip().replace(',', '.'))
+        total_costo = models.importe(precio_costo, cantidad)
+        venta_total = models.importe(precio_venta, cantidad)
+
+        if recambio_seleccionado:
+            print(f"Recambio seleccionado: {recambio_seleccionado.nombre_recambio}")
+            registro_recambio = Registro(pu_costo=precio_costo, pu_venta=precio_venta, cantidad=cantidad,
+                                         costo_total=total_costo, venta_total=venta_total)
+
+            # Relación bidireccional automática
+            ingreso_actual.registros.append(registro_recambio)
+            recambio_seleccionado.registros.append(registro_recambio)
+
+            # Guardar cambios
+            db.session.add(registro_recambio)
+            db.session.commit()
+            print("Registro guardado exitosamente.")
+        else:
+            print("Error: Cliente o recambio no encontrado.")
+
+        # Restablecer el valor del campo de busqueda a una cadena vacia
+        self.precio_costoYventa.controls[1].value = ""
+        self.precio_costoYventa.controls[3].value = ""
+        self.cantidad_items.controls[1].value = ""
+
+        # Actualizar el campo de busqueda en la interfaz de usuario
+        self.precio_costoYventa.update()
+        self.cantidad_items.update()
+
+        db.session.close()
+
+
+# Gestion de Ingresos - Registros del Ingreso Seleccionado
+class VentanaVerRegistrosIngresoSeleccionado(ft.View):
+    '''Clase VentanaVerRegistrosIngresoSeleccionado:
+    Interfaz gráfica para la visualización de los registros del ingreso seleccionado.
+
+    Esta clase representa una ventana de la aplicación dedicada a mostrar los registros del ingreso seleccionado.
+    Permite al usuario explorar el ingreso seleccionado y realizar
+    acciones específicas, como añadir datos o editar información relacionada.
+
+    Args:
+        page (ft.Page): Instancia de la página actual, utilizada para gestionar el contenido
+                       y las interacciones de la ventana.
+
+    Componentes principales:
+        - Título (ft.Text): Identifica la sección correspondiente a los registros del ingreso seleccionado.
+        - ListView (ft.ListView): Muestra una lista interactiva del ingreso seleccionado.
+        - IconButtons (ft.IconButton):
+            * Icono 1: Visualiza la información detallada de la reparación o mantenimiento.
+            * Icono 2: Permite editar los datos del registro.
+        - Botón Volver (ft.ElevatedButton): Navega de regreso a la ventana ingresos del clientes.
+'''
+    def __init__(self, page: ft.Page):
+        '''Constructor de la interfaz grafica para visualizar los registros del ingreso seleccionado desd gestion de clietes'''
+        super(VentanaVerRegistrosIngresoSeleccionado, self).__init__(
+            route="/registrosIngreso1", horizontal_alignment=CrossAxisAlignment.CENTER,
+            vertical_alignment=MainAxisAlignment.CENTER
+        )
+        print("Gestion de Clientes - Registros del Ingreso Seleccionado (VentanaVerRegistrosIngresoSeleccionado)")
+
+        self.page = page
+
+        # Color de fondo contenedor principal
+        self.bgcolor = "#E0E7ED"
+
+        # Titulo que identifica la sección correspondiente
+        self.modelo_vehiculo = ft.Row([
+            ft.Text(
+                value=f'Registros del Ingreso',
+                width=None,
+                size=12,
+                text_align=TextAlign.START,
+                weight=FontWeight.W_600,
+                color="#333333"
+            ),
+            ft.Text(
+                value = self.page.session.get("marcaVehiculoSeleccionadoCliente"), # objeto_seleccionado VentanaVerVehiculosCliente
+                size=12,
+                color='green700',
+                weight=FontWeight.W_600
+            ),
+            ft.Text(
+                value=self.page.session.get("modeloVehiculoSeleccionadoCliente"), # objeto_seleccionado VentanaVerVehiculosCliente
+                size=12,
+                color='green700',
+                weight=FontWeight.W_600
+            ),
+            ft.Text(
+                value=self.page.session.get("matriculaVehiculoSeleccionadoCliente"), # objeto_seleccionado VentanaVerVehiculosCliente
+                size=12,
+                color='green700',
+                weight=FontWeight.W_600
+            )
+        ],
+            alignment=ft.MainAxisAlignment.CENTER,
+        )
+
+        # Contenedor para mostrar los ingresos del cliente
+        self.vistaResultadosBusqueda = ft.Container(
+            bgcolor='#E0E7ED',  # Color de fondo
+            expand=True,
+            content=ft.GridView(
+                expand=1,
+                on_scroll_interval=10,  # Intervalo de scroll
+                child_aspect_ratio=1.6,  # Ajusta la relación alto por ancho
+                runs_count=1,  # Número de columnas según el diseño
+                spacing=10,  # Espacio entre las imágenes
+                run_spacing=1,  # Espacio entre las filas
+            )
+        )
+
+        # Boton para realizar la accion de volver a la ventana vehiculos
+        self.botonVolver = ft.Container(
+            ft.ElevatedButton(
+                text="Volver",
+                color="#FAFAF3",
+                bgcolor="#12597b",
+                tooltip='Volver atras',
+                icon=icons.ARROW_BACK,
+                icon_color="#FAFAF3",
+                width=180,
+                height=30,
+                on_click=lambda e: self.page.go("/clientes"),
+            ),
+            alignment=ft.alignment.Alignment(x=0, y=0)
+        )
+
+
+
+        # Contenedor principal que contiene todos los elementos de la interfaz
+        self.controls = [
+            ft.Container(
+                ft.Column([
+                    self.modelo_vehiculo,
+                    self.vistaResultadosBusqueda,
+                    self.botonVolver,
+
+                ]
+                ),
+
+                # propiedades contenedor principal
+                border_radius=25,
+                width=350,  # ancho
+                height=655,  # Alto
+                gradient=ft.LinearGradient([  # color del contenedor configurable en 2 tonos de color
+                    "#E0E7ED",
+                    "#E0E7ED",
+                ])
+
+            )
+        ]
+
+
+# Gestion de Ingresos - Registros Ingreso Seleccionado
+class VentanaVerRegistrosIngreso(ft.View):
+    '''Clase VentanaRegistro: Interfaz gráfica para la gestión de registro de repuestos e historial.
+
+      Esta clase representa la ventana de la aplicación dedicada a la gestión de registro de repuestos e historial,
+      permitiendo al usuario mantener un seguimiento del historial por cliente o vehiculo.
+
+      Args:
+          - page: Instancia de la página actual, que gestiona el contenido y las interacciones de la ventana.
+
+      Contiene:
+          - Imagen de diagnóstico de ingresos como título: Identifica la sección de ingreso nuevo con una imagen representativa.
+          - Dropdown Cliente: Desplegable para seleccionar el cliente que ingresa el vehículo al taller.
+          - Dropdown Vehículo: Desplegable para seleccionar el vehículo del cliente que será ingresado al taller.
+          - Input Kilometraje: Campo de texto para introducir el kilometraje actual del vehículo al momento del ingreso.
+          - Input Motivo de Ingreso: Campo de texto para introducir el motivo por el cual el vehículo acude al taller.
+          - Input Diagnóstico Previo: Campo de texto para introducir el diagnóstico inicial del taller antes del ingreso.
+          - Botón Aceptar: Botón para confirmar y registrar el ingreso.
+      '''
+
+    def __init__(self, page: ft.Page):
+        '''Constructor de la interfaz grafica para visualizar los registros del ingreso seleccionado'''
+        super(VentanaVerRegistrosIngreso, self).__init__(
+            route="/registrosIngreso2", horizontal_alignment=CrossAxisAlignment.CENTER,
+            vertical_alignment=MainAxisAlignment.CENTER
+        )
+        print("Gestion de Registros - Registros Ingreso Seleccionado (VentanaVerRegistrosIngreso)")
+
+        self.page = page
+
+        # Color de fondo contenedor principal
+        self.bgcolor = "#E0E7ED"
+
+        # Titulo que identifica la sección correspondiente
+        self.ingreso_vehiculo = ft.Row([
+            ft.Text(
+                value=f'Ingreso',
+                width=None,
+                size=12,
+                text_align=TextAlign.START,
+                weight=FontWeight.W_600,
+                color="#333333"
+            ),
+            ft.Text(
+                value=self.page.session.get("idIngresoSeleccionadoCliente"),
+                size=12,
+                color='green700',
+                weight=FontWeight.W_600
+            ),
+            ft.Text(
+                value=f'del',
+                width=None,
+                size=12,
+                text_align=TextAlign.START,
+                weight=FontWeight.W_600,
+                color="#333333"
+            ),
+            ft.Text(
+                value=self.page.session.get("fechaIngresoSeleccionadoCliente").strftime('%d/%m/%Y'),
+                size=12,
+                color='green700',
+                weight=FontWeight.W_600
+            ),
+            ft.Text(
+                value=f'con',
+                width=None,
+                size=12,
+                text_align=TextAlign.START,
+                weight=FontWeight.W_600,
+                color="#333333"
+            ),
+            ft.Text(
+                value=self.page.session.get("kilometrosIngresoSeleccionadoCliente"),
+                size=12,
+                color='green700',
+                weight=FontWeight.W_600
+            ),
+            ft.Text(
+                value=f'km',
+                width=None,
+                size=12,
+                text_align=TextAlign.START,
+                weight=FontWeight.W_600,
+                color="#333333"
+            ),
+        ],
+            alignment=ft.MainAxisAlignment.CENTER,
+        )
+
+
+        # Contenedor para mostrar los ingresos del cliente
+        self.registros_ingresoGridView = ft.Container(
+            bgcolor='#E0E7ED',  # Color de fondo
+            expand=True,
+            content=ft.GridView(
+                expand=1,
+                on_scroll_interval=10,  # Intervalo de scroll
+                child_aspect_ratio=1.6,  # Ajusta la relación alto por ancho
+                runs_count=1,  # Número de columnas según el diseño
+                spacing=10,  # Espacio entre las imágenes
+                run_spacing=1,  # Espacio entre las filas
+            )
+        )
+
+        self.listaRegistros = ft.ListView(
+            expand=1,
+            spacing=10,
+            padding=20,
+            auto_scroll=True
+        )
+
+        # Totales del ingreso, leidos de la tabla resumen_ingresos (una fila) sin sumar los registros
+        lineas, total_costo, total_venta = resumenes.totales_ingreso(
+            db.session, self.page.session.get("idIngresoSeleccionadoCliente"))
+        self.totales_ingreso = ft.Row([
+            ft.Text(value=f'{lineas} recambios', size=12, weight=FontWeight.W_600, color="#333333"),
+            ft.Text(value=f'Costo: {total_costo:.2f}', size=12, weight=FontWeight.W_600, color="#333333"),
+            ft.Text(value=f'Venta: {total_venta:.2f}', size=12, weight=FontWeight.W_600, color='green700'),
+        ],
+            alignment=ft.MainAxisAlignment.SPACE_EVENLY,
+        )
+
+
+        # Boton para realizar la accion de volver a la ventana vehiculos
+        self.botonVolver = ft.Container(
+            ft.ElevatedButton(
+                text="Volver",
+                color="#FAFAF3",
+                bgcolor="#12597b",
+                tooltip='Volver atras',
+                icon=icons.ARROW_BACK,
+                icon_color="#FAFAF3",
+                width=180,
+                height=30,
+                on_click=lambda e: self.page.go("/registrosIngreso"),
+            ),
+            alignment=ft.alignment.Alignment(x=0, y=0)
+        )
+
+
+
+
+
+        # Contenedor principal que contiene todos los elementos de la interfaz
+        self.controls = [
+            ft.Container(
+                ft.Column([
+                    self.ingreso_vehiculo,
+                    #self.vistaregistros,
+                    self.listaRegistros,
+                    self.totales_ingreso,
+                    self.botonVolver,
+
+                ]
+                ),
+
+                # propiedades contenedor principal
+                border_radius=25,
+                width=350,  # ancho
+                height=655,  # Alto
+                gradient=ft.LinearGradient([  # color del contenedor configurable en 2 tonos de color
+                    "#E0E7ED",
+                    "#E0E7ED",
+                ])
+
+            )
+        ]
+        self.listaRegistrosGridView(self)
+
+    # metodo para mostrar los registros del ingreso seleccionado en GridView
+    # metodo para cargar los recambios existentes en el GridView
+    def listaRegistrosGridView(self,e):
+        # Limpia los controles actuales del GridView
+        self.registros_ingresoGridView.content.controls = []
+
+        # Obtener el ingreso seleccionado desde la sesión
+        id_ingreso_actual = self.page.session.get("idIngresoSeleccionadoCliente")
+        # Obtener el ingreso con sus registros y recambios en una unica consulta
+        ingresoSeleccionado = consultas.ingreso_con_registros(db.session, id_ingreso_actual)
+
+        if not ingresoSeleccionado:
+            print("No se encontró el ingreso.")
+            return
+
+        if ingresoSeleccionado.registros:
+            cards = []
+            for registro in ingresoSeleccionado.registros:
+                recambio = registro.recambios
+                if not recambio:
+                    print(f"No se encontró información del recambio con ID {registro.id_recambio}")
+                    continue
+                # mostramos detalles del recambio registrado
+                print(f"Recambio: {recambio.nombre_recambio}, Cantidad: {registro.cantidad}")
+                card = ft.Card(
+                    elevation=15,
+                    content=ft.Container(
+                        alignment=ft.alignment.Alignment(x=0, y=0),
+                        bgcolor="#9ec4cc",
+                        padding=5,
+                        border=ft.border.all(1, ft.colors.BLUE_800),
+                        border_radius=ft.border_radius.all(12),
+                        content=ft.Column([
+                            ft.Container(
+                                ft.Row(
+                                    [
+                                        ft.Text(f"Recambio:", size=12, weight=ft.FontWeight.W_700, color="#283747", text_align=ft.TextAlign.LEFT),
+                                        ft.Text(f"{recambio.nombre_recambio}",size=12, text_align=ft.TextAlign.CENTER, color="#283747", no_wrap = False) # no_wrap Asegura que el texto se ajuste si es largo
+                                    ],
+                                    wrap=True,
+                                    alignment=ft.MainAxisAlignment.START,
+                                    vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                                ),
+                                bgcolor="transparent",
+                                padding=0,
+                                alignment=ft.alignment.center_left,
+                            ),
+                            ft.Container(
+                                ft.Row(
+                                    [
+                                        ft.Text(f"Descripcion:", size=12, weight=ft.FontWeight.W_700,
+                                                text_align=ft.TextAlign.LEFT),
+                                        ft.Text(f"{recambio.descripcion}", size=11, text_align=ft.TextAlign.LEFT,  no_wrap = False) # no_wrap Asegura que el texto se ajuste si es largo)
+                                    ],
+                                    wrap=True, # asegura que el contenido se ajuste en varias filas si es necesario
+                                    alignment=ft.MainAxisAlignment.START,
+                                    vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                                ),
+                                expand=True,
+                                bgcolor="transparent",
+                                padding=1,
+                                alignment=ft.alignment.center_left,
+                            ),
+                            ft.Container(
+                                ft.Row(
+                                    [
+                                        ft.Text(f"Cantidad:", size=12, weight=ft.FontWeight.W_700, color="#283747", text_align=ft.TextAlign.LEFT),
+                                        ft.Text(f"{registro.cantidad}", size=12, text_align=ft.TextAlign.LEFT, color="#283747"),
+                                        ft.Text(f"Total:", size=12, weight=ft.FontWeight.W_700, color="#283747", text_align=ft.TextAlign.LEFT),
+                                        ft.Text(f"{registro.total_venta}", size=12, text_align=ft.TextAlign.LEFT, color="#283747"),
+                                    ],
+                                    alignment=ft.MainAxisAlignment.SPACE_EVENLY,
+                                    vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                                ),
+                                bgcolor="transparent",
+                                padding=0,
+                                alignment=ft.alignment.center_left,
+                            ),
+                        ])
+                    )
+                )
+
+                cards.append(card)
+
+            # agregar cards al GridView
+            for card in cards:
+                self.registros_ingresoGridView.content.controls.append(card)
+
+    # metodo para mostrar los registros del ingreso seleccionado en ListView
+    def listaRegistrosListView(self, e):
+
+        # Obtener el ingreso seleccionado desde la sesión con sus registros y recambios en una unica consulta
+        id_ingreso_actual = self.page.session.get("idIngresoSeleccionadoCliente")
+        ingresoSeleccionado = consultas.ingreso_con_registros(db.session, id_ingreso_actual)
+
+        # Limpiar los controles existentes
+        self.listaRegistros.controls.clear()
+
+        if not ingresoSeleccionado:
+            print("No se encontró el ingreso.")
+            return
+
+        # Registros relacionados con el ingreso (ya cargados)
+        registros = ingresoSeleccionado.registros
+
+        if not registros:
+            print("No se encontraron registros para el ingreso.")
+            return
+
+        # Mostrar información general del ingreso
+        self.listaRegistros.controls.append(
+            ft.Text(
+                f"Motivo del cliente: {ingresoSeleccionado.averia}, Diagnóstico del Taller: {ingresoSeleccionado.diagnostico}, "
+                f"Kilómetros de ingreso: {ingresoSeleccionado.kilometros_ingreso}, Fecha ingreso: {ingresoSeleccionado.fecha_ingreso}",
+                weight=ft.FontWeight.W_700,
+                size=12,
+                color="#9C5273"
+            )
+        )
+
+        # Crear una lista de controles para los recambios
+        items_recambios = []
+
+        for registro in registros:
+            recambio = registro.recambios
+            if recambio:
+                texto_producto = f"-> {recambio.nombre_recambio},\n->{recambio.descripcion}"
+                items_recambios.append(
+                    ft.Text(
+                        texto_producto,
+                        weight=ft.FontWeight.W_500,
+                        size=11,
+                        color="#9C5273"
+                    )
+                )
+                print(texto_producto)
+            else:
+                print(f"No se encontró información del recambio con ID {registro.id_recambio}")
+
+        # Agregar los controles al contenedor principal
+        self.listaRegistros.controls.extend(items_recambios)
+
+        # Actualizar la interfaz
+        self.listaRegistros.update()
+
+        # Cerrar la sesión de base de datos
+        db.session.close()
@@ -0,0 +1,268 @@
+# Ventana principal de inicio, con el menu de las gestiones
+
+import flet as ft
+from flet import CrossAxisAlignment, ImageRepeat, MainAxisAlignment
+import imagenes
+
+
+# Ventana Principal de Inicio
+class VentanaInicio(ft.View):
+    '''Clase VentanaInicio: Interfaz gráfica de la ventana de inicio del sistema de gestión del taller.
+
+    Esta clase representa la ventana principal de la aplicación, donde se muestran diversas opciones
+    relacionadas con el análisis y reporte de datos del taller mecánico. En esta interfaz, el usuario
+    puede acceder a diferentes funcionalidades clave para gestionar y analizar los datos de los clientes
+    y el desempeño del taller.
+
+    Args:
+        - page: Instancia de la página actual, que maneja el contenido y las interacciones de la ventana.
+
+    Contiene:
+        - Botón ElevatedButton "Análisis de Costos por Cliente": Accede a una vista detallada que muestra el
+          desglose de costos por cada cliente registrado en el sistema.
+        - Botón ElevatedButton "Reporte de Beneficios": Permite al usuario consultar los beneficios generados
+          por el taller, calculando la diferencia entre ingresos y costos.
+        - Botón ElevatedButton "Estadísticas del Taller": Muestra un resumen del desempeño del taller,
+          incluyendo la cantidad de vehículos atendidos y los tipos de reparaciones más comunes.
+        - Botón ElevatedButton "Proyecciones Futuras": Accede a una vista de proyecciones basadas en datos
+          históricos, como ingresos estimados o número de servicios futuros.
+    '''
+
+    def __init__(self, page: ft.Page):
+        '''Constructor de la interfaz grafica para la ventana Inicio'''
+        super(VentanaInicio, self).__init__(
+            route="/inicio", horizontal_alignment=CrossAxisAlignment.CENTER,
+            vertical_alignment=MainAxisAlignment.CENTER
+        )
+        print("Ventana Principal de Inicio (VentanaInicio)")
+        self.page = page
+
+        # Color de fondo contenedor principal
+        self.bgcolor = "#E0E7ED"
+
+        # Logo de la App
+        self.logo = ft.Container(
+            ft.Container(
+                bgcolor="black",
+                width=250,
+                height=250,
+                padding=0,
+                image_repeat=ImageRepeat.NO_REPEAT,
+                shape=ft.BoxShape("rectangle"),
+                # Define imagen
+                image_src=imagenes.ruta("/logo-APP3.png"),
+                image_fit=ft.ImageFit.COVER,
+            ),
+            alignment=ft.alignment.Alignment(x=0, y=0)
+        )
+
+        # Imagen vehiculo
+        self.ImagenVehiculo = ft.Container(
+            ft.Container(
+                bgcolor="#E0E7ED",
+                width=200,
+                height=90,
+                padding=0,
+                image_repeat=ImageRepeat.NO_REPEAT,
+                shape=ft.BoxShape("rectangle"),
+                # Define imagen
+                image_src=imagenes.ruta("/ImagenVehiculo2.png"),
+                image_fit=ft.ImageFit.COVER,
+            ),
+            expand=False,
+            alignment=ft.alignment.Alignment(x=0, y=0)
+        )
+
+        # Boton para acceder al análisis de costos por cliente.
+        self.boton_CostoPorCliente = ft.Container(
+            ft.ElevatedButton(
+                text="Costos por Cliente",
+                color="white",
+                bgcolor="#12597b",
+                # icon=icons.LOGIN,
+                # icon_color="333333",
+                width=200,
+                height=30,
+                on_click=lambda _: page.go("/clientes")
+            ),
+            alignment=ft.alignment.Alignment(x=0, y=0)
+        )
+
+        # Boton para acceder a consultar los beneficios del taller.
+        self.boton_ReporteBeneficios = ft.Container(
+            ft.ElevatedButton(
+                text="Reporte de Beneficios",
+                color="white",
+                bgcolor="#12597b",
+                # icon=icons.LOGIN,
+                # icon_color="333333",
+                width=200,
+                height=30,
+                on_click=lambda _: page.go("/vehiculos")
+
+            ),
+            alignment=ft.alignment.Alignment(x=0, y=0)
+        )
+
+        # Boton para acceder al analisis del uso y desempeño general del taller
+        self.boton_EstadisticasTaller = ft.Container(
+            ft.ElevatedButton(
+                text="Estadísticas del Taller",
+                color="white",
+                bgcolor="#12597b",
+                # icon=icons.LOGIN,
+                # icon_color="333333",
+                width=200,
+                height=30,
+                on_click=lambda _: page.go("/recambios")
+            ),
+            alignment=ft.alignment.Alignment(x=0, y=0)
+        )
+
+        # Boton para acceder a proyecciones y análisis futuros
+        self.boton_Proyecciones = ft.Container(
+            ft.ElevatedButton(
+                text="Proyecciones",
+                color="white",
+                bgcolor="#12597b",
+                # icon=icons.LOGIN,
+                # icon_color="333333",
+                width=200,
+                height=30,
+                on_click=lambda _: page.go("/ingresos")
+            ),
+            alignment=ft.alignment.Alignment(x=0, y=0)
+        )
+
+        # contenedor vacio para relleno
+        self.contenedor_vacio = ft.Container(
+            expand= True
+        )
+
+        # Barra de navegacion VentanaInicio
+        self.barraNavegacion = ft.NavigationBar(
+            selected_index=0,
+            height=50,
+            on_change=lambda e: self.barra_de_navegacion(e),
+            destinations=[
+                ft.NavigationBarDestination(
+                    icon_content=ft.Icon(
+                        name=ft.icons.HOME_OUTLINED,
+                        color="#31708E",
+                        size=20  # Ajusta el tamaño del ícono no seleccionado
+                    ),
+                    selected_icon_content=ft.Icon(
+                        name=ft.icons.HOME_ROUNDED,
+                        color="#31708E",
+                        size=24  # Ajusta el tamaño del ícono seleccionado
+                    ),
+                    label="Inicio",
+                ),
+                ft.NavigationBarDestination(
+                    icon_content=ft.Icon(
+                        name=ft.icons.PERSON_OUTLINED,
+                        color="#31708E",
+                        size=20
+                    ),
+                    selected_icon_content=ft.Icon(
+                        name=ft.icons.PERSON,
+                        color="#31708E",
+                        size=24
+                    ),
+                    label="Cliente",
+
+                ),
+                ft.NavigationBarDestination(
+                    icon_content=ft.Icon(
+                        name=ft.icons.DIRECTIONS_CAR_OUTLINED,
+                        color="#31708E",
+                        size=20
+                    ),
+                    selected_icon_content=ft.Icon(
+                        name=ft.icons.DIRECTIONS_CAR,
+                        color="#31708E",
+                        size=24
+                    ),
+                    label="Vehículo",
+                ),
+                ft.NavigationBarDestination(
+                    icon_content=ft.Icon(
+                        name=ft.icons.SETTINGS_OUTLINED,
+                        color="#31708E",
+                        size=20
+                    ),
+                    selected_icon_content=ft.Icon(
+                        name=ft.icons.SETTINGS,
+                        color="#31708E",
+                        size=24
+                    ),
+                    label="Recambio",
+                ),
+                ft.NavigationBarDestination(
+                    icon_content=ft.Icon(
+                        name=ft.icons.CAR_REPAIR_OUTLINED,
+                        color="#31708E",
+                        size=20
+                    ),
+                    selected_icon_content=ft.Icon(
+                        name=ft.icons.CAR_REPAIR,
+                        color="#31708E",
+                        size=24
+                    ),
+                    label="Ingreso",
+                )
+            ],
+            bgcolor="#D1E2E7",  # Color de fondo de la barra de navegación (azul oscuro)
+            indicator_color="#FFD700",  # Color del indicador del destino seleccionado (ámbar)
+            surface_tint_color="#E0E7ED",  # Color de superficie para el material (#ede0cc)
+            label_behavior=ft.NavigationBarLabelBehavior.ONLY_SHOW_SELECTED  # Mostrar la etiqueta  seleccionada
+        )
+
+        # Contenedor principal que contiene todos los elementos de la interfaz
+        self.controls = [
+            ft.Container(
+                ft.Column([
+                    ft.Divider(height=10, color="transparent"),
+                    self.logo,
+                    ft.Divider(height=70, color="transparent"),
+                    #self.ImagenVehiculo,
+                    ft.Divider(height=5, color="transparent"),
+                    self.boton_CostoPorCliente,
+                    ft.Divider(height=5, color="transparent"),
+                    self.boton_ReporteBeneficios,
+                    ft.Divider(height=5, color="transparent"),
+                    self.boton_EstadisticasTaller,
+                    ft.Divider(height=5, color="transparent"),
+                    self.boton_Proyecciones,
+                    self.contenedor_vacio,
+                    self.barraNavegacion,
+                ]
+                ),
+
+                # propiedades contenedor principal
+                border_radius=25,
+                width=350,  # ancho
+                height=655,  # Alto
+                gradient=ft.LinearGradient([  # color del contenedor configurable en 2 tonos de color
+                    "#E0E7ED",
+                    "#E0E7ED",
+                ])
+
+            )
+        ]
+
+    # metodo para navegar entre ventanas
+    def barra_de_navegacion(self, e):
+        selected_index = e.control.selected_index
+        self.page.controls.clear()
+        if selected_index == 0:
+            self.page.go("/inicio")
+        elif selected_index == 1:
+            self.page.go("/clientes")
+        elif selected_index == 2:
+            self.page.go("/vehiculos")
+        elif selected_index == 3:
+            self.page.go("/recambios")
+        elif selected_index == 4:
+            self.page.go("/ingresos")
+        self.page.update()
@@ -0,0 +1,802 @@
+# Ventanas de gestion de recambios: busqueda y alta
+
+from datetime import datetime
+import flet as ft
+from flet import Alignment, CrossAxisAlignment, ImageRepeat, MainAxisAlignment, Row, TextStyle, icons
+from sqlalchemy.exc import SQLAlchemyError
+from models import Recambio
+import busqueda
+import consultas
+from catalogo import catalogo
+from componentes import ListaVirtual, barra_carga, cargar_mas_al_final
+import tareas
+import imagenes
+import db
+import asyncio
+
+
+# Gestion de Recambios
+class VentanaRecambios(ft.View):
+    '''Clase VentanaRecambios: Interfaz gráfica para la gestión de recambios.
+
+    Esta clase representa la ventana de la aplicación dedicada a la gestión de recambios, donde el
+    usuario puede realizar operaciones como búsqueda, adición, modificación y eliminación de recambios
+    utilizados en las reparaciones.
+
+    Args:
+        - page: Instancia de la página actual, que maneja el contenido y las interacciones de la ventana.
+
+    Contiene:
+        - Imagen de título: Muestra una imagen de "Recambios" para identificar visualmente la sección.
+        - Input: Campo de texto para ingresar el nombre o los detalles del recambio a buscar.
+        - Botón ElevatedButton "Buscar Recambio": Activa la búsqueda de recambios en base a los datos ingresados.
+        - Botón ElevatedButton "Añadir Recambio": Permite al usuario añadir un nuevo recambio al sistema ingresando
+          los datos requeridos (nombre, descripción, costo, etc.).
+        - Botón ElevatedButton "Modificar Recambio": Accede a una interfaz para modificar los datos de un
+          recambio existente en el sistema.
+        - Botón ElevatedButton "Eliminar Recambio": Elimina del sistema los registros del recambio seleccionado.
+    '''
+
+    def __init__(self, page: ft.Page):
+        '''Constructor de la interfaz grafica para la ventana recambios'''
+        super(VentanaRecambios, self).__init__(
+            route="/recambios", horizontal_alignment=CrossAxisAlignment.CENTER,
+            vertical_alignment=MainAxisAlignment.CENTER
+        )
+        print("Gestion de Recambios (VentanaRecambios)")
+
+        self.page = page
+
+        # Color de fondo contenedor principal
+        self.bgcolor = "#E0E7ED"
+
+        # Titulo imagen recambios
+        self.imagenRecambios = ft.Container(
+            ft.Container(
+                    content=ft.Text(
+                        value=" Gestión de Recambios",
+                        size=22,
+                        color=ft.colors.WHITE,
+                        weight=ft.FontWeight.BOLD
+                    ),
+                    shadow=ft.BoxShadow(
+                        blur_radius=4,  # Difuminado de la sombra
+                        spread_radius=2,  # Expansión de la sombra
+                        offset=ft.Offset(0, 4),  # Posición: hacia abajo
+                        color=ft.colors.GREY_500,  # Color de la sombra
+                    ),
+                    bgcolor="black",
+                    width=320,
+                    height=120,
+                    padding=0,
+                    image_repeat=ImageRepeat.NO_REPEAT,
+                    shape=ft.BoxShape("rectangle"),
+                    # Define imagen
+                    image_src=imagenes.ruta("/ImagenRecambios.png"),
+                    image_fit=ft.ImageFit.COVER,
+                    image_opacity=0.7,
+                ),
+                alignment=ft.alignment.Alignment(x=0, y=0)
+            )
+
+        # Campo de entrada para la busqueda
+        self.input_buscar = ft.TextField(
+            label="Buscar Recambio",
+            label_style=TextStyle(color='#6a6965', size=12),
+            value="",
+            border_radius=ft.border_radius.vertical(top=6, bottom=6),
+            hint_text="Introduce el recambio",
+            hint_style=TextStyle(color='#6a6965', size=10),
+            color='black',
+            height=35,
+            cursor_color="#12597b",
+            text_size=13,
+            border_color="#12597b",
+            autofocus=True,
+            bgcolor="#D9E4EA",
+            on_change=lambda e: self.buscar_recambio(e),  # busca mientras se escribe
+        )
+
+        # Menu desplegable principal para elegir una opcion
+        self.menu_principal = ft.Container(
+            alignment=ft.alignment.Alignment(x=0, y=0),
+            content=Row(
+                alignment=ft.MainAxisAlignment.START,
+                controls=[
+                    ft.Dropdown(
+                        label='Selecciona Categoría',
+                        alignment = Alignment(0.0, 0.0),
+                        label_style=TextStyle(color='#12597b', size=13, bgcolor= '#E0E7ED', weight=ft.FontWeight.W_700),
+                        options_fill_horizontally =True,
+                        dense = True,
+                        height=40,
+                        width=300,
+                        content_padding=6,
+                        color='#12597b',
+                        border_color='#12597b',
+                        text_size=11,
+                        on_change=lambda e: (self.pestaniaOpcion(e),
+                                             self.actualizar_submenu(e)),
+                        # Lista de opciones para los recambios, del catalogo de menu_recambios.json
+                        options=[ft.dropdown.Option(categoria) for categoria in catalogo.categorias_ordenadas()],
+                        bgcolor="#E0E7ED",
+                        padding = 0,
+                    )
+                ]
+            )
+        )
+
+        # Menu desplegable secundario para elegir una opcion
+        self.submenu_opciones = ft.Dropdown(
+                        label='Selecciona Subcategoría',
+                        alignment = Alignment(0.0, 0.0),
+                        label_style=TextStyle(color='#12597b', size=12, bgcolor= '#E0E7ED', weight=ft.FontWeight.W_700),
+                        options_fill_horizontally =True,
+                        dense = True,
+                        max_menu_height=True,
+                        height=50,
+                        width=300,
+                        content_padding=6,
+                        color='#12597b',
+                        border_color='#12597b',
+                        text_size=10,
+                        #on_change=lambda e: (self.actualizar_submenu(e)),
+                        options=[],
+                        bgcolor="#E0E7ED",
+                        padding=0,
+                    )
+
+        # Boton para activar la busqueda del recambio y boton agregar nuevo recambio
+        self.BotonBuscarRecambio = ft.Container(
+            alignment=ft.alignment.Alignment(x=0, y=0),
+            content=Row(
+                alignment=ft.MainAxisAlignment.CENTER,
+                controls=[
+                    # Boton buscar cliente y añadir nuevo
+                    ft.ElevatedButton(
+                        text="Buscar Recambio",
+                        color="#FAFAF3",
+                        bgcolor="#12597b",
+                        tooltip='Buscar Recambio',
+                        icon=icons.SEARCH,
+                        icon_color="#FAFAF3",
+                        width=185,
+                        height=30,
+                        on_click=lambda e: self.buscar_recambio(e),
+                    ),
+                    # Boton para añadir nuevo recambio a la db
+                    ft.IconButton(
+                        content=ft.Image(src=imagenes.ruta("add-spare part.png"),
+                                         color="#709775",
+                                         height=30,
+                                         width=30),
+                        tooltip="Añadir Nuevo",
+                        on_click=lambda _: page.go("/crearRecambio"),
+                    ),
+
+                ]
+            )
+        )
+
+        # Paginacion de los resultados: cursor de la pagina siguiente y consultas en curso de la ventana
+        self.cursor_busqueda = None
+        self.tareas = tareas.Tareas(page)
+        self.barraCarga = barra_carga()  # visible mientras se espera a la base de datos
+        self.incremental = busqueda.BusquedaIncremental(busqueda.coincide_recambio, ('recambios',))  # resultados para refinar en memoria
+
+        # Contenedor para mostrar los resultados de búsqueda
+        # solo se crean las tarjetas visibles y se reutilizan al hacer scroll
+        self.vistaResultadosBusqueda = ListaVirtual(
+            alto_elemento=195,  # el alto que daba child_aspect_ratio=1.7 con el ancho de la ventana
+            crear_elemento=self.crear_tarjeta,
+            rellenar_elemento=self.rellenar_tarjeta,
+            cargar_mas=lambda e: cargar_mas_al_final(self, e),  # carga la siguiente pagina al llegar al final
+            espacio=1,  # Espacio entre las tarjetas
+            bgcolor='#E0E7ED',
+            expand=True,
+        )
+
+
+        # Barra de navegacion
+        self.barraNavegacion = ft.NavigationBar(
+            selected_index=3,
+            height=50,
+            on_change=lambda e: self.barra_de_navegacion(e),
+            destinations=[
+                ft.NavigationBarDestination(
+                    icon_content=ft.Icon(
+                        name=ft.icons.HOME_OUTLINED,
+                        color="#12597b",
+                        size=20  # Ajusta el tamaño del ícono no seleccionado
+                    ),
+                    selected_icon_content=ft.Icon(
+                        name=ft.icons.HOME_ROUNDED,
+                        color="#12597b",
+                        size=24  # Ajusta el tamaño del ícono seleccionado
+                    ),
+                    label="Inicio",
+                ),
+                ft.NavigationBarDestination(
+                    icon_content=ft.Icon(
+                        name=ft.icons.PERSON_OUTLINED,
+                        color="#12597b",
+                        size=20
+                    ),
+                    selected_icon_content=ft.Icon(
+                        name=ft.icons.PERSON,
+                        color="#12597b",
+                        size=24
+                    ),
+                    label="Cliente",
+
+                ),
+                ft.NavigationBarDestination(
+                    icon_content=ft.Icon(
+                        name=ft.icons.DIRECTIONS_CAR_OUTLINED,
+                        color="#12597b",
+                        size=20
+                    ),
+                    selected_icon_content=ft.Icon(
+                        name=ft.icons.DIRECTIONS_CAR,
+                        color="#12597b",
+                        size=24
+                    ),
+                    label="Vehículo",
+                ),
+                ft.NavigationBarDestination(
+                    icon_content=ft.Icon(
+                        name=ft.icons.SETTINGS_OUTLINED,
+                        color="#12597b",
+                        size=20
+                    ),
+                    selected_icon_content=ft.Icon(
+                        name=ft.icons.SETTINGS,
+                        color="#12597b",
+                        size=24
+                    ),
+                    label="Recambio",
+                ),
+                ft.NavigationBarDestination(
+                    icon_content=ft.Icon(
+                        name=ft.icons.CAR_REPAIR_OUTLINED,
+                        color="#12597b",
+                        size=20
+                    ),
+                    selected_icon_content=ft.Icon(
+                        name=ft.icons.CAR_REPAIR,
+                        color="#12597b",
+                        size=24
+                    ),
+                    label="Ingreso",
+                )
+            ],
+            bgcolor="#D1E2E7",  # Color de fondo de la barra de navegación (azul oscuro)
+            indicator_color="#FFD700",  # Color del indicador del destino seleccionado (ámbar)
+            surface_tint_color="#E0E7ED",  # Color de superficie para el material (gris claro)
+            label_behavior=ft.NavigationBarLabelBehavior.ONLY_SHOW_SELECTED  # Mostrar la etiqueta  seleccionada
+        )
+
+        # Contenedor principal que contiene todos los elementos de la interfaz
+        self.controls = [
+            ft.Container(
+                ft.Column([
+                    self.imagenRecambios,
+                    self.input_buscar,
+                    self.barraCarga,
+                    self.menu_principal,
+                    self.submenu_opciones,
+                    self.BotonBuscarRecambio,
+                    self.vistaResultadosBusqueda,
+                    self.barraNavegacion,
+
+                ]
+                ),
+
+                # propiedades contenedor principal
+                border_radius=25,
+                width=350,  # ancho
+                height=655,  # Alto
+                gradient=ft.LinearGradient([  # color del contenedor configurable en 2 tonos de color
+                    "#E0E7ED",
+                    "#E0E7ED",
+                ])
+
+            )
+        ]
+
+    # metodo para manejar la opcion seleccionada en el menu desplegable principal
+    def pestaniaOpcion(self, e):
+        try:
+            # Crear un objeto Text para mostrar la opcion elegida
+            t = ft.Text()
+
+            # Obtener la opcion elegida del menu desplegable
+            elegirOpcion = self.menu_principal.content.controls[0].value
+
+            # Actualizar el valor del objeto Text con la opcion elegida
+            t.value = f"Opción elegida: {elegirOpcion}"
+
+            # Categoria del catalogo que corresponde a la opcion elegida (sin mayusculas ni acentos)
+            categoria = catalogo.categoria(elegirOpcion)
+
+            # Imprimir un mensaje segun la opcion elegida
+            if categoria is not None:
+                print(f'Buscar en {categoria}')
+            else:
+                print('Opcion no valida')
+
+            # Actualizar la pagina con el objeto Text
+            self.page.update(self)
+            # Agregar el objeto Text a la pagina
+            self.page.add(t)
+        except Exception as e:
+            print(f'Error: {e}')
+            # Registrar el error en el archivo de texto
+            with open("errores.txt", "a") as file:
+                momentoEspecificoError = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                nombre_metodo = "pestaniaOpcion, VentanaRecambios"
+                mensaje_error = f"{momentoEspecificoError} - Método: {nombre_metodo} - Error general: {e}\n"
+                file.write(mensaje_error)
+        finally:
+            db.session.close()
+
+    # Submenús asociados a cada opción del menú principal
+    def actualizar_submenu(self, e):
+        # Obtiene las opciones del submenú basadas en la selección del primer dropdown
+        seleccion = e.control.value
+
+        # Submenús asociados a la opción elegida, del catalogo compartido en memoria
+        subcategorias = catalogo.subcategorias(seleccion)
+
+        # Actualizar el valor del objeto Text con la opcion elegida
+        if subcategorias is not None:
+            print(subcategorias)
+            self.submenu_opciones.options = [ft.dropdown.Option(sub) for sub in subcategorias]
+            print(self.submenu_opciones.options)
+
+        else:
+            self.submenu_opciones.options = []  # Si no hay submenú, vacía las opciones
+        self.submenu_opciones.value = None  # Resetea la selección del submenú
+        self.submenu_opciones.update()
+
+    # metodo para el evento de clic del boton de busqueda
+    def botonBuscar(self, e):
+        categoria = self.menu_principal.content.controls[0].value
+
+        # Realizar la búsqueda segun la categoria seleccionada
+        if catalogo.categoria(categoria) is not None:
+                self.buscar_recambio(e)
+        else:
+            print('Opción no válida, elige categoria en el desplegable')
+
+    # metodo para cargar los recambios existentes en el GridView
+    def buscar_recambio(self,e):
+        # inputs donde el usuario ingresa el nombre, categoria y subcategoria del recambio que quiere buscar
+        # (el texto se deja escrito para poder afinarlo)
+        self.recambio_buscado = (
+            (self.input_buscar.value or "").strip(),  # este es el Input
+            (self.menu_principal.content.controls[0].value or "").strip(),
+            self.submenu_opciones.value.strip() if self.submenu_opciones.value else ""
+        )
+        self.cursor_busqueda = None  # la busqueda empieza por la primera pagina
+
+        # la consulta va a un hilo de base de datos; si habia otra busqueda en curso se cancela
+        # mientras se escribe (on_change) se espera a que pase PAUSA_TECLEO sin otra tecla
+        pausa = busqueda.PAUSA_TECLEO if e.name == 'change' else 0
+        if e.name != 'change':
+            self.incremental.olvidar()  # al pulsar Buscar siempre se consulta la base de datos
+        self.tareas.lanzar('busqueda', self.cargar_pagina, True, pausa, indicador=self.barraCarga)
+
+    # metodo para cargar la siguiente pagina de recambios en la lista
+    async def cargar_pagina(self, nueva=False, pausa=0):
+        await asyncio.sleep(pausa)
+        recambio, categoria, subcategoria = self.recambio_buscado
+        cursor = self.cursor_busqueda
+
+        # si el texto amplia el de la busqueda anterior (completa) con los mismos desplegables
+        # se filtran sus resultados en memoria
+        recambio_localizado = self.incremental.refinar(recambio, (categoria, subcategoria)) if nueva else None
+        if recambio_localizado is None:
+            # Buscamos el recambio en el indice de texto completo (ignorando mayúsculas y acentos), una pagina cada vez
+            recambio_localizado, cursor = await tareas.consultar(
+                busqueda.buscar_recambios, recambio, categoria, subcategoria, cursor,
+                busqueda.FILAS_REFINABLES if nueva else consultas.TAMANIO_PAGINA)
+            self.incremental.guardar(recambio, recambio_localizado, cursor, nueva, (categoria, subcategoria))
+
+        # Limpia los resultados anteriores cuando llegan los de la busqueda nueva
+        if nueva:
+            self.vistaResultadosBusqueda.limpiar()
+        self.cursor_busqueda = cursor
+
+        if recambio_localizado:
+            # agregar los recambios a la lista, que solo dibuja las tarjetas visibles
+            self.vistaResultadosBusqueda.agregar(recambio_localizado)
+        #actualizar la interfaz
+        self.vistaResultadosBusqueda.update()
+
+    # metodo para crear una tarjeta de recambio vacia que la lista reutiliza
+    def crear_tarjeta(self):
+        '''Crea la tarjeta de resultados de recambios sin datos; en card.data se guardan los textos
+           que cambian y el recambio que muestra, que se escriben con rellenar_tarjeta'''
+        nombre = ft.Text(size=12, text_align=ft.TextAlign.CENTER, color="#283747", no_wrap = False) # no_wrap Asegura que el texto se ajuste si es largo
+        descripcion = ft.Text(size=11, text_align=ft.TextAlign.LEFT,  no_wrap = False) # no_wrap Asegura que el texto se ajuste si es largo)
+
+        card = ft.Card(
+            elevation=15,
+            content=ft.Container(
+                alignment=ft.alignment.Alignment(x=0, y=0),
+                bgcolor="#9ec4cc",
+                padding=5,
+                border=ft.border.all(1, ft.colors.BLUE_800),
+                border_radius=ft.border_radius.all(12),
+                content=ft.Column([
+                    ft.Container(
+                        ft.Row(
+                            [
+                                ft.Text(f"Recambio:", size=12, weight=ft.FontWeight.W_700, color="#283747", text_align=ft.TextAlign.LEFT),
+                                nombre
+                            ],
+                            wrap=True,
+                            alignment=ft.MainAxisAlignment.START,
+                            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                        ),
+                        bgcolor="transparent",
+                        padding=0,
+                        alignment=ft.alignment.center_left,
+                    ),
+                    ft.Container(
+                        ft.Row(
+                            [
+                                ft.Text(f"Descripcion:", size=12, weight=ft.FontWeight.W_700,
+                                        text_align=ft.TextAlign.LEFT),
+                                descripcion
+                            ],
+                            wrap=True, # asegura que el contenido se ajuste en varias filas si es necesario
+                            alignment=ft.MainAxisAlignment.START,
+                            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                        ),
+                        expand=True,
+                        bgcolor="transparent",
+                        padding=1,
+                        alignment=ft.alignment.center_left,
+                    ),
+
+                    ft.Row(
+                        [
+                            ft.IconButton(
+                                icon=ft.icons.CAR_REPAIR,
+                                icon_color="E0E7ED",
+                                icon_size=25,
+                                tooltip="Añadir a Ingreso",
+                            ),
+                            ft.IconButton(
+                                icon=ft.icons.MODE_EDIT_OUTLINED,
+                                icon_color="E0E7ED",
+                                icon_size=25,
+                                tooltip="Editar",
+                                #on_click=lambda e: self.page.go("/editarVehiculo"),
+                            ),
+                        ],
+                        alignment=ft.MainAxisAlignment.SPACE_EVENLY,
+                        vertical_alignment=ft.CrossAxisAlignment.END,
+                    )
+                ])
+            )
+        )
+        card.data = {'recambio': None, 'nombre': nombre, 'descripcion': descripcion}
+        return card
+
+    # metodo para mostrar un recambio en una tarjeta de la lista
+    def rellenar_tarjeta(self, card, recambios):
+        campos = card.data
+        campos['recambio'] = recambios
+        campos['nombre'].value = f"{recambios.nombre_recambio}"
+        campos['descripcion'].value = f"{recambios.descripcion}"
+
+    # metodo para navegar entre ventanas
+    def barra_de_navegacion(self, e):
+        selected_index = e.control.selected_index
+        if selected_index == 0:
+            self.page.go("/inicio")
+        elif selected_index == 1:
+            self.page.go("/clientes")
+        elif selected_index == 2:
+            self.page.go("/vehiculos")
+        elif selected_index == 3:
+            self.page.go("/recambios")
+        elif selected_index == 4:
+            self.page.go("/ingresos")
+
+
+# Gestion de Recambios - Crear recambio
+class VentanaCrearRecambio(ft.View):
+    '''Clase VentanaRecambios: Interfaz gráfica para la gestión de recambios.
+
+      Esta clase representa la ventana de la aplicación dedicada a la gestión de recambios, donde el
+      usuario puede realizar operaciones como búsqueda, adición, modificación y eliminación de recambios
+      utilizados en las reparaciones.
+
+      Args:
+          - page: Instancia de la página actual, que maneja el contenido y las interacciones de la ventana.
+
+      Contiene:
+          - Imagen de título: Muestra una imagen de "Recambios" para identificar visualmente la sección.
+          - Input: Campo de texto para ingresar el nombre o los detalles del recambio a buscar.
+          - Botón ElevatedButton "Buscar Recambio": Activa la búsqueda de recambios en base a los datos ingresados.
+          - Botón ElevatedButton "Añadir Recambio": Permite al usuario añadir un nuevo recambio al sistema ingresando
+            los datos requeridos (nombre, descripción, costo, etc.).
+          - Botón ElevatedButton "Modificar Recambio": Accede a una interfaz para modificar los datos de un
+            recambio existente en el sistema.
+          - Botón ElevatedButton "Eliminar Recambio": Elimina del sistema los registros del recambio seleccionado.
+      '''
+
+    def __init__(self, page: ft.Page):
+        '''Constructor de la interfaz grafica para añadir recambios a la db'''
+        super(VentanaCrearRecambio, self).__init__(
+            route="/crearRecambio", horizontal_alignment=CrossAxisAlignment.CENTER,
+            vertical_alignment=MainAxisAlignment.CENTER
+        )
+        print("Gestion de Recambios - Crear recambio (VentanaCrearRecambio)")
+
+        self.page = page
+
+        # Color de fondo contenedor principal
+        self.bgcolor = "#E0E7ED"
+
+        # Titulo imagen recambios
+        self.imagenCrearRecambios = ft.Container(
+            ft.Container(
+                    content=ft.Text(
+                        value=" Añadir Nuevo",
+                        size=22,
+                        color=ft.colors.WHITE,
+                        weight=ft.FontWeight.BOLD
+                    ),
+                    shadow=ft.BoxShadow(
+                        blur_radius=8,  # Difuminado de la sombra
+                        spread_radius=2,  # Expansión de la sombra
+                        offset=ft.Offset(0, 4),  # Posición: hacia abajo
+                        color=ft.colors.GREY_500,  # Color de la sombra
+                    ),
+                    bgcolor="black",
+                    width=320,
+                    height=120,
+                    padding=0,
+                    image_repeat=ImageRepeat.NO_REPEAT,
+                    shape=ft.BoxShape("rectangle"),
+                    # Define imagen
+                    image_src=imagenes.ruta("/ImagenCrearRecambio.png"),
+                    image_fit=ft.ImageFit.COVER,
+                    image_opacity=0.7,
+                ),
+                alignment=ft.alignment.Alignment(x=0, y=0)
+            )
+
+        # Campo de entrada para nombre del recambio
+        self.input_nombreRecambio = ft.Container(
+            bgcolor='#D9E4EA',
+            border=ft.border.all(color="#B0BEC5"),
+            #expand=True,
+            height=70,
+            content = ft.TextField(
+                filled=False,
+                #label="Nombre del Recambio",
+                label_style=TextStyle(color='#6a6965', size=12),
+                value="",
+                border_radius=ft.border_radius.vertical(top=5, bottom=5),
+                hint_text="Introduce el Recambio",
+                hint_style=TextStyle(color='#6a6965', size=10),
+                max_length=70,  # maximo de caracteres que se pueden ingresar en TextField
+                multiline=True,  # puede contener varias lineas de texto
+                color='black',
+                height=90,
+                cursor_color="#12597b",
+                text_size=13,
+                border_color="transparent",
+                autofocus=True,
+                bgcolor="#D9E4EA",
+            )
+        )
+
+        # Campo de entrada para la descripcion del recambio
+        self.input_descripcionRecambio = ft.Container(
+            bgcolor='#D9E4EA',
+            border=ft.border.all(color="#B0BEC5"),
+            #expand=True,
+            height=180,
+            content=
+                ft.TextField(
+                    filled=False,
+                    #label="Descripccion del Recambio...",
+                    label_style=TextStyle(color='#12597b', size=12, ),
+                    expand=True,
+                    value="",
+                    border_radius=ft.border_radius.vertical(top=5, bottom=5),
+                    hint_text="Introduce la Descripcion",
+                    hint_style=TextStyle(color='#6a6965', size=10),
+                    max_length=180,  # maximo de caracteres que se pueden ingresar en TextField
+                    # max_lines =  10, # maximo de líneas que se mostraran a la vez
+                    multiline=True,  # puede contener varias lineas de texto
+                    color='black',
+                    height=180,
+                    cursor_color="#12597b",
+                    text_size=13,
+                    border_color="transparent",
+                    autofocus=False,
+                    bgcolor="#D9E4EA",
+                    text_vertical_align=ft.VerticalAlignment.START,
+                )
+            )
+
+        # Menu desplegable principal para elegir una opcion
+        self.categoria = ft.Container(
+            alignment=ft.alignment.Alignment(x=0, y=0),
+            content=Row(
+                alignment=ft.MainAxisAlignment.START,
+                controls=[
+                    ft.Dropdown(
+                        label='Selecciona Categoría',
+                        alignment = Alignment(0.0, 0.0),
+                        label_style=TextStyle(color='#12597b', size=13, bgcolor= '#D9E4EA', weight=ft.FontWeight.W_700),
+                        options_fill_horizontally =True,
+                        dense = True,
+                        height=40,
+                        width=300,
+                        content_padding=6,
+                        color='#12597b',
+                        border_color='#12597b',
+                        text_size=11,
+                        on_change=lambda e: (self.pestaniaOpcion(e),
+                                             self.actualizar_submenu(e)),
+                        # Lista de opciones para los recambios, del catalogo de menu_recambios.json
+                        options=[ft.dropdown.Option(categoria) for categoria in catalogo.categorias_ordenadas()],
+                        bgcolor="#D9E4EA",
+                        padding = 0,
+                    )
+                ]
+            )
+        )
+
+        # Menu desplegable secundario para elegir una opcion
+        self.subcategoria = ft.Dropdown(
+                        label='Selecciona Subcategoría ',
+                        alignment = Alignment(0.0, 0.0),
+                        label_style=TextStyle(color='#12597b', size=13, bgcolor= '#D9E4EA', weight=ft.FontWeight.W_700),
+                        options_fill_horizontally =True,
+                        dense = True,
+                        max_menu_height=True,
+                        height=50,
+                        width=300,
+                        content_padding=6,
+                        color='#12597b',
+                        border_color='#12597b',
+                        text_size=10,
+                        on_change=lambda e: (self.actualizar_submenu(e)),
+                        options=[],
+                        bgcolor="#D9E4EA",
+                        padding=0,
+                    )
+
+        # Boton para activar la creacion del recambio
+        self.BotonCrearRecambio = ft.Container(
+            expand=True,
+            alignment=ft.alignment.Alignment(x=0, y=0),
+            content=Row(
+                alignment=ft.MainAxisAlignment.CENTER,
+                controls=[
+                    # Boton buscar cliente y añadir nuevo
+                    ft.ElevatedButton(
+                        text="Aceptar",
+                        color="#FAFAF3",
+                        bgcolor="#12597b",
+                        tooltip='Añadir Recambio',
+                        icon=icons.ADD,
+                        icon_color="#FAFAF3",
+                        width=140,
+                        height=30,
+                        on_click=lambda e: (self.crear_recambio(e), page.go("/recambios")),
+                    ), ft.ElevatedButton(
+                        text="Cancelar",
+                        color="#FAFAF3",
+                        bgcolor="#12597b",
+                        tooltip='Cancelar Ingreso',
+                        icon=icons.CANCEL,
+                        icon_color="#FAFAF3",
+                        width=140,
+                        height=30,
+                        on_click=lambda _: page.go("/recambios"),
+                    ),
+                ]
+            )
+        )
+
+        # Contenedor principal que contiene todos los elementos de la interfaz
+        self.controls = [
+            ft.Container(
+                ft.Column([
+                    self.imagenCrearRecambios,
+                    self.input_nombreRecambio,
+                    self.input_descripcionRecambio,
+                    self.categoria,
+                    self.subcategoria,
+                    self.BotonCrearRecambio,
+                ]
+                ),
+
+                # propiedades contenedor principal
+                border_radius=25,
+                width=350,  # ancho
+                height=655,  # Alto
+                gradient=ft.LinearGradient([  # color del contenedor configurable en 2 tonos de color
+                    "#E0E7ED",
+                    "#E0E7ED",
+                ])
+
+            )
+        ]
+
+    # metodo para manejar la opcion seleccionada en el menu desplegable principal
+    def pestaniaOpcion(self, e):
+
+        # Crear un objeto Text para mostrar la opcion elegida
+        t = ft.Text()
+
+        # Obtener la opcion elegida del menu desplegable
+        elegirOpcion = self.categoria.content.controls[0].value
+
+        # Actualizar el valor del objeto Text con la opcion elegida
+        t.value = f"Opción elegida: {elegirOpcion}"
+
+        # Categoria del catalogo que corresponde a la opcion elegida (sin mayusculas ni acentos)
+        categoria = catalogo.categoria(elegirOpcion)
+
+        # Imprimir un mensaje segun la opcion elegida
+        if categoria is not None:
+            print(f'Añadir en {categoria}')
+        else:
+            print('Opcion no valida')
+
+        # Actualizar la pagina con el objeto Text
+        self.page.update(self)
+        # Agregar el objeto Text a la pagina
+        self.page.add(t)
+
+        db.session.close()
+
+    # Submenús asociados a cada opción del menú principal
+    def actualizar_submenu(self, e):
+        # Obtiene las opciones del submenú basadas en la selección del primer dropdown
+        seleccion = e.control.value
+
+        # Submenús asociados a la opción elegida, del catalogo compartido en memoria
+        subcategorias = catalogo.subcategorias(seleccion)
+
+        # Actualizar el valor del objeto Text con la opcion elegida
+        if subcategorias is not None:
+            print(subcategorias)
+            self.subcategoria.options = [ft.dropdown.Option(sub) for sub in subcategorias]
+            print(self.subcategoria.options)
+        self.subcategoria.update()
+
+    # metodo para registrar nuevo recambio
+    def crear_recambio(self, e):
+        print("\n > Crear recambio")
+        nombre_recambio = self.input_nombreRecambio.content.value.strip()  # este es el Input
+        descripcion = self.input_descripcionRecambio.content.value.strip()  # este es el Input
+        categoria = self.categoria.content.controls[0].value
+        categoria = catalogo.categoria(categoria) or categoria  # se guarda con la clave del catalogo
+        subcategoria = self.subcategoria.value.strip()
+        fecha_alta = datetime.now()
+
+        # Creación y adición del nuevo recambio
+        nuevo_recambio = Recambio(nombre_recambio=nombre_recambio, descripcion=descripcion, categoria=categoria,
+                                  subcategoria=subcategoria, fecha_alta=fecha_alta)
+        try:
+            db.session.add(nuevo_recambio)
+            db.session.commit()
+            print("Recambio creado con éxito.")
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            print(f"Error al crear el recambio: {e}")
+        finally:
+            db.session.close()
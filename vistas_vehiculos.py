@@ -0,0 +1,1282 @@
+# Ventanas de gestion de vehiculos: busqueda, alta, edicion y sus ingresos
+
+from datetime import datetime
+import flet as ft
+from flet import Alignment, CrossAxisAlignment, FontWeight, ImageRepeat, MainAxisAlignment, Row, TextAlign, TextStyle, icons
+from sqlalchemy import select
+from models import Cliente, Vehiculo, Ingreso
+import models
+import busqueda
+import consultas
+from componentes import ListaVirtual, barra_carga, cargar_mas_al_final
+import tareas
+import cache_consultas
+import imagenes
+import db
+import asyncio
+
+
+# Gestion de Vehiculos
+class VentanaVehiculo(ft.View):
+    '''Clase VentanaVehiculo: Interfaz gráfica para la gestión de vehículos.
+
+    Esta clase representa la ventana de la aplicación dedicada a la gestión de vehículos, donde el
+    usuario puede realizar operaciones como búsqueda, adición, modificación y eliminación de los vehículos
+    registrados en el sistema del taller.
+
+    Args:
+        - page: Instancia de la página actual, que maneja el contenido y las interacciones de la ventana.
+
+    Contiene:
+        - Imagen de título: Muestra una imagen de "Vehículos" para identificar visualmente la sección.
+        - Input: Campo de texto para ingresar la matrícula o los datos del vehículo a buscar.
+        - Botón ElevatedButton "Buscar Vehículo": Activa la búsqueda de vehículos en base a los datos ingresados.
+        - Botón ElevatedButton "Añadir Vehículo": Permite al usuario añadir un nuevo vehículo al sistema
+          ingresando los datos requeridos (marca, modelo, matrícula, kilometraje, etc.).
+        - Botón ElevatedButton "Modificar Vehículo": Accede a una interfaz para modificar los datos de un
+          vehículo existente en el sistema.
+        - Botón ElevatedButton "Eliminar Vehículo": Elimina del sistema los registros del vehículo seleccionado.
+    '''
+
+    def __init__(self, page: ft.Page):
+        '''Constructor de la interfaz grafica para la ventana Vehiculos'''
+        super(VentanaVehiculo, self).__init__(
+            route="/vehiculos", horizontal_alignment=CrossAxisAlignment.CENTER,
+            vertical_alignment=MainAxisAlignment.CENTER
+        )
+        print("Gestion de Vehiculos (VentanaVehiculo)")
+
+        self.page = page
+
+        # Color de fondo contenedor principal
+        self.bgcolor = "#E0E7ED"
+
+        # Titulo con imagen vehiculo
+        self.imagenVehiculos = ft.Container(
+            ft.Container(
+                    content=ft.Text(
+                        value=" Gestión de Vehiculos",
+                        size=22,
+                        color=ft.colors.WHITE,
+                        weight=ft.FontWeight.BOLD
+                    ),
+                    shadow=ft.BoxShadow(
+                        blur_radius=4,  # Difuminado de la sombra
+                        spread_radius=2,  # Expansión de la sombra
+                        offset=ft.Offset(0, 4),  # Posición: hacia abajo
+                        color=ft.colors.GREY_500,  # Color de la sombra
+                    ),
+                    bgcolor="black",
+                    width=320,
+                    height=120,
+                    padding=0,
+                    image_repeat=ImageRepeat.NO_REPEAT,
+                    shape=ft.BoxShape("rectangle"),
+                    # Define imagen
+                    image_src=imagenes.ruta("/ImagenVehiculos.png"),
+                    image_fit=ft.ImageFit.COVER,
+                    image_opacity=0.7,
+                ),
+                alignment=ft.alignment.Alignment(x=0, y=0)
+            )
+
+        # Campo de entrada para la busqueda
+        self.input_buscar = ft.TextField(
+            label="Buscar Vehiculo",
+            label_style=TextStyle(color='#6a6965', size=12),
+            value="",
+            border_radius=ft.border_radius.vertical(top=6, bottom=6),
+            hint_text="Introduce la matricula del vehiculo",
+            hint_style=TextStyle(color='#6a6965', size=10),
+            color='black',
+            height=35,
+            cursor_color="#12597b",
+            text_size=13,
+            border_color="#12597b",
+            autofocus=True,
+            bgcolor="#D9E4EA",
+            on_change=lambda e: self.buscar_vehiculo(e),  # busca mientras se escribe
+        )
+
+        # Boton para activar la busqueda del vehiculo y boton agregar nuevo vehiculo
+        self.BotonBuscarVehiculo = ft.Container(
+            alignment=ft.alignment.Alignment(x=0, y=0),
+            content=Row(
+                alignment=ft.MainAxisAlignment.CENTER,
+                controls=[
+                    # Boton buscar cliente y añadir nuevo
+                    ft.ElevatedButton(
+                        text="Buscar Vehiculo",
+                        color="#FAFAF3",
+                        bgcolor="#12597b",
+                        tooltip='Buscar Vehiculo',
+                        icon=icons.SEARCH,
+                        icon_color="#FAFAF3",
+                        width=180,
+                        height=30,
+                        on_click=lambda e: self.buscar_vehiculo(e),
+                    ),
+                    ft.IconButton(
+                        content=ft.Image(src=imagenes.ruta("car-add.png"),
+                                         color= "#709775",
+                                         height=30,
+                                         width=30),
+                        tooltip="Añadir Nuevo",
+                        on_click=lambda e: page.go("/vehiculoNuevo"),
+                    )
+                ]
+            )
+        )
+
+        # Paginacion de los resultados: cursor de la pagina siguiente y consultas en curso de la ventana
+        self.cursor_busqueda = None
+        self.tareas = tareas.Tareas(page)
+        self.barraCarga = barra_carga()  # visible mientras se espera a la base de datos
+        self.incremental = busqueda.BusquedaIncremental(busqueda.coincide_vehiculo, ('vehiculos', 'clientes'))  # resultados para refinar en memoria
+
+        # Contenedor para mostrar los resultados de búsqueda
+        # solo se crean las tarjetas visibles y se reutilizan al hacer scroll
+        self.vistaResultadosBusqueda = ListaVirtual(
+            alto_elemento=175,  # el alto que daba child_aspect_ratio=1.9 con el ancho de la ventana
+            crear_elemento=self.crear_tarjeta,
+            rellenar_elemento=self.rellenar_tarjeta,
+            cargar_mas=lambda e: cargar_mas_al_final(self, e),  # carga la siguiente pagina al llegar al final
+            espacio=10,  # Espacio entre las tarjetas
+            bgcolor='#E0E7ED',
+            expand=True,
+        )
+
+        # Barra de navegacion
+        self.barraNavegacion = ft.NavigationBar(
+            selected_index=2,
+            height=50,
+            on_change=lambda e: self.barra_de_navegacion(e),
+            destinations=[
+                ft.NavigationBarDestination(
+                    icon_content=ft.Icon(
+                        name=ft.icons.HOME_OUTLINED,
+                        color="#12597b",
+                        size=20  # Ajusta el tamaño del ícono no seleccionado
+                    ),
+                    selected_icon_content=ft.Icon(
+                        name=ft.icons.HOME_ROUNDED,
+                        color="#12597b",
+                        size=24  # Ajusta el tamaño del ícono seleccionado
+                    ),
+                    label="Inicio",
+                ),
+                ft.NavigationBarDestination(
+                    icon_content=ft.Icon(
+                        name=ft.icons.PERSON_OUTLINED,
+                        color="#12597b",
+                        size=20
+                    ),
+                    selected_icon_content=ft.Icon(
+                        name=ft.icons.PERSON,
+                        color="#12597b",
+                        size=24
+                    ),
+                    label="Cliente",
+
+                ),
+                ft.NavigationBarDestination(
+                    icon_content=ft.Icon(
+                        name=ft.icons.DIRECTIONS_CAR_OUTLINED,
+                        color="#12597b",
+                        size=20
+                    ),
+                    selected_icon_content=ft.Icon(
+                        name=ft.icons.DIRECTIONS_CAR,
+                        color="#12597b",
+                        size=24
+                    ),
+                    label="Vehículo",
+                ),
+                ft.NavigationBarDestination(
+                    icon_content=ft.Icon(
+                        name=ft.icons.SETTINGS_OUTLINED,
+                        color="#12597b",
+                        size=20
+                    ),
+                    selected_icon_content=ft.Icon(
+                        name=ft.icons.SETTINGS,
+                        color="#12597b",
+                        size=24
+                    ),
+                    label="Recambio",
+                ),
+                ft.NavigationBarDestination(
+                    icon_content=ft.Icon(
+                        name=ft.icons.CAR_REPAIR_OUTLINED,
+                        color="#12597b",
+                        size=20
+                    ),
+                    selected_icon_content=ft.Icon(
+                        name=ft.icons.CAR_REPAIR,
+                        color="#12597b",
+                        size=24
+                    ),
+                    label="Ingreso",
+                )
+            ],
+            bgcolor="#D1E2E7",  # Color de fondo de la barra de navegación (azul oscuro)
+            indicator_color="#FFD700",  # Color del indicador del destino seleccionado (ámbar)
+            surface_tint_color="#E0E7ED",  # Color de superficie para el material (gris claro)
+            label_behavior=ft.NavigationBarLabelBehavior.ONLY_SHOW_SELECTED  # Mostrar la etiqueta  seleccionada
+        )
+
+        # Contenedor principal que contiene todos los elementos de la interfaz
+        self.controls = [
+            ft.Container(
+                ft.Column([
+                    self.imagenVehiculos,
+                    self.input_buscar,
+                    self.barraCarga,
+                    self.BotonBuscarVehiculo,
+                    ft.Divider(height=10, color="#B0BEC5"),
+                    self.vistaResultadosBusqueda,
+                    self.barraNavegacion,
+                ]
+                ),
+
+                # propiedades contenedor principal
+                border_radius=25,
+                width=350,  # ancho
+                height=655,  # Alto
+                gradient=ft.LinearGradient([  # color del contenedor configurable en 2 tonos de color
+                    "#E0E7ED",
+                    "#E0E7ED",
+                ])
+
+            )
+        ]
+
+        # metodo de navegacion para la barra de navegacion
+
+    # metodo para cargar los vehiculos existentes en el GridView
+    def buscar_vehiculo(self,e):
+        # input donde el usuario ingresa la matricula del vehiculo que quiere buscar, se deja escrita para poder afinarla
+        self.matricula_buscada = self.input_buscar.value or ""  # este es el Input
+        self.cursor_busqueda = None  # la busqueda empieza por la primera pagina
+
+        # la consulta va a un hilo de base de datos; si habia otra busqueda en curso se cancela
+        # mientras se escribe (on_change) se espera a que pase PAUSA_TECLEO sin otra tecla
+        pausa = busqueda.PAUSA_TECLEO if e.name == 'change' else 0
+        if e.name != 'change':
+            self.incremental.olvidar()  # al pulsar Buscar siempre se consulta la base de datos
+        self.tareas.lanzar('busqueda', self.cargar_pagina, True, pausa, indicador=self.barraCarga)
+
+    # metodo para cargar la siguiente pagina de vehiculos en la lista
+    async def cargar_pagina(self, nueva=False, pausa=0):
+        await asyncio.sleep(pausa)
+        matricula, cursor = self.matricula_buscada, self.cursor_busqueda
+
+        # si el texto amplia el de la busqueda anterior (completa) se filtran sus resultados en memoria
+        vehiculo_localizado = self.incremental.refinar(matricula) if nueva else None
+        if vehiculo_localizado is None:
+            # Buscamos el vehiculo por parte de la matricula en el indice de trigramas (sin espacios ni guiones)
+            # junto con su cliente en la misma consulta, una pagina cada vez
+            vehiculo_localizado, cursor = await tareas.consultar(
+                busqueda.buscar_vehiculos, matricula, cursor, busqueda.FILAS_REFINABLES if nueva else consultas.TAMANIO_PAGINA)
+            self.incremental.guardar(matricula, vehiculo_localizado, cursor, nueva)
+
+        # Limpia los resultados anteriores cuando llegan los de la busqueda nueva
+        if nueva:
+            self.vistaResultadosBusqueda.limpiar()
+        self.cursor_busqueda = cursor
+
+        if vehiculo_localizado:
+            # agregar los vehiculos a la lista, que solo dibuja las tarjetas visibles
+            self.vistaResultadosBusqueda.agregar(vehiculo_localizado)
+        #actualizar la interfaz
+        self.vistaResultadosBusqueda.update()
+
+    # metodo para crear una tarjeta de vehiculo vacia que la lista reutiliza
+    def crear_tarjeta(self):
+        '''Crea la tarjeta de resultados de vehiculos sin datos; en card.data se guardan los textos
+           que cambian y el vehiculo que muestra, que se escriben con rellenar_tarjeta'''
+        cliente = ft.Text(size=14, color="#283747", weight=ft.FontWeight.W_700, text_align=ft.TextAlign.CENTER, no_wrap=False) # no_wrap Asegura que el texto se ajuste si es largo
+        desde = ft.Text(size=14, text_align=ft.TextAlign.LEFT, color="#283747", no_wrap=False)
+        marca = ft.Text(size=12, text_align=ft.TextAlign.CENTER, color="#283747", no_wrap=True)
+        modelo = ft.Text(size=12, text_align=ft.TextAlign.CENTER, color="#283747", no_wrap=False)
+        matricula = ft.Text(size=12, text_align=ft.TextAlign.LEFT, color="#283747", no_wrap = False)
+        kilometros = ft.Text(size=12, text_align=ft.TextAlign.LEFT, color="#283747", no_wrap=False)
+
+        card = ft.Card(
+                    elevation=8,
+                content=ft.Container(
+                    alignment=ft.alignment.Alignment(x=0, y=0),
+                    bgcolor="#9ec4cc",
+                    padding=5,
+                    border=ft.border.all(1, ft.colors.BLUE_800),
+                    border_radius=ft.border_radius.all(12),
+                    content=ft.Column([
+                        ft.Container(
+                            ft.Row(
+                                [cliente, desde],
+                                alignment=ft.MainAxisAlignment.CENTER,
+                                vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                            ),
+                            bgcolor="transparent",
+                            alignment=ft.alignment.center
+                        ),
+                        ft.Container(
+                            ft.Row(
+                                [
+                                    ft.Text(f"Marca:", size=12, weight=ft.FontWeight.W_700, color="#283747",text_align=ft.TextAlign.CENTER, no_wrap=True),
+                                    marca,
+                                    ft.Text(f"Modelo:", size=12, weight=ft.FontWeight.W_700, color="#283747", text_align=ft.TextAlign.CENTER, no_wrap=False),
+                                    modelo
+                                ],
+                                alignment=ft.MainAxisAlignment.SPACE_EVENLY,
+                                vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                            ),
+                            bgcolor="transparent",
+                            padding=0,
+                            alignment=ft.alignment.center,
+
+                        ),
+
+                        ft.Container(
+                            ft.Row(
+                                [
+                                    ft.Text(f"Matricula:", size=12, color="#283747", weight=ft.FontWeight.W_700, text_align=ft.TextAlign.RIGHT),
+                                    matricula,
+                                    ft.Text(f"Kilometros:", size=12, color="#283747", weight=ft.FontWeight.W_700, text_align=ft.TextAlign.RIGHT),
+                                    kilometros
+                                ],
+                                alignment=ft.MainAxisAlignment.CENTER,
+                                vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                            ),
+                            bgcolor="transparent",
+                            padding=0,
+                            alignment=ft.alignment.center_left,
+                        ),
+
+                        ft.Row(
+                            [
+                                # los botones leen el vehiculo que muestra la tarjeta en el momento del click
+                                ft.IconButton(
+                                    icon=ft.icons.CAR_RENTAL,
+                                    icon_color="E0E7ED",
+                                    icon_size=25,
+                                    tooltip="Ingresos",
+                                    on_click=lambda e: (
+                                        self.objeto_seleccionado(e, card.data['vehiculo']),
+                                        self.page.go("/ingresosVehiculo"), print("VentanaVerIngresosVehiculo")
+                                    )
+                                ),
+                                ft.IconButton(
+                                    icon=ft.icons.MODE_EDIT_OUTLINED,
+                                    icon_color="E0E7ED",
+                                    icon_size=25,
+                                    tooltip="Editar",
+                                    on_click=lambda e: (
+                                        self.objeto_seleccionado(e, card.data['vehiculo']),
+                                        self.page.go("/editarVehiculo"), print("VentanaEditarVehiculo")
+                                )
+                                ),
+                                ft.IconButton(
+                                    icon=ft.icons.DELETE_FOREVER_ROUNDED,
+                                    icon_color="E0E7ED",
+                                    icon_size=25,
+                                    tooltip="Eliminar Vehiculo",
+                                )
+                            ],
+                        alignment=ft.MainAxisAlignment.SPACE_EVENLY,
+                        vertical_alignment=ft.CrossAxisAlignment.END,
+                        )
+                    ])
+                )
+            )
+        card.data = {'vehiculo': None, 'cliente': cliente, 'desde': desde, 'marca': marca, 'modelo': modelo,
+                     'matricula': matricula, 'kilometros': kilometros}
+        return card
+
+    # metodo para mostrar un vehiculo en una tarjeta de la lista
+    def rellenar_tarjeta(self, card, vehiculo):
+        campos = card.data
+        campos['vehiculo'] = vehiculo
+        campos['cliente'].value = f"{vehiculo.clientes.nombre}, "
+        campos['desde'].value = f"Desde: {vehiculo.fecha_alta.strftime('%d/%m/%Y')}"
+        campos['marca'].value = f"{vehiculo.marca}"
+        campos['modelo'].value = f"{vehiculo.modelo}"
+        campos['matricula'].value = f"{vehiculo.matricula}"
+        campos['kilometros'].value = f"{vehiculo.kilometros}"
+
+    def objeto_seleccionado(self, e, vehiculo_seleccionado):
+        # Guardar el ID y el nombre del cliente seleccionado
+        self.page.session.set("idVehiculoSeleccionado", vehiculo_seleccionado.id_vehiculo)
+        self.page.session.set("marcaVehiculoSeleccionado",vehiculo_seleccionado.marca)
+        self.page.session.set("modeloVehiculoSeleccionado", vehiculo_seleccionado.modelo)
+        self.page.session.set("matriculaVehiculoSeleccionado", vehiculo_seleccionado.matricula)
+        self.page.session.set("kilometrosVehiculoSeleccionado", vehiculo_seleccionado.kilometros)
+
+    # metodo para navegar entre ventanas
+    def barra_de_navegacion(self, e):
+        selected_index = e.control.selected_index
+        if selected_index == 0:
+            self.page.go("/inicio")
+        elif selected_index == 1:
+            self.page.go("/clientes")
+        elif selected_index == 2:
+            self.page.go("/vehiculos")
+        elif selected_index == 3:
+            self.page.go("/recambios")
+        elif selected_index == 4:
+            self.page.go("/ingresos")
+
+
+# Gestion de Vehiculos - Añadir Vehiculo
+class VentanaVehiculoNuevo(ft.View):
+    '''Clase VentanaVehiculoNuevo: Interfaz gráfica para la gestión de vehiculos.
+
+    Esta clase representa la ventana de la aplicación dedicada a la adición de vehiculos nuevos en el sistema
+    del taller.
+
+    Args:
+        - page: Instancia de la página actual, que maneja el contenido y las interacciones de la ventana.
+
+    Contiene:
+        - Imagen de título: Muestra una imagen de "Gestión de vehiculos" para identificar visualmente la sección.
+        - Input: Campo de texto para ingresar la marca del vehiculo.
+        - Input: Campo de texto para ingresar el el modelo del vehiculo
+        - Input: Campo de texto para ingresar la matricula del vehiculo.
+        - Input: Campo de texto para ingresar los kilometros del vehiculo.
+        - Botón ElevatedButton: "Aceptar" activa la accion de añadir el vehiculo al sistema los registros del taller
+        - Botón ElevatedButton: "Cancelar" cancela la operacion de añadir el vehiculo.
+    '''
+
+    def __init__(self, page: ft.Page):
+        '''Constructor de la interfaz grafica para la ventana Vehiculo Nuevo'''
+        super(VentanaVehiculoNuevo, self).__init__(
+            route="/vehiculoNuevo", horizontal_alignment=CrossAxisAlignment.CENTER,
+            vertical_alignment=MainAxisAlignment.CENTER
+        )
+        print("Gestion de Vehiculos - Añadir Vehiculo (VentanaVehiculoNuevo)")
+
+        self.page = page
+
+        # Color de fondo contenedor principal
+        self.bgcolor = "#E0E7ED"
+
+        # Imagen gestion de vehiculos
+        self.imagen_gestionVehiculo = ft.Container(
+            ft.Container(
+                    content=ft.Text(
+                        value=" Añadir Nuevo",
+                        size=22,
+                        color=ft.colors.WHITE,
+                        weight=ft.FontWeight.BOLD
+                    ),
+                    shadow=ft.BoxShadow(
+                        blur_radius=8,  # Difuminado de la sombra
+                        spread_radius=2,  # Expansión de la sombra
+                        offset=ft.Offset(0, 4),  # Posición: hacia abajo
+                        color=ft.colors.GREY_500,  # Color de la sombra
+                    ),
+                    bgcolor="black",
+                    width=320,
+                    height=120,
+                    padding=0,
+                    image_repeat=ImageRepeat.NO_REPEAT,
+                    shape=ft.BoxShape("rectangle"),
+                    # Define imagen
+                    image_src=imagenes.ruta("/imagen_de_nuevo_vehiculo.png"),
+                    image_fit=ft.ImageFit.COVER,
+                    image_opacity=0.7,
+                ),
+                alignment=ft.alignment.Alignment(x=0, y=0)
+            )
+
+        # Objeto Text para mostrar la opción elegida
+        self.texto_opcion_elegida = ft.Text()
+
+        # menu desplegable para elegir el cliente del vehiculo
+        self.menu_clientes = ft.Container(
+            alignment=ft.alignment.Alignment(x=0, y=0),
+            content=Row(
+                alignment=ft.MainAxisAlignment.CENTER,
+                controls=[
+                    ft.Dropdown(
+                        label='Selecciona un Cliente',
+                        alignment=Alignment(0.0, 0.0),
+                        label_style=TextStyle(color='#12597b', size=12, bgcolor='#D9E4EA', weight=ft.FontWeight.W_700),
+                        options_fill_horizontally=True,
+                        dense=True,
+                        max_menu_height=True,
+                        height=50,
+                        width=300,
+                        content_padding=6,
+                        color='#12597b',
+                        border_color='#12597b',
+                        text_size=10,
+                        on_change=lambda e: (self.pestaniaOpcion(e)),
+                        # nombres de los clientes de la cache de consultas, compartida con las demas ventanas
+                        options=[ft.dropdown.Option(str(cliente.nombre))
+                            for cliente in cache_consultas.consultar(db.session, select(Cliente.nombre))],
+                        bgcolor="#D9E4EA",
+                        padding=0,
+                    )
+                ]
+            )
+        )
+
+        # Campo de entrada para la marca del vehiculo
+        self.input_marcaVehiculo = ft.TextField(
+            label="Marca",
+            label_style=TextStyle(color='#6a6965', size=12),
+            value="",
+            border_radius=ft.border_radius.vertical(top=6, bottom=6),
+            hint_text="Introduce la marca",
+            hint_style=TextStyle(color='#6a6965', size=10),
+            color='black',
+            height=35,
+            cursor_color="#12597b",
+            text_size=13,
+            border_color="#B0BEC5",
+            autofocus=True,
+            bgcolor="#D9E4EA"
+        )
+        # Campo de entrada para el modelo del vehiculo
+        self.input_modeloVehiculo = ft.TextField(
+            label="Modelo",
+            label_style=TextStyle(color='#6a6965', size=12),
+            value="",
+            border_radius=ft.border_radius.vertical(top=6, bottom=6),
+            hint_text="Introduce el modelo",
+            hint_style=TextStyle(color='#6a6965', size=10),
+            color='black',
+            height=35,
+            cursor_color="#12597b",
+            text_size=13,
+            border_color="#B0BEC5",
+            autofocus=True,
+            bgcolor="#D9E4EA"
+        )
+
+        # Campo de entrada para la matricula del vehiculo
+        self.input_matriculaVehiculo = ft.TextField(
+            label="Matricula",
+            label_style=TextStyle(color='#6a6965', size=12),
+            value="",
+            border_radius=ft.border_radius.vertical(top=6, bottom=6),
+            hint_text="Introduce la matricula",
+            hint_style=TextStyle(color='#6a6965', size=10),
+            color='black',
+            height=35,
+            cursor_color="#12597b",
+            text_size=13,
+            border_color="#B0BEC5",
+            autofocus=True,
+            bgcolor="#D9E4EA"
+        )
+
+        # Campo de entrada para los kilometros del vehiculo
+        self.input_kilometrosVehiculo = ft.TextField(
+            label="Kilometros",
+            label_style=TextStyle(color='#6a6965', size=12),
+            value="",
+            border_radius=ft.border_radius.vertical(top=6, bottom=6),
+            hint_text="Introduce los kilometros",
+            hint_style=TextStyle(color='#6a6965', size=10),
+            color='black',
+            height=35,
+            cursor_color="#12597b",
+            text_size=13,
+            border_color="#B0BEC5",
+            autofocus=True,
+            bgcolor="#D9E4EA"
+        )
+
+        # Botones para agregar y cancelar operacion
+        self.BotonAgregarCliente = ft.Container(
+            expand=True,
+            alignment=ft.alignment.Alignment(x=0, y=0),
+            content=Row(
+                alignment=ft.MainAxisAlignment.CENTER,
+                controls=[
+                    # Boton agregar cliente nuevo
+                    ft.ElevatedButton(
+                        text="Aceptar",
+                        color="#FAFAF3",
+                        bgcolor="#12597b",
+                        tooltip='Aceptar Añadir',
+                        icon=icons.ADD,
+                        icon_color="#FAFAF3",
+                        width=140,
+                        height=30,
+                        on_click=lambda e: (self.vehiculo_nuevo(e), page.go("/vehiculos")),
+                    ),
+                    # cancelar operacion
+                    ft.ElevatedButton(
+                        text="Cancelar",
+                        color="#FAFAF3",
+                        bgcolor="#12597b",
+                        tooltip='Cancelar Añadir',
+                        icon=icons.CANCEL,
+                        icon_color="#FAFAF3",
+                        width=140,
+                        height=30,
+                        on_click=lambda _: page.go("/vehiculos"),
+                    ),
+                ]
+            )
+        )
+
+        # Contenedor principal que contiene todos los elementos de la interfaz
+        self.controls = [
+            ft.Container(
+                ft.Column([
+                    # self.tituloClientes,
+                    self.imagen_gestionVehiculo,
+                    self.menu_clientes,
+                    self.input_marcaVehiculo,
+                    self.input_modeloVehiculo,
+                    self.input_matriculaVehiculo,
+                    self.input_kilometrosVehiculo,
+                    self.BotonAgregarCliente,
+                ]
+                ),
+
+                # propiedades contenedor principal
+                border_radius=25,
+                width=350,  # ancho
+                height=655,  # Alto
+                gradient=ft.LinearGradient([  # color del contenedor configurable en 2 tonos de color
+                    "#E0E7ED",
+                    "#E0E7ED",
+                ])
+
+            )
+        ]
+
+    # metodo para manejar la opcion seleccionada en el menu desplegable
+    def pestaniaOpcion(self, e):
+        # Obtener la opción seleccionada
+        elegirOpcion = self.menu_clientes.content.controls[0].value
+
+        # Actualizar texto con la opción elegida
+        self.texto_opcion_elegida.value = (
+            f"Opción elegida: {elegirOpcion}" if elegirOpcion else "No se ha seleccionado ninguna opción."
+        )
+
+        # Imprime la opción seleccionada
+        print(f"Cliente seleccionado: {elegirOpcion}")
+
+        # Actualiza la interfaz
+        self.page.update(self)
+
+    # metodo para añadir un nuevo vehículo al sistema del taller
+    def vehiculo_nuevo(self, e):
+        print("\n > Crear vehiculo")
+        # Obtención de datos de entrada para el nuevo vehículo y cliente
+        id_cliente = self.menu_clientes.content.controls[0].value.strip() # ID o nombre del cliente seleccionado
+        marca = self.input_marcaVehiculo.value.strip()  # Marca del vehículo
+        modelo = self.input_modeloVehiculo.value.strip() # Modelo del vehículo
+        matricula = self.input_matriculaVehiculo.value.strip() # Matrícula del vehículo
+        kilometros = self.input_kilometrosVehiculo.value.strip() or '0' # Kilómetros actuales del vehículo
+        fecha_alta = datetime.now() # Fecha de alta del vehículo en el sistema
+        try:
+            kilometros = models.leer_kilometros(kilometros)
+        except ValueError as error:
+            print(f"Error: {error}")
+            return
+
+        # Consulta para encontrar el cliente en la base de datos por nombre (o ID según el valor seleccionado)
+        cliente = db.session.query(Cliente).filter_by(nombre=id_cliente).first()
+
+        # Creación de una nueva instancia de Vehiculo con los datos de entrada
+        nuevo_vehiculo = Vehiculo(marca=marca, modelo=modelo, matricula=matricula, kilometros=kilometros, fecha_alta=fecha_alta)
+
+        # Agregar el nuevo vehículo a la sesión de la base de datos
+        db.session.add(nuevo_vehiculo)
+
+        # Establecer la relación bidireccional entre el cliente y el vehículo
+        # Se añade el vehículo a la lista de vehículos del cliente, gestionando la relación automáticamente
+        cliente.vehiculos.append(nuevo_vehiculo)
+
+        # Confirmar y cerrar la sesión
+        db.session.commit()
+        db.session.close()
+
+
+# Gestion de Vehiculos - Ingresos del Vehiculo Seleccionado
+class VentanaVerIngresosVehiculo(ft.View):
+    '''Clase VentanaRegistro: Interfaz gráfica para la gestión de registro de repuestos e historial.
+
+      Esta clase representa la ventana de la aplicación dedicada a la gestión de registro de repuestos e historial,
+      permitiendo al usuario mantener un seguimiento del historial por cliente o vehiculo.
+
+      Args:
+          - page: Instancia de la página actual, que gestiona el contenido y las interacciones de la ventana.
+
+      Contiene:
+          - Imagen de diagnóstico de ingresos como título: Identifica la sección de ingreso nuevo con una imagen representativa.
+          - Dropdown Cliente: Desplegable para seleccionar el cliente que ingresa el vehículo al taller.
+          - Dropdown Vehículo: Desplegable para seleccionar el vehículo del cliente que será ingresado al taller.
+          - Input Kilometraje: Campo de texto para introducir el kilometraje actual del vehículo al momento del ingreso.
+          - Input Motivo de Ingreso: Campo de texto para introducir el motivo por el cual el vehículo acude al taller.
+          - Input Diagnóstico Previo: Campo de texto para introducir el diagnóstico inicial del taller antes del ingreso.
+          - Botón Aceptar: Botón para confirmar y registrar el ingreso.
+      '''
+
+    def __init__(self, page: ft.Page):
+        '''Constructor de la interfaz grafica para visualizar los ingresos del vehiculo seleccionado'''
+        super(VentanaVerIngresosVehiculo, self).__init__(
+            route="/ingresosVehiculo", horizontal_alignment=CrossAxisAlignment.CENTER,
+            vertical_alignment=MainAxisAlignment.CENTER
+        )
+        print("Gestion de Vehiculos - Ingresos del Vehiculo Seleccionado (VentanaVerIngresosVehiculo)")
+
+        self.page = page
+
+        # Color de fondo contenedor principal
+        self.bgcolor = "#E0E7ED"
+
+        # Titulo que identifica la sección correspondiente
+        self.modelo_vehiculo = ft.Row([
+            ft.Text(
+                value=f'Ingresos de',
+                width=None,
+                size=12,
+                text_align=TextAlign.START,
+                weight=FontWeight.W_600,
+                color="#333333"
+            ),
+            ft.Text(
+                value = self.page.session.get("marcaVehiculoSeleccionado"),
+                size=12,
+                color='green700',
+                weight=FontWeight.W_600
+            ),
+            ft.Text(
+                value=self.page.session.get("modeloVehiculoSeleccionado"),
+                size=12,
+                color='green700',
+                weight=FontWeight.W_600
+            ),
+            ft.Text(
+                value=self.page.session.get("matriculaVehiculoSeleccionado"),
+                size=12,
+                color='green700',
+                weight=FontWeight.W_600
+            )
+        ],
+            alignment=ft.MainAxisAlignment.CENTER,
+        )
+
+        # Contenedor para mostrar los ingresos del cliente
+        self.vistaResultadosBusqueda = ft.Container(
+            bgcolor='#E0E7ED',  # Color de fondo
+            expand=True,
+            content=ft.GridView(
+                expand=1,
+                on_scroll_interval=10,  # Intervalo de scroll
+                child_aspect_ratio=1.6,  # Ajusta la relación alto por ancho
+                runs_count=1,  # Número de columnas según el diseño
+                spacing=10,  # Espacio entre las imágenes
+                run_spacing=1,  # Espacio entre las filas
+            )
+        )
+
+        # Boton para realizar la accion de volver a la ventana vehiculos
+        self.botonVolver = ft.Container(
+            ft.ElevatedButton(
+                text="Volver",
+                color="#FAFAF3",
+                bgcolor="#12597b",
+                tooltip='Volver atras',
+                icon=icons.ARROW_BACK,
+                icon_color="#FAFAF3",
+                width=180,
+                height=30,
+                on_click=lambda e: self.page.go("/vehiculos"),
+            ),
+            alignment=ft.alignment.Alignment(x=0, y=0)
+        )
+
+
+
+        # Contenedor principal que contiene todos los elementos de la interfaz
+        self.controls = [
+            ft.Container(
+                ft.Column([
+                    self.modelo_vehiculo,
+                    self.vistaResultadosBusqueda,
+                    self.botonVolver,
+
+                ]
+                ),
+
+                # propiedades contenedor principal
+                border_radius=25,
+                width=350,  # ancho
+                height=655,  # Alto
+                gradient=ft.LinearGradient([  # color del contenedor configurable en 2 tonos de color
+                    "#E0E7ED",
+                    "#E0E7ED",
+                ])
+
+            )
+        ]
+
+        self.ingresos_vehiculo(self)
+
+# metodo para cargar todos los ingresos existentes del vehiculo seleccionado
+    def ingresos_vehiculo(self, e):
+        # Obtener el ID del vehiculo actual de la sesion
+        id_vehiculo_actual = self.page.session.get("idVehiculoSeleccionado")
+
+        vehiculoSeleccionado = db.session.query(Ingreso).filter_by(
+            id_vehiculo = id_vehiculo_actual ).all(
+        )
+
+        vehiculoActual = db.session.query(Vehiculo).filter_by(
+            id_vehiculo=id_vehiculo_actual).all(
+        )
+
+        if vehiculoSeleccionado:
+            cards = []
+            for ingreso in vehiculoSeleccionado:
+                for vehiculo in vehiculoActual:
+                    card = ft.Card(
+                                elevation=8,
+                            content=ft.Container(
+                                alignment=ft.alignment.Alignment(x=0, y=0),
+                                bgcolor="#9ec4cc",
+                                padding=5,
+                                border=ft.border.all(1, ft.colors.BLUE_800),
+                                border_radius=ft.border_radius.all(12),
+                                content=ft.Column([
+                                    ft.Container(
+                                        ft.Row(
+                                            [
+                                                ft.Text(f"Ingreso:", size=12, weight=ft.FontWeight.W_700, color="#283747",text_align=ft.TextAlign.CENTER, no_wrap=True),
+                                                ft.Text(f"{ingreso.id_ingreso}",size=12, text_align=ft.TextAlign.CENTER, color="#283747", no_wrap=True),
+                                            ],
+                                            alignment=ft.MainAxisAlignment.START,
+                                            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                                        ),
+                                        bgcolor="transparent",
+                                        padding=0,
+                                        alignment=ft.alignment.center,
+
+                                    ),
+                                    ft.Container(
+                                        ft.Row(
+                                            [
+                                                ft.Text(f"Fecha Ingreso:", size=12, weight=ft.FontWeight.W_700,
+                                                        color="#283747", text_align=ft.TextAlign.CENTER, no_wrap=False),
+                                                ft.Text(f"{ingreso.fecha_ingreso.strftime('%d/%m/%Y')}", size=12, text_align=ft.TextAlign.CENTER,
+                                                        color="#283747", no_wrap=False)
+                                            ],
+                                            alignment=ft.MainAxisAlignment.START
+                                            ,
+                                            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                                        ),
+                                        bgcolor="transparent",
+                                        padding=0,
+                                        alignment=ft.alignment.center,
+
+                                    ),
+                                    ft.Container(
+                                        ft.Row(
+                                            [
+                                                ft.Text(f"Vehiculo:", size=12, weight=ft.FontWeight.W_700,
+                                                        color="#283747", text_align=ft.TextAlign.CENTER, no_wrap=False),
+                                                ft.Text(f"{vehiculo.marca}, {vehiculo.modelo}", size=12, text_align=ft.TextAlign.CENTER,
+                                                        color="#283747", no_wrap=False)
+                                            ],
+                                            alignment=ft.MainAxisAlignment.START
+                                            ,
+                                            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                                        ),
+                                        bgcolor="transparent",
+                                        padding=0,
+                                        alignment=ft.alignment.center,
+                                    ),
+
+                                    ft.Container(
+                                        ft.Row(
+                                            [
+                                                ft.Text(f"Kilometros Ingreso:", size=12, color="#283747", weight=ft.FontWeight.W_700, text_align=ft.TextAlign.RIGHT),
+                                                ft.Text(f"{ingreso.kilometros_ingreso}", size=12, text_align=ft.TextAlign.LEFT, color="#283747", no_wrap = False),
+
+                                            ],
+                                            alignment=ft.MainAxisAlignment.START,
+                                            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                                        ),
+                                        bgcolor="transparent",
+                                        padding=0,
+                                        alignment=ft.alignment.center_left,
+                                    ),
+                                    ft.Container(
+                                        ft.Row(
+                                            [
+                                                # ft.Text(f"   ", size=12, weight=ft.FontWeight.W_700, color="Transparent", text_align=ft.TextAlign.CENTER),
+                                                ft.Text(f"Diagnostico:", size=12, color="#283747",
+                                                        weight=ft.FontWeight.W_700, text_align=ft.TextAlign.RIGHT),
+                                                ft.Text(f"{ingreso.diagnostico}", size=12, text_align=ft.TextAlign.LEFT,
+                                                        color="#283747", no_wrap=False)
+                                            ],
+                                            alignment=ft.MainAxisAlignment.START,
+                                            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                                        ),
+                                        bgcolor="transparent",
+                                        padding=0,
+                                        alignment=ft.alignment.center_left,
+                                    ),
+
+                                    ft.Row(
+                                        [
+                                            ft.IconButton(
+                                                icon=ft.icons.REMOVE_RED_EYE,
+                                                icon_color="E0E7ED",
+                                                icon_size=25,
+                                                tooltip="Ver Registro",
+                                                on_click=lambda e: self.page.go("/ingresosVehiculo"),
+                                            ),
+                                            ft.IconButton(
+                                                icon=ft.icons.MODE_EDIT_OUTLINED,
+                                                icon_color="E0E7ED",
+                                                icon_size=25,
+                                                tooltip="Editar",
+                                                on_click=lambda e: self.page.go("/editarVehiculo"),
+                                            ),
+                                        ],
+                                    alignment=ft.MainAxisAlignment.SPACE_AROUND,
+                                    vertical_alignment=ft.CrossAxisAlignment.END,
+                                    )
+                                ])
+                            )
+                        )
+
+                    cards.append(card)
+
+            # Limpia los controles actuales del GridView
+            self.vistaResultadosBusqueda.content.controls = []
+
+            # agregar cards al GridView
+            for card in cards:
+                self.vistaResultadosBusqueda.content.controls.append(card)
+
+
+# Gestion de Vehiculos - Editar Vehiculo
+class VentanaEditarVehiculo(ft.View):
+    '''Clase VentanaEditarVehiculo: Interfaz gráfica para la edición de los datos de un vehículo.
+
+    Esta clase representa la ventana de la aplicación dedicada a la modificación de los datos
+    de un vehículo previamente registrado en el sistema del taller. El usuario puede visualizar
+    la información actual del vehículo y actualizarla según sea necesario.
+
+    Args:
+        - page: Instancia de la página actual, que maneja el contenido y las interacciones de la ventana.
+
+    Contiene:
+        - Imagen de título: Muestra un encabezado visual con el texto "Editar Vehículo".
+        - Datos actuales: Sección donde se presentan los datos actuales del vehículo
+          (marca, modelo, matrícula y kilómetros).
+        - Campos de entrada (Input/TextField): Permiten modificar los datos del vehículo
+          (marca, modelo, matrícula y kilómetros).
+        - Botón "Aceptar": Guarda los cambios realizados en la información del vehículo.
+        - Botón "Cancelar": Cancela la edición y regresa a la vista anterior sin guardar cambios.
+      '''
+
+    def __init__(self, page: ft.Page):
+        '''Constructor de la interfaz grafica para editar/modificar los datos del vehiculo seleccionado'''
+        super(VentanaEditarVehiculo, self).__init__(
+            route="/editarVehiculo", horizontal_alignment=CrossAxisAlignment.CENTER,
+            vertical_alignment=MainAxisAlignment.CENTER
+        )
+        print("Gestion de Vehiculos - Editar Vehiculo (VentanaEditarVehiculo)")
+
+        self.page = page
+
+        # Color de fondo contenedor principal
+        self.bgcolor = "#E0E7ED"
+
+        # Imagen gestion de vehiculos
+        self.imagen_editarVehiculo = ft.Container(
+            ft.Container(
+                    content=ft.Text(
+                        value=" Editar Vehiculo",
+                        size=22,
+                        color=ft.colors.WHITE,
+                        weight=ft.FontWeight.BOLD
+                    ),
+                    shadow=ft.BoxShadow(
+                        blur_radius=8,  # Difuminado de la sombra
+                        spread_radius=2,  # Expansión de la sombra
+                        offset=ft.Offset(0, 4),  # Posición: hacia abajo
+                        color=ft.colors.GREY_500,  # Color de la sombra
+                    ),
+                    bgcolor="black",
+                    width=320,
+                    height=120,
+                    padding=0,
+                    image_repeat=ImageRepeat.NO_REPEAT,
+                    shape=ft.BoxShape("rectangle"),
+                    # Define imagen
+                    image_src=imagenes.ruta("/imagen_de_nuevo_vehiculo.png"),
+                    image_fit=ft.ImageFit.COVER,
+                    image_opacity=0.7,
+                ),
+                alignment=ft.alignment.Alignment(x=0, y=0)
+            )
+
+
+
+        # Marca del vehiculo
+        self.marca_vehiculo = ft.Row([
+            ft.Text(
+                value=f'Marca:',
+                width=None,
+                size=12,
+                text_align=TextAlign.CENTER,
+                weight=FontWeight.W_600,
+                color="#333333"
+            ),
+            ft.Text(
+                value=self.page.session.get("marcaVehiculoSeleccionado"),
+                size=12,
+                color='green700',
+                weight=FontWeight.W_600
+            ),
+        ],
+            alignment=ft.MainAxisAlignment.START,
+            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+        )
+
+        # Modelo del vehiculo
+        self.modelo_vehiculo = ft.Row([
+            ft.Text(
+                value=f'Modelo:',
+                width=None,
+                size=12,
+                text_align=TextAlign.CENTER,
+                weight=FontWeight.W_600,
+                color="#333333"
+            ),
+            ft.Text(
+                value=self.page.session.get("modeloVehiculoSeleccionado"),
+                size=12,
+                color='green700',
+                weight=FontWeight.W_600
+            ),
+        ],
+            alignment=ft.MainAxisAlignment.START,
+            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+        )
+
+        # Matricula del vehiculo
+        self.matricula_vehiculo = ft.Row([
+            ft.Text(
+                value=f'Matricula:',
+                width=None,
+                size=12,
+                text_align=TextAlign.CENTER,
+                weight=FontWeight.W_600,
+                color="#333333"
+            ),
+            ft.Text(
+                value=self.page.session.get("matriculaVehiculoSeleccionado"),
+                size=12,
+                color='green700',
+                weight=FontWeight.W_600
+            ),
+        ],
+            alignment=ft.MainAxisAlignment.START,
+            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+        )
+
+        # Kilometros del vehiculo
+        self.kilometros_vehiculo = ft.Row([
+            ft.Text(
+                value=f'Kilometros de Alta:',
+                width=None,
+                size=12,
+                text_align=TextAlign.CENTER,
+                weight=FontWeight.W_600,
+                color="#333333"
+            ),
+            ft.Text(
+                value=self.page.session.get("kilometrosVehiculoSeleccionado"),
+                size=12,
+                color='green700',
+                weight=FontWeight.W_600
+            ),
+        ],
+            alignment=ft.MainAxisAlignment.START,
+            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+        )
+
+        # Campo de entrada para la marca del vehiculo
+        self.input_marcaVehiculo = ft.TextField(
+            label="Marca",
+            label_style=TextStyle(color='#6a6965', size=12),
+            value="",
+            border_radius=ft.border_radius.vertical(top=6, bottom=6),
+            hint_text="Introduce la marca",
+            hint_style=TextStyle(color='#6a6965', size=10),
+            color='black',
+            height=35,
+            cursor_color="#12597b",
+            text_size=13,
+            border_color="#B0BEC5",
+            autofocus=True,
+            bgcolor="#D9E4EA"
+        )
+        # Campo de entrada para el modelo del vehiculo
+        self.input_modeloVehiculo = ft.TextField(
+            label="Modelo",
+            label_style=TextStyle(color='#6a6965', size=12),
+            value="",
+            border_radius=ft.border_radius.vertical(top=6, bottom=6),
+            hint_text="Introduce el modelo",
+            hint_style=TextStyle(color='#6a6965', size=10),
+            color='black',
+            height=35,
+            cursor_color="#12597b",
+            text_size=13,
+            border_color="#B0BEC5",
+            autofocus=True,
+            bgcolor="#D9E4EA"
+        )
+
+        # Campo de entrada para la matricula del vehiculo
+        self.input_matriculaVehiculo = ft.TextField(
+            label="Matricula",
+            label_style=TextStyle(color='#6a6965', size=12),
+            value="",
+            border_radius=ft.border_radius.vertical(top=6, bottom=6),
+            hint_text="Introduce la matricula",
+            hint_style=TextStyle(color='#6a6965', size=10),
+            color='black',
+            height=35,
+            cursor_color="#12597b",
+            text_size=13,
+            border_color="#B0BEC5",
+            autofocus=True,
+            bgcolor="#D9E4EA"
+        )
+
+        # Campo de entrada para los kilometros del vehiculo
+        self.input_kilometrosVehiculo = ft.TextField(
+            label="Kilometros",
+            label_style=TextStyle(color='#6a6965', size=12),
+            value="",
+            border_radius=ft.border_radius.vertical(top=6, bottom=6),
+            hint_text="Introduce los kilometros",
+            hint_style=TextStyle(color='#6a6965', size=10),
+            color='black',
+            height=35,
+            cursor_color="#12597b",
+            text_size=13,
+            border_color="#B0BEC5",
+            autofocus=True,
+            bgcolor="#D9E4EA"
+        )
+
+        # Botones para agregar y cancelar operacion
+        self.BotonAgregarCliente = ft.Container(
+            expand=True,
+            alignment=ft.alignment.Alignment(x=0, y=0),
+            content=Row(
+                alignment=ft.MainAxisAlignment.CENTER,
+                controls=[
+                    # Boton agregar cliente nuevo
+                    ft.ElevatedButton(
+                        text="Aceptar",
+                        color="#FAFAF3",
+                        bgcolor="#12597b",
+                        tooltip='Aceptar Añadir',
+                        icon=icons.ADD,
+                        icon_color="#FAFAF3",
+                        width=140,
+                        height=30,
+                        on_click=lambda e: (self.vehiculo_modificar(e), page.go("/vehiculos")),
+                    ),
+                    # cancelar operacion
+                    ft.ElevatedButton(
+                        text="Cancelar",
+                        color="#FAFAF3",
+                        bgcolor="#12597b",
+                        tooltip='Cancelar Añadir',
+                        icon=icons.CANCEL,
+                        icon_color="#FAFAF3",
+                        width=140,
+                        height=30,
+                        on_click=lambda _: page.go("/vehiculos"),
+                    ),
+                ]
+            )
+        )
+
+
+        # Contenedor principal que contiene todos los elementos de la interfaz
+        self.controls = [
+            ft.Container(
+                ft.Column([
+                    self.imagen_editarVehiculo,
+                    self.marca_vehiculo,
+                    self.modelo_vehiculo,
+                    self.matricula_vehiculo,
+                    self.kilometros_vehiculo,
+                    ft.Divider(height=1, color="gray"),
+                    self.input_marcaVehiculo,
+                    self.input_modeloVehiculo,
+                    self.input_matriculaVehiculo,
+                    self.input_kilometrosVehiculo,
+                    self.BotonAgregarCliente,
+
+                ]
+                ),
+
+                # propiedades contenedor principal
+                border_radius=25,
+                width=350,  # ancho
+                height=655,  # Alto
+                gradient=ft.LinearGradient([  # color del contenedor configurable en 2 tonos de color
+                    "#E0E7ED",
+                    "#E0E7ED",
+                ])
+
+            )
+        ]
+
+    def vehiculo_modificar(self, e):
+        print("\n > Modificar vehiculo")
+
+        # Recuperar el id desde la sesión
+        id_vehiculo = self.page.session.get("idVehiculoSeleccionado")
+
+        if not id_vehiculo:
+            print("⚠️ No hay vehiculo seleccionado en la sesión")
+            return
+
+        # Buscar el vehiculo en la base de datos
+        vehiculo = db.session.query(Vehiculo).get(int(id_vehiculo))
+
+        if vehiculo:
+            # Actualizar solo si el input no está vacío
+            if self.input_marcaVehiculo.value.strip():
+                vehiculo.marca = self.input_marcaVehiculo.value.strip()
+            if self.input_modeloVehiculo.value.strip():
+                vehiculo.modelo = self.input_modeloVehiculo.value.strip()
+            if self.input_matriculaVehiculo.value.strip():
+                vehiculo.matricula = self.input_matriculaVehiculo.value.strip()
+            if self.input_kilometrosVehiculo.value.strip():
+                try:
+                    vehiculo.kilometros = models.leer_kilometros(self.input_kilometrosVehiculo.value)
+                except ValueError as error:
+                    print(f"Error: {error}")
+                    db.session.rollback()
+                    return
+
+            # Guardar cambios
+            db.session.commit()
+            db.session.close()
+            print("Vehiculo actualizado correctamente ✅")
+        else:
+            print("⚠️ Vehiculo no encontrado")